@@ -24,6 +24,7 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.audio
 import thesystem.misc as misc
 
 OUTPUT_PATH = Path(__file__).parent
@@ -85,7 +86,7 @@ bottom_images = f"thesystem/{all_prev}bottom_bar"
 top_preloaded_images = thesystem.system.load_or_cache_images(top_images, (695, 39), job, type_="top")
 bottom_preloaded_images = thesystem.system.load_or_cache_images(bottom_images, (702, 36), job, type_="bottom")
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 def start_move(event):
     window.lastx, window.lasty = event.widget.winfo_pointerxy()
@@ -102,9 +103,9 @@ def move_window(event):
 def ex_close(win):
     if setting_data["Settings"]["Performernce (ANIME):"] != "True":
         stop_event.set()
-        update_thread.join()
+        bar_animator.stop()
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, 0, window_width, step=20, delay=1)
 
 canvas = Canvas(
@@ -128,7 +129,7 @@ image_1 = canvas.create_image(
 
 pres_file_data=misc.load_ujson("Files/Mod/presets.json")
 video_path=pres_file_data["Anime"][video]
-preloaded_frames = np.load(video_path)
+preloaded_frames = thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 478.0, 313.0)
 
 image_image_2 = PhotoImage(
@@ -245,23 +246,7 @@ bottom_image = canvas.create_image(
 
 step,delay=1,1
 
-def update_images():
-    global image_index, bot_image_index
-
-    image_index = (image_index + 1) % len(top_preloaded_images)
-    top_img = top_preloaded_images[image_index]
-    canvas.itemconfig(top_image, image=top_img)
-    canvas.top_img = top_img
-
-    bot_image_index = (bot_image_index + 1) % len(bottom_preloaded_images)
-    bot_img = bottom_preloaded_images[bot_image_index]
-    canvas.itemconfig(bottom_image, image=bot_img)
-    canvas.bot_img = bot_img
-
-    window.after(1000 // 24, update_images)
-
-update_thread = threading.Thread(target=update_images)
-update_thread.start()
+bar_animator = thesystem.system.BarAnimator(canvas, (top_image, top_preloaded_images), (bottom_image, bottom_preloaded_images))
 
 button_image_1 = PhotoImage(
     file=get_stuff_path("close.png"))
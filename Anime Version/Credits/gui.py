@@ -27,6 +27,7 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.audio
 import thesystem.misc as misc
 
 
@@ -103,11 +104,11 @@ def ex_close(win):
         
     if setting_data["Settings"]["Performernce (ANIME):"] != "True":
         stop_event.set()
-        update_thread.join()
-    subprocess.Popen([sys.executable, misc.resource_path('Files/Mod/default/sfx_close.py')])
+        bar_animator.stop()
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, 0, window_width, step=50, delay=1)
 
-subprocess.Popen([sys.executable, misc.resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 def attri_show():
     canvas.itemconfig("Credit", state="hidden")
@@ -138,7 +139,7 @@ image_1 = canvas.create_image(
 
 pres_file_data=misc.load_ujson("Files/Mod/presets.json")
 video_path=pres_file_data["Anime"][video]
-preloaded_frames = np.load(video_path)
+preloaded_frames = thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 478.0, 313.0, pause_duration=1)
 
 image_image_16 = PhotoImage(
@@ -387,24 +388,8 @@ button_7.place(
 
 step,delay=1,1
 
-def update_images():
-    global image_index, bot_image_index
-
-    image_index = (image_index + 1) % len(top_preloaded_images)
-    top_img = top_preloaded_images[image_index]
-    canvas.itemconfig(top_image, image=top_img)
-    canvas.top_img = top_img
-
-    bot_image_index = (bot_image_index + 1) % len(bottom_preloaded_images)
-    bot_img = bottom_preloaded_images[bot_image_index]
-    canvas.itemconfig(bottom_image, image=bot_img)
-    canvas.bot_img = bot_img
-
-    window.after(1000 // 24, update_images)
-
 if setting_data["Settings"]["Performernce (ANIME):"] != "True":
-    update_thread = threading.Thread(target=update_images)
-    update_thread.start()
+    bar_animator = thesystem.system.BarAnimator(canvas, (top_image, top_preloaded_images), (bottom_image, bottom_preloaded_images))
 
 window.resizable(False, False)
 window.mainloop()
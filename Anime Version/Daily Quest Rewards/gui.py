@@ -9,7 +9,6 @@ from pathlib import Path
 # Explicit imports to satisfy Flake8
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
 from datetime import datetime, timedelta, date
-import subprocess
 import threading
 import json
 import cv2
@@ -18,7 +17,6 @@ import csv
 import sys
 import os
 import numpy as np
-from thesystem.misc import resource_path
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -27,6 +25,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 import thesystem.dailyquest as dailyquest
 
 with open("Files/Mod/presets.json", 'r') as pres_file:
@@ -51,11 +51,11 @@ def move_window(event):
 
 def ex_close(window):
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, initial_height, window_width, step=20, delay=1)
     
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 window = Tk()
 
@@ -152,7 +152,7 @@ def get():
         tab_son_data=json.load(tab_son)
 
     if tab_son_data["Status"]=='Close':
-        subprocess.Popen([sys.executable, resource_path('Anime Version/Status Tab/gui.py')])
+        thesystem.windows.open_script('Anime Version/Status Tab/gui.py')
     ex_close(window)
 
 def secret_get():
@@ -204,7 +204,7 @@ def secret_get():
     with open("Files/Player Data/Tabs.json",'r') as tab_son:
         tab_son_data=json.load(tab_son)
     if tab_son_data["Status"]!='Open':
-        subprocess.Popen([sys.executable, resource_path('Anime Version/Status Tab/gui.py')])
+        thesystem.windows.open_script('Anime Version/Status Tab/gui.py')
     window.quit()
 
 def great_get():
@@ -256,7 +256,7 @@ def great_get():
     with open("Files/Player Data/Tabs.json",'r') as tab_son:
         tab_son_data=json.load(tab_son)
     if tab_son_data["Status"]!='Open':
-        subprocess.Popen([sys.executable, resource_path('Anime Version/Status Tab/gui.py')])
+        thesystem.windows.open_script('Anime Version/Status Tab/gui.py')
     window.quit()
 
 def give_rev():
@@ -290,7 +290,7 @@ with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=json.load(pres_file)
     normal_font_col=pres_file_data["Anime"]["Normal Font Color"]
     video_path=pres_file_data["Anime"]["Video"]
-    preloaded_frames = np.load(video_path)
+    preloaded_frames = thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 277.0, 320.0, resize_factor=0.8, pause_duration=0.3)
 
 image_image_2 = PhotoImage(
@@ -14,7 +14,6 @@ import time
 import random
 import ujson
 import csv
-import subprocess
 import cv2
 from PIL import Image, ImageTk
 import sys
@@ -29,6 +28,8 @@ sys.path.insert(0, project_root)
 
 import thesystem.dailyquest
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 import thesystem.dailyquest as dailyquest
 import thesystem.misc
 
@@ -80,10 +81,10 @@ def move_window(event):
 def ex_close(win):
     if setting_data["Settings"]["Performernce (ANIME):"] != "True":
         stop_event.set()
-        update_thread.join()
+        bar_animator.stop()
     thesystem.misc.update_screen("Daily","Close")
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, 0, window_width, step=30, delay=1)
 
 with open("Files/Checks/Daily_time_check.csv", 'r') as Daily_date_check_file:
@@ -160,7 +161,7 @@ if full_check==False:
     top_preloaded_images = thesystem.system.load_or_cache_images(top_images, (488, 38), job, type_="top")
     bottom_preloaded_images = thesystem.system.load_or_cache_images(bottom_images, (488, 33), job, type_="bottom")
 
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx.py')])
+    thesystem.audio.play("Open SFX")
 
     window.configure(bg = "#FFFFFF")
     set_data=thesystem.misc.return_settings()
@@ -192,7 +193,7 @@ if full_check==False:
     pres_file_data=thesystem.misc.load_ujson("Files/Mod/presets.json")
     normal_font_col=pres_file_data["Anime"]["Normal Font Color"]
     video_path=pres_file_data["Anime"][video]
-    preloaded_frames = np.load(video_path)
+    preloaded_frames = thesystem.system.load_video_frames(video_path)
     player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 277.0, 400.0, resize_factor=0.6, pause_duration=0.5, buffer_size=50)
 
     image_image_2 = PhotoImage(
@@ -450,51 +451,51 @@ if full_check==False:
     )
 
     def update_pushup():
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_point.py')])
+        thesystem.audio.play("Point SFX")
         #global pushup_txt
         current_text=int((((canvas.itemcget(pushup_txt, "text")).split("/"))[0])[1:])
         daily_quest_data["Player"]["Push"]+=1
-        thesystem.misc.dump_ujson("Files/Player Data/Daily_Quest.json", daily_quest_data, indents=4)
+        thesystem.misc.dump_ujson_field("Files/Player Data/Daily_Quest.json", ("Player", "Push"), daily_quest_data["Player"]["Push"])
         canvas.itemconfig(pushup_txt, text=f"[{current_text+1}/{fl_push}]")
 
     def update_situp():
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_point.py')])
+        thesystem.audio.play("Point SFX")
         #global situp_txt
         current_text=int((((canvas.itemcget(situp_txt, "text")).split("/"))[0])[1:])
         daily_quest_data["Player"]["Sit"]+=1
-        thesystem.misc.dump_ujson("Files/Player Data/Daily_Quest.json", daily_quest_data, indents=4)
+        thesystem.misc.dump_ujson_field("Files/Player Data/Daily_Quest.json", ("Player", "Sit"), daily_quest_data["Player"]["Sit"])
         canvas.itemconfig(situp_txt, text=f"[{current_text+1}/{fl_sit}]")
 
     def update_sqat():
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_point.py')])
+        thesystem.audio.play("Point SFX")
         #global situp_txt
         current_text=int((((canvas.itemcget(squat_txt, "text")).split("/"))[0])[1:])
         daily_quest_data["Player"]["Squat"]+=1
-        thesystem.misc.dump_ujson("Files/Player Data/Daily_Quest.json", daily_quest_data, indents=4)
+        thesystem.misc.dump_ujson_field("Files/Player Data/Daily_Quest.json", ("Player", "Squat"), daily_quest_data["Player"]["Squat"])
         canvas.itemconfig(squat_txt, text=f"[{current_text+1}/{fl_sit}]")
 
     def update_run():
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_point.py')])
+        thesystem.audio.play("Point SFX")
         #global run_txt
         current_text=float((((canvas.itemcget(run_txt, "text")).split("/"))[0])[1:])
         daily_quest_data["Player"]["Run"]+=0.5
-        thesystem.misc.dump_ujson("Files/Player Data/Daily_Quest.json", daily_quest_data, indents=4)
+        thesystem.misc.dump_ujson_field("Files/Player Data/Daily_Quest.json", ("Player", "Run"), daily_quest_data["Player"]["Run"])
         canvas.itemconfig(run_txt, text=f"[{current_text+0.5}/{fl_run}]")
 
     def update_int():
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_point.py')])
+        thesystem.audio.play("Point SFX")
         #global int_txt
         current_text=float((((canvas.itemcget(int_txt, "text")).split("/"))[0])[1:])
         daily_quest_data["Player"]["Int_type"]+=0.5
-        thesystem.misc.dump_ujson("Files/Player Data/Daily_Quest.json", daily_quest_data, indents=4)
+        thesystem.misc.dump_ujson_field("Files/Player Data/Daily_Quest.json", ("Player", "Int_type"), daily_quest_data["Player"]["Int_type"])
         canvas.itemconfig(int_txt, text=f"[{current_text+0.5}/{fl_int}]")
 
     def update_sleep():
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_point.py')])
+        thesystem.audio.play("Point SFX")
         #global sleep_txt
         current_text=int((((canvas.itemcget(sleep_txt, "text")).split("/"))[0])[1:])
         daily_quest_data["Player"]["Sleep"]+=1
-        thesystem.misc.dump_ujson("Files/Player Data/Daily_Quest.json", daily_quest_data, indents=4)
+        thesystem.misc.dump_ujson_field("Files/Player Data/Daily_Quest.json", ("Player", "Sleep"), daily_quest_data["Player"]["Sleep"])
         canvas.itemconfig(sleep_txt, text=f"[{current_text+1}/{fl_slp}]")
 
     canvas.create_text(
@@ -602,25 +603,9 @@ if full_check==False:
 
     step,delay=1,1
 
-    def update_images():
-        global image_index, bot_image_index
-
-        image_index = (image_index + 1) % len(top_preloaded_images)
-        top_img = top_preloaded_images[image_index]
-        canvas.itemconfig(top_image, image=top_img)
-        canvas.top_img = top_img
-
-        bot_image_index = (bot_image_index + 1) % len(bottom_preloaded_images)
-        bot_img = bottom_preloaded_images[bot_image_index]
-        canvas.itemconfig(bottom_image, image=bot_img)
-        canvas.bot_img = bot_img
-
-        window.after(1000 // 24, update_images)
-
     # Start the animation
     if setting_data["Settings"]["Performernce (ANIME):"] != "True":
-        update_thread = threading.Thread(target=update_images)
-        update_thread.start()
+        bar_animator = thesystem.system.BarAnimator(canvas, (top_image, top_preloaded_images), (bottom_image, bottom_preloaded_images))
 
 
     button_image_9 = PhotoImage(
@@ -651,4 +636,4 @@ elif full_check==True:
         with open("Files/Temp Files/Daily Rewards.csv", 'w', newline='') as rew_csv_open:
             rew_fw=csv.writer(rew_csv_open)
             rew_fw.writerow(["Reward"])
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path('Anime Version/Daily Quest Rewards/gui.py')])
\ No newline at end of file
+        thesystem.windows.open_script('Anime Version/Daily Quest Rewards/gui.py')
\ No newline at end of file
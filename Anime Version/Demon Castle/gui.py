@@ -8,7 +8,6 @@ from pathlib import Path
 # Explicit imports to satisfy Flake8
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
 import pyvista as pv
-import subprocess
 import csv
 import ujson
 import cv2
@@ -446,6 +445,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 import thesystem.castle
 import thesystem.misc as misc
 
@@ -554,7 +555,7 @@ bottom_images = f"thesystem/{all_prev}bottom_bar"
 top_preloaded_images = thesystem.system.load_or_cache_images(top_images, (1229, 47), job, type_="top")
 bottom_preloaded_images = thesystem.system.load_or_cache_images(bottom_images, (1229, 47), job, type_="bottom")
 
-subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 thesystem.system.animate_window_open(window, target_height, window_width, step=50, delay=1)
 
@@ -594,7 +595,7 @@ def ex_close(win):
     stop_animation = True
     if setting_data["Settings"]["Performernce (ANIME):"] != "True":
         stop_event.set()
-        update_thread.join()    
+        bar_animator.stop()
     with open("Files/Player Data/Tabs.json",'r') as tab_son:
         tab_son_data=ujson.load(tab_son)
 
@@ -602,7 +603,7 @@ def ex_close(win):
         tab_son_data["Castle"]='Close'
         ujson.dump(tab_son_data,fin_tab_son,indent=4)
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, initial_height, window_width, step=50, delay=1)
 
 def ex_dc_close(win):
@@ -610,7 +611,7 @@ def ex_dc_close(win):
     stop_animation = True
     if setting_data["Settings"]["Performernce (ANIME):"] != "True":
         stop_event.set()
-        update_thread.join()
+        bar_animator.stop()
     with open("Files/Player Data/Tabs.json",'r') as tab_son:
         tab_son_data=ujson.load(tab_son)
 
@@ -618,10 +619,10 @@ def ex_dc_close(win):
         tab_son_data["Castle"]='Close'
         ujson.dump(tab_son_data,fin_tab_son,indent=4)
 
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path('Anime Version/Demon Castle Quest Reminder/gui.py')])
+    thesystem.windows.open_script('Anime Version/Demon Castle Quest Reminder/gui.py')
     
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, initial_height, window_width, step=50, delay=1)
 
 canvas = Canvas(
@@ -646,7 +647,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Anime"][video]
-    preloaded_frames = np.load(video_path)
+    preloaded_frames = thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 478.0, 277.0, pause_duration=1.0)
 
 image_image_2 = PhotoImage(
@@ -1166,28 +1167,9 @@ stop_animation = False
 
 
 
-def update_images():
-    if stop_animation or not canvas.winfo_exists():
-        return
-    
-    global image_index, bot_image_index
-
-    image_index = (image_index + 1) % len(top_preloaded_images)
-    top_img = top_preloaded_images[image_index]
-    canvas.itemconfig(top_image, image=top_img)
-    canvas.top_img = top_img
-
-    bot_image_index = (bot_image_index + 1) % len(bottom_preloaded_images)
-    bot_img = bottom_preloaded_images[bot_image_index]
-    canvas.itemconfig(bottom_image, image=bot_img)
-    canvas.bot_img = bot_img
-
-    window.after(1000 // 24, update_images)
-
 # Start the animation
 if setting_data["Settings"]["Performernce (ANIME):"] != "True":
-    update_thread = threading.Thread(target=update_images)
-    update_thread.start()
+    bar_animator = thesystem.system.BarAnimator(canvas, (top_image, top_preloaded_images), (bottom_image, bottom_preloaded_images))
 
 # ===========================================================
 
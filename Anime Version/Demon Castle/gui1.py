@@ -8,7 +8,6 @@ from pathlib import Path
 # from tkinter import *
 # Explicit imports to satisfy Flake8
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
-import subprocess
 import csv
 import ujson
 from PIL import Image, ImageTk
@@ -19,7 +18,6 @@ import sys
 import os
 import random
 import numpy as np
-from thesystem.misc import resource_path
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -28,6 +26,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 import thesystem.castle
 import thesystem.dungeon
 import thesystem.misc
@@ -73,7 +73,7 @@ bottom_images = f"thesystem/{all_prev}bottom_bar"
 top_preloaded_images = thesystem.system.load_or_cache_images(top_images, (840, 47), job, type_="top")
 bottom_preloaded_images = thesystem.system.load_or_cache_images(bottom_images, (723, 47), job, type_="bottom")
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 thesystem.system.animate_window_open(window, target_height, window_width, step=30, delay=1)
 
@@ -348,12 +348,12 @@ def next():
 
         thesystem.system.get_fin_xp()
         stop_event.set()
-        update_thread.join()
-        subprocess.Popen([sys.executable, resource_path('Anime Version/Demon Castle/gui.py')])
+        bar_animator.stop()
+        thesystem.windows.open_script('Anime Version/Demon Castle/gui.py')
         window.quit()
 
     else:
-        subprocess.Popen([sys.executable, resource_path('Files\Mod\default\sfx_glitch.py')])
+        thesystem.audio.play("Glitch SFX")
         mob_fun()
 
 canvas = Canvas(
@@ -384,7 +384,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Anime"][video]
-    preloaded_frames = np.load(video_path)
+    preloaded_frames = thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 478.0, 277.0, pause_duration=0.6)
 
 image_image_2 = PhotoImage(
@@ -581,25 +581,9 @@ bottom_image = canvas.create_image(
 
 step,delay=1,1
 
-def update_images():
-    global image_index, bot_image_index
-
-    image_index = (image_index + 1) % len(top_preloaded_images)
-    top_img = top_preloaded_images[image_index]
-    canvas.itemconfig(top_image, image=top_img)
-    canvas.top_img = top_img
-
-    bot_image_index = (bot_image_index + 1) % len(bottom_preloaded_images)
-    bot_img = bottom_preloaded_images[bot_image_index]
-    canvas.itemconfig(bottom_image, image=bot_img)
-    canvas.bot_img = bot_img
-
-    window.after(1000 // 24, update_images)
-
 # Start the animation
 if setting_data["Settings"]["Performernce (ANIME):"] != "True":
-    update_thread = threading.Thread(target=update_images)
-    update_thread.start()
+    bar_animator = thesystem.system.BarAnimator(canvas, (top_image, top_preloaded_images), (bottom_image, bottom_preloaded_images))
 
 # ===========================================================
 
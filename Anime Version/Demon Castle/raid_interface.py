@@ -1,13 +1,12 @@
 import tkinter as tk
 from tkinter import ttk
 import time
-import threading
+import math
 import random
 import ujson
 from pathlib import Path
 import sys
 import os
-import subprocess
 from PIL import Image, ImageTk
 
 # --- (Your existing import paths and helper functions remain the same) ---
@@ -16,6 +15,11 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+from thesystem.raid import RaidEngine
+
+# How often the fight clock moves, in ms
+TICK_MS = 250
 
 def load_player_stats():
     try:
@@ -53,8 +57,8 @@ class RaidInterface(tk.Frame):
         style.configure("Player.Horizontal.TProgressbar", foreground='#00FFFF', background='#00FFFF', troughcolor='#004040', bordercolor="#111", lightcolor="#111", darkcolor="#111")
         style.configure("Stagger.Horizontal.TProgressbar", foreground='#FFD700', background='#FFD700', troughcolor='#4A4100', bordercolor="#111", lightcolor="#111", darkcolor="#111")
 
-        self.exercises = {'easy': ['Jumping Jacks', 'Wall Sit', 'Crunches'], 'medium': ['Squats', 'Push-ups', 'Plank'], 'hard': ['Pull-ups', 'Burpees', 'V-Ups']}
-        self.bosses = ['an Orc Warlord', 'a Lich King', 'a Fire Drake', 'a Demon Knight']
+        self.engine = None
+        self._tick_job = None
         self.current_floor = 0
         self.damage_indicator_labels = []
 
@@ -245,202 +249,109 @@ class RaidInterface(tk.Frame):
             self.after(20, shake)
         shake()
 
-    def _generate_raid_data(self, floor_num):
-        self.hazard = None
-        self.current_floor = floor_num
+    def start(self, floor_num):
         stats = load_player_stats()
-        player = stats["status"][0]
+        self.current_floor = floor_num
+        self.engine = RaidEngine(floor_num, stats["status"][0])
         self.battle_is_over = False
-        
-        self.boss_mechanic = None
-        if floor_num == 100:
-            self.current_boss = "Final Demon Lord"
-            self.boss_mechanic = "execute_phase"
-        elif floor_num % 25 == 0:
-            self.current_boss = "Archdemon of Ruin"
-            self.boss_mechanic = "power_charge"
-        elif floor_num % 10 == 0:
-            self.current_boss = "Armored Gatekeeper"
-            self.boss_mechanic = "defensive_stance"
-        else:
-            self.current_boss = random.choice(self.bosses)
-        
-        self.affliction = None
-        if self.current_boss == "Archdemon of Ruin":
-            self.affliction = "timer_burn"
-        elif self.current_boss == "Lich King":
-            self.affliction = "fatigue"
-
-        base_hp = 50 + (floor_num * 15) + round(pow(floor_num, 1.2))
-        self.enemy_max_health = base_hp + (player["level"] * 10)
-        self.enemy_health = self.enemy_max_health
-        self.player_str, self.player_agi, self.player_vit = player["str"], player["agi"], player["vit"]
-        self.player_max_health = 75 + (self.player_vit * 5)
-        self.player_health = self.player_max_health
-        self.stagger_value = 0
-        self.stagger_threshold = self.enemy_max_health * 0.3
-        self.is_staggered = False
-
-        if self.boss_mechanic == "execute_phase":
-            self.boss_phase = 1
-            self.enemy_max_health *= 2
-            self.enemy_health = self.enemy_max_health
-            
-        if 50 <= floor_num <= 74:
-            self.hazard = "unstable_ground"
-
-    def check_for_phase_change(self):
-        if self.boss_mechanic == "execute_phase" and self.boss_phase == 1 and self.enemy_health <= self.enemy_max_health / 2:
-            self.boss_phase = 2
-            self.status_label.config(text="The Demon Lord is ENRAGED! Finish it NOW!")
-            self.timer_label.config(text="EXECUTE!")
-            self.stop_timer_event = threading.Event()
-            threading.Thread(target=self._burn_phase_timer, daemon=True).start()
-            self.start_new_player_turn()
-            return True
-        return False
-
-    def _burn_phase_timer(self):
-        for i in range(60, -1, -1):
-            if self.stop_timer_event.is_set() or self.enemy_health <= 0: return
-            time.sleep(1)
-        if self.enemy_health > 0 and not self.battle_is_over:
-            self.after(0, self.defeat, "You were overwhelmed by the Demon Lord's power.")
-
-    def _hazard_timer(self):
-        while not self.battle_is_over and self.winfo_exists():
-            time.sleep(random.randint(15, 25))
-            if self.battle_is_over: return
-            hazard_damage = round(self.current_floor * 0.5)
-            self.player_health -= hazard_damage
-            self.after(0, self.show_damage_indicator, hazard_damage, False)
-            self.after(0, lambda: self.status_label.config(text=f"The ground shakes! You take {hazard_damage} damage!"))
-            self.after(0, self.update_ui)
-            if self.player_health <= 0:
-                self.after(0, self.defeat, "You succumbed to the hazardous environment.")
-                return
-
-    def start(self, floor_num):
-        self._generate_raid_data(floor_num)
-        if self.hazard == "unstable_ground":
-            threading.Thread(target=self._hazard_timer, daemon=True).start()
-        self.title_label.config(text=f"{self.current_boss.upper()}")
-        self.status_label.config(text=f"You face {self.current_boss}! Choose your attack.")
+        self.title_label.config(text=f"{self.engine.current_boss.upper()}")
+        self.status_label.config(text=f"You face {self.engine.current_boss}! Choose your attack.")
         self.return_button.pack_forget()
         self.complete_move_button.pack_forget()
         self.timer_label.config(text="")
         self.start_new_player_turn()
+        if self._tick_job is not None:
+            self.after_cancel(self._tick_job)
+        self._tick_job = self.after(TICK_MS, self._tick)
+
+    def _tick(self):
+        # One clock drives the hazards, the burn phase and the move's countdown
+        self._tick_job = None
+        if self.engine.over or not self.winfo_exists(): return
+        self.show_events(self.engine.tick(TICK_MS / 1000))
+        if self.engine.chosen_move is not None:
+            self.timer_label.config(text=f"{math.ceil(self.engine.time_left())}")
+        if not self.engine.over:
+            self._tick_job = self.after(TICK_MS, self._tick)
+
+    def show_events(self, events):
+        if not events: return
+        for kind, *values in events:
+            if kind == "hit":
+                damage, glanced = values
+                self.show_damage_indicator(damage, is_player=False)
+                if glanced:
+                    self.status_label.config(text="Your attack glances off its armor!")
+                else:
+                    self.status_label.config(text=f"A direct hit! You dealt {damage} damage!")
+            elif kind == "timeout":
+                self.complete_move_button.pack_forget()
+                self.status_label.config(text="You ran out of time and failed the exercise!")
+            elif kind == "staggered":
+                self.status_label.config(text="STAGGERED! The enemy is vulnerable!")
+            elif kind == "enraged":
+                self.status_label.config(text="The Demon Lord is ENRAGED! Finish it NOW!")
+                self.timer_label.config(text="EXECUTE!")
+            elif kind == "recovered":
+                self.status_label.config(text="The enemy recovered its footing!")
+            elif kind == "enemy_hit":
+                damage, blast = values
+                self.show_damage_indicator(damage, is_player=True)
+                self.screen_shake()
+                self.status_label.config(text=f"The enemy strikes back, dealing {damage} damage!")
+                self.timer_label.config(text="")
+            elif kind == "hazard":
+                damage, = values
+                self.show_damage_indicator(damage, False)
+                self.status_label.config(text=f"The ground shakes! You take {damage} damage!")
+            elif kind == "victory":
+                self.after(1000, self.victory)
+            elif kind == "defeat":
+                _, message, delay = values
+                self.after(int(delay * 1000), self.defeat, message)
+            elif kind == "next":
+                step, delay = values
+                following = self.enemy_turn if step == "enemy" else self.start_new_player_turn
+                self.after(int(delay * 1000), following)
+        choosing = bool(self.engine.moves) and self.engine.chosen_move is None
+        self.update_ui(disable_buttons=not choosing)
 
     def select_move(self, move_index):
-        self.chosen_move = self.available_moves[move_index]
-        self._update_card_ui(disable=True) 
-        
+        self.engine.choose(move_index)
+        self._update_card_ui(disable=True)
+
         selected_card = self.move_cards[move_index]['frame']
         selected_card.config(bg="#00FFFF", relief=tk.SUNKEN)
         for child in selected_card.winfo_children():
             child.config(bg="#00FFFF")
-        
+
         tags = list(selected_card.bindtags())
         tags.insert(1, 'selected')
         selected_card.bindtags(tuple(tags))
-        
+
         self.moves_frame_container.pack_forget()
         self.complete_move_button.pack(pady=20)
-        self.stop_timer_event = threading.Event()
-        threading.Thread(target=self._action_phase, daemon=True).start()
+        move = self.engine.chosen_move
+        self.status_label.config(text=f"Perform {move['reps']} {move['name']}!")
+        self.timer_label.config(text=f"{move['time']}")
 
     def complete_move(self):
-        self.stop_timer_event.set()
         self.resolve_turn(success=True)
 
-    def _action_phase(self):
-        duration = self.chosen_move['time']
-        self.status_label.config(text=f"Perform {self.chosen_move['reps']} {self.chosen_move['name']}!")
-        for i in range(duration, -1, -1):
-            if self.stop_timer_event.is_set(): return
-            if self.winfo_exists(): self.timer_label.config(text=f"{i}")
-            time.sleep(1)
-        if not self.stop_timer_event.is_set():
-            self.after(0, self.resolve_turn, False)
-                
     def resolve_turn(self, success):
         self.complete_move_button.pack_forget()
-        if self.battle_is_over: return
-
-        if success:
-            damage = round(self.chosen_move['reps'] * 1.5) + (self.player_str * 1.5)
-            if self.is_staggered: damage = round(damage * 1.5)
-            self.enemy_health -= damage
-            self.stagger_value += damage
-            self.show_damage_indicator(damage, is_player=False)
-            if hasattr(self, 'is_defending') and self.is_defending:
-                self.status_label.config(text="Your attack glances off its armor!")
-                self.is_defending = False
-            else:
-                self.status_label.config(text=f"A direct hit! You dealt {damage} damage!")
-        else:
-            self.status_label.config(text="You ran out of time and failed the exercise!")
-
-        self.update_ui(disable_buttons=True)
-
-        if self.enemy_health <= 0:
-            self.after(1000, self.victory) 
-            return
-        
-        if self.check_for_phase_change(): return
-
-        if self.stagger_value >= self.stagger_threshold:
-            self.is_staggered = True
-            self.stagger_value = 0
-            self.status_label.config(text="STAGGERED! The enemy is vulnerable!")
-            threading.Timer(1.5, self.start_new_player_turn).start()
-        else:
-            threading.Timer(1.5, self.enemy_turn).start()
+        if self.engine.over: return
+        self.show_events(self.engine.resolve(success))
 
     def enemy_turn(self):
-        if self.battle_is_over or not self.winfo_exists(): return
-        self.player_affliction = None
-        if self.is_staggered:
-            self.is_staggered = False
-            self.status_label.config(text="The enemy recovered its footing!")
-
-        if self.boss_mechanic == "power_charge" and self.enemy_health < self.enemy_max_health / 2:
-            self.status_label.config(text="The Archdemon unleashes a devastating blast!")
-            enemy_attack_power = (self.current_floor * 18)
-            self.boss_mechanic = None
-        else:
-            enemy_attack_power = (self.current_floor * 12)
-        
-        player_defense = self.player_vit / 2
-        final_damage = max(1, round(enemy_attack_power - player_defense) + random.randint(-3, 3))
-        
-        self.player_health -= final_damage
-        self.show_damage_indicator(final_damage, is_player=True) 
-        self.screen_shake()
-
-        self.status_label.config(text=f"The enemy strikes back, dealing {final_damage} damage!")
-        self.timer_label.config(text="")
-        self.update_ui(disable_buttons=True)
-
-        if self.player_health <= 0:
-            threading.Timer(1.5, self.defeat, ["You have been slain."]).start()
-        else:
-            threading.Timer(1.5, self.start_new_player_turn).start()
+        if self.engine.over or not self.winfo_exists(): return
+        self.show_events(self.engine.enemy_turn())
 
     def start_new_player_turn(self):
-        if self.battle_is_over or not self.winfo_exists(): return
+        if self.engine.over or not self.winfo_exists(): return
         self.moves_frame_container.pack(fill=tk.BOTH, expand=True) # Ensure container is visible
         self.status_label.config(text="Choose your next move.")
-        all_exercises = self.exercises['easy'] + self.exercises['medium'] + self.exercises['hard']
-        self.available_moves = []
-        base_reps = random.randint(8, 20)
-        base_time = 45
-        if hasattr(self, 'player_affliction') and self.player_affliction:
-            if self.player_affliction == "fatigue": base_reps = round(base_reps * 1.5)
-            elif self.player_affliction == "timer_burn": base_time = 30
-        for name in random.sample(all_exercises, 3):
-            self.available_moves.append({'name': name, 'reps': base_reps, 'time': base_time})
-        
+        self.available_moves = self.engine.new_turn()
         self.update_ui(disable_buttons=False)
 
     def victory(self):
@@ -449,8 +360,7 @@ class RaidInterface(tk.Frame):
         player = stats["status"][0]
         if self.current_floor > player["highest_floor"]:
             player["highest_floor"] = self.current_floor
-        base_xp = 10 + (self.enemy_max_health // 10)
-        coin_gain = 5 if "Boss" in self.current_boss else 0
+        base_xp, coin_gain = self.engine.rewards()
         player["XP"] += base_xp
         player["coins"] += coin_gain
         player["fatigue"] += 5
@@ -468,19 +378,17 @@ class RaidInterface(tk.Frame):
         self.battle_is_over = True
         for label in self.damage_indicator_labels: label.destroy()
         main_window = self.winfo_toplevel()
-        try:
-            subprocess.Popen([sys.executable, 'First/Game Over/gui.py'])
-        except FileNotFoundError:
-            print("ERROR: 'game_over_screen.py' not found.")
+        thesystem.windows.open_script('First/Game Over/gui.py')
         main_window.destroy()
 
     def update_ui(self, disable_buttons=False):
         if not self.winfo_exists(): return
-        self._animate_progress_bar(self.enemy_health_bar, (self.enemy_health / self.enemy_max_health) * 100)
-        self.enemy_health_label.config(text=f"HP: {max(0, round(self.enemy_health))} / {self.enemy_max_health}")
-        self._animate_progress_bar(self.player_health_bar, (self.player_health / self.player_max_health) * 100)
-        self.player_health_label.config(text=f"HP: {max(0, round(self.player_health))} / {self.player_max_health}")
-        self._animate_progress_bar(self.stagger_bar, (self.stagger_value / self.stagger_threshold) * 100 if self.stagger_threshold > 0 else 0)
+        engine = self.engine
+        self._animate_progress_bar(self.enemy_health_bar, (engine.enemy_health / engine.enemy_max_health) * 100)
+        self.enemy_health_label.config(text=f"HP: {max(0, round(engine.enemy_health))} / {engine.enemy_max_health}")
+        self._animate_progress_bar(self.player_health_bar, (engine.player_health / engine.player_max_health) * 100)
+        self.player_health_label.config(text=f"HP: {max(0, round(engine.player_health))} / {engine.player_max_health}")
+        self._animate_progress_bar(self.stagger_bar, (engine.stagger_value / engine.stagger_threshold) * 100 if engine.stagger_threshold > 0 else 0)
 
         self._update_card_ui(disable=disable_buttons)
 
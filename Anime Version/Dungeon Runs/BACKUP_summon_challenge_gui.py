@@ -21,6 +21,7 @@ sys.path.insert(0, project_root)
 
 import thesystem.dungeon
 import thesystem.system
+import thesystem.audio
 import thesystem.misc
 
 OUTPUT_PATH = Path(__file__).parent
@@ -390,7 +391,7 @@ class DungeonSystem:
         stop_event.set()
         update_thread.join()
         threading.Thread(target=thesystem.system.fade_out, args=(self.window, 0.8)).start()
-        subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+        thesystem.audio.play("Close SFX")
         thesystem.system.animate_window_close(self.window, 0, self.window_width, step=20, delay=1)
         subprocess.Popen([sys.executable, resource_path('Anime Version/Message/gui.py')])
         
@@ -3,7 +3,6 @@ from pathlib import Path
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage, StringVar, Frame, Label, RIGHT, LEFT, X, Y, BOTTOM, TOP, END, NORMAL, HIDDEN, BOTH, VERTICAL, HORIZONTAL, SOLID, Scrollbar
 import ujson
 import csv
-import subprocess
 import random
 import cv2
 from PIL import Image, ImageTk
@@ -15,7 +14,6 @@ import time
 import math
 import json
 import numpy as np
-from thesystem.misc import resource_path
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.abspath(os.path.join(current_dir, '../../'))
@@ -23,7 +21,11 @@ sys.path.insert(0, project_root)
 
 import thesystem.dungeon
 import thesystem.system
+import thesystem.windows
+import thesystem.journal
+import thesystem.audio
 import thesystem.misc
+from thesystem.catalog import catalog
 import thesystem.dungeon
 
 OUTPUT_PATH = Path(__file__).parent
@@ -169,7 +171,7 @@ class DungeonSystem:
             pres_file_data = ujson.load(pres_file)
             self.normal_font_col = pres_file_data["Anime"]["Normal Font Color"]
             video_path = pres_file_data["Anime"][self.video]
-            preloaded_frames = np.load(video_path)
+            preloaded_frames = thesystem.system.load_video_frames(video_path)
         self.player = thesystem.system.FastVideoPlayer(self.canvas, preloaded_frames, 478.0, 213.0)
         
     def create_ui_elements(self):
@@ -362,13 +364,8 @@ class DungeonSystem:
             353.0,
             image=self.bottom_preloaded_images[self.bot_image_index]
         )
-        
-    def update_images(self):
-        self.image_index = (self.image_index + 1) % len(self.top_preloaded_images)
-        self.canvas.itemconfig(self.top_image, image=self.top_preloaded_images[self.image_index])
-        self.bot_image_index = (self.bot_image_index + 1) % len(self.bottom_preloaded_images)
-        self.canvas.itemconfig(self.bottom_image, image=self.bottom_preloaded_images[self.bot_image_index])
-        self.window.after(1000 // 24, self.update_images)
+
+        self.bar_animator = thesystem.system.BarAnimator(self.canvas, (self.top_image, self.top_preloaded_images), (self.bottom_image, self.bottom_preloaded_images))
         
     def start_move(self, event):
         self.lastx = event.x_root
@@ -385,11 +382,11 @@ class DungeonSystem:
         
     def ex_close(self):
         stop_event.set()
-        update_thread.join()
+        self.bar_animator.stop()
         threading.Thread(target=thesystem.system.fade_out, args=(self.window, 0.8)).start()
-        subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+        thesystem.audio.play("Close SFX")
         thesystem.system.animate_window_close(self.window, 0, self.window_width, step=20, delay=1)
-        subprocess.Popen([sys.executable, resource_path('Anime Version/Message/gui.py')])
+        thesystem.windows.open_script('Anime Version/Message/gui.py')
         
     def start_dungeon(self):
         self.hide_activities_and_checkboxes()
@@ -968,6 +965,10 @@ class DungeonSystem:
                     check_fw = csv.writer(check_file)
                     check_fw.writerow(["Instance Reward"])
 
+            reward_scale = 2 if self.type_of_dun == 'Instance' else 1
+            thesystem.journal.record("dungeon", rank=self.rew_rank, type=self.type_of_dun,
+                                     coins=adjusted_coin * reward_scale, str=adjusted_avp * reward_scale,
+                                     int=adjusted_avp * reward_scale)
             thesystem.system.get_fin_xp()
 
             # --- Skill Rune Stone Reward Logic ---
@@ -978,13 +979,9 @@ class DungeonSystem:
                 elif self.rew_rank == 'A':
                     rune_chance = 0.01
                 if rune_chance > 0 and random.random() < rune_chance:
-                    with open("Files/Data/Inventory_List.json", 'r') as inv_list_file:
-                        inv_list = ujson.load(inv_list_file)
-                    # Get all rune stone keys
-                    rune_keys = [k for k, v in inv_list.items() if v[0].get('cat') == 'Rune Stone']
-                    if rune_keys:
-                        chosen_rune = random.choice(rune_keys)
-                        rune_data = inv_list[chosen_rune][0].copy()
+                    chosen_rune = catalog.sample(cat='Rune Stone')
+                    if chosen_rune:
+                        rune_data = catalog.item(chosen_rune)
                         rune_data['qty'] = 1
                         # Load player inventory
                         try:
@@ -1807,6 +1804,4 @@ if __name__ == "__main__":
     window = Tk()
     window.title("Dungeon System")
     app = DungeonSystem(window)
-    update_thread = threading.Thread(target=app.update_images())
-    update_thread.start()
     window.mainloop()
\ No newline at end of file
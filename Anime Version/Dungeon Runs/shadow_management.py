@@ -19,6 +19,7 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.audio
 import thesystem.misc
 
 OUTPUT_PATH = Path(__file__).parent
@@ -93,7 +94,7 @@ window.wm_attributes("-topmost", True)
 top_preloaded_images = thesystem.system.preload_images(top_images, (970, 40))
 bottom_preloaded_images = thesystem.system.preload_images(bottom_images, (970, 40))
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 def start_move(event):
     window.lastx, window.lasty = event.widget.winfo_pointerxy()
@@ -118,7 +119,7 @@ def ex_close():
         tab_son_data["Shadows"] = 'Close'
         ujson.dump(tab_son_data, fin_tab_son, indent=4)
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, initial_height, window_width, step=50, delay=1)
 
 canvas = Canvas(
@@ -17,6 +17,7 @@ sys.path.insert(0, project_root)
 
 import thesystem.dungeon
 import thesystem.system
+import thesystem.audio
 import thesystem.misc
 
 OUTPUT_PATH = Path(__file__).parent
@@ -822,7 +823,7 @@ class ShadowSummonSystem:
             print(f"Error updating Tabs.json: {e}")
             
         threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-        subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+        thesystem.audio.play("Close SFX")
         thesystem.system.animate_window_close(window, initial_height, window_width, step=50, delay=1)
 
 # Shadow Manager class to handle summoned soldiers in dungeons
@@ -11,7 +11,6 @@ from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
 import cv2
 from PIL import Image, ImageTk
 import threading
-import subprocess
 import ujson
 import sys
 import os
@@ -24,6 +23,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 import thesystem.titleequip
 import thesystem.misc
 
@@ -49,10 +50,10 @@ def move_window(event):
 def ex_close(win):
     if setting_data["Settings"]["Performernce (ANIME):"] != "True":
         stop_event.set()
-        update_thread.join()
+        bar_animator.stop()
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_close.py')])
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path('Anime Version/Status Tab/gui.py')])
+    thesystem.audio.play("Close SFX")
+    thesystem.windows.open_script('Anime Version/Status Tab/gui.py')
     thesystem.system.animate_window_close(window, 0, window_width, step=20, delay=1)
 
 
@@ -179,7 +180,7 @@ bottom_images = f"thesystem/{all_prev}bottom_bar"
 top_preloaded_images = thesystem.system.load_or_cache_images(top_images, (580, 38), job, type_="top")
 bottom_preloaded_images = thesystem.system.load_or_cache_images(bottom_images, (580, 33), job, type_="bottom")
 
-subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 canvas = Canvas(
     window,
@@ -204,7 +205,7 @@ with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     normal_font_col=pres_file_data["Anime"]["Normal Font Color"]
     video_path=pres_file_data["Anime"][video]
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 277.0, 350.0, resize_factor=1, pause_duration=0.4)
 
 image_image_2 = PhotoImage(
@@ -572,25 +573,9 @@ bottom_image = canvas.create_image(
 
 step,delay=1,1
 
-def update_images():
-    global image_index, bot_image_index
-
-    image_index = (image_index + 1) % len(top_preloaded_images)
-    top_img = top_preloaded_images[image_index]
-    canvas.itemconfig(top_image, image=top_img)
-    canvas.top_img = top_img
-
-    bot_image_index = (bot_image_index + 1) % len(bottom_preloaded_images)
-    bot_img = bottom_preloaded_images[bot_image_index]
-    canvas.itemconfig(bottom_image, image=bot_img)
-    canvas.bot_img = bot_img
-
-    window.after(1000 // 24, update_images)
-
 # Start the animation
 if setting_data["Settings"]["Performernce (ANIME):"] != "True":
-    update_thread = threading.Thread(target=update_images)
-    update_thread.start()
+    bar_animator = thesystem.system.BarAnimator(canvas, (top_image, top_preloaded_images), (bottom_image, bottom_preloaded_images))
 
 # =================================================================================================
 
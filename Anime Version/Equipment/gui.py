@@ -10,7 +10,6 @@ from pathlib import Path
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
 import csv
 import ujson
-import subprocess
 import threading
 import cv2
 from PIL import Image, ImageTk
@@ -26,9 +25,10 @@ sys.path.insert(0, project_root)
 
 import thesystem.equipmentbk
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 import thesystem.inventory
 import thesystem.equipmentbk as equipment
-from thesystem.misc import resource_path
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame0")
@@ -87,7 +87,7 @@ bottom_images = f"thesystem/{all_prev}bottom_bar"
 top_preloaded_images = thesystem.system.load_or_cache_images(top_images, (970, 40), job, type_="top")
 bottom_preloaded_images = thesystem.system.load_or_cache_images(bottom_images, (970, 40), job, type_="bottom")
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 def start_move(event):
     window.lastx, window.lasty = event.widget.winfo_pointerxy()
@@ -104,7 +104,7 @@ def move_window(event):
 def ex_close():
     if setting_data["Settings"]["Performernce (ANIME):"] != "True":
         stop_event.set()
-        update_thread.join()
+        bar_animator.stop()
     with open("Files/Player Data/Tabs.json",'r') as tab_son:
         tab_son_data=ujson.load(tab_son)
 
@@ -115,7 +115,7 @@ def ex_close():
             ujson.dump(tab_son_data,fin_tab_son,indent=4)
 
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, 0, window_width, step=20, delay=1)
 
 def split_text(text, segment_length):
@@ -145,12 +145,12 @@ def open_select(cat):
     fw.writerow(rec)
     fout.close()
 
-    subprocess.Popen([sys.executable, resource_path('Anime Version/Equip Item/gui.py')])
+    thesystem.windows.open_script('Anime Version/Equip Item/gui.py')
 
     ex_close()
 
 def set_effect_open():
-    subprocess.Popen([sys.executable, resource_path('Anime Version/Set Effects/gui.py')])
+    thesystem.windows.open_script('Anime Version/Set Effects/gui.py')
 
 canvas = Canvas(
     window,
@@ -174,7 +174,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Anime"][video]
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 478.0, 277.0, pause_duration=0.3)
 
 image_image_2 = PhotoImage(
@@ -893,25 +893,9 @@ bottom_image = canvas.create_image(
 
 step,delay=1,1
 
-def update_images():
-    global image_index, bot_image_index
-
-    image_index = (image_index + 1) % len(top_preloaded_images)
-    top_img = top_preloaded_images[image_index]
-    canvas.itemconfig(top_image, image=top_img)
-    canvas.top_img = top_img
-
-    bot_image_index = (bot_image_index + 1) % len(bottom_preloaded_images)
-    bot_img = bottom_preloaded_images[bot_image_index]
-    canvas.itemconfig(bottom_image, image=bot_img)
-    canvas.bot_img = bot_img
-
-    window.after(1000 // 24, update_images)
-
 # Start the animation
 if setting_data["Settings"]["Performernce (ANIME):"] != "True":
-    update_thread = threading.Thread(target=update_images)
-    update_thread.start()
+    bar_animator = thesystem.system.BarAnimator(canvas, (top_image, top_preloaded_images), (bottom_image, bottom_preloaded_images))
 
 # ===========================================================
 
@@ -29,6 +29,7 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.audio
 import thesystem.misc
 
 
@@ -85,7 +86,7 @@ bottom_images = f"thesystem/{all_prev}bottom_bar"
 top_preloaded_images = thesystem.system.load_or_cache_images(top_images, (400, 19), job, type_="top")
 bottom_preloaded_images = thesystem.system.load_or_cache_images(bottom_images, (400, 16), job, type_="bottom")
 
-subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 def start_move(event):
     window.lastx, window.lasty = event.widget.winfo_pointerxy()
@@ -100,7 +101,7 @@ def move_window(event):
 
 def ex_close(win=0):
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, initial_height, window_width, step=35, delay=1)
 
 last_val=0
@@ -117,16 +118,16 @@ def fatigue_return():
         fatigue_max=stat_data["status"][0]["fatigue_max"]
         fatigue_percent=int((fatigue/fatigue_max)*100)
         if (last_val!=fatigue_percent) and (fatigue_percent<70):
-            subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_point.py')])
+            thesystem.audio.play("Point SFX")
         elif (fatigue_percent>=70 and fatigue_percent<90) and warn1==False:
-            subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_error.py')])
+            thesystem.audio.play("Error SFX")
             canvas.itemconfig(fat_val, fill="#FF0000")
             warn1=True
         elif (fatigue_percent>=70 and fatigue_percent<90):
-            subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_point.py')])
+            thesystem.audio.play("Point SFX")
             canvas.itemconfig(fat_val, fill="#FF0000")
         elif fatigue_percent>=90:
-            subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_error.py')])
+            thesystem.audio.play("Error SFX")
             canvas.itemconfig(fat_val, fill="#FF0000")
         
         last_val=fatigue_percent
@@ -157,7 +158,7 @@ with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     normal_font_col=pres_file_data["Anime"]["Normal Font Color"]
     video_path=pres_file_data["Anime"][video]
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 478.0, 330.0, resize_factor=0.8, pause_duration=0.5)
 
 image_image_2 = PhotoImage(
@@ -236,21 +237,6 @@ bottom_image = canvas.create_image(
 
 step,delay=1,1
 
-def update_images():
-    global image_index, bot_image_index
-
-    image_index = (image_index + 1) % len(top_preloaded_images)
-    top_img = top_preloaded_images[image_index]
-    canvas.itemconfig(top_image, image=top_img)
-    canvas.top_img = top_img
-
-    bot_image_index = (bot_image_index + 1) % len(bottom_preloaded_images)
-    bot_img = bottom_preloaded_images[bot_image_index]
-    canvas.itemconfig(bottom_image, image=bot_img)
-    canvas.bot_img = bot_img
-
-    window.after(1000 // 24, update_images)
-
 canvas_height = canvas.winfo_reqheight()
 
 y_center = canvas_height / 2
@@ -284,22 +270,7 @@ image_7 = canvas.create_image(
 canvas.tag_bind(image_7, "<ButtonPress-1>", lambda event: ex_close(window))
 
 
-def update_images():
-    global image_index, bot_image_index
-
-    image_index = (image_index + 1) % len(top_preloaded_images)
-    top_img = top_preloaded_images[image_index]
-    canvas.itemconfig(top_image, image=top_img)
-    canvas.top_img = top_img
-
-    bot_image_index = (bot_image_index + 1) % len(bottom_preloaded_images)
-    bot_img = bottom_preloaded_images[bot_image_index]
-    canvas.itemconfig(bottom_image, image=bot_img)
-    canvas.bot_img = bot_img
-
-    window.after(1000 // 24, update_images)
-
-update_images()
+bar_animator = thesystem.system.BarAnimator(canvas, (top_image, top_preloaded_images), (bottom_image, bottom_preloaded_images))
 
 update_thread = threading.Thread(target=fatigue_return, daemon=True)
 update_thread.start()
@@ -7,7 +7,6 @@ from pathlib import Path
 # from tkinter import *
 # Explicit imports to satisfy Flake8
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
-import subprocess
 import csv
 import ujson
 import cv2
@@ -27,10 +26,12 @@ sys.path.insert(0, project_root)
 import thesystem.equipmentbk
 import thesystem.misc
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 import thesystem.equipmentbk as equipment
 import thesystem.inventory
+from thesystem.catalog import catalog
 import thesystem.itemequip
-from thesystem.misc import resource_path
 
 
 window = Tk()
@@ -77,7 +78,7 @@ bottom_images = f"thesystem/{all_prev}bottom_bar"
 top_preloaded_images = thesystem.system.load_or_cache_images(top_images, (957, 43), job, type_="top")
 bottom_preloaded_images = thesystem.system.load_or_cache_images(bottom_images, (1026, 47), job, type_="bottom")
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 debuff_1_name=''
 debuff_2_name=''
@@ -108,10 +109,10 @@ def move_window(event):
 def ex_close(win):
     if setting_data["Settings"]["Performernce (ANIME):"] != "True":
         stop_event.set()
-        update_thread.join()
+        bar_animator.stop()
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
-    subprocess.Popen([sys.executable, resource_path('Anime Version/Inventory/gui.py')])
+    thesystem.audio.play("Close SFX")
+    thesystem.windows.open_script('Anime Version/Inventory/gui.py')
     thesystem.system.animate_window_close(window, 0, window_width, step=20, delay=1)
 
 typs='Item'
@@ -138,9 +139,8 @@ if typs=='Item':
         dat_keys=list(data.keys())
 
 elif typs=='Preview':
-    with open("Files/Data/Inventory_List.json", 'r') as fson:
-        data=ujson.load(fson)
-        dat_keys=list(data.keys())
+    data=catalog.listing()
+    dat_keys=list(data.keys())
 
 item_full_data={}
 
@@ -202,7 +202,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Anime"][video]
-    prealoaded_frames=np.load(video_path)
+    prealoaded_frames=thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, prealoaded_frames, 478.0, 277.0, pause_duration=0.4)
 
 image_image_2 = PhotoImage(
@@ -564,25 +564,9 @@ bottom_image = canvas.create_image(
 
 step,delay=1,1
 
-def update_images():
-    global image_index, bot_image_index
-
-    image_index = (image_index + 1) % len(top_preloaded_images)
-    top_img = top_preloaded_images[image_index]
-    canvas.itemconfig(top_image, image=top_img)
-    canvas.top_img = top_img
-
-    bot_image_index = (bot_image_index + 1) % len(bottom_preloaded_images)
-    bot_img = bottom_preloaded_images[bot_image_index]
-    canvas.itemconfig(bottom_image, image=bot_img)
-    canvas.bot_img = bot_img
-
-    window.after(1000 // 24, update_images)
-
 # Start the animation
 if setting_data["Settings"]["Performernce (ANIME):"] != "True":
-    update_thread = threading.Thread(target=update_images)
-    update_thread.start()
+    bar_animator = thesystem.system.BarAnimator(canvas, (top_image, top_preloaded_images), (bottom_image, bottom_preloaded_images))
 
 window.resizable(False, False)
 window.mainloop()
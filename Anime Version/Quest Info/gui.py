@@ -10,7 +10,6 @@ from pathlib import Path
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
 import ujson
 import csv
-import subprocess
 import cv2
 import threading
 from PIL import Image, ImageTk
@@ -26,7 +25,8 @@ sys.path.insert(0, project_root)
 
 import thesystem.quests
 import thesystem.system
-from thesystem.misc import resource_path
+import thesystem.windows
+import thesystem.audio
 
 window = Tk()
 
@@ -63,7 +63,7 @@ bottom_images = f"thesystem/{all_prev}bottom_bar"
 top_preloaded_images = thesystem.system.load_or_cache_images(top_images, (957, 43), job, type_="top")
 bottom_preloaded_images = thesystem.system.load_or_cache_images(bottom_images, (1026, 47), job, type_="bottom")
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 window.configure(bg = transp_clr)
 set_data=thesystem.misc.return_settings()
@@ -87,7 +87,7 @@ def move_window(event):
 
 def ex_close(win):
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, initial_height, window_width, step=50, delay=1)
 
 
@@ -133,7 +133,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Anime"][video]
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 478.0, 277.0, pause_duration=0.5)
 
 image_image_2 = PhotoImage(
@@ -635,7 +635,7 @@ elif typeof == "Common":
         with open("Files/Temp Files/Quest Reminder.csv", 'w', newline='') as csv_open:
             writer=csv.writer(csv_open)
             writer.writerow([name, ex_tr_txt])
-        subprocess.Popen([sys.executable, resource_path("Anime Version/Quest Reminder/gui.py")])
+        thesystem.windows.open_script("Anime Version/Quest Reminder/gui.py")
         ex_close(0)
     
     with open("Files/Player Data/Active_Quests.json", 'r') as fson:
@@ -692,7 +692,7 @@ elif typeof == "Common":
         ex_tr_txt=canvas.itemcget(ex_txt, "text")
         new_1=int(ex_tr_txt)+1
         be_new_1=f"{new_1}"
-        subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_point.py')])
+        thesystem.audio.play("Point SFX")
         canvas.itemconfig(ex_txt, text=be_new_1)
         
 
@@ -1534,24 +1534,9 @@ bottom_image = canvas.create_image(
 
 step,delay=1,1
 
-def update_images():
-    global image_index, bot_image_index
-
-    image_index = (image_index + 1) % len(top_preloaded_images)
-    top_img = top_preloaded_images[image_index]
-    canvas.itemconfig(top_image, image=top_img)
-    canvas.top_img = top_img
-
-    bot_image_index = (bot_image_index + 1) % len(bottom_preloaded_images)
-    bot_img = bottom_preloaded_images[bot_image_index]
-    canvas.itemconfig(bottom_image, image=bot_img)
-    canvas.bot_img = bot_img
-
-    window.after(1000 // 24, update_images)
-
 # Start the animation
 if setting_data["Settings"]["Performernce (ANIME):"] != "True":
-    update_images()
+    bar_animator = thesystem.system.BarAnimator(canvas, (top_image, top_preloaded_images), (bottom_image, bottom_preloaded_images))
 
 window.resizable(False, False)
 window.mainloop()
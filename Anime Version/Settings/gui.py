@@ -10,7 +10,6 @@ from pathlib import Path
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage, Checkbutton, IntVar, ttk, StringVar
 import ujson
 import csv
-import subprocess
 import threading
 from PIL import Image, ImageTk
 from datetime import datetime, timedelta
@@ -26,8 +25,9 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 import thesystem.settings as settings
-from thesystem.misc import resource_path
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame0")
@@ -85,7 +85,7 @@ bottom_images = f"thesystem/{all_prev}bottom_bar"
 top_preloaded_images = thesystem.system.load_or_cache_images(top_images, (490, 34), job, type_="top")
 bottom_preloaded_images = thesystem.system.load_or_cache_images(bottom_images, (490, 34), job, type_="bottom")
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 checkbox_var0 = IntVar(value=0)
 checkbox_var2 = IntVar(value=0)
@@ -139,7 +139,7 @@ def is_valid_decimal_non(new_value):
 def ex_close(win):
     if setting_data["Settings"]["Performernce (ANIME):"] != "True":
         stop_event.set()
-        update_thread.join()
+        bar_animator.stop()
     with open("Files/Player Data/Tabs.json",'r') as tab_son:
         tab_son_data=ujson.load(tab_son)
 
@@ -147,7 +147,7 @@ def ex_close(win):
         tab_son_data["Settings"]='Close'
         ujson.dump(tab_son_data,fin_tab_son,indent=4)
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, initial_height, window_width, step=20, delay=1)
 
 def theme_open():
@@ -155,7 +155,7 @@ def theme_open():
         fw=csv.writer(info_open)
         fw.writerow(["True"])
         
-    subprocess.Popen([sys.executable, resource_path('First/Theme Check/gui.py')])
+    thesystem.windows.open_script('First/Theme Check/gui.py')
     ex_close(window)
 
 def info_open():
@@ -163,7 +163,7 @@ def info_open():
         fw=csv.writer(info_open)
         fw.writerow(["True"])
 
-    subprocess.Popen([sys.executable, resource_path('First/Info/gui.py')])
+    thesystem.windows.open_script('First/Info/gui.py')
     ex_close(window)
 
 def dailys_open():
@@ -171,7 +171,7 @@ def dailys_open():
         fw=csv.writer(info_open)
         fw.writerow(["True"])
 
-    subprocess.Popen([sys.executable, resource_path('First/Daily Quest Tweak/gui.py')])
+    thesystem.windows.open_script('First/Daily Quest Tweak/gui.py')
     ex_close(window)
 
 def penalty_open():
@@ -179,11 +179,11 @@ def penalty_open():
         fw=csv.writer(info_open)
         fw.writerow(["True"])
 
-    subprocess.Popen([sys.executable, resource_path('First/Penalty Tweak/gui.py')])
+    thesystem.windows.open_script('First/Penalty Tweak/gui.py')
     ex_close(window)
 
 def apply_changes():
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_button.py')])
+    thesystem.audio.play("Button SFX")
     with open("Files/Player Data/Settings.json", 'r') as settings_open:
         setting_data=ujson.load(settings_open)
     setting_data["Settings"]["Transparency"] = float(entry_3.get())
@@ -219,7 +219,7 @@ with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     normal_font_col=pres_file_data["Anime"]["Normal Font Color"]
     video_path=pres_file_data["Anime"][video]
-    preloaded_frames = np.load(video_path)
+    preloaded_frames = thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 478.0, 330.0, resize_factor=0.8, pause_duration=0.3)
 
 image_image_2 = PhotoImage(
@@ -366,25 +366,9 @@ bottom_image = canvas.create_image(
 
 step,delay=1,1
 
-def update_images():
-    global image_index, bot_image_index
-
-    image_index = (image_index + 1) % len(top_preloaded_images)
-    top_img = top_preloaded_images[image_index]
-    canvas.itemconfig(top_image, image=top_img)
-    canvas.top_img = top_img
-
-    bot_image_index = (bot_image_index + 1) % len(bottom_preloaded_images)
-    bot_img = bottom_preloaded_images[bot_image_index]
-    canvas.itemconfig(bottom_image, image=bot_img)
-    canvas.bot_img = bot_img
-
-    window.after(1000 // 24, update_images)
-
 # Start the animation
 if setting_data["Settings"]["Performernce (ANIME):"] != "True":
-    update_thread = threading.Thread(target=update_images)
-    update_thread.start()
+    bar_animator = thesystem.system.BarAnimator(canvas, (top_image, top_preloaded_images), (bottom_image, bottom_preloaded_images))
 
 # =================================================================
 
@@ -10,7 +10,6 @@ from pathlib import Path
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
 import ujson
 import csv
-import subprocess
 import threading
 import cv2
 from PIL import Image, ImageTk
@@ -25,7 +24,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
-from thesystem.misc import resource_path
+import thesystem.windows
+import thesystem.audio
 
 check=False
 
@@ -82,7 +82,7 @@ bottom_images = f"thesystem/{all_prev}bottom_bar"
 top_preloaded_images = thesystem.system.load_or_cache_images(top_images, (957, 43), job, type_="top")
 bottom_preloaded_images = thesystem.system.load_or_cache_images(bottom_images, (1026, 47), job, type_="bottom")
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 def start_move(event):
     window.lastx, window.lasty = event.widget.winfo_pointerxy()
@@ -98,7 +98,7 @@ def move_window(event):
 def ex_close(win):
     if setting_data["Settings"]["Performernce (ANIME):"] != "True":
         stop_event.set()
-        update_thread.join()
+        bar_animator.stop()
     thesystem.system.animate_window_open(window, target_height, window_width, step=25, delay=1)
 
 with open("Files/Temp Files/Skill Temp.csv", 'r') as csv_open:
@@ -254,13 +254,13 @@ def delete():
     with open("Files/Player Data/Skill.json", 'w') as fols:
         ujson.dump(skills, fols, indent=6)
 
-    subprocess.Popen([sys.executable, resource_path('Anime Version/Skills Tab/gui.py')])
+    thesystem.windows.open_script('Anime Version/Skills Tab/gui.py')
 
     window.quit()
 
 def update():
     if lvl!="MAX":
-        subprocess.Popen([sys.executable, resource_path('Anime Version/Skill Info/gui1.py')])
+        thesystem.windows.open_script('Anime Version/Skill Info/gui1.py')
 
         window.quit()
 
@@ -379,7 +379,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Anime"][video]  # Replace with your video path
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 450.0, 277.0, pause_duration=0.4)
 
 image_image_2 = PhotoImage(
@@ -516,7 +516,7 @@ button_1 = Button(
     image=button_image_1,
     borderwidth=0,
     highlightthickness=0,
-    command=lambda: (subprocess.Popen([sys.executable, resource_path('Anime Version/Skills Tab/gui.py')]),window.quit()),
+    command=lambda: (thesystem.windows.open_script('Anime Version/Skills Tab/gui.py'),window.quit()),
     relief="flat"
 )
 button_1.place(
@@ -672,25 +672,9 @@ bottom_image = canvas.create_image(
 )
 step,delay=1,1
 
-def update_images():
-    global image_index, bot_image_index
-
-    image_index = (image_index + 1) % len(top_preloaded_images)
-    top_img = top_preloaded_images[image_index]
-    canvas.itemconfig(top_image, image=top_img)
-    canvas.top_img = top_img
-
-    bot_image_index = (bot_image_index + 1) % len(bottom_preloaded_images)
-    bot_img = bottom_preloaded_images[bot_image_index]
-    canvas.itemconfig(bottom_image, image=bot_img)
-    canvas.bot_img = bot_img
-
-    window.after(1000 // 24, update_images)
-
 # Start the animation
 if setting_data["Settings"]["Performernce (ANIME):"] != "True":
-    update_thread = threading.Thread(target=update_images)
-    update_thread.start()
+    bar_animator = thesystem.system.BarAnimator(canvas, (top_image, top_preloaded_images), (bottom_image, bottom_preloaded_images))
 
 # ! ============================================================
 window.resizable(False, False)
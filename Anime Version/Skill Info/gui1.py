@@ -10,7 +10,6 @@ from pathlib import Path
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
 import csv
 import ujson
-import subprocess
 import cv2
 from PIL import Image, ImageTk
 import sys
@@ -23,8 +22,9 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 import thesystem.misc as misc
-from thesystem.misc import resource_path
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame1")
@@ -41,7 +41,7 @@ def up():
     screen_tr_txt=canvas_1.itemcget(screen_txt, "text")
     av_tr_txt=canvas_1.itemcget(av_txt, "text")
     if int(av_tr_txt)!=0:
-        subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_point.py')])
+        thesystem.audio.play("Point SFX")
         new=int(screen_tr_txt)+1
         be_new=f"{new:03d}"
         canvas_1.itemconfig(screen_txt, text=be_new)
@@ -56,7 +56,7 @@ def down():
     screen_tr_txt=canvas_1.itemcget(screen_txt, "text")
     av_tr_txt=canvas_1.itemcget(av_txt, "text")
     if int(screen_tr_txt)!=0:
-        subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_point.py')])
+        thesystem.audio.play("Point SFX")
         new=int(screen_tr_txt)-1
         be_new=f"{new:03d}"
         canvas_1.itemconfig(screen_txt, text=be_new)
@@ -100,16 +100,16 @@ def confirm():
     with open("Files/Player Data/Skill.json", 'w') as fin_skill:
         ujson.dump(data_main, fin_skill, indent=6)
 
-    subprocess.Popen([sys.executable, resource_path('Anime Version/Skill Info/gui.py')])
+    thesystem.windows.open_script('Anime Version/Skill Info/gui.py')
 
     window.quit()
 
 def goback():
-    subprocess.Popen([sys.executable, resource_path('Anime Version/Skill Info/gui.py')])
+    thesystem.windows.open_script('Anime Version/Skill Info/gui.py')
 
     window.quit()
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 window = Tk()
 
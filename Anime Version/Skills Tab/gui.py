@@ -11,7 +11,6 @@ from pathlib import Path
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
 import ujson
 import csv
-import subprocess
 import threading
 import cv2
 from PIL import Image, ImageTk
@@ -26,7 +25,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
-from thesystem.misc import resource_path
+import thesystem.windows
+import thesystem.audio
 
 
 OUTPUT_PATH = Path(__file__).parent
@@ -52,7 +52,7 @@ def ex_close(win):
         tab_son_data["Skill"]='Close'
         ujson.dump(tab_son_data,fin_tab_son,indent=4)
     thesystem.system.animate_window_close(window, target_height, window_width, step=40, delay=1)
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     win.quit()
 
 stop_event=threading.Event()
@@ -95,7 +95,7 @@ top_preloaded_images = thesystem.system.load_or_cache_images(top_images, (488, 3
 bottom_preloaded_images = thesystem.system.load_or_cache_images(bottom_images, (609, 33), job, type_="bottom")
 
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 presets_data = thesystem.misc.load_ujson("Files/Mod/presets.json")
 
@@ -130,7 +130,7 @@ image_1 = canvas.create_image(
 )
 
 canvas.create_image(430.0, 363.0, image=PhotoImage(file=relative_to_assets("image_1.png")))
-player = thesystem.system.FastVideoPlayer(canvas, np.load(presets_data["Anime"][video]), 430.0, 363.0, resize_factor=0.3, pause_duration=0.7)
+player = thesystem.system.FastVideoPlayer(canvas, thesystem.system.load_video_frames(presets_data["Anime"][video]), 430.0, 363.0, resize_factor=0.3, pause_duration=0.7)
 
 image_image_2 = PhotoImage(
     file=relative_to_assets("image_2.png"))
@@ -179,7 +179,7 @@ def open_prog(name):
             rec=[name]
             fw.writerow(rec)
 
-        subprocess.Popen([sys.executable, resource_path('Anime Version/Skill Info/gui.py')])
+        thesystem.windows.open_script('Anime Version/Skill Info/gui.py')
 
         ex_close(window)
 
@@ -936,24 +936,8 @@ bottom_image = canvas.create_image(
 
 step,delay=1,1
 
-def update_images():
-    global image_index, bot_image_index
-
-    image_index = (image_index + 1) % len(top_preloaded_images)
-    top_img = top_preloaded_images[image_index]
-    canvas.itemconfig(top_image, image=top_img)
-    canvas.top_img = top_img
-
-    bot_image_index = (bot_image_index + 1) % len(bottom_preloaded_images)
-    bot_img = bottom_preloaded_images[bot_image_index]
-    canvas.itemconfig(bottom_image, image=bot_img)
-    canvas.bot_img = bot_img
-
-    window.after(1000 // 24, update_images)
-
 if setting_data["Settings"]["Performernce (ANIME):"] != "True":
-    update_thread = threading.Thread(target=update_images)
-    update_thread.start()
+    bar_animator = thesystem.system.BarAnimator(canvas, (top_image, top_preloaded_images), (bottom_image, bottom_preloaded_images))
 
 button_image_1 = PhotoImage(
     file=relative_to_assets("button_1.png"))
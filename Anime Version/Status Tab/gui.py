@@ -27,6 +27,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 import thesystem.misc
 
 OUTPUT_PATH = Path(__file__).parent
@@ -77,7 +79,7 @@ top_preloaded_images = thesystem.system.load_or_cache_images(top_images, (488, 3
 bottom_preloaded_images = thesystem.system.load_or_cache_images(bottom_images, (609, 33), job, type_="bottom")
 
 
-subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 presets_data = thesystem.misc.load_ujson("Files/Mod/presets.json")
 
@@ -86,7 +88,7 @@ status_data = thesystem.misc.load_ujson("Files/Player Data/Status.json")
 job_data = thesystem.misc.load_ujson("Files/Player Data/Job_info.json")
 
 def title_chng(event):
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path('Anime Version/Equip Title/gui.py')])
+    thesystem.windows.open_script('Anime Version/Equip Title/gui.py')
 
     ex_close(0)
 
@@ -114,7 +116,7 @@ def update_fatigue_text(canvas, fatigue_val):
         # Update canvas text only if fatigue value has changed
         if current_fatigue_percent != loaded_fatigue_value:
             canvas.itemconfig(fatigue_val, text=f"{current_fatigue_percent}%")
-            subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_point.py')])
+            thesystem.audio.play("Point SFX")
             loaded_fatigue_value = current_fatigue_percent
 
         # Wait for 3 minutes before updating again
@@ -151,11 +153,11 @@ def update_tabs_ujson(status='Open'):
 def ex_close(event=None):
     update_tabs_ujson('Close')
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     stop_update_thread_func()
     if setting_data["Settings"]["Performernce (ANIME):"] != "True":
         stop_event.set()
-        update_thread.join()
+        bar_animator.stop()
     # Create a thread and start it
     close_thread = threading.Thread(target=animate_close, daemon=True)
     close_thread.start()
@@ -180,8 +182,8 @@ canvas = Canvas(window, bg="#FFFFFF", height=716, width=488, bd=0, highlightthic
 canvas.place(x=0, y=0)
 
 def fatigue_window():
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_button.py')])
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path('Anime Version/Fatigue/gui.py')])
+    thesystem.audio.play("Button SFX")
+    thesystem.windows.open_script('Anime Version/Fatigue/gui.py')
 
 def start_move(event):
     window.lastx, window.lasty = event.widget.winfo_pointerxy()
@@ -197,7 +199,7 @@ def move_window(event):
 
 # Background image and character attributes
 canvas.create_image(430.0, 363.0, image=PhotoImage(file=relative_to_assets("image_1.png")))
-player = thesystem.system.FastVideoPlayer(canvas, np.load(presets_data["Anime"][video]), 430.0, 363.0, resize_factor=0.3, pause_duration=0.7)
+player = thesystem.system.FastVideoPlayer(canvas, thesystem.system.load_video_frames(presets_data["Anime"][video]), 430.0, 363.0, resize_factor=0.3, pause_duration=0.7)
 
 # Display Character Status
 name, hp, mp, lvl = status_data["status"][0]["name"].upper(), status_data["status"][0]["hp"], status_data["status"][0]["mp"], status_data["status"][0]["level"]
@@ -270,7 +272,7 @@ fin_xp=round(fin_list[1], 2)
 
 if re_check==True:
     try:
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path("Anime Version/Status Tab/gui.py")])
+        thesystem.windows.open_script("Anime Version/Status Tab/gui.py")
         
         ex_close(0)
     except:
@@ -287,7 +289,7 @@ def update_stat(stat_name):
             status_data["status"][0][stat_name] += 1
             val=status_data["status"][0][stat_name]
             canvas.itemconfig(stat_text_widgets[stat_name], text=f"{val:03d}")
-            subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_point.py')])
+            thesystem.audio.play("Point SFX")
             status_data["avail_eq"][0]["str_based" if stat_name in ["str", "agi", "vit"] else "int_based"] -= 1
             if stat_name=='vit':
                 status_data["status"][0]["fatigue_max"]+=20
@@ -304,7 +306,7 @@ def update_stat(stat_name):
         with open("Files/Temp Files/Urgent Temp.csv", 'w', newline='') as urgent_file:
             fr=csv.writer(urgent_file)
             fr.writerow([stat_name.upper()])
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path('Anime Version/Urgent Quest/gui.py')])
+        thesystem.windows.open_script('Anime Version/Urgent Quest/gui.py')
         ex_close(0)
 
 stat_buttons = {
@@ -684,24 +686,8 @@ bottom_image = canvas.create_image(
 
 step,delay=1,1
 
-def update_images():
-    global image_index, bot_image_index
-
-    image_index = (image_index + 1) % len(top_preloaded_images)
-    top_img = top_preloaded_images[image_index]
-    canvas.itemconfig(top_image, image=top_img)
-    canvas.top_img = top_img
-
-    bot_image_index = (bot_image_index + 1) % len(bottom_preloaded_images)
-    bot_img = bottom_preloaded_images[bot_image_index]
-    canvas.itemconfig(bottom_image, image=bot_img)
-    canvas.bot_img = bot_img
-
-    window.after(1000 // 24, update_images)
-
 if setting_data["Settings"]["Performernce (ANIME):"] != "True":
-    update_thread = threading.Thread(target=update_images)
-    update_thread.start()
+    bar_animator = thesystem.system.BarAnimator(canvas, (top_image, top_preloaded_images), (bottom_image, bottom_preloaded_images))
 
 # ===========================================================
 
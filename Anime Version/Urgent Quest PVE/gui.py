@@ -26,6 +26,7 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.audio
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame0")
@@ -59,7 +60,7 @@ def ex_close(win):
         update_thread.join()
     thesystem.misc.update_screen("Daily","Close")
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, 0, window_width, step=30, delay=1)
 
 def split_description(desc_full):
@@ -124,7 +125,7 @@ thesystem.system.animate_window_open(window, target_height, window_width, step=5
 top_preloaded_images = thesystem.system.preload_images(top_images, (488, 38))
 bottom_preloaded_images = thesystem.system.preload_images(bottom_images, (488, 33))
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 window.configure(bg = "#FFFFFF")
 set_data=thesystem.misc.return_settings()
@@ -1,13 +1,13 @@
 from pathlib import Path
 from tkinter import Tk, Canvas, PhotoImage
-import subprocess
 from datetime import datetime, timedelta, date
 import cv2
 from PIL import Image, ImageTk
 import time
 import ujson
-import sys
 import os
+import thesystem.audio
+import thesystem.windows
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\\frame0")
@@ -20,7 +20,7 @@ window = Tk()
 
 # Configure the window
 window.geometry("1272x718")
-subprocess.Popen([sys.executable, resource_path('Files\Mod\default\sfx_glitch.py')])
+thesystem.audio.play("Glitch SFX")
 
 window.configure(bg="#000000")
 window.wm_attributes("-topmost", True)
@@ -62,7 +62,7 @@ if z<0:
     z=0
 
 if x==y or x>y:
-    subprocess.Popen([sys.executable, resource_path('Anime Version/Final Penalty/gui.py')])
+    thesystem.windows.open_script('Anime Version/Final Penalty/gui.py')
     window.quit()
 
 # Create the canvas
@@ -78,7 +78,7 @@ canvas = Canvas(
 canvas.pack(fill="both", expand=True)
 
 def ex_close(eve):
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     window.quit()
 
 # Load images
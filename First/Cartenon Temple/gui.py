@@ -8,7 +8,6 @@ from pathlib import Path
 # from tkinter import *
 # Explicit imports to satisfy Flake8
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
-import subprocess
 import random
 import cv2
 import ujson
@@ -25,11 +24,13 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame0")
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 def relative_to_assets(path: str) -> Path:
     return ASSETS_PATH / Path(path)
@@ -79,7 +80,7 @@ def ex_close(win=window):
     win.quit()
 
 def ex_close_0(win=window):
-    subprocess.Popen([sys.executable, resource_path('First/Health Warning/gui.py')])
+    thesystem.windows.open_script('First/Health Warning/gui.py')
     win.quit()
 
 def confirming():
@@ -125,7 +126,7 @@ def play():
     window.after(5000, start)
 
 def answer():
-    subprocess.Popen([sys.executable, resource_path('Files\Mod\default\sfx_glitch.py')])
+    thesystem.audio.play("Glitch SFX")
     global confirm
 
     canvas.itemconfig("Sixth", state="hidden")
@@ -143,34 +144,34 @@ def start(c=0):
     global confirm
 
     if c==0:
-        subprocess.Popen([sys.executable, resource_path('Files\Mod\default\sfx_glitch.py')])
+        thesystem.audio.play("Glitch SFX")
         canvas.itemconfig("Zero", state="hidden")
         canvas.itemconfig("First", state="normal")
     elif c==1:
-        subprocess.Popen([sys.executable, resource_path('Files\Mod\default\sfx_glitch.py')])
+        thesystem.audio.play("Glitch SFX")
         canvas.itemconfig("Zero", state="hidden")
         canvas.itemconfig("First", state="hidden")
         canvas.itemconfig("Second", state="normal")
     elif c==2:
-        subprocess.Popen([sys.executable, resource_path('Files\Mod\default\sfx_glitch.py')])
+        thesystem.audio.play("Glitch SFX")
         canvas.itemconfig("First", state="hidden")
         canvas.itemconfig("Second", state="hidden")
         canvas.itemconfig("Third", state="normal")
     elif c==3:
-        subprocess.Popen([sys.executable, resource_path('Files\Mod\default\sfx_glitch.py')])
+        thesystem.audio.play("Glitch SFX")
         canvas.itemconfig("First", state="hidden")
         canvas.itemconfig("Second", state="hidden")
         canvas.itemconfig("Third", state="hidden")
         canvas.itemconfig("Fourth", state="normal")
     elif c==4:
-        subprocess.Popen([sys.executable, resource_path('Files\Mod\default\sfx_glitch.py')])
+        thesystem.audio.play("Glitch SFX")
         canvas.itemconfig("First", state="hidden")
         canvas.itemconfig("Second", state="hidden")
         canvas.itemconfig("Third", state="hidden")
         canvas.itemconfig("Fourth", state="hidden")
         canvas.itemconfig("Fifth", state="normal")
     elif c==5:
-        subprocess.Popen([sys.executable, resource_path('Files\Mod\default\sfx_glitch.py')])
+        thesystem.audio.play("Glitch SFX")
         canvas.itemconfig("First", state="hidden")
         canvas.itemconfig("Second", state="hidden")
         canvas.itemconfig("Third", state="hidden")
@@ -394,7 +395,7 @@ image_17 = canvas.create_image(
 )
 
 play()
-subprocess.Popen([sys.executable, resource_path('First/Cartenon Temple/gui1.py')])
+thesystem.windows.open_script('First/Cartenon Temple/gui1.py')
 
 window.resizable(False, False)
 window.mainloop()
@@ -13,6 +13,7 @@ import ujson
 import cv2
 from PIL import Image, ImageTk
 import time
+import thesystem.audio
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame1")
@@ -147,7 +148,7 @@ image_3 = canvas.create_image(
 )
 
 prog()
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 window.resizable(False, False)
 window.mainloop()
@@ -11,14 +11,12 @@ from pathlib import Path
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
 import ujson
 import csv
-import subprocess
 import threading
 import cv2
 from PIL import Image, ImageTk
 import sys
 import os
 import numpy as np
-from thesystem.misc import resource_path
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -27,6 +25,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 
 
 OUTPUT_PATH = Path(__file__).parent
@@ -49,7 +49,7 @@ def move_window(event):
 
 def ex_close(win):
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, 0, window_width, step=20, delay=1)
 
 window = Tk()
@@ -82,7 +82,7 @@ bottom_images = f"thesystem/{all_prev}bottom_bar"
 top_preloaded_images = thesystem.system.load_or_cache_images(top_images, (488, 38), job, type_="top")
 bottom_preloaded_images = thesystem.system.load_or_cache_images(bottom_images, (488, 33), job, type_="bottom")
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 window.configure(bg = "#FFFFFF")
 set_data=thesystem.misc.return_settings()
@@ -168,13 +168,13 @@ def entry_data():
                     theme_data=ujson.load(themefile)
                     theme=theme_data["Theme"]
 
-                subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Settings/gui.py')])
+                thesystem.windows.open_script(f'{theme} Version/Settings/gui.py')
                 with open("Files/Checks/daily_open.csv", 'w', newline='') as info_open:
                     fw=csv.writer(info_open)
                     fw.writerow(["False"])
             
             else:
-                subprocess.Popen([sys.executable, resource_path('First/Penalty Check/gui.py')])
+                thesystem.windows.open_script('First/Penalty Check/gui.py')
             
             ex_close(window)
 
@@ -221,7 +221,7 @@ image_1 = canvas.create_image(
 pres_file_data=thesystem.misc.load_ujson("Files/Mod/presets.json")
 normal_font_col=pres_file_data["Anime"]["Normal Font Color"]
 video_path=pres_file_data["Anime"][video]
-player = thesystem.system.FastVideoPlayer(canvas, np.load(video_path), 277.0, 400.0, 
+player = thesystem.system.FastVideoPlayer(canvas, thesystem.system.load_video_frames(video_path), 277.0, 400.0, 
                                       resize_factor=0.6, pause_duration=0.9, buffer_size=50)
 
 
@@ -677,23 +677,8 @@ bottom_image = canvas.create_image(
 
 step,delay=1,1
 
-def update_images():
-    global image_index, bot_image_index
-
-    image_index = (image_index + 1) % len(top_preloaded_images)
-    top_img = top_preloaded_images[image_index]
-    canvas.itemconfig(top_image, image=top_img)
-    canvas.top_img = top_img
-
-    bot_image_index = (bot_image_index + 1) % len(bottom_preloaded_images)
-    bot_img = bottom_preloaded_images[bot_image_index]
-    canvas.itemconfig(bottom_image, image=bot_img)
-    canvas.bot_img = bot_img
-
-    window.after(1000 // 24, update_images)
-
 # Start the animation
-update_images()
+bar_animator = thesystem.system.BarAnimator(canvas, (top_image, top_preloaded_images), (bottom_image, bottom_preloaded_images))
 
 button_image_1 = PhotoImage(
     file=relative_to_assets("button_1.png"))
@@ -7,7 +7,6 @@ from pathlib import Path
 # from tkinter import *
 # Explicit imports to satisfy Flake8
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage, BOTH
-import subprocess
 import threading
 import cv2
 from PIL import Image, ImageTk
@@ -24,7 +23,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
-from thesystem.misc import resource_path
+import thesystem.windows
+import thesystem.audio
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame0")
@@ -59,7 +59,7 @@ top_preloaded_images = thesystem.system.load_or_cache_images(top_images, (695, 3
 bottom_preloaded_images = thesystem.system.load_or_cache_images(bottom_images, (702, 36), job, type_="bottom")
 
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 window.geometry(f"{window_width}x{initial_height}")
 thesystem.system.make_window_transparent(window)
@@ -89,7 +89,7 @@ def move_window(event):
 
 def ex_close(eve):
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, initial_height, window_width, step=25, delay=1)
 
 
@@ -115,7 +115,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Anime"][video]
-player = thesystem.system.FastVideoPlayer(canvas, np.load(video_path), 478.0, 313.0)
+player = thesystem.system.FastVideoPlayer(canvas, thesystem.system.load_video_frames(video_path), 478.0, 313.0)
 
 image_image_2 = PhotoImage(
     file=relative_to_assets("image_2.png"))
@@ -206,7 +206,7 @@ def fade_out_text(text_id, shadow_id, step=20):
 def animate_dots(base_text, dot_count=0, loop_count=0, max_loops=3):
     """Animates the '...' at the end of the blue text."""
     if loop_count >= max_loops:
-        subprocess.Popen([sys.executable, resource_path('First/Info/gui.py')])
+        thesystem.windows.open_script('First/Info/gui.py')
         ex_close(window)
         return
 
@@ -362,22 +362,7 @@ bottom_image = canvas.create_image(
 
 step,delay=1,1
 
-def update_images():
-    global image_index, bot_image_index
-
-    image_index = (image_index + 1) % len(top_preloaded_images)
-    top_img = top_preloaded_images[image_index]
-    canvas.itemconfig(top_image, image=top_img)
-    canvas.top_img = top_img
-
-    bot_image_index = (bot_image_index + 1) % len(bottom_preloaded_images)
-    bot_img = bottom_preloaded_images[bot_image_index]
-    canvas.itemconfig(bottom_image, image=bot_img)
-    canvas.bot_img = bot_img
-
-    window.after(1000 // 24, update_images)
-
-update_images()
+bar_animator = thesystem.system.BarAnimator(canvas, (top_image, top_preloaded_images), (bottom_image, bottom_preloaded_images))
 
 
 button_image_20 = PhotoImage(
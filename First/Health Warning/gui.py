@@ -8,7 +8,6 @@ from pathlib import Path
 # from tkinter import *
 # Explicit imports to satisfy Flake8
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
-import subprocess
 import sys
 from PIL import Image, ImageTk
 from datetime import datetime
@@ -17,7 +16,6 @@ import ujson
 import sys
 import os
 import numpy as np
-from thesystem.misc import resource_path
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -26,6 +24,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame0")
@@ -37,7 +37,7 @@ def relative_to_assets(path: str) -> Path:
 
 window = Tk()
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 initial_height = 0
 target_height = 549
@@ -69,8 +69,8 @@ def move_window(event):
 
 
 def ex_close(eve):
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
-    subprocess.Popen([sys.executable, resource_path('First/Check/gui.py')])
+    thesystem.audio.play("Close SFX")
+    thesystem.windows.open_script('First/Check/gui.py')
     thesystem.system.animate_window_close(window, initial_height, window_width, step=30, delay=1)
 
 canvas = Canvas(
@@ -95,7 +95,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Anime"]["Video"]
-player = thesystem.system.FastVideoPlayer(canvas, np.load(video_path), 430.0, 263.0)
+player = thesystem.system.FastVideoPlayer(canvas, thesystem.system.load_video_frames(video_path), 430.0, 263.0)
 
 image_image_2 = PhotoImage(
     file=relative_to_assets("image_2.png"))
@@ -8,7 +8,6 @@ from pathlib import Path
 # from tkinter import *
 # Explicit imports to satisfy Flake8
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage, StringVar, ttk
-import subprocess
 import threading
 import random
 import cv2
@@ -19,7 +18,6 @@ import csv
 import sys
 import os
 import numpy as np
-from thesystem.misc import resource_path
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -28,6 +26,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame0")
@@ -50,7 +50,7 @@ def move_window(event):
 
 def ex_close(eve):
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, initial_height, window_width, step=20, delay=1)
 
 def get():
@@ -118,14 +118,14 @@ def get():
                 theme_data=ujson.load(themefile)
                 theme=theme_data["Theme"]
 
-            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Settings/gui.py')])
+            thesystem.windows.open_script(f'{theme} Version/Settings/gui.py')
             with open("Files/Checks/info_open.csv", 'w', newline='') as info_open:
                 fw=csv.writer(info_open)
                 fw.writerow(["False"])
             ex_close(window)
         
         else:
-            subprocess.Popen([sys.executable, resource_path('First/Daily Quest Tweak/gui.py')])
+            thesystem.windows.open_script('First/Daily Quest Tweak/gui.py')
             ex_close(window)
 
 def only_numbers(char):
@@ -150,7 +150,7 @@ window_width = 867
 
 window.geometry(f"{window_width}x{initial_height}")
 thesystem.system.animate_window_open(window, target_height, window_width, step=40, delay=1)
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 window.configure(bg = "#FFFFFF")
 set_data=thesystem.misc.return_settings()
@@ -188,7 +188,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Anime"]["Video"]
-player = thesystem.system.FastVideoPlayer(canvas, np.load(video_path), 430.0, 263.0)
+player = thesystem.system.FastVideoPlayer(canvas, thesystem.system.load_video_frames(video_path), 430.0, 263.0)
 
 image_image_2 = PhotoImage(
     file=relative_to_assets("image_2.png"))
@@ -8,7 +8,6 @@ from pathlib import Path
 # from tkinter import *
 # Explicit imports to satisfy Flake8
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
-import subprocess
 import threading
 import ujson
 import sys
@@ -21,6 +20,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame0")
@@ -43,8 +44,8 @@ def move_window(event):
 
 def ex_close(eve):
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
-    subprocess.Popen([sys.executable, resource_path('First\Daily Quest Tweak\gui.py')])
+    thesystem.audio.play("Close SFX")
+    thesystem.windows.open_script('First/Daily Quest Tweak/gui.py')
     thesystem.system.animate_window_close(window, initial_height, window_width, step=30, delay=1)
 
 window = Tk()
@@ -55,7 +56,7 @@ window_width = 867
 
 window.geometry(f"{window_width}x{initial_height}")
 thesystem.system.animate_window_open(window, target_height, window_width, step=30, delay=1)
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 window.configure(bg = "#FFFFFF")
 set_data=thesystem.misc.return_settings()
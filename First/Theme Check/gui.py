@@ -28,6 +28,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 from thesystem.misc import resource_path
 
 OUTPUT_PATH = Path(__file__).parent
@@ -50,7 +52,7 @@ def move_window(event):
 
 def ex_close(eve):
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, initial_height, window_width, step=20, delay=1)
 
 def name(eve,name):
@@ -74,7 +76,7 @@ def name(eve,name):
             theme=theme_data["Theme"]
 
     if istrue=='True':
-        subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Settings/gui.py')])
+        thesystem.windows.open_script(f'{theme} Version/Settings/gui.py')
         with open("Files/Checks/theme_open.csv", 'w', newline='') as info_open:
             fw=csv.writer(info_open)
             fw.writerow(["False"])
@@ -117,7 +119,7 @@ bottom_size = (850, 47)
 top_preloaded_images = thesystem.system.load_or_cache_images(top_folder_path, top_size, job="NONE", type_="top")
 bottom_preloaded_images = thesystem.system.load_or_cache_images(bottom_folder_path, bottom_size, job="NONE", type_="bottom")
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 canvas = Canvas(
     window,
@@ -141,7 +143,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Anime"]["Video"]
-    preloaded_frames = np.load(video_path)
+    preloaded_frames = thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 430.0, 263.0, pause_duration=0.6, resize_factor=-1)
 
 image_image_2 = PhotoImage(
@@ -303,23 +305,8 @@ canvas.tag_bind(top_image, "<B1-Motion>", move_window)
 bottom_image = canvas.create_image(459.0, 562.0, image=bottom_preloaded_images[bot_image_index])
 
 # Function to update the image
-def update_images():
-    global image_index, bot_image_index
-
-    image_index = (image_index + 1) % len(top_preloaded_images)
-    top_img = top_preloaded_images[image_index]
-    canvas.itemconfig(top_image, image=top_img)
-    canvas.top_img = top_img
-
-    bot_image_index = (bot_image_index + 1) % len(bottom_preloaded_images)
-    bot_img = bottom_preloaded_images[bot_image_index]
-    canvas.itemconfig(bottom_image, image=bot_img)
-    canvas.bot_img = bot_img
-
-    window.after(1000 // 24, update_images)
-
 # Start the animation
-update_images()
+bar_animator = thesystem.system.BarAnimator(canvas, (top_image, top_preloaded_images), (bottom_image, bottom_preloaded_images))
 
 window.resizable(False, False)
 window.mainloop()
\ No newline at end of file
@@ -24,8 +24,9 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.audio
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame0")
@@ -78,7 +79,7 @@ canvas = Canvas(
 )
 
 def next(eve):
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_button.py')])
+    thesystem.audio.play("Button SFX")
     global slide
     if slide == 1:
         canvas.itemconfig("s1",state="hidden")
@@ -96,14 +97,14 @@ def next(eve):
         canvas.itemconfig("s4", state="hidden")
         canvas.itemconfig("s5", state="normal")
         canvas.itemconfig("s6", state="hidden")
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_glitch.py')])
+    thesystem.audio.play("Glitch SFX")
 
 def keep(eve):
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_button.py')])
+    thesystem.audio.play("Button SFX")
     window.quit()
 
 def remove(eve):
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_button.py')])
+    thesystem.audio.play("Button SFX")
     
     file_path= "Files/Player Data/Vow_status.json"
     # Create the file
@@ -9,7 +9,6 @@ from pathlib import Path
 # Explicit imports to satisfy Flake8
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
 from datetime import datetime, timedelta, date
-import subprocess
 import threading
 import ujson
 import cv2
@@ -18,7 +17,6 @@ import csv
 import sys
 import os
 import numpy as np
-from thesystem.misc import resource_path
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -27,6 +25,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 import thesystem.dailyquest as dailyquest
 
 OUTPUT_PATH = Path(__file__).parent
@@ -50,7 +50,7 @@ def move_window(event):
 
 def ex_close(l=0):
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, initial_height, window_width, step=20, delay=1)
 
 window = Tk()
@@ -61,7 +61,7 @@ window_width = 555
 
 window.geometry(f"{window_width}x{initial_height}")
 thesystem.system.make_window_transparent(window)
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 thesystem.system.animate_window_open(window, target_height, window_width, step=30, delay=1)
 
 window.configure(bg = "#FFFFFF")
@@ -149,7 +149,7 @@ def get():
         tab_son_data=ujson.load(tab_son)
 
     if tab_son_data["Status"]=='Close':
-        subprocess.Popen([sys.executable, resource_path('Manwha Version/Status Tab/gui.py')])
+        thesystem.windows.open_script('Manwha Version/Status Tab/gui.py')
     ex_close()
 
 def secret_get():
@@ -201,7 +201,7 @@ def secret_get():
     with open("Files/Player Data/Tabs.json",'r') as tab_son:
         tab_son_data=ujson.load(tab_son)
     if tab_son_data["Status"]!='Open':
-        subprocess.Popen([sys.executable, resource_path('Manwha Version/Status Tab/gui.py')])
+        thesystem.windows.open_script('Manwha Version/Status Tab/gui.py')
     window.quit()
 
 def great_get():
@@ -253,7 +253,7 @@ def great_get():
     with open("Files/Player Data/Tabs.json",'r') as tab_son:
         tab_son_data=ujson.load(tab_son)
     if tab_son_data["Status"]!='Open':
-        subprocess.Popen([sys.executable, resource_path('Manwha Version/Status Tab/gui.py')])
+        thesystem.windows.open_script('Manwha Version/Status Tab/gui.py')
     window.quit()
 
 def give_rev():
@@ -286,7 +286,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Manwha"]["Video"]
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 277.0, 270.0, resize_factor=1)
 
 image_image_2 = PhotoImage(
@@ -14,13 +14,11 @@ import time
 import random
 import ujson
 import csv
-import subprocess
 import cv2
 from PIL import Image, ImageTk
 import sys
 import os
 import numpy as np
-from thesystem.misc import resource_path
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -29,6 +27,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 import thesystem.dailyquest
 import thesystem.dailyquest as dailyquest
 
@@ -76,7 +76,7 @@ def ex_close(win):
     with open("Files/Player Data/Tabs.json",'w') as fin_tab_son:
         tab_son_data["Daily"]='Close'
         ujson.dump(tab_son_data,fin_tab_son,indent=4)
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, target_height, window_width, step=10, delay=1)
 
 with open("Files/Checks/Daily_time_check.csv", 'r') as Daily_date_check_file:
@@ -124,7 +124,7 @@ if full_check==False:
         tab_son_data["Daily"]='Open'
         ujson.dump(tab_son_data,fin_tab_son,indent=4)
 
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+    thesystem.audio.play("Open SFX")
 
     window = Tk()
 
@@ -165,7 +165,7 @@ if full_check==False:
     with open("Files/Mod/presets.json", 'r') as pres_file:
         pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Manwha"]["Video"]
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
     player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 200.0, 350.0, resize_factor=1.5, pause_duration=0.7)
 
     image_image_2 = PhotoImage(
@@ -422,51 +422,51 @@ if full_check==False:
         height=20.0
     )
     def update_pushup():
-        subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_point.py')])
+        thesystem.audio.play("Point SFX")
         #global pushup_txt
         current_text=int((((canvas.itemcget(pushup_txt, "text")).split("/"))[0])[1:])
         daily_quest_data["Player"]["Push"]+=1
-        thesystem.misc.dump_ujson("Files/Player Data/Daily_Quest.json", daily_quest_data, indents=4)
+        thesystem.misc.dump_ujson_field("Files/Player Data/Daily_Quest.json", ("Player", "Push"), daily_quest_data["Player"]["Push"])
         canvas.itemconfig(pushup_txt, text=f"[{current_text+1}/{fl_push}]")
 
     def update_situp():
-        subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_point.py')])
+        thesystem.audio.play("Point SFX")
         #global situp_txt
         current_text=int((((canvas.itemcget(situp_txt, "text")).split("/"))[0])[1:])
         daily_quest_data["Player"]["Sit"]+=1
-        thesystem.misc.dump_ujson("Files/Player Data/Daily_Quest.json", daily_quest_data, indents=4)
+        thesystem.misc.dump_ujson_field("Files/Player Data/Daily_Quest.json", ("Player", "Sit"), daily_quest_data["Player"]["Sit"])
         canvas.itemconfig(situp_txt, text=f"[{current_text+1}/{fl_sit}]")
 
     def update_sqat():
-        subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_point.py')])
+        thesystem.audio.play("Point SFX")
         #global situp_txt
         current_text=int((((canvas.itemcget(squat_txt, "text")).split("/"))[0])[1:])
         daily_quest_data["Player"]["Squat"]+=1
-        thesystem.misc.dump_ujson("Files/Player Data/Daily_Quest.json", daily_quest_data, indents=4)
+        thesystem.misc.dump_ujson_field("Files/Player Data/Daily_Quest.json", ("Player", "Squat"), daily_quest_data["Player"]["Squat"])
         canvas.itemconfig(squat_txt, text=f"[{current_text+1}/{fl_sit}]")
 
     def update_run():
-        subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_point.py')])
+        thesystem.audio.play("Point SFX")
         #global run_txt
         current_text=float((((canvas.itemcget(run_txt, "text")).split("/"))[0])[1:])
         daily_quest_data["Player"]["Run"]+=0.5
-        thesystem.misc.dump_ujson("Files/Player Data/Daily_Quest.json", daily_quest_data, indents=4)
+        thesystem.misc.dump_ujson_field("Files/Player Data/Daily_Quest.json", ("Player", "Run"), daily_quest_data["Player"]["Run"])
         canvas.itemconfig(run_txt, text=f"[{current_text+0.5}/{fl_run}]")
 
     def update_int():
-        subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_point.py')])
+        thesystem.audio.play("Point SFX")
         #global int_txt
         current_text=float((((canvas.itemcget(int_txt, "text")).split("/"))[0])[1:])
         daily_quest_data["Player"]["Int_type"]+=0.5
-        thesystem.misc.dump_ujson("Files/Player Data/Daily_Quest.json", daily_quest_data, indents=4)
+        thesystem.misc.dump_ujson_field("Files/Player Data/Daily_Quest.json", ("Player", "Int_type"), daily_quest_data["Player"]["Int_type"])
         canvas.itemconfig(int_txt, text=f"[{current_text+0.5}/{fl_int}]")
 
     def update_sleep():
-        subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_point.py')])
+        thesystem.audio.play("Point SFX")
         #global sleep_txt
         current_text=int((((canvas.itemcget(sleep_txt, "text")).split("/"))[0])[1:])
         daily_quest_data["Player"]["Sleep"]+=1
-        thesystem.misc.dump_ujson("Files/Player Data/Daily_Quest.json", daily_quest_data, indents=4)
+        thesystem.misc.dump_ujson_field("Files/Player Data/Daily_Quest.json", ("Player", "Sleep"), daily_quest_data["Player"]["Sleep"])
         canvas.itemconfig(sleep_txt, text=f"[{current_text+1}/{fl_slp}]")
 
     canvas.create_text(
@@ -557,5 +557,5 @@ elif full_check==True:
         with open("Files/Temp Files/Daily Rewards.csv", 'w', newline='') as rew_csv_open:
             rew_fw=csv.writer(rew_csv_open)
             rew_fw.writerow(["Reward"])
-        subprocess.Popen([sys.executable, resource_path('Manwha Version/Daily Quest Rewards/gui.py')])
+        thesystem.windows.open_script('Manwha Version/Daily Quest Rewards/gui.py')
 
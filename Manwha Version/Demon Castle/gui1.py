@@ -8,7 +8,6 @@ from pathlib import Path
 # from tkinter import *
 # Explicit imports to satisfy Flake8
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
-import subprocess
 import csv
 import ujson
 import cv2
@@ -19,7 +18,6 @@ import threading
 import sys
 import os
 import numpy as np
-from thesystem.misc import resource_path
 import random
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -29,10 +27,12 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 import thesystem.castle
 import thesystem.dungeon
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame1")
 
@@ -321,11 +321,11 @@ def next():
             ujson.dump(status_read_data, fson, indent=4)
 
         thesystem.system.get_fin_xp()
-        subprocess.Popen([sys.executable, resource_path('Manwha Version/Demon Castle/gui.py')])
+        thesystem.windows.open_script('Manwha Version/Demon Castle/gui.py')
         window.quit()
 
     else:
-        subprocess.Popen([sys.executable, resource_path('Files\Mod\default\sfx_glitch.py')])
+        thesystem.audio.play("Glitch SFX")
         mob_fun()
 
 canvas = Canvas(
@@ -357,7 +357,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Manwha"]["Video"]
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 478.0, 277.0, resize_factor=1.3)
 
 
@@ -3,7 +3,6 @@ from pathlib import Path
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage, StringVar, Frame, Label, RIGHT, LEFT, X, Y, BOTTOM, TOP, END, NORMAL, HIDDEN, BOTH, VERTICAL, HORIZONTAL, SOLID, Scrollbar
 import ujson
 import csv
-import subprocess
 import random
 import cv2
 from PIL import Image, ImageTk
@@ -22,8 +21,11 @@ sys.path.insert(0, project_root)
 
 import thesystem.dungeon
 import thesystem.system
+import thesystem.windows
+import thesystem.journal
+import thesystem.audio
 import thesystem.misc
-from thesystem.misc import resource_path
+from thesystem.catalog import catalog
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame0")
@@ -168,7 +170,7 @@ class DungeonSystem:
             pres_file_data=ujson.load(pres_file)
             self.normal_font_col = pres_file_data["Manwha"]["Normal Font Color"]
             video_path=pres_file_data["Manwha"]["Video"]
-            preloaded_frames=np.load(video_path)
+            preloaded_frames=thesystem.system.load_video_frames(video_path)
         player = thesystem.system.FastVideoPlayer(self.canvas, preloaded_frames, 300, 240, resize_factor=1)
         
     def create_ui_elements(self):
@@ -374,9 +376,9 @@ class DungeonSystem:
     def ex_close(self):
         stop_event.set()
         threading.Thread(target=thesystem.system.fade_out, args=(self.window, 0.8)).start()
-        subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+        thesystem.audio.play("Close SFX")
         thesystem.system.animate_window_close(self.window, 0, self.window_width, step=20, delay=1)
-        subprocess.Popen([sys.executable, resource_path('Manwha Version/Message/gui.py')])
+        thesystem.windows.open_script('Manwha Version/Message/gui.py')
         
     def start_dungeon(self):
         self.hide_activities_and_checkboxes()
@@ -963,13 +965,9 @@ class DungeonSystem:
                 elif self.rew_rank == 'A':
                     rune_chance = 0.01
                 if rune_chance > 0 and random.random() < rune_chance:
-                    with open("Files/Data/Inventory_List.json", 'r') as inv_list_file:
-                        inv_list = ujson.load(inv_list_file)
-                    # Get all rune stone keys
-                    rune_keys = [k for k, v in inv_list.items() if v[0].get('cat') == 'Rune Stone']
-                    if rune_keys:
-                        chosen_rune = random.choice(rune_keys)
-                        rune_data = inv_list[chosen_rune][0].copy()
+                    chosen_rune = catalog.sample(cat='Rune Stone')
+                    if chosen_rune:
+                        rune_data = catalog.item(chosen_rune)
                         rune_data['qty'] = 1
                         # Load player inventory
                         try:
@@ -989,6 +987,10 @@ class DungeonSystem:
                 pass
                 #print(f"Error giving rune stone: {e}")
 
+            reward_scale = 2 if self.type_of_dun == 'Instance' else 1
+            thesystem.journal.record("dungeon", rank=self.rew_rank, type=self.type_of_dun,
+                                     coins=adjusted_coin * reward_scale, str=adjusted_avp * reward_scale,
+                                     int=adjusted_avp * reward_scale)
             thesystem.system.get_fin_xp()
 
         except Exception as e:
@@ -10,13 +10,11 @@ from pathlib import Path
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
 import ujson
 import csv
-import subprocess
 import cv2
 from PIL import Image, ImageTk
 import sys
 import os
 import numpy as np
-from thesystem.misc import resource_path
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -25,6 +23,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 import thesystem.itemequip
 import thesystem.misc
 
@@ -54,11 +54,11 @@ def move_window(event):
 
 
 def ex_close(win):
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
-    subprocess.Popen([sys.executable, resource_path('Manwha Version\Equipment\gui.py')])
+    thesystem.audio.play("Close SFX")
+    thesystem.windows.open_script('Manwha Version/Equipment/gui.py')
     thesystem.system.animate_window_close(window, target_height, window_width, step=30, delay=1)
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 window = Tk()
 
@@ -138,7 +138,7 @@ for k in rol:
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Manwha"]["Video"]
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
     normal_font_col=pres_file_data["Manwha"]["Normal Font Color"]
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 300.0, 190.0)
 
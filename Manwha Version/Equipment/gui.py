@@ -6,14 +6,12 @@ from pathlib import Path
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
 import csv
 import ujson
-import subprocess
 import threading
 import cv2
 from PIL import Image, ImageTk
 import sys
 import os
 import numpy as np
-from thesystem.misc import resource_path
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -22,6 +20,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 import thesystem.equipmentbk
 import thesystem.equipmentbk as equipment
 import thesystem.inventory
@@ -42,7 +42,7 @@ def relative_to_assets(path: str) -> Path:
 
 window = Tk()
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 initial_height = 0
 target_height = 479
@@ -83,7 +83,7 @@ def ex_close():
             ujson.dump(tab_son_data,fin_tab_son,indent=4)
 
     #threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, target_height, window_width, step=20, delay=1)
 
 def split_text(text, segment_length):
@@ -113,12 +113,12 @@ def open_select(cat):
     fw.writerow(rec)
     fout.close()
 
-    subprocess.Popen([sys.executable, resource_path('Manwha Version/Equip Item/gui.py')])
+    thesystem.windows.open_script('Manwha Version/Equip Item/gui.py')
 
     ex_close()
 
 def set_effect_open():
-    subprocess.Popen([sys.executable, resource_path('Manwha Version/Set Effects/gui.py')])
+    thesystem.windows.open_script('Manwha Version/Set Effects/gui.py')
 
 canvas = Canvas(
     window,
@@ -142,7 +142,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Manwha"]["Video"]
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 370.0, 200.0, resize_factor=1)
 
 image_image_2 = PhotoImage(
@@ -28,6 +28,7 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.audio
 
 
 OUTPUT_PATH = Path(__file__).parent
@@ -65,7 +66,7 @@ window.overrideredirect(True)
 window.wm_attributes("-topmost", True)
 
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 def start_move(event):
     window.lastx, window.lasty = event.widget.winfo_pointerxy()
@@ -80,7 +81,7 @@ def move_window(event):
 
 def ex_close(win=0):
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, initial_height, window_width, step=35, delay=1)
 
 last_val=0
@@ -97,16 +98,16 @@ def fatigue_return():
         fatigue_max=stat_data["status"][0]["fatigue_max"]
         fatigue_percent=int((fatigue/fatigue_max)*100)
         if (last_val!=fatigue_percent) and (fatigue_percent<70):
-            subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_point.py')])
+            thesystem.audio.play("Point SFX")
         elif (fatigue_percent>=70 and fatigue_percent<90) and warn1==False:
-            subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_error.py')])
+            thesystem.audio.play("Error SFX")
             canvas.itemconfig(fat_val, fill="#FF0000")
             warn1=True
         elif (fatigue_percent>=70 and fatigue_percent<90):
-            subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_point.py')])
+            thesystem.audio.play("Point SFX")
             canvas.itemconfig(fat_val, fill="#FF0000")
         elif fatigue_percent>=90:
-            subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_error.py')])
+            thesystem.audio.play("Error SFX")
             canvas.itemconfig(fat_val, fill="#FF0000")
         
         last_val=fatigue_percent
@@ -136,7 +137,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Manwha"]["Video"]
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 478.0, 330.0, resize_factor=0.8, pause_duration=0.5)
 
 image_image_2 = PhotoImage(
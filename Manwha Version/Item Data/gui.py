@@ -8,7 +8,6 @@ from pathlib import Path
 # from tkinter import *
 # Explicit imports to satisfy Flake8
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
-import subprocess
 import csv
 import ujson
 import cv2
@@ -17,7 +16,6 @@ import threading
 import sys
 import os
 import numpy as np
-from thesystem.misc import resource_path
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -27,10 +25,13 @@ sys.path.insert(0, project_root)
 
 import thesystem.itemequip
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 import thesystem.equipmentbk as equipment
 import thesystem.inventory
+from thesystem.catalog import catalog
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame0")
@@ -86,8 +87,8 @@ def move_window(event):
 
 def ex_close(win):
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
-    subprocess.Popen([sys.executable, resource_path('Manwha Version/Inventory/gui.py')])
+    thesystem.audio.play("Close SFX")
+    thesystem.windows.open_script('Manwha Version/Inventory/gui.py')
     thesystem.system.animate_window_close(window, 0, window_width, step=20, delay=1)
 typs='Item'
 
@@ -114,9 +115,8 @@ if typs=='Item':
         dat_keys=list(data.keys())
 
 elif typs=='Preview':
-    with open("Files/Data/Inventory_List.json", 'r') as fson:
-        data=ujson.load(fson)
-        dat_keys=list(data.keys())
+    data=catalog.listing()
+    dat_keys=list(data.keys())
 
 item_full_data={}
 
@@ -169,7 +169,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Manwha"]["Video"]
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 280.0, 300.0, resize_factor=1.2)
 
 image_image_2 = PhotoImage(
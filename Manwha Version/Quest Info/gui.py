@@ -25,9 +25,10 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.audio
 import thesystem.quests
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 window = Tk()
 
@@ -201,7 +202,7 @@ if typeof == "Learn":
     with open("Files/Mod/presets.json", 'r') as pres_file:
         pres_file_data=ujson.load(pres_file)
         video_path=pres_file_data["Manwha"]["Video"]
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
     player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 200.0, 180.0)
 
     image_image_2 = PhotoImage(
@@ -741,7 +742,7 @@ elif typeof == "Common":
         ex_tr_txt=canvas.itemcget(ex_txt, "text")
         new_1=int(ex_tr_txt)+1
         be_new_1=f"{new_1}"
-        subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_point.py')])
+        thesystem.audio.play("Point SFX")
         canvas.itemconfig(ex_txt, text=be_new_1)
 
         if int(new_1)==int(num):
@@ -769,7 +770,7 @@ elif typeof == "Common":
     with open("Files/Mod/presets.json", 'r') as pres_file:
         pres_file_data=ujson.load(pres_file)
         video_path=pres_file_data["Manwha"]["Video"]
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
     player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 200.0, 180.0)
 
     image_image_2 = PhotoImage(
@@ -1266,7 +1267,7 @@ elif typeof == "Unknown":
     with open("Files/Mod/presets.json", 'r') as pres_file:
         pres_file_data=ujson.load(pres_file)
         video_path=pres_file_data["Manwha"]["Video"]
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
     player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 200.0, 180.0)
 
     image_image_2 = PhotoImage(
@@ -10,7 +10,6 @@ from pathlib import Path
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage, IntVar, Checkbutton
 import ujson
 import csv
-import subprocess
 import threading
 from PIL import Image, ImageTk
 from datetime import datetime, timedelta
@@ -18,7 +17,6 @@ import pandas as pd
 import sys
 import os
 import numpy as np
-from thesystem.misc import resource_path
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -27,6 +25,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 import thesystem.settings as settings
 
 OUTPUT_PATH = Path(__file__).parent
@@ -42,7 +42,7 @@ with open("Files/Player Data/Tabs.json",'w') as fin_tab_son:
 def relative_to_assets(path: str) -> Path:
     return ASSETS_PATH / Path(path)
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 window = Tk()
 
@@ -101,7 +101,7 @@ def theme_open():
         fw=csv.writer(info_open)
         fw.writerow(["True"])
         
-    subprocess.Popen([sys.executable, resource_path('First/Theme Check/gui.py')])
+    thesystem.windows.open_script('First/Theme Check/gui.py')
     ex_close(window)
 
 def info_open():
@@ -109,7 +109,7 @@ def info_open():
         fw=csv.writer(info_open)
         fw.writerow(["True"])
 
-    subprocess.Popen([sys.executable, resource_path('First/Info/gui.py')])
+    thesystem.windows.open_script('First/Info/gui.py')
     ex_close(window)
 
 def dailys_open():
@@ -117,7 +117,7 @@ def dailys_open():
         fw=csv.writer(info_open)
         fw.writerow(["True"])
 
-    subprocess.Popen([sys.executable, resource_path('First/Daily Quest Tweak/gui.py')])
+    thesystem.windows.open_script('First/Daily Quest Tweak/gui.py')
     ex_close(window)
 
 def penalty_open():
@@ -125,7 +125,7 @@ def penalty_open():
         fw=csv.writer(info_open)
         fw.writerow(["True"])
 
-    subprocess.Popen([sys.executable, resource_path('First/Penalty Tweak/gui.py')])
+    thesystem.windows.open_script('First/Penalty Tweak/gui.py')
     ex_close(window)
 
 def ex_close(win):
@@ -136,11 +136,11 @@ def ex_close(win):
         tab_son_data["Settings"]='Close'
         ujson.dump(tab_son_data,fin_tab_son,indent=4)
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, initial_height, window_width, step=20, delay=1)
 
 def apply_changes():
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_button.py')])
+    thesystem.audio.play("Button SFX")
     with open("Files/Player Data/Settings.json", 'r') as settings_open:
         setting_data=ujson.load(settings_open)
     setting_data["Settings"]["Transparency"] = float(entry_3.get())
@@ -173,7 +173,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Manwha"]["Video"]
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 200.0, 300.0, resize_factor=1.2)
 
 image_image_2 = PhotoImage(
@@ -8,7 +8,6 @@ from pathlib import Path
 # from tkinter import *
 # Explicit imports to satisfy Flake8
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
-import subprocess
 import ujson
 import csv
 import cv2
@@ -16,7 +15,6 @@ from PIL import Image, ImageTk
 import sys
 import os
 import numpy as np
-from thesystem.misc import resource_path
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -25,8 +23,10 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame0")
@@ -81,7 +81,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Manwha"]["Video"]
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 277.0, 378.0, resize_factor=1.5)
 
 def start_move(event):
@@ -103,7 +103,7 @@ def ex_close(win):
     with open("Files/Player Data/Tabs.json",'w') as fin_tab_son:
         tab_son_data["Shop"]='Close'
         ujson.dump(tab_son_data,fin_tab_son,indent=4)
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     win.quit()
 
 with open("Files/Player Data/Status.json", 'r') as fson:
@@ -118,13 +118,13 @@ def open_prog(name, cat, rank, desc, value):
             rec=[name,cat,rank,desc,value]
             fw.writerow(rec)
 
-        subprocess.Popen([sys.executable, resource_path('Manwha Version/Shop/gui1.py')])
+        thesystem.windows.open_script('Manwha Version/Shop/gui1.py')
 
         ex_close(window)
 
 def sell_tab():
     if lvl>=5:
-        subprocess.Popen([sys.executable, resource_path('Manwha Version/Shop Sell/gui1.py')])
+        thesystem.windows.open_script('Manwha Version/Shop Sell/gui1.py')
 
         ex_close(window)
 
@@ -10,13 +10,11 @@ from pathlib import Path
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
 import ujson
 import csv
-import subprocess
 import cv2
 from PIL import Image, ImageTk
 import sys
 import os
 import numpy as np
-from thesystem.misc import resource_path
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -25,8 +23,10 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame0")
@@ -65,7 +65,7 @@ def move_window(event):
 
 
 def ex_close(win):
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, target_height, window_width, step=25, delay=1)
     win.quit()
 
@@ -215,7 +215,7 @@ def preview(nameob,quantity):
             fw=csv.writer(new_csv_open)
             rec=[nameob, quantity]
             fw.writerow(rec)
-        subprocess.Popen([sys.executable, resource_path('Manwha Version/Preview Item/gui.py')])
+        thesystem.windows.open_script('Manwha Version/Preview Item/gui.py')
 
 def delete():
     with open("Files/Player Data/Skill.json", 'r') as fols:
@@ -226,13 +226,13 @@ def delete():
     with open("Files/Player Data/Skill.json", 'r') as fols:
         ujson.dump(skills, fols, indent=6)
 
-    subprocess.Popen([sys.executable, resource_path('Manwha Version/Skills Tab/gui.py')])
+    thesystem.windows.open_script('Manwha Version/Skills Tab/gui.py')
 
     ex_close(window)
 
 def update():
     if lvl!="MAX":
-        subprocess.Popen([sys.executable, resource_path('Manwha Version/Skill Info/gui1.py')])
+        thesystem.windows.open_script('Manwha Version/Skill Info/gui1.py')
 
         ex_close(window)
 
@@ -351,7 +351,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Manwha"]["Video"]
-    preloaded_frames=np.load(video_path)  # Replace with your video path
+    preloaded_frames=thesystem.system.load_video_frames(video_path)  # Replace with your video path
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 320.0, 100.0)
 
 image_image_2 = PhotoImage(
@@ -419,7 +419,7 @@ button_1 = Button(
     image=button_image_1,
     borderwidth=0,
     highlightthickness=0,
-    command=lambda: (subprocess.Popen([sys.executable, resource_path('Manwha Version/Skills Tab/gui.py')]),ex_close(window)),
+    command=lambda: (thesystem.windows.open_script('Manwha Version/Skills Tab/gui.py'),ex_close(window)),
     relief="flat"
 )
 button_1.place(
@@ -10,14 +10,12 @@ from pathlib import Path
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
 import ujson
 import csv
-import subprocess
 import random
 import cv2
 from PIL import Image, ImageTk
 import sys
 import os
 import numpy as np
-from thesystem.misc import resource_path
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -26,8 +24,10 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH2 = OUTPUT_PATH / Path(r"assets\frame3")
@@ -67,8 +67,8 @@ def move_window(event):
 
 
 def ex_close(win):
-    subprocess.Popen([sys.executable, resource_path('Manwha Version/Skills Tab/gui.py')])
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.windows.open_script('Manwha Version/Skills Tab/gui.py')
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, target_height, window_width, step=40, delay=1)
     window.quit()
 
@@ -108,7 +108,7 @@ def open_prog(name):
             rec=[name]
             fw.writerow(rec)
 
-        subprocess.Popen([sys.executable, resource_path('Manwha Version/Skill Info/gui.py')])
+        thesystem.windows.open_script('Manwha Version/Skill Info/gui.py')
 
         ex_close(window)
 
@@ -134,7 +134,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Manwha"]["Video"]
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 250.0, 150.0)
 
 image_image_2 = PhotoImage(
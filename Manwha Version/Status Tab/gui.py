@@ -12,7 +12,6 @@ import threading
 import ujson
 import json
 import csv
-import subprocess
 import time
 import cv2
 from PIL import Image, ImageTk
@@ -21,7 +20,6 @@ import pandas as pd
 import sys
 import os
 import numpy as np
-from thesystem.misc import resource_path
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -30,6 +28,8 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
+import thesystem.audio
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame0")
@@ -53,7 +53,7 @@ window_width = 355
 window.geometry(f"{window_width}x{initial_height}")
 thesystem.system.animate_window_open(window, target_height, window_width, step=40, delay=1)
 
-subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx.py')])
+thesystem.audio.play("Open SFX")
 window.configure(bg = "#FFFFFF")
 set_data=thesystem.misc.return_settings()
 transp_value=set_data["Settings"]["Transparency"]
@@ -82,12 +82,12 @@ def ex_close(eve):
         ujson.dump(tab_son_data,fin_tab_son,indent=4)
 
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     stop_update_thread_func()
     thesystem.system.animate_window_close(window, initial_height, window_width, step=20, delay=1)
 
 def title_chng(event):
-    subprocess.Popen([sys.executable, resource_path('Manwha Version/Equip Title/gui.py')])
+    thesystem.windows.open_script('Manwha Version/Equip Title/gui.py')
 
     ex_close(0)
 
@@ -175,8 +175,8 @@ def start_job(event):
         ujson.dump(data, fson, indent=4)
 
 def fatigue_window():
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_button.py')])
-    subprocess.Popen([sys.executable, resource_path('Manwha Version/Fatigue/gui.py')])
+    thesystem.audio.play("Button SFX")
+    thesystem.windows.open_script('Manwha Version/Fatigue/gui.py')
 
 canvas = Canvas(
     window,
@@ -200,7 +200,7 @@ image_1 = canvas.create_image(
 with open("Files/Mod/presets.json", 'r') as pres_file:
     pres_file_data=ujson.load(pres_file)
     video_path=pres_file_data["Manwha"]["Video"]
-    preloaded_frames=np.load(video_path)
+    preloaded_frames=thesystem.system.load_video_frames(video_path)
 player = thesystem.system.FastVideoPlayer(canvas, preloaded_frames, 200.0, 180.0, resize_factor=1.2)
 
 image_image_2 = PhotoImage(
@@ -316,7 +316,7 @@ fin_xp=round(fin_list[1], 2)
 
 if re_check==True:
     try:
-        subprocess.Popen([sys.executable, resource_path("Manwha Version/Status Tab/gui.py")])
+        thesystem.windows.open_script("Manwha Version/Status Tab/gui.py")
         
         ex_close(0)
     except:
@@ -334,7 +334,7 @@ def update_stat(stat_name):
             data["status"][0][stat_name] += 1
             val=data["status"][0][stat_name]
             canvas.itemconfig(stat_text_widgets[stat_name], text=f"{val:03d}")
-            subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_point.py')])
+            thesystem.audio.play("Point SFX")
             data["avail_eq"][0]["str_based" if stat_name in ["str", "agi", "vit"] else "int_based"] -= 1
             if stat_name=='vit':
                 data["status"][0]["fatigue_max"]+=20
@@ -351,7 +351,7 @@ def update_stat(stat_name):
         with open("Files/Temp Files/Urgent Temp.csv", 'w', newline='') as urgent_file:
             fr=csv.writer(urgent_file)
             fr.writerow([stat_name.upper()])
-        subprocess.Popen([sys.executable, resource_path('Manwha Version/Urgent Quest/gui.py')])
+        thesystem.windows.open_script('Manwha Version/Urgent Quest/gui.py')
         ex_close(0)
 
 # / =================================================
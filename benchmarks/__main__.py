@@ -0,0 +1,68 @@
+"""
+Core-logic micro-benchmarks, headless.
+
+    python -m benchmarks                 run every case and compare with baseline.json
+    python -m benchmarks -k dungeon      only cases whose name contains "dungeon"
+    python -m benchmarks --update        record the results as the new baseline
+    python -m benchmarks --threshold 2   fail only past twice the baseline
+
+Exits with status 1 when any case's best time is slower than its baseline
+by more than the threshold. Baselines are per machine; record one with
+--update on the machine that runs the comparison.
+"""
+import argparse
+import shutil
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import harness
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", dest="pattern", default="", help="only run cases whose name contains this")
+    parser.add_argument("--update", action="store_true", help="write the results to the baseline file")
+    parser.add_argument("--threshold", type=float, default=harness.THRESHOLD)
+    parser.add_argument("--baseline", default=harness.BASELINE_FILE)
+    args = parser.parse_args(argv)
+
+    workspace = harness.prepare_workspace()
+    try:
+        import benchmarks.cases  # noqa: F401  (registers the cases)
+        cases = [bench for bench in harness.CASES if args.pattern.lower() in bench.name.lower()]
+        if not cases:
+            print(f"No case matches '{args.pattern}'")
+            return 2
+        results = harness.run_cases(cases)
+    finally:
+        harness.close_workspace()
+        os.chdir(harness.REPO_ROOT)
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    if args.update:
+        harness.save_baseline(results, args.baseline)
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    baseline = harness.load_baseline(args.baseline)
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}; run with --update to record one.")
+        return 0
+    if baseline.get("machine") != harness.machine():
+        print(f"\nNote: the baseline was recorded on {baseline.get('machine')}")
+
+    regressions = harness.compare(results, baseline, args.threshold)
+    if not regressions:
+        print(f"\nNo case slower than {args.threshold}x its baseline.")
+        return 0
+    print(f"\n{len(regressions)} case(s) slower than {args.threshold}x the baseline:")
+    for name, reference, median in regressions:
+        print(f"  {name:<44} {harness.format_seconds(reference):>10} -> {harness.format_seconds(median):>10}"
+              f"  ({median / reference:.2f}x)")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
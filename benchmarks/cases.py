@@ -0,0 +1,180 @@
+"""
+The benchmark cases. Imported only after harness.prepare_workspace(), since
+the modules under test read and write "Files/..." relative to the working
+directory.
+"""
+import importlib.util
+import contextlib
+import io
+import os
+from datetime import datetime
+
+import thesystem.system
+import thesystem.dungeon
+import thesystem.nightmarket
+import thesystem.quests
+from thesystem.assets import assets
+from thesystem.state import player_state
+
+from benchmarks.harness import REPO_ROOT, case
+
+BAR_FOLDER = "thesystem/top_bar"
+BAR_SIZE = (488, 38)
+
+
+# --- Levels ------------------------------------------------------------------
+
+@case("xp_formula levels 1-1000", number=20)
+def xp_formula_sweep():
+    for level in range(1, 1001):
+        thesystem.system.xp_formula(level)
+
+
+def set_level(level, xp):
+    status = player_state.status()
+    status["level"] = level
+    status["last_level"] = level
+    status["XP"] = xp
+    player_state.update("Status.json")
+
+
+real_rank_up = thesystem.system.rank_up
+
+
+def climb_setup():
+    set_level(1, thesystem.system.xp_formula(300) + 1)
+    # The level-up screen is not part of what is measured
+    thesystem.system.rank_up = lambda old_lvl, new_lvl: None
+
+
+def climb_teardown():
+    thesystem.system.rank_up = real_rank_up
+
+
+@case("get_fin_xp climb 1 -> 300", setup=climb_setup, teardown=climb_teardown)
+def get_fin_xp_climb():
+    thesystem.system.get_fin_xp()
+
+
+@case("get_fin_xp at level 500", setup=lambda: set_level(500, thesystem.system.xp_formula(500) + 1), number=50)
+def get_fin_xp_high():
+    thesystem.system.get_fin_xp()
+
+
+# --- Dungeons ----------------------------------------------------------------
+
+@case("dun_check (today already rolled)", setup=thesystem.dungeon.dun_check, number=50)
+def dun_check_cached():
+    thesystem.dungeon.dun_check()
+
+
+def forget_todays_dungeons():
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(os.path.join("Files", "Player Data", "Todays_Dungeon.json"))
+
+
+@case("dun_check (new day)", setup=forget_todays_dungeons)
+def dun_check_new_day():
+    thesystem.dungeon.dun_check()
+
+
+@case("dungeon_rank_get all ranks", number=20)
+def dungeon_rank_get():
+    for rank in ["E", "D", "C", "B", "A", "S"]:
+        for amount, kind in [(50, "amt"), (15, "amt"), (30, "amt"), (45, "time"), (60, "time")]:
+            thesystem.dungeon.dungeon_rank_get(rank, amount, kind, "")
+
+
+def load_dungeon_runs():
+    path = os.path.join(REPO_ROOT, "Anime Version", "Dungeon Runs", "gui.py")
+    spec = importlib.util.spec_from_file_location("dungeon_runs_gui", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.DungeonSystem
+
+
+DungeonSystem = load_dungeon_runs()
+
+
+def make_waves(rank):
+    dungeon = DungeonSystem.__new__(DungeonSystem)
+    dungeon.rank = rank
+    dungeon.XP_val = 0
+    dungeon.generate_waves()
+    return dungeon
+
+
+@case("Dungeon Runs generate_waves S rank", number=10)
+def generate_waves_s():
+    make_waves("S")
+
+
+@case("Dungeon Runs generate_waves E rank", number=10)
+def generate_waves_e():
+    make_waves("E")
+
+
+@case("dungeonsim S rank 100k runs", repeat=3)
+def dungeon_simulator():
+    import thesystem.dungeonsim
+    thesystem.dungeonsim.simulate("S", thesystem.dungeonsim.Profile(70, 200, 180, completion=0.8), runs=100_000)
+
+
+@case("raidsim floor 60 1000 fights", repeat=3)
+def raid_simulator():
+    import thesystem.raidsim
+    player = {"level": 40, "str": 60, "agi": 50, "vit": 60}
+    thesystem.raidsim.fight_chunk(60, 0, 1000, player, thesystem.raidsim.Athlete(), 2222)
+
+
+# --- Shops, skills and quests ------------------------------------------------
+
+@case("nightmarket _create_new_weekly_data", number=5)
+def night_market_week():
+    monday = datetime(2025, 1, 6)
+    thesystem.nightmarket._create_new_weekly_data(monday.strftime("%Y-%m-%d"), monday)
+
+
+def skill_roll_setup():
+    status = player_state.status()
+    status["level"] = 25
+    player_state.update("Status.json")
+    player_state.get("Skill_old_check.json")["old_stat"][0]["lvl"] = 20
+    player_state.update("Skill_old_check.json")
+
+
+@case("random_skill_check level-up roll", setup=skill_roll_setup)
+def random_skill_roll():
+    thesystem.system.random_skill_check()
+
+
+@case("quest_adding_func reward selection", number=10)
+def quest_rewards():
+    for rank in ["E", "D", "C", "B", "A", "S"]:
+        thesystem.quests.quest_rewards(rank, "STR")
+
+
+# --- Frame caches ------------------------------------------------------------
+
+@case("images_to_npy_with_mode 270 frames 488x38", repeat=3)
+def build_bar_stack():
+    with contextlib.redirect_stdout(io.StringIO()):
+        thesystem.system.images_to_npy_with_mode(BAR_FOLDER, "bench top 488 38.npy", resize=BAR_SIZE)
+
+
+def build_bar_cache():
+    import thesystem.cachebuild
+    asset = assets.declare(BAR_FOLDER, BAR_SIZE, "NONE", "top")
+    if not thesystem.cachebuild.stack_is_fresh(BAR_FOLDER, asset.cache_path, BAR_SIZE):
+        asset.load(decode=True, count=False)
+    asset.stack = None
+
+
+@case("load_or_cache_images from npy", setup=build_bar_cache, number=1)
+def load_bar_cold():
+    thesystem.system.load_or_cache_images(BAR_FOLDER, BAR_SIZE, "NONE", "top")
+
+
+@case("load_or_cache_images from memory", setup=lambda: load_bar_cold(), number=200)
+def load_bar_warm():
+    thesystem.system.load_or_cache_images(BAR_FOLDER, BAR_SIZE, "NONE", "top")
@@ -0,0 +1,182 @@
+import statistics
+import platform
+import tempfile
+import random
+import shutil
+import ujson
+import time
+import sys
+import os
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_FILE = os.path.join(REPO_ROOT, "benchmarks", "baseline.json")
+
+# A case regresses when its best time is this many times its baseline best time...
+THRESHOLD = 1.5
+# ...and slower by more than this, so timer noise on microsecond cases is not a failure
+NOISE_SECONDS = 50e-6
+
+# Every repeat starts from the same random state, so cases that roll dice
+# (wave counts, rewards, skills) do the same work each time
+SEED = 2222
+
+# Copied into the workspace, so cases can write player data freely
+COPIED = ["Files/Data", "Files/Player Data", "Files/Checks", "Files/Temp Files", "Files/Workout"]
+# Read-only and large, linked instead
+LINKED = ["Files/Mod"]
+
+CASES = []
+
+
+class Case:
+    """
+    One benchmark. `run` is timed `number` times in a row per repeat;
+    `setup` and `teardown` run around every repeat, untimed.
+    """
+
+    def __init__(self, name, run, setup=None, teardown=None, number=1, repeat=7):
+        self.name = name
+        self.run = run
+        self.setup = setup
+        self.teardown = teardown
+        self.number = number
+        self.repeat = repeat
+
+    def measure(self):
+        """Seconds per call for each repeat."""
+        times = []
+        for _ in range(self.repeat):
+            if self.setup is not None:
+                self.setup()
+            random.seed(SEED)
+            try:
+                start = time.perf_counter()
+                for _ in range(self.number):
+                    self.run()
+                times.append((time.perf_counter() - start) / self.number)
+            finally:
+                if self.teardown is not None:
+                    self.teardown()
+        return times
+
+
+def case(name, setup=None, teardown=None, number=1, repeat=7):
+    """Register the decorated function as a benchmark case."""
+    def register(run):
+        CASES.append(Case(name, run, setup, teardown, number, repeat))
+        return run
+    return register
+
+
+def prepare_workspace(link_assets=False, chdir=True):
+    """
+    Copy the game's data into a temporary folder and make it the working
+    directory, so every relative "Files/..." path the code opens lands
+    there. Must run before thesystem is imported: several modules resolve
+    their files and storage backend at import time.
+
+    With link_assets the thesystem/ asset folders (and the frame caches in
+    them) are linked as they are, for running real screens; otherwise only
+    the top bar's source frames are copied.
+    """
+    workspace = tempfile.mkdtemp(prefix="thesystem-bench-")
+    for path in COPIED:
+        shutil.copytree(os.path.join(REPO_ROOT, path), os.path.join(workspace, path))
+    for path in LINKED:
+        os.symlink(os.path.join(REPO_ROOT, path), os.path.join(workspace, path))
+
+    os.makedirs(os.path.join(workspace, "thesystem"))
+    if link_assets:
+        for name in os.listdir(os.path.join(REPO_ROOT, "thesystem")):
+            source = os.path.join(REPO_ROOT, "thesystem", name)
+            if os.path.isdir(source) and name != "__pycache__":
+                os.symlink(source, os.path.join(workspace, "thesystem", name))
+    else:
+        # Frame sources only; the cases build their own caches
+        bars = os.path.join(workspace, "thesystem", "top_bar")
+        os.makedirs(bars)
+        source = os.path.join(REPO_ROOT, "thesystem", "top_bar")
+        for name in os.listdir(source):
+            if name.endswith(".png"):
+                shutil.copy2(os.path.join(source, name), bars)
+
+    os.environ.setdefault("THESYSTEM_AUDIO", "null")
+    os.environ.setdefault("THESYSTEM_STORAGE", "json")
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    if chdir:
+        os.chdir(workspace)
+    return workspace
+
+
+def close_workspace():
+    """Write out what the cases left pending while the workspace is still the working directory."""
+    if "thesystem.state" in sys.modules:
+        sys.modules["thesystem.state"].player_state.flush()
+    if "thesystem.journal" in sys.modules:
+        sys.modules["thesystem.journal"].journal.close()
+
+
+def machine():
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def run_cases(cases, log=print):
+    results = {}
+    for bench in cases:
+        times = bench.measure()
+        results[bench.name] = {
+            "median": statistics.median(times),
+            "min": min(times),
+            "repeat": bench.repeat,
+            "number": bench.number,
+        }
+        log(f"{bench.name:<44} median {format_seconds(results[bench.name]['median']):>10}"
+            f"   min {format_seconds(results[bench.name]['min']):>10}")
+    return results
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """
+    Return (name, baseline, result) best times for every case past the
+    threshold. The best of the repeats is compared rather than the median:
+    it is what the code costs with the least interference from the rest of
+    the machine, and moves far less between runs.
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get("cases", {}).get(name)
+        if reference is None:
+            continue
+        if result["min"] > reference["min"] * threshold and result["min"] - reference["min"] > NOISE_SECONDS:
+            regressions.append((name, reference["min"], result["min"]))
+    return regressions
+
+
+def load_baseline(path=BASELINE_FILE):
+    try:
+        with open(path, 'r') as f:
+            return ujson.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(results, path=BASELINE_FILE, merge=True):
+    baseline = (load_baseline(path) if merge else None) or {"cases": {}}
+    baseline["machine"] = machine()
+    baseline["cases"].update(results)
+    baseline["cases"] = dict(sorted(baseline["cases"].items()))
+    with open(path, 'w') as f:
+        ujson.dump(baseline, f, indent=4)
+
+
+def format_seconds(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.3f}s"
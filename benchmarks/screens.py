@@ -0,0 +1,295 @@
+"""
+Screen-open latency under a virtual X display.
+
+    python -m benchmarks.screens                      every screen of both versions, one process each
+    python -m benchmarks.screens --theme Anime -k Status
+    python -m benchmarks.screens --hosted             open them in one window host, as gui.py does
+    python -m benchmarks.screens --output latency.json
+
+Each screen runs with THESYSTEM_LATENCY pointing at a log that
+thesystem.latency appends its milestones to: interpreter up (the
+screen's imports reach thesystem), import done (the screen creates its
+window), the first mainloop pass, the first bar animation frame and the
+first video frame. Times are measured from process start, i.e. the Popen
+(or the host's open), so they are what a click in gui.py open_tab costs. Peak RSS is sampled from
+outside as well as reported by the process itself.
+
+Xvfb is started on a free display unless --display names one that is
+already running. The screens run in a copy of Files/ so player data is
+not touched; the thesystem/ frame caches are used (and rebuilt) in place.
+"""
+import argparse
+import subprocess
+import shutil
+import ujson
+import time
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import harness
+
+THEMES = ["Anime", "Manwha"]
+COLUMNS = ["interpreter up", "import done", "mainloop", "bar frame", "video frame"]
+# A screen without video is done once no new milestone has come for this long after mainloop
+SETTLE_SECONDS = 1.5
+POLL_SECONDS = 0.02
+
+
+def find_screens(themes, pattern=""):
+    screens = []
+    for theme in themes:
+        folder = os.path.join(harness.REPO_ROOT, f"{theme} Version")
+        for name in sorted(os.listdir(folder)):
+            script = os.path.join(folder, name, "gui.py")
+            if os.path.isfile(script) and pattern.lower() in f"{theme} {name}".lower():
+                screens.append((f"{theme}/{name}", script))
+    return screens
+
+
+def start_virtual_display():
+    """Start Xvfb on a free display number. Returns (process, ':N')."""
+    if shutil.which("Xvfb") is None:
+        raise SystemExit("Xvfb was not found. Install it (e.g. the xvfb package) or pass --display for a running X server.")
+    read_fd, write_fd = os.pipe()
+    proc = subprocess.Popen(
+        ["Xvfb", "-displayfd", str(write_fd), "-screen", "0", "1920x1080x24", "-nolisten", "tcp"],
+        pass_fds=(write_fd,), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    os.close(write_fd)
+    number = b""
+    while not number.endswith(b"\n"):
+        chunk = os.read(read_fd, 16)
+        if not chunk:
+            proc.kill()
+            raise SystemExit("Xvfb exited before reporting its display.")
+        number += chunk
+    os.close(read_fd)
+    return proc, f":{number.decode().strip()}"
+
+
+class MarkLog:
+    """Reads the marks appended to the latency log since the last call."""
+
+    def __init__(self, path):
+        self.path = path
+        self.offset = 0
+
+    def read(self):
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self.offset)
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        end = data.rfind(b"\n") + 1
+        self.offset += end
+        return [ujson.loads(line) for line in data[:end].splitlines() if line.strip()]
+
+
+def sample_rss(proc):
+    import psutil
+    try:
+        process = psutil.Process(proc.pid)
+        return sum(p.memory_info().rss for p in [process] + process.children(recursive=True))
+    except psutil.Error:
+        return 0
+
+
+def finished(events, last_change, now):
+    if "video frame" in events:
+        return True
+    return "mainloop" in events and now - last_change >= SETTLE_SECONDS
+
+
+def run_standalone(script, workspace, env, log, timeout):
+    """Launch one screen in its own interpreter and wait for its milestones."""
+    events = {}
+    rss = 0
+    with open(os.path.join(workspace, "stderr.txt"), "wb") as stderr:
+        start = time.time()
+        proc = subprocess.Popen([sys.executable, script], cwd=workspace, env=env,
+                                stdout=subprocess.DEVNULL, stderr=stderr)
+        last_change = time.time()
+        status = "timeout"
+        while time.time() - start < timeout:
+            for entry in log.read():
+                if entry["pid"] == proc.pid:
+                    events[entry["event"]] = entry
+                    last_change = time.time()
+            rss = max(rss, sample_rss(proc))
+            if finished(events, last_change, time.time()):
+                status = "ok"
+                break
+            if proc.poll() is not None:
+                status = f"exited {proc.returncode}"
+                break
+            time.sleep(POLL_SECONDS)
+
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=3)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+
+    result = summarize(events, start, status, rss)
+    if status != "ok":
+        with open(os.path.join(workspace, "stderr.txt"), "rb") as f:
+            lines = f.read().decode(errors="replace").strip().splitlines()
+        if lines:
+            result["error"] = lines[-1]
+    return result
+
+
+def run_hosted(screens, workspace, env, log, timeout):
+    """Open every screen, one after the other, inside a single window-host process."""
+    host = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--host-child", "--timeout", str(timeout), "--"]
+        + [script for _, script in screens],
+        cwd=workspace, env=env, stdout=subprocess.DEVNULL
+    )
+    deadline = time.time() + timeout * len(screens) + 30
+    rss = 0
+    while host.poll() is None and time.time() < deadline:
+        rss = max(rss, sample_rss(host))
+        time.sleep(POLL_SECONDS)
+    if host.poll() is None:
+        host.kill()
+        host.wait()
+
+    by_screen = {}
+    for entry in log.read():
+        if entry["pid"] == host.pid and entry["screen"]:
+            by_screen.setdefault(entry["screen"], {})[entry["event"]] = entry
+
+    results = {}
+    for name, script in screens:
+        events = by_screen.get(script, {})
+        opened = events.get("open")
+        if opened is None:
+            results[name] = summarize({}, 0, "not reached", rss)
+            continue
+        status = "ok" if "video frame" in events or "mainloop" in events else "failed"
+        results[name] = summarize(events, opened["t"], status, rss)
+    return results
+
+
+def host_child(scripts, timeout):
+    """The --hosted child: a withdrawn root with the window host, as gui.py runs it."""
+    import tkinter
+    import thesystem.windows
+    import thesystem.latency
+
+    root = tkinter.Tk()
+    root.withdraw()
+    host = thesystem.windows.install_host(root)
+    pending = list(scripts)
+    state = {}
+
+    def close_screens():
+        for window in host.windows:
+            window.quit()
+        host.windows = []
+
+    def open_next():
+        close_screens()
+        if not pending:
+            root.quit()
+            return
+        script = pending.pop(0)
+        state.update(started=time.time(), last_change=time.time(), seen=0)
+        host.run(script)
+        root.after(int(POLL_SECONDS * 1000), watch)
+
+    def watch():
+        now = time.time()
+        seen = set(thesystem.latency._seen)
+        if len(seen) != state["seen"]:
+            state.update(seen=len(seen), last_change=now)
+        if finished(seen, state["last_change"], now) or now - state["started"] >= timeout or not host.windows:
+            open_next()
+        else:
+            root.after(int(POLL_SECONDS * 1000), watch)
+
+    root.after(0, open_next)
+    root.mainloop()
+
+
+def summarize(events, start, status, sampled_rss):
+    result = {"status": status}
+    for event in COLUMNS:
+        if event in events:
+            result[event] = round((events[event]["t"] - start) * 1000, 1)
+    reported = [entry["rss"] for entry in events.values() if entry.get("rss")]
+    result["peak_rss_mb"] = round(max(reported + [sampled_rss]) / (1 << 20), 1)
+    return result
+
+
+def print_table(results):
+    header = f"{'screen':<36}" + "".join(f"{column:>14}" for column in COLUMNS) + f"{'peak RSS':>11}  status"
+    print(header)
+    print("-" * len(header))
+    for name, result in results.items():
+        cells = "".join(f"{result[column]:>12.0f}ms" if column in result else f"{'-':>14}" for column in COLUMNS)
+        error = f"  ({result['error']})" if "error" in result else ""
+        print(f"{name:<36}{cells}{result['peak_rss_mb']:>9.0f}MB  {result['status']}{error}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.screens")
+    parser.add_argument("--theme", choices=THEMES, action="append", help="version(s) to run; both by default")
+    parser.add_argument("-k", dest="pattern", default="", help="only screens whose 'Theme/Name' contains this")
+    parser.add_argument("--hosted", action="store_true", help="open the screens in one window host instead of one process each")
+    parser.add_argument("--timeout", type=float, default=20, help="seconds to wait for one screen")
+    parser.add_argument("--display", help="use this running X display instead of starting Xvfb")
+    parser.add_argument("--output", help="also write the results to this JSON file")
+    parser.add_argument("--host-child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("scripts", nargs="*", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.host_child:
+        host_child(args.scripts, args.timeout)
+        return 0
+
+    screens = find_screens(args.theme or THEMES, args.pattern)
+    if not screens:
+        print(f"No screen matches '{args.pattern}'")
+        return 2
+
+    xvfb = None
+    display = args.display
+    if display is None:
+        xvfb, display = start_virtual_display()
+
+    workspace = harness.prepare_workspace(link_assets=True, chdir=False)
+    log_path = os.path.join(workspace, "latency.jsonl")
+    env = dict(os.environ, DISPLAY=display, THESYSTEM_LATENCY=log_path,
+               PYTHONPATH=os.pathsep.join(filter(None, [harness.REPO_ROOT, os.environ.get("PYTHONPATH")])))
+    log = MarkLog(log_path)
+
+    try:
+        if args.hosted:
+            results = run_hosted(screens, workspace, env, log, args.timeout)
+        else:
+            results = {}
+            for name, script in screens:
+                results[name] = run_standalone(script, workspace, env, log, args.timeout)
+                print(f"  {name}: {results[name]['status']}", file=sys.stderr)
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+
+    print_table(results)
+    if args.output:
+        with open(args.output, "w") as f:
+            ujson.dump({"machine": harness.machine(), "hosted": args.hosted, "screens": results}, f, indent=4)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,9 +21,7 @@ import pandas as pd
 import sys
 import os
 import pandas as pd
-from packaging import version
 from io import StringIO
-import requests
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -33,7 +31,13 @@ sys.path.insert(0, project_root)
 
 import thesystem.skills
 import thesystem.system
+import thesystem.audio
 import thesystem.misc
+import thesystem.windows
+import thesystem.watcher
+from thesystem.state import player_state
+from thesystem.scheduler import scheduler
+from thesystem.updates import update_checker
 
 OUTPUT_PATH = Path(__file__).parent 
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame0")
@@ -42,8 +46,8 @@ ASSETS_PATH = OUTPUT_PATH / Path(r"assets\frame0")
 def relative_to_assets(path: str) -> Path:
     return ASSETS_PATH / Path(path)
 
-if os.path.exists("thesystem/temp 7x2.txt"):
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path('npy_creator.py')])
+# Stale or missing bar caches are rebuilt one at a time in the background by
+# load_or_cache_images (thesystem.cachebuild), so there is no full rebuild at startup.
 
 def get_base_path():
     """Get the correct base path for file operations"""
@@ -135,13 +139,11 @@ if vow==False:
         return ASSETS_PATH / Path(path)
 
     def load_data():
-        with open('Files/Player Data/Status.json', 'r') as file:
-            return json.load(file)
+        return player_state.get('Status.json')
 
     # Function to save the updated JSON data
     def save_data(data):
-        with open('Files/Player Data/Status.json', 'w') as file:
-            json.dump(data, file, indent=4)
+        player_state.update('Status.json', data)
 
     # Function to reduce fatigue by 1% of fatigue_max every 3 minutes
     FATIGUE_INTERVAL_SECONDS = 180  # 3 minutes
@@ -181,20 +183,16 @@ if vow==False:
         return data
 
     def reduce_fatigue():
-        global stop_thread
-        while not stop_thread:
-            data = load_data()
+        # Scheduler job, runs again every FATIGUE_INTERVAL_SECONDS until stop_thread is set
+        if stop_thread:
+            return None
+        data = load_data()
 
-            # Apply missed reductions (and create timestamp if missing)
-            data = apply_missed_fatigue(data)
+        # Apply missed reductions (and create timestamp if missing)
+        data = apply_missed_fatigue(data)
 
-            save_data(data)
-
-            # Wait with early-stop support
-            for _ in range(FATIGUE_INTERVAL_SECONDS):
-                if stop_thread:
-                    return
-                time.sleep(1)
+        save_data(data)
+        return FATIGUE_INTERVAL_SECONDS
 
     def start_move(event):
         window.lastx, window.lasty = event.widget.winfo_pointerxy()
@@ -258,40 +256,43 @@ if vow==False:
             json.dump(data, stfson, indent=4)
 
         if abi=="STR":
-            subprocess.Popen([sys.executable, thesystem.misc.resource_path(f'{theme} Version/All Jobs/gui.py')])
+            thesystem.windows.open_screen("All Jobs", "gui.py", theme=theme)
         elif abi=="AGI":
-            subprocess.Popen([sys.executable, thesystem.misc.resource_path(f'{theme} Version/All Jobs/gui1.py')])
+            thesystem.windows.open_screen("All Jobs", "gui1.py", theme=theme)
         elif abi=="VIT":
-            subprocess.Popen([sys.executable, thesystem.misc.resource_path(f'{theme} Version/All Jobs/gui2.py')])
+            thesystem.windows.open_screen("All Jobs", "gui2.py", theme=theme)
         elif abi=="INT":
-            subprocess.Popen([sys.executable, thesystem.misc.resource_path(f'{theme} Version/All Jobs/gui3.py')])
+            thesystem.windows.open_screen("All Jobs", "gui3.py", theme=theme)
         elif abi=="PER":
-            subprocess.Popen([sys.executable, thesystem.misc.resource_path(f'{theme} Version/All Jobs/gui4.py')])
+            thesystem.windows.open_screen("All Jobs", "gui4.py", theme=theme)
         elif abi=="MAN":
-            subprocess.Popen([sys.executable, thesystem.misc.resource_path(f'{theme} Version/All Jobs/gui5.py')])
+            thesystem.windows.open_screen("All Jobs", "gui5.py", theme=theme)
 
     def check_for_job():
-        while not stop_event1.is_set():
-            with open("Files/Player Data/Job_info.json", 'r') as fson:
-                data=json.load(fson)
-            job_check=data["status"][0]['job_active']
-            job_confim=data["status"][0]['job_confirm']
-
-            if job_check=='True' and job_confim=='False':
-                if data["status"][0]['job_check']=='False':
-                    data["status"][0]['job_check']='True'
-                    with open("Files/Player Data/Job_info.json", 'w') as fina_fson:
-                        json.dump(data, fina_fson, indent=4)
-            
-                    subprocess.Popen([sys.executable, thesystem.misc.resource_path(f'D:/Projects/System/{theme} Version/Accept Job Change/gui.py')])
-                    canvas.itemconfig("job", state='normal')
-                    timer_func()
-                    stop_event1.set()
-                else:
-                    canvas.itemconfig("job", state='normal')
-                    timer_func()
-                    stop_event1.set()
-            time.sleep(5)
+        # Scheduler job, checks again every 5 seconds until the job change has started
+        if stop_event1.is_set():
+            return None
+
+        with open("Files/Player Data/Job_info.json", 'r') as fson:
+            data=json.load(fson)
+        job_check=data["status"][0]['job_active']
+        job_confim=data["status"][0]['job_confirm']
+
+        if job_check=='True' and job_confim=='False':
+            if data["status"][0]['job_check']=='False':
+                data["status"][0]['job_check']='True'
+                with open("Files/Player Data/Job_info.json", 'w') as fina_fson:
+                    json.dump(data, fina_fson, indent=4)
+        
+                thesystem.windows.open_script(f'{theme} Version/Accept Job Change/gui.py')
+                canvas.itemconfig("job", state='normal')
+                timer_func()
+                stop_event1.set()
+            else:
+                canvas.itemconfig("job", state='normal')
+                timer_func()
+                stop_event1.set()
+        return 5
 
     window = Tk()
 
@@ -307,8 +308,21 @@ if vow==False:
 
     thesystem.system.make_window_transparent(window, "#292929")
 
-    thread0 = threading.Thread(target=thesystem.system.check_midnight, args=(window, stop_event0), daemon=True)
-    thread0.start()
+    # Every tab opened from here becomes a Toplevel of this window instead of a new interpreter
+    thesystem.windows.install_host(window)
+    # Sound effects and anything that cannot be hosted start from a warm interpreter
+    thesystem.windows.start_pool()
+    # The sounds decode in the background rather than on the first click
+    thesystem.audio.preload()
+
+    def settings_changed(path):
+        transp_value=player_state.settings()["Transparency"]
+        thesystem.windows.call_in_host(lambda: window.attributes('-alpha', transp_value))
+
+    # Player Data and Checks changes are pushed to subscribers instead of being polled
+    thesystem.watcher.watch("Files/Player Data/Settings.json", settings_changed)
+
+    thesystem.system.check_midnight(window, stop_event0)
 
     show_bar=False
     time0=25
@@ -316,7 +330,7 @@ if vow==False:
     def open_home(event):
         global show_bar
 
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_button.py')])
+        thesystem.audio.play("Button SFX")
         home_items = [
             "home", "home1", "home2", "home3", "home4", "home5", 
             "home6", "home7", "home8", "home9", "home10", "home11", 
@@ -344,7 +358,7 @@ if vow==False:
             show_bar = False
 
     def update_open(event):
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_button.py')])
+        thesystem.audio.play("Button SFX")
         stop_event.set()
         stop_event0.set()
         stop_event1.set()
@@ -355,10 +369,12 @@ if vow==False:
 
         # Wait for the threads to finish
 
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_close.py')])
+        thesystem.audio.play("Close SFX")
         subprocess.Popen([sys.executable, thesystem.misc.resource_path('update.py')])
         if os.path.exists("window_positions.json"):
             os.remove("window_positions.json")
+        window.withdraw()
+        thesystem.audio.drain()
         window.quit()
 
     def get_theme():
@@ -379,11 +395,10 @@ if vow==False:
                 json.dump(tab_data, f, indent=4)
 
             theme = get_theme()
-            gui_path = os.path.join(f"{theme} Version", gui_subpath, "gui.py")
-            
-            subprocess.Popen([sys.executable, thesystem.misc.resource_path(gui_path)])
+
+            thesystem.windows.open_screen(gui_subpath, theme=theme)
             if play_sfx:
-                subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_button.py')])
+                thesystem.audio.play("Button SFX")
 
     # Handlers for each tab
     def open_cal(e):        open_tab("Calories", "Calorie Input")
@@ -400,7 +415,7 @@ if vow==False:
     def shop_open(e):       open_tab("Shop", "Shop")
     
     def close_full(event):
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_button.py')])
+        thesystem.audio.play("Button SFX")
         stop_event.set()
         stop_event0.set()
         stop_event1.set()
@@ -415,7 +430,10 @@ if vow==False:
         if os.path.exists("window_positions.json"):
             os.remove("window_positions.json")
 
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_close.py')])
+        thesystem.audio.play("Close SFX")
+        # The mixer thread dies with the process; let the sound finish first
+        window.withdraw()
+        thesystem.audio.drain()
         sys.exit()
 
     def intro(event):
@@ -432,9 +450,8 @@ if vow==False:
                 tab_son_data["Intro"]='Open'
                 json.dump(tab_son_data,fin_tab_son,indent=4)
 
-            inv_name=f"{theme} Version/Intro/gui.py"
-            subprocess.Popen([sys.executable, thesystem.misc.resource_path(inv_name)])
-            subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx_button.py')])
+            thesystem.windows.open_screen("Intro", theme=theme)
+            thesystem.audio.play("Button SFX")
 
     def show_job():
         canvas.itemconfig("job", state="normal")
@@ -442,41 +459,10 @@ if vow==False:
     def hide_job():
         canvas.itemconfig("job", state="hidden")
 
-    def check_for_update() -> bool:
-        github_csv_url = "https://raw.githubusercontent.com/Venexs/The-System/Update_RAW/version.csv"
-        local_csv_path = "version.csv"
-
-        try:
-            # Get remote version as plain text
-            response = requests.get(github_csv_url)
-            response.raise_for_status()
-            remote_ver = response.text.strip().splitlines()[0]
-        except Exception as e:
-            print(f"[Update Check] Error reading remote version: {e}")
-            return False
-
-        try:
-            with open(local_csv_path, 'r') as f:
-                local_ver = f.readline().strip()
-        except Exception as e:
-            print(f"[Update Check] Error reading local version: {e}")
-            return False
-
-        try:
-            return version.parse(remote_ver) > version.parse(local_ver)
-        except Exception as e:
-            print(f"[Update Check] Version parsing failed: {e}")
-            return False
-    
-    def hourly_update_check():
-        with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
-            theme_data = json.load(themefile)
-            theme = theme_data["Theme"]
-
-        while True:
-            if check_for_update():
-                thesystem.system.message_open("Update")
-            time.sleep(1800)
+    def update_found(local_ver, latest_ver, manifest):
+        print(f"[Update Check] {local_ver} -> {latest_ver} available")
+        # Called on the checker's thread; the message screen is built on the Tk thread
+        thesystem.windows.call_in_host(lambda: thesystem.system.message_open("Update"))
 
 
     # ? =====================================================================
@@ -792,17 +778,14 @@ if vow==False:
     #thesystem.system.run_once_prog(stop_event0, thread0)
     thesystem.system.run_once_setting_chaneg()
 
-    voice_thread = threading.Thread(target=thesystem.misc.voice_activate, daemon=True)
-    voice_thread.start()
+    thesystem.misc.voice_activate()
 
-    skill_thread = threading.Thread(target=thesystem.skills.skill_tracking_and_fatigue, daemon=True)
-    skill_thread.start()
+    thesystem.skills.skill_tracking_and_fatigue()
 
-    update_thread = threading.Thread(target=hourly_update_check, daemon=True)
-    update_thread.start()
+    update_checker.subscribe(update_found)
+    update_checker.start()
 
-    thread1 = threading.Thread(target=check_for_job, daemon=True)
-    thread1.start()
+    scheduler.schedule("job change", check_for_job)
 
     window.resizable(False, False)
     window.mainloop()
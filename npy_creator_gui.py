@@ -1,24 +1,23 @@
 
 """
 NPY Creator GUI - Tkinter-based interface for recreating all npy files
-used by thesystem.system.load_or_cache_images function and video files
+used by thesystem.system.load_or_cache_images function and video files.
+The work itself is done by thesystem.cachebuild.
 
 This script provides a beautiful GUI interface that matches the aesthetic
 style of the update.py file and starts automatically.
 """
 
-import os
 import sys
-import numpy as np
 from thesystem.misc import resource_path
-from PIL import Image, ImageTk
+from thesystem.cachebuild import VIDEO_CONFIGURATIONS, discover_configurations, run_configurations
+from PIL import ImageTk
 import time
 import threading
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, messagebox
 import queue
-import cv2
 
 class NPYCreatorGUI:
     def __init__(self, root):
@@ -184,167 +183,14 @@ class NPYCreatorGUI:
     
     def setup_configurations(self):
         """Setup all the configurations to process."""
-        # Image configurations
-        self.image_configurations = [
-            # Anime Version configurations
-            ("thesystem/top_bar", (400, 19), "NONE", "top"),
-            ("thesystem/bottom_bar", (400, 16), "NONE", "bottom"),
-            ("thesystem/alt_top_bar", (400, 19), "JOB", "top"),
-            ("thesystem/alt_bottom_bar", (400, 16), "JOB", "bottom"),
-            
-            ("thesystem/top_bar", (488, 38), "NONE", "top"),
-            ("thesystem/bottom_bar", (488, 33), "NONE", "bottom"),
-            ("thesystem/alt_top_bar", (488, 38), "JOB", "top"),
-            ("thesystem/alt_bottom_bar", (488, 33), "JOB", "bottom"),
-            
-            ("thesystem/top_bar", (490, 34), "NONE", "top"),
-            ("thesystem/bottom_bar", (490, 34), "NONE", "bottom"),
-            ("thesystem/alt_top_bar", (490, 34), "JOB", "top"),
-            ("thesystem/alt_bottom_bar", (490, 34), "JOB", "bottom"),
-            
-            ("thesystem/top_bar", (550, 38), "NONE", "top"),
-            ("thesystem/bottom_bar", (550, 33), "NONE", "bottom"),
-            ("thesystem/alt_top_bar", (550, 38), "JOB", "top"),
-            ("thesystem/alt_bottom_bar", (550, 33), "JOB", "bottom"),
-            
-            ("thesystem/top_bar", (580, 38), "NONE", "top"),
-            ("thesystem/bottom_bar", (580, 33), "NONE", "bottom"),
-            ("thesystem/alt_top_bar", (580, 38), "JOB", "top"),
-            ("thesystem/alt_bottom_bar", (580, 33), "JOB", "bottom"),
-            
-            ("thesystem/top_bar", (587, 19), "NONE", "top"),
-            ("thesystem/bottom_bar", (587, 16), "NONE", "bottom"),
-            ("thesystem/alt_top_bar", (587, 19), "JOB", "top"),
-            ("thesystem/alt_bottom_bar", (587, 16), "JOB", "bottom"),
-            
-            ("thesystem/top_bar", (609, 33), "NONE", "bottom"),
-            ("thesystem/alt_top_bar", (609, 33), "JOB", "bottom"),
-            
-            ("thesystem/top_bar", (695, 39), "NONE", "top"),
-            ("thesystem/bottom_bar", (702, 36), "NONE", "bottom"),
-            ("thesystem/alt_top_bar", (695, 39), "JOB", "top"),
-            ("thesystem/alt_bottom_bar", (702, 36), "JOB", "bottom"),
-            
-            ("thesystem/top_bar", (715, 41), "NONE", "top"),
-            ("thesystem/bottom_bar", (715, 41), "NONE", "bottom"),
-            ("thesystem/alt_top_bar", (715, 41), "JOB", "top"),
-            ("thesystem/alt_bottom_bar", (715, 41), "JOB", "bottom"),
-            
-            ("thesystem/top_bar", (727, 38), "NONE", "top"),
-            ("thesystem/bottom_bar", (737, 27), "NONE", "bottom"),
-            ("thesystem/alt_top_bar", (727, 38), "JOB", "top"),
-            ("thesystem/alt_bottom_bar", (737, 27), "JOB", "bottom"),
-            
-            ("thesystem/top_bar", (748, 39), "NONE", "top"),
-            ("thesystem/bottom_bar", (763, 36), "NONE", "bottom"),
-            ("thesystem/alt_top_bar", (748, 39), "JOB", "top"),
-            ("thesystem/alt_bottom_bar", (763, 36), "JOB", "bottom"),
-            
-            ("thesystem/top_bar", (840, 47), "NONE", "top"),
-            ("thesystem/bottom_bar", (723, 47), "NONE", "bottom"),
-            ("thesystem/alt_top_bar", (840, 47), "JOB", "top"),
-            ("thesystem/alt_bottom_bar", (723, 47), "JOB", "bottom"),
-            
-            ("thesystem/top_bar", (957, 43), "NONE", "top"),
-            ("thesystem/bottom_bar", (1026, 47), "NONE", "bottom"),
-            ("thesystem/alt_top_bar", (957, 43), "JOB", "top"),
-            ("thesystem/alt_bottom_bar", (1026, 47), "JOB", "bottom"),
-            
-            ("thesystem/top_bar", (970, 40), "NONE", "top"),
-            ("thesystem/bottom_bar", (970, 40), "NONE", "bottom"),
-            ("thesystem/alt_top_bar", (970, 40), "JOB", "top"),
-            ("thesystem/alt_bottom_bar", (970, 40), "JOB", "bottom"),
-            
-            ("thesystem/top_bar", (974, 47), "NONE", "top"),
-            ("thesystem/bottom_bar", (983, 52), "NONE", "bottom"),
-            ("thesystem/alt_top_bar", (974, 47), "JOB", "top"),
-            ("thesystem/alt_bottom_bar", (983, 52), "JOB", "bottom"),
-            
-            ("thesystem/top_bar", (1053, 43), "NONE", "bottom"),
-            ("thesystem/alt_top_bar", (1053, 43), "JOB", "bottom"),
-            
-            ("thesystem/top_bar", (1120, 47), "NONE", "top"),
-            ("thesystem/alt_top_bar", (1120, 47), "JOB", "top"),
-            
-            ("thesystem/top_bar", (1229, 47), "NONE", "top"),
-            ("thesystem/bottom_bar", (1229, 47), "NONE", "bottom"),
-            ("thesystem/alt_top_bar", (1229, 47), "JOB", "top"),
-            ("thesystem/alt_bottom_bar", (1229, 47), "JOB", "bottom"),
-
-            ("thesystem/bottom_bar", (609, 33), "NONE", "bottom"),
-            ("thesystem/alt_bottom_bar", (609, 33), "JOB", "bottom"),
-
-            ("thesystem/bottom_bar", (1053, 43), "NONE", "bottom"),
-            ("thesystem/alt_bottom_bar", (1053, 43), "JOB", "bottom"),
-            
-            # Special configurations
-            ("thesystem/top_bar", (332, 30), "NONE", "top"),
-            ("thesystem/bottom_bar", (322, 25), "NONE", "bottom"),
-            ("thesystem/alt_top_bar", (332, 30), "JOB", "top"),
-            ("thesystem/alt_bottom_bar", (322, 25), "JOB", "bottom"),
-        ]
-        
-        # Video configurations
-        self.video_configurations = [
-            ("Files/Mod/default/Anime/alt1.mp4", "Files/Mod/default/Anime/alt1.npy", 1, False),
-            ("Files/Mod/default/Anime/0001-0200.mp4", "Files/Mod/default/Anime/default.npy", 1, False),
-            ("Files/Mod/default/Manwha/0001-1000.mp4", "Files/Mod/default/Manwha/0001-1000.npy", 1, False),
-        ]
+        self.image_configurations = discover_configurations()
+        self.video_configurations = VIDEO_CONFIGURATIONS
         
         # Combine all configurations
-        self.configurations = self.image_configurations + self.video_configurations
-        self.total_configs = len(self.configurations)
+        self.total_configs = len(self.image_configurations) + len(self.video_configurations)
         self.overall_progress["maximum"] = self.total_configs
         self.progress_text.config(text=f"0 / {self.total_configs} configurations")
     
-    def video_to_npy(self, video_path, output_path, resize_factor=None, rotate=False):
-        """Convert video to NPY format."""
-        if not os.path.exists(video_path):
-            self.log_message(f"❌ Video file not found: {video_path}", "ERROR")
-            return False
-        
-        try:
-            cap = cv2.VideoCapture(video_path)
-            frames = []
-            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            processed_frames = 0
-            
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-
-                if rotate:
-                    frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
-
-                if resize_factor and resize_factor != 1:
-                    h, w = frame.shape[:2]
-                    new_w = int(w * resize_factor)
-                    new_h = int(h * resize_factor)
-                    frame = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_AREA)
-
-                frames.append(frame)
-                processed_frames += 1
-                
-                # Update progress
-                progress = (processed_frames / total_frames) * 100
-                self.message_queue.put(("update_current", progress))
-
-            cap.release()
-
-            if frames:
-                frames_array = np.array(frames)
-                np.save(output_path, frames_array)
-                self.log_message(f"✅ Saved {len(frames)} video frames to {output_path}", "SUCCESS")
-                return True
-            else:
-                self.log_message(f"❌ No frames extracted from video: {video_path}", "ERROR")
-                return False
-                
-        except Exception as e:
-            self.log_message(f"❌ Error processing video {video_path}: {str(e)}", "ERROR")
-            return False
-    
     def log_message(self, message, level="INFO"):
         """Add a message to the log with timestamp and level."""
         timestamp = time.strftime("%H:%M:%S")
@@ -384,9 +230,6 @@ class NPYCreatorGUI:
     
     def process_configurations(self):
         """Process all configurations in a separate thread."""
-        successful = 0
-        failed = 0
-        
         self.log_message("Starting NPY creation process...", "INFO")
         self.log_message(f"Found {self.total_configs} configurations to process", "INFO")
         self.log_message(f"- {len(self.image_configurations)} image configurations", "INFO")
@@ -394,43 +237,22 @@ class NPYCreatorGUI:
         
         start_time = time.time()
         
-        for i, config in enumerate(self.configurations, 1):
-            if not self.is_processing:  # Check if cancelled
-                break
-                
-            self.current_config = i
-            self.message_queue.put(("update_overall", i))
-            
-            # Determine if this is an image or video configuration
-            if len(config) == 4 and isinstance(config[0], str) and config[0].endswith('.mp4'):
-                # Video configuration
-                video_path, output_path, resize_factor, rotate = config
-                self.message_queue.put(("update_progress", i, f"Video: {os.path.basename(video_path)}", "VIDEO", "PROCESSING"))
-                
-                success = self.video_to_npy(video_path, output_path, resize_factor, rotate)
-                
-            else:
-                # Image configuration
-                folder_path, resize, job, type_ = config
-                self.message_queue.put(("update_progress", i, f"Images: {folder_path} ({resize[0]}x{resize[1]}) - {job} {type_}", "IMAGES", "PROCESSING"))
-                
-                # Convert relative path to absolute
-                current_dir = os.path.dirname(os.path.abspath(__file__))
-                abs_folder_path = os.path.join(current_dir, folder_path)
-                
-                # Process this configuration
-                success = self.create_npy_for_config(abs_folder_path, resize, job, type_)
-            
-            if success:
-                successful += 1
-            else:
-                failed += 1
-            
-            # Update progress
-            self.message_queue.put(("update_overall", i))
-        
-        end_time = time.time()
-        total_time = end_time - start_time
+        def on_step(index, total, description):
+            self.current_config = index
+            self.message_queue.put(("update_overall", index))
+            self.message_queue.put(("update_progress", index, description, "", "DONE"))
+            self.message_queue.put(("update_current", 100))
+        
+        successful, failed = run_configurations(
+            self.image_configurations,
+            self.video_configurations,
+            log=self.log_message,
+            on_step=on_step,
+            cancelled=lambda: not self.is_processing
+        )
+        self.message_queue.put(("update_overall", self.total_configs))
+        
+        total_time = time.time() - start_time
         
         # Final status
         if failed > 0:
@@ -443,76 +265,6 @@ class NPYCreatorGUI:
         # Reset UI
         self.message_queue.put(("finish_processing", successful, failed))
     
-    def create_npy_for_config(self, folder_path, resize, job, type_):
-        """Create NPY file for a specific configuration."""
-        width, height = resize
-        job_upper = job.upper()
-        type_lower = type_.lower()
-        
-        # Build cache filename (same logic as load_or_cache_images)
-        if job_upper == "NONE":
-            cache_name = f"{type_lower}_frame_stack {width} {height}.npy"
-        else:
-            cache_name = f"alt_{type_lower}_frame_stack {width} {height}.npy"
-        
-        cache_path = os.path.join(folder_path, cache_name)
-        
-        # Check if folder exists
-        if not os.path.exists(folder_path):
-            return False
-        
-        # Create npy file
-        return self.images_to_npy_with_mode(folder_path, cache_path, resize=resize)
-    
-    def images_to_npy_with_mode(self, folder_path, output_path, resize=None, sort=True):
-        """Convert images in a folder to npy format with mode information."""
-        if not os.path.exists(folder_path):
-            return False
-        
-        files = [f for f in os.listdir(folder_path) if f.lower().endswith((".png", ".jpg", ".jpeg"))]
-        if not files:
-            return False
-        
-        if sort:
-            files.sort()
-        
-        data_to_save = []
-        total_files = len(files)
-        
-        for i, filename in enumerate(files):
-            if not self.is_processing:  # Check if cancelled
-                break
-                
-            path = os.path.join(folder_path, filename)
-            if not os.path.exists(path):
-                continue
-                
-            try:
-                img = Image.open(path)
-                mode = img.mode
-                img = img.convert("RGBA")
-                
-                if resize:
-                    img = img.resize(resize, Image.Resampling.LANCZOS)
-                
-                data_to_save.append((np.array(img), mode))
-                
-                # Update current progress
-                current_progress = (i + 1) / total_files * 100
-                self.message_queue.put(("update_current", current_progress))
-                
-            except Exception as e:
-                continue
-        
-        if data_to_save and self.is_processing:
-            try:
-                np.save(output_path, np.array(data_to_save, dtype=object), allow_pickle=True)
-                return True
-            except Exception as e:
-                return False
-        
-        return False
-    
     def update_ui(self):
         """Update the UI based on messages from the processing thread."""
         try:
@@ -548,7 +300,6 @@ class NPYCreatorGUI:
                             text=f"Successfully created {successful} NPY files!",
                             fg=self.success_color
                         )
-                        os.remove("thesystem/temp 7x2.txt")
                     
                     # Auto-close after 5 seconds if successful
                     if failed == 0:
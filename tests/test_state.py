@@ -0,0 +1,41 @@
+"""python -m unittest discover tests"""
+import tempfile
+import unittest
+import ujson
+import os
+
+from thesystem.state import PlayerStateStore
+from thesystem.storage import JSONFiles, SQLiteFiles, import_json
+
+
+class TransactionRollbackTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        with open(os.path.join(self.folder.name, "Inventory.json"), "w") as f:
+            ujson.dump({"Coin Bag 500": [{"qty": 3}]}, f)
+
+    def check_rollback(self, backend):
+        store = PlayerStateStore(self.folder.name, backend=backend)
+        self.addCleanup(backend.close)
+        store.get("Inventory.json")
+
+        with self.assertRaises(RuntimeError):
+            with store.transaction():
+                # Edited in place, then the block fails before update() is called
+                store.get("Inventory.json")["Coin Bag 500"][0]["qty"] -= 1
+                raise RuntimeError("sale failed")
+
+        self.assertEqual(store.get("Inventory.json")["Coin Bag 500"][0]["qty"], 3)
+
+    def test_json_files(self):
+        self.check_rollback(JSONFiles(self.folder.name))
+
+    def test_sqlite(self):
+        database = os.path.join(self.folder.name, "player.db")
+        import_json(self.folder.name, database)
+        self.check_rollback(SQLiteFiles(self.folder.name, database))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import threading
+import time
+
+import thesystem.cachebuild
+import thesystem.framecache
+
+# Bar variants the screens are known to use. Declaring one costs nothing; its
+# frames are only produced the first time something asks for them.
+COMMON_VARIANTS = [
+    ("thesystem/top_bar", (695, 39), "NONE", "top"),
+    ("thesystem/bottom_bar", (702, 36), "NONE", "bottom"),
+    ("thesystem/top_bar", (715, 41), "NONE", "top"),
+    ("thesystem/bottom_bar", (715, 41), "NONE", "bottom"),
+    ("thesystem/top_bar", (488, 38), "NONE", "top"),
+    ("thesystem/bottom_bar", (488, 33), "NONE", "bottom"),
+    ("thesystem/top_bar", (1229, 47), "NONE", "top"),
+    ("thesystem/bottom_bar", (1229, 47), "NONE", "bottom"),
+]
+
+
+class Asset:
+    """
+    One frame sequence at one size for one job. Frames come from the fastest
+    tier that has them: this process's memory, then the memory-mapped npy
+    stack, then decoding the source PNGs.
+    """
+
+    def __init__(self, folder_path, resize, job, type_):
+        self.folder_path = folder_path
+        self.resize = tuple(resize)
+        self.job = job.upper()
+        self.type_ = type_.lower()
+        self.cache_path = thesystem.cachebuild.cache_path_for(folder_path, self.resize, self.job, self.type_)
+        self.stack = None
+        self.lock = threading.Lock()
+        # Where the frames came from and how long that took, for timings()
+        self.tier = None
+        self.load_seconds = None
+        self.uses = 0
+
+    @property
+    def key(self):
+        return (self.folder_path, self.resize, self.job, self.type_)
+
+    def load(self, decode=False, count=True):
+        """
+        Return (frames, complete). When no up-to-date npy exists the stack is
+        rebuilt in a background process and `complete` is False, with a
+        low-res placeholder frame returned in the meantime. With decode=True
+        the PNGs are decoded here instead, which blocks until they are.
+        """
+        with self.lock:
+            if count:
+                self.uses += 1
+            if self.stack is not None:
+                return self.stack, True
+
+            start = time.perf_counter()
+            stack = thesystem.cachebuild.load_stack(self.folder_path, self.cache_path, self.resize,
+                                                    self.job, self.type_, rebuild=not decode)
+            tier = "npy"
+            if stack is None and decode:
+                thesystem.framecache.build_frame_stack(self.folder_path, self.cache_path, resize=self.resize)
+                stack = thesystem.framecache.load_frame_stack(self.cache_path)
+                tier = "png"
+
+            if stack is None:
+                self._record("placeholder", start)
+                return thesystem.cachebuild.placeholder_stack(self.folder_path, self.resize), False
+
+            self.stack = stack
+            self._record(tier, start)
+            return stack, True
+
+    def reload(self):
+        """Forget the frames held in memory, e.g. once a background rebuild has finished."""
+        with self.lock:
+            self.stack = None
+        return self.load(count=False)
+
+    def _record(self, tier, start):
+        self.tier = tier
+        self.load_seconds = time.perf_counter() - start
+
+
+class AssetRegistry:
+    def __init__(self):
+        self.assets = {}
+        self.lock = threading.Lock()
+
+    def declare(self, folder_path, resize, job="NONE", type_="top"):
+        """Return the Asset for a variant, registering it if needed. Nothing is loaded."""
+        key = (folder_path, tuple(resize), job.upper(), type_.lower())
+        with self.lock:
+            asset = self.assets.get(key)
+            if asset is None:
+                asset = self.assets[key] = Asset(folder_path, resize, job, type_)
+            return asset
+
+    def timings(self):
+        """
+        One entry per declared variant: how often it was used, which tier its
+        frames came from and how long loading them took. Variants that were
+        declared but never used show uses 0.
+        """
+        with self.lock:
+            assets = list(self.assets.values())
+        return sorted((
+            {
+                "folder": asset.folder_path,
+                "size": asset.resize,
+                "job": asset.job,
+                "type": asset.type_,
+                "uses": asset.uses,
+                "tier": asset.tier,
+                "seconds": asset.load_seconds,
+            }
+            for asset in assets
+        ), key=lambda entry: -entry["uses"])
+
+    def report(self):
+        lines = []
+        for entry in self.timings():
+            seconds = "-" if entry["seconds"] is None else f"{entry['seconds']:.4f}s"
+            size = f"{entry['size'][0]}x{entry['size'][1]}"
+            lines.append(f"{entry['folder']:<24} {size:>9} {entry['job']:<6} {entry['uses']:>4} uses  "
+                         f"{entry['tier'] or 'unused':<11} {seconds}")
+        return "\n".join(lines)
+
+
+assets = AssetRegistry()
+for variant in COMMON_VARIANTS:
+    assets.declare(*variant)
@@ -0,0 +1,375 @@
+import threading
+import atexit
+import ujson
+import wave
+import time
+import sys
+import os
+
+import numpy as np
+
+from thesystem.scheduler import scheduler
+from thesystem.state import player_state
+
+PRESETS_FILE = "Files/Mod/presets.json"
+# Every preset sound, by the script that used to play it in its own interpreter
+SCRIPTS = {
+    "sfx.py": "Open SFX",
+    "sfx_close.py": "Close SFX",
+    "sfx_button.py": "Button SFX",
+    "sfx_error.py": "Error SFX",
+    "sfx_glitch.py": "Glitch SFX",
+    "sfx_point.py": "Point SFX",
+}
+
+RATE = 48000
+CHANNELS = 2
+# Mixer block, about 10 ms: the most a sound can start late on top of SFX Delay
+BLOCK = 512
+# Longest the process waits at exit for sounds still playing
+DRAIN_SECONDS = 2.0
+
+
+def read_wav(path, rate=RATE, channels=CHANNELS):
+    """Decode a PCM WAV into float32 samples of shape (frames, channels) at `rate`."""
+    with wave.open(path, "rb") as f:
+        width = f.getsampwidth()
+        source_rate = f.getframerate()
+        source_channels = f.getnchannels()
+        raw = f.readframes(f.getnframes())
+
+    if width == 1:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif width == 2:
+        samples = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768
+    elif width == 3:
+        data = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
+        ints = (data[:, 0].astype(np.int32) | (data[:, 1].astype(np.int32) << 8) | (data[:, 2].astype(np.int32) << 16))
+        samples = ((ints ^ 0x800000) - 0x800000).astype(np.float32) / 8388608
+    elif width == 4:
+        samples = np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2147483648
+    else:
+        raise ValueError(f"Unsupported sample width {width} in {path}")
+
+    samples = samples.reshape(-1, source_channels)
+    if source_channels != channels:
+        samples = np.repeat(samples.mean(axis=1, keepdims=True), channels, axis=1)
+
+    if source_rate != rate and len(samples):
+        count = int(round(len(samples) * rate / source_rate))
+        positions = np.linspace(0, len(samples) - 1, count)
+        samples = np.stack([np.interp(positions, np.arange(len(samples)), samples[:, c]) for c in range(channels)], axis=1)
+
+    return np.ascontiguousarray(samples, dtype=np.float32)
+
+
+# --- Backends ----------------------------------------------------------------
+
+class NullBackend:
+    """Discards the mix, but takes as long as playing it would."""
+
+    streaming = True
+
+    def __init__(self, rate=RATE, channels=CHANNELS):
+        self.rate = rate
+        self.channels = channels
+
+    def open(self):
+        return self
+
+    def write(self, block):
+        time.sleep(len(block) / self.rate)
+
+    def close(self):
+        pass
+
+
+class FileSinkBackend(NullBackend):
+    """Writes the mix to a WAV file, for headless runs and checking what was played."""
+
+    def __init__(self, path, rate=RATE, channels=CHANNELS, realtime=False):
+        super().__init__(rate, channels)
+        self.path = path
+        self.realtime = realtime
+        self.file = None
+
+    def open(self):
+        self.file = wave.open(self.path, "wb")
+        self.file.setnchannels(self.channels)
+        self.file.setsampwidth(2)
+        self.file.setframerate(self.rate)
+        return self
+
+    def write(self, block):
+        self.file.writeframes(block.tobytes())
+        if self.realtime:
+            super().write(block)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class SoundDeviceBackend(NullBackend):
+    def open(self):
+        import sounddevice
+        self.stream = sounddevice.OutputStream(samplerate=self.rate, channels=self.channels, dtype="int16", blocksize=BLOCK)
+        self.stream.start()
+        return self
+
+    def write(self, block):
+        self.stream.write(block)
+
+    def close(self):
+        self.stream.stop()
+        self.stream.close()
+
+
+class WinsoundBackend:
+    """
+    winsound cannot be fed a mix, so this plays each sound file on its own,
+    asynchronously. A new sound cuts off the one still playing.
+    """
+
+    streaming = False
+
+    def open(self):
+        import winsound
+        self.winsound = winsound
+        return self
+
+    def play_file(self, path):
+        self.winsound.PlaySound(path, self.winsound.SND_FILENAME | self.winsound.SND_ASYNC | self.winsound.SND_NODEFAULT)
+
+    def close(self):
+        pass
+
+
+def default_backend():
+    """
+    The backend named by THESYSTEM_AUDIO ('sounddevice', 'winsound', 'null'
+    or 'file:<path>'), otherwise the first one that can be opened.
+    """
+    choice = os.environ.get("THESYSTEM_AUDIO", "")
+    if choice == "null":
+        return NullBackend().open()
+    if choice.startswith("file:"):
+        return FileSinkBackend(choice[5:]).open()
+
+    candidates = [SoundDeviceBackend, WinsoundBackend]
+    if choice == "winsound":
+        candidates.reverse()
+    for backend in candidates:
+        try:
+            return backend().open()
+        except Exception:
+            continue
+    print("[Audio] No audio output available, sounds are muted.")
+    return NullBackend().open()
+
+
+# --- Service -----------------------------------------------------------------
+
+class AudioService:
+    """
+    Plays the preset sound effects from inside the process.
+
+    The active theme's WAVs are decoded on a background thread by preload()
+    (or when play() first sees the theme); a sound asked for before its turn
+    comes is decoded on its own, so the first click never waits for the
+    whole set. Sounds are mixed block by block on one thread, so overlapping
+    effects play together, and SFX Delay is a start time in the mix rather
+    than a sleep. The mixer thread is a daemon: drain() (run at exit) lets
+    the sounds already started finish before the process goes.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend
+        self.sounds = {}
+        self.paths = {}
+        self.theme = None
+        self.voices = []
+        self.condition = threading.Condition()
+        self.lock = threading.Lock()
+        self.thread = None
+        # Mixer is inside backend.write(); the block it is writing still has to be heard
+        self.writing = False
+        # When the last sound handed to a non-streaming backend ends (monotonic)
+        self.until = 0
+        self.drain_registered = False
+
+    def _switch(self, theme):
+        """Point the service at `theme`'s presets. Returns True if it was a different theme."""
+        with self.lock:
+            if theme == self.theme:
+                return False
+            with open(PRESETS_FILE, "r") as f:
+                presets = ujson.load(f).get(theme, {})
+            self.paths = {name: path for name, path in presets.items() if name.endswith("SFX")}
+            self.sounds = {}
+            self.theme = theme
+            return True
+
+    def _decode(self, theme, name):
+        path = self.paths.get(name)
+        if path is None:
+            return None
+        try:
+            sound = (path, read_wav(path))
+        except (OSError, EOFError, ValueError, wave.Error) as e:
+            print(f"[Audio] Could not load {name} ({path}): {e}")
+            return None
+        with self.lock:
+            # A theme change while decoding makes this sound stale
+            if theme == self.theme:
+                self.sounds[name] = sound
+        return sound
+
+    def load(self, theme):
+        """Decode every preset sound of `theme`, here and now."""
+        self._switch(theme)
+        for name in list(self.paths):
+            if name not in self.sounds:
+                self._decode(theme, name)
+
+    def preload(self, theme=None):
+        """Decode the theme's sounds (the active theme by default) on a background thread."""
+        try:
+            theme = theme or player_state.theme()
+            self._switch(theme)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[Audio] Could not preload sounds: {e}")
+            return
+        threading.Thread(target=self.load, args=(theme,), daemon=True, name="audio preload").start()
+
+    def play(self, name, delay=None):
+        """
+        Play preset sound `name` (e.g. 'Open SFX') without blocking. `delay`
+        defaults to the SFX Delay setting.
+        """
+        try:
+            theme = player_state.theme()
+            if self._switch(theme):
+                self.preload(theme)
+            if delay is None:
+                delay = float(player_state.settings().get("SFX Delay", 0))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[Audio] Could not play {name}: {e}")
+            return False
+
+        sound = self.sounds.get(name) or self._decode(theme, name)
+        if sound is None:
+            return False
+        path, samples = sound
+
+        if self.backend is None:
+            self.backend = default_backend()
+        if not self.drain_registered:
+            self.drain_registered = True
+            atexit.register(self.drain)
+
+        if not self.backend.streaming:
+            self.until = max(self.until, time.monotonic() + delay + len(samples) / RATE)
+            scheduler.schedule(f"sound {name} {time.time()}", lambda: self.backend.play_file(path), delay)
+            return True
+
+        with self.condition:
+            self.voices.append([samples, 0, time.monotonic() + delay])
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._mix, daemon=True)
+                self.thread.start()
+            # All waiters: drain() may be waiting on the same condition as the mixer
+            self.condition.notify_all()
+        return True
+
+    def drain(self, timeout=DRAIN_SECONDS):
+        """
+        Wait, at most `timeout` seconds, for the sounds already started to
+        finish. Call before the process exits; a sound played just before
+        sys.exit() is otherwise cut off with the mixer thread.
+        """
+        deadline = time.monotonic() + timeout
+        if self.backend is not None and not self.backend.streaming:
+            time.sleep(max(0, min(self.until, deadline) - time.monotonic()))
+            return self.until <= time.monotonic()
+        with self.condition:
+            while self.voices or self.writing:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    return False
+                self.condition.wait(left)
+        return True
+
+    def _mix(self):
+        block_seconds = BLOCK / self.backend.rate
+        while True:
+            with self.condition:
+                while not self.voices:
+                    self.condition.wait()
+                now = time.monotonic()
+                start = min(voice[2] for voice in self.voices)
+                if start > now + block_seconds:
+                    # Nothing due yet: sleep until the earliest delayed sound instead of mixing silence
+                    self.condition.wait(start - now - block_seconds)
+                    continue
+
+                mix = np.zeros((BLOCK, self.backend.channels), dtype=np.float32)
+                for voice in self.voices:
+                    samples, position, start = voice
+                    offset = max(0, int(round((start - now) * self.backend.rate)))
+                    if offset >= BLOCK:
+                        continue
+                    part = samples[position:position + BLOCK - offset]
+                    mix[offset:offset + len(part)] += part
+                    voice[1] = position + len(part)
+                    voice[2] = now
+                self.voices = [voice for voice in self.voices if voice[1] < len(voice[0])]
+                self.writing = True
+
+            block = (np.clip(mix, -1, 1) * 32767).astype(np.int16)
+            try:
+                self.backend.write(block)
+            except Exception as e:
+                print(f"[Audio] Output failed, muting: {e}")
+                self.backend = NullBackend(self.backend.rate, self.backend.channels)
+            with self.condition:
+                self.writing = False
+                self.condition.notify_all()
+
+    def close(self):
+        with self.condition:
+            self.voices = []
+        if self.backend is not None:
+            self.backend.close()
+
+
+audio = AudioService()
+
+
+def play(name, delay=None):
+    """Play preset sound `name` ('Open SFX', 'Close SFX', ...) through the shared service."""
+    return audio.play(name, delay)
+
+
+def drain(timeout=DRAIN_SECONDS):
+    """Let the sounds already playing finish, before a sys.exit()."""
+    return audio.drain(timeout)
+
+
+def preload():
+    """Decode the active theme's sounds in the background, ahead of the first play()."""
+    audio.preload()
+
+
+def play_script(script_name):
+    """Play the sound of one of the old Files/Mod/default/sfx*.py scripts."""
+    return audio.play(SCRIPTS[os.path.basename(script_name)])
+
+
+if __name__ == "__main__":
+    # python -m thesystem.audio "Open SFX" ...  (THESYSTEM_AUDIO=file:out.wav to capture)
+    for name in sys.argv[1:] or ["Open SFX"]:
+        play(name, delay=0)
+    drain()
+    audio.close()
@@ -0,0 +1,466 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import subprocess
+import threading
+import ujson
+import ast
+import sys
+import os
+import cv2
+import numpy as np
+from PIL import Image
+
+from thesystem.framecache import (build_frame_stacks, convert_legacy, list_frames, load_frame_stack,
+                                  read_header, replace, source_entry, source_manifest, stack_is_fresh)
+
+# Present while the shipped caches still have to be (re)built after an install or update
+MARKER = "thesystem/temp 7x2.txt"
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SKIP_DIRS = {".git", "__pycache__", "venv", ".venv", "build", "dist"}
+
+# Configurations that cannot be read off a call site (sizes computed at runtime)
+REGISTERED_CONFIGURATIONS = []
+
+# (video_path, output_path, resize_factor, rotate)
+VIDEO_CONFIGURATIONS = [
+    ("Files/Mod/default/Anime/alt1.mp4", "Files/Mod/default/Anime/alt1.npy", 1, False),
+    ("Files/Mod/default/Anime/0001-0200.mp4", "Files/Mod/default/Anime/default.npy", 1, False),
+    ("Files/Mod/default/Manwha/0001-1000.mp4", "Files/Mod/default/Manwha/0001-1000.npy", 1, False),
+]
+
+# Sizes of one folder built by the same worker, so each source frame is decoded once per batch
+SIZES_PER_TASK = 4
+
+# Rebuilds started by this process, by cache path
+rebuilding = {}
+rebuild_lock = threading.Lock()
+
+
+def cache_path_for(folder_path, resize, job, type_):
+    width, height = resize
+    if job.upper() == "NONE":
+        cache_name = f"{type_.lower()}_frame_stack {width} {height}.npy"
+    else:
+        cache_name = f"alt_{type_.lower()}_frame_stack {width} {height}.npy"
+    return os.path.join(folder_path, cache_name)
+
+
+def register_configuration(folder_path, resize, job, type_):
+    """Add a configuration that discover_configurations() cannot see."""
+    config = (folder_path, tuple(resize), job, type_)
+    if config not in REGISTERED_CONFIGURATIONS:
+        REGISTERED_CONFIGURATIONS.append(config)
+
+
+# --- Discovery ---------------------------------------------------------------------
+
+def _assignments(tree):
+    values = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+            if isinstance(target, ast.Name):
+                values.setdefault(target.id, node.value)
+            elif isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name) and target.value.id == "self":
+                values.setdefault(target.attr, node.value)
+    return values
+
+
+def _resolve(node, values, depth=0):
+    """Follow simple names back to the literal they were assigned."""
+    if depth < 3 and isinstance(node, ast.Name) and node.id in values:
+        return _resolve(values[node.id], values, depth + 1)
+    if depth < 3 and isinstance(node, ast.Attribute) and node.attr in values:
+        return _resolve(values[node.attr], values, depth + 1)
+    return node
+
+
+def _folder_variants(node):
+    """
+    Folder paths a folder argument can take. Screens build it as
+    f"thesystem/{all_prev}top_bar", where all_prev is 'alt_' for players with
+    a job, so an f-string yields one variant per job state.
+    """
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return [(node.value, None)]
+    if not isinstance(node, ast.JoinedStr):
+        return []
+
+    variants = [("", "NONE"), ("alt_", "JOB")]
+    folders = []
+    for prefix, job in variants:
+        parts = []
+        for value in node.values:
+            if isinstance(value, ast.Constant):
+                parts.append(value.value)
+            else:
+                parts.append(prefix)
+        folders.append(("".join(parts), job))
+    return folders
+
+
+def _size(node):
+    if isinstance(node, ast.Tuple) and len(node.elts) == 2:
+        if all(isinstance(e, ast.Constant) and isinstance(e.value, int) for e in node.elts):
+            return (node.elts[0].value, node.elts[1].value)
+    return None
+
+
+def _parse_lines(source):
+    """
+    For files that do not parse as a whole: keep every single line that
+    parses on its own (assignments and the calls we look for).
+    """
+    lines = []
+    for line in source.splitlines():
+        line = line.strip()
+        try:
+            ast.parse(line)
+        except SyntaxError:
+            continue
+        lines.append(line)
+    return ast.parse("\n".join(lines))
+
+
+def configurations_in_file(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            source = f.read()
+    except (OSError, ValueError):
+        return []
+    if "load_or_cache_images" not in source:
+        return []
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        tree = _parse_lines(source)
+
+    values = None
+    configs = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+        if name != "load_or_cache_images":
+            continue
+        if values is None:
+            values = _assignments(tree)
+
+        args = list(node.args)
+        keywords = {k.arg: k.value for k in node.keywords}
+        names = ["folder_path", "resize", "job", "type_"]
+        for index, arg_name in enumerate(names):
+            if arg_name in keywords and index >= len(args):
+                args.append(keywords[arg_name])
+        if len(args) < 4:
+            continue
+
+        resize = _size(_resolve(args[1], values))
+        job_node = _resolve(args[2], values)
+        type_node = _resolve(args[3], values)
+        if resize is None or not (isinstance(type_node, ast.Constant) and isinstance(type_node.value, str)):
+            continue
+
+        for folder_path, variant_job in _folder_variants(_resolve(args[0], values)):
+            if isinstance(job_node, ast.Constant) and isinstance(job_node.value, str):
+                job = job_node.value
+            else:
+                job = variant_job or "NONE"
+            configs.append((folder_path, resize, job.upper(), type_node.value.lower()))
+    return configs
+
+
+def discover_configurations(root=ROOT):
+    """Every (folder_path, resize, job, type_) passed to load_or_cache_images in the project."""
+    configs = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        for filename in filenames:
+            if filename.endswith(".py"):
+                configs.extend(configurations_in_file(os.path.join(dirpath, filename)))
+
+    unique = []
+    for folder_path, resize, job, type_ in configs + REGISTERED_CONFIGURATIONS:
+        config = (folder_path, resize, job, type_)
+        if config not in unique and os.path.isdir(os.path.join(root, folder_path)):
+            unique.append(config)
+    return sorted(unique)
+
+
+# --- Building ----------------------------------------------------------------------
+
+def build_image_config(folder_path, resize, job, type_, progress=None):
+    """Build the frame stack for one image configuration. Returns True on success."""
+    return build_folder(folder_path, [cache_path_for(folder_path, resize, job, type_)], [resize], progress)
+
+
+def build_folder(folder_path, cache_paths, resizes, progress=None):
+    if not os.path.exists(folder_path):
+        print(f"[ERROR] Image folder not found: {folder_path}")
+        return False
+    if not list_frames(folder_path):
+        print(f"[WARNING] No image files found in: {folder_path}")
+        return False
+
+    counts = build_frame_stacks(folder_path, list(zip(cache_paths, resizes)), progress=progress)
+    return all(counts)
+
+
+def video_manifest_path(output_path):
+    base = output_path[:-4] if output_path.endswith(".npy") else output_path
+    return base + ".src.json"
+
+
+def video_is_fresh(video_path, output_path, resize_factor, rotate):
+    try:
+        with open(video_manifest_path(output_path), "r") as f:
+            manifest = ujson.load(f)
+        stat = os.stat(video_path)
+    except (OSError, ValueError):
+        return False
+    if not os.path.exists(output_path):
+        return False
+    size, mtime_ns, digest = manifest["source"]
+    return (manifest["resize_factor"], manifest["rotate"], size, mtime_ns) == (resize_factor, rotate, stat.st_size, stat.st_mtime_ns)
+
+
+def video_to_npy(video_path, output_path, resize_factor=None, rotate=False, progress=None):
+    """
+    Convert video to NPY format.
+
+    Frames are written straight into a preallocated memmap of the output file
+    instead of being collected in a list first.
+
+    Args:
+        video_path: Path to input video file
+        output_path: Path where npy file should be saved
+        resize_factor: Factor to resize frames (None for no resize)
+        rotate: Whether to rotate frames 90 degrees clockwise
+        progress: Optional callable taking (done, total) after every frame
+    """
+    if not os.path.exists(video_path):
+        print(f"[ERROR] Video file not found: {video_path}")
+        return False
+
+    cap = cv2.VideoCapture(video_path)
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    temp_path = output_path + ".tmp"
+    frames = None
+    count = 0
+
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+
+        if rotate:
+            frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
+
+        if resize_factor and resize_factor != 1:
+            h, w = frame.shape[:2]
+            frame = cv2.resize(frame, (int(w * resize_factor), int(h * resize_factor)), interpolation=cv2.INTER_AREA)
+
+        if frames is None:
+            frames = np.lib.format.open_memmap(temp_path, mode="w+", dtype=frame.dtype, shape=(max(total_frames, 1),) + frame.shape)
+        if count == len(frames):
+            # The container under-reported its frame count
+            print(f"[WARNING] {video_path} has more frames than reported, keeping the first {count}")
+            break
+
+        frames[count] = frame
+        count += 1
+        if progress is not None:
+            progress(count, total_frames)
+
+    cap.release()
+
+    if frames is None:
+        print(f"[ERROR] No frames extracted from video: {video_path}")
+        return False
+
+    if count < len(frames):
+        # Fewer frames than reported: copy the decoded part into a right-sized file
+        trimmed_path = output_path + ".trim.tmp"
+        trimmed = np.lib.format.open_memmap(trimmed_path, mode="w+", dtype=frames.dtype, shape=(count,) + frames.shape[1:])
+        trimmed[:] = frames[:count]
+        trimmed.flush()
+        del trimmed, frames
+        os.remove(temp_path)
+        temp_path = trimmed_path
+    else:
+        frames.flush()
+        del frames
+
+    replace(temp_path, output_path)
+    with open(video_manifest_path(output_path), "w") as f:
+        ujson.dump({"source": source_entry(video_path), "resize_factor": resize_factor, "rotate": rotate}, f, indent=4)
+    return True
+
+
+def plan_builds(image_configs, force=False):
+    """
+    Group the configurations that need building into worker tasks.
+
+    Returns:
+        tuple: (tasks, up_to_date) where each task is (folder_path, cache_paths, resizes, configs).
+    """
+    by_folder = {}
+    up_to_date = []
+    for config in image_configs:
+        folder_path, resize, job, type_ = config
+        cache_path = cache_path_for(folder_path, resize, job, type_)
+        if not force and stack_is_fresh(folder_path, cache_path, resize):
+            up_to_date.append(config)
+            continue
+        by_folder.setdefault(folder_path, []).append((cache_path, resize, config))
+
+    tasks = []
+    for folder_path, entries in by_folder.items():
+        for start in range(0, len(entries), SIZES_PER_TASK):
+            batch = entries[start:start + SIZES_PER_TASK]
+            tasks.append((folder_path, [e[0] for e in batch], [e[1] for e in batch], [e[2] for e in batch]))
+    return tasks, up_to_date
+
+
+def describe(config):
+    if len(config) == 4 and isinstance(config[1], tuple):
+        folder_path, resize, job, type_ = config
+        return f"Images: {folder_path} ({resize[0]}x{resize[1]}) - {job} {type_}"
+    return f"Video: {os.path.basename(config[0])}"
+
+
+def run_configurations(image_configs=None, video_configs=None, log=print, on_step=None, cancelled=None, force=False, workers=None):
+    """
+    Build every configuration that is missing or out of date, spread over a
+    process pool. Configurations that are already up to date count as successful.
+
+    Args:
+        log (callable): Receives (message, level) for every result.
+        on_step (callable, optional): Called with (done, total, description) as configurations finish.
+        cancelled (callable, optional): Returns True to stop handing out work.
+        force (bool, optional): Rebuild even up-to-date configurations.
+        workers (int, optional): Pool size. Defaults to the CPU count.
+
+    Returns:
+        tuple: (successful, failed)
+    """
+    if image_configs is None:
+        image_configs = discover_configurations()
+    if video_configs is None:
+        video_configs = VIDEO_CONFIGURATIONS
+
+    total = len(image_configs) + len(video_configs)
+    tasks, up_to_date = plan_builds(image_configs, force)
+    videos = [config for config in video_configs if force or not video_is_fresh(*config)]
+    up_to_date += [config for config in video_configs if config not in videos]
+
+    done = 0
+    successful = failed = 0
+    for config in up_to_date:
+        done += 1
+        successful += 1
+        if on_step is not None:
+            on_step(done, total, describe(config))
+    if up_to_date:
+        log(f"{len(up_to_date)} configurations already up to date", "INFO")
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = {}
+        for folder_path, cache_paths, resizes, configs in tasks:
+            futures[executor.submit(build_folder, folder_path, cache_paths, resizes)] = configs
+        for config in videos:
+            futures[executor.submit(video_to_npy, *config)] = [config]
+
+        for future in as_completed(futures):
+            configs = futures[future]
+            try:
+                success = future.result()
+                error = None
+            except Exception as e:
+                success = False
+                error = e
+
+            for config in configs:
+                done += 1
+                if success:
+                    successful += 1
+                    log(f"Built {describe(config)}", "SUCCESS")
+                else:
+                    failed += 1
+                    log(f"Failed {describe(config)}" + (f": {error}" if error else ""), "ERROR")
+                if on_step is not None:
+                    on_step(done, total, describe(config))
+
+            if cancelled is not None and cancelled():
+                executor.shutdown(wait=True, cancel_futures=True)
+                break
+
+    if failed == 0 and done == total and os.path.exists(MARKER):
+        os.remove(MARKER)
+    return successful, failed
+
+
+# --- Runtime use from load_or_cache_images ---------------------------------------
+
+def load_stack(folder_path, cache_path, resize, job, type_, rebuild=True):
+    """
+    Return the frame stack for a configuration if it is up to date, converting
+    an old pickled cache on the way. Returns None when it is missing or stale,
+    after starting a background rebuild unless `rebuild` is False.
+    """
+    if stack_is_fresh(folder_path, cache_path, resize):
+        stack = load_frame_stack(cache_path)
+        if stack is not None:
+            return stack
+
+    if read_header(cache_path) is None and os.path.exists(cache_path):
+        # Pickled caches predate the manifest; trust them for the frames on disk now
+        return convert_legacy(cache_path, sources=source_manifest(folder_path))
+
+    if rebuild:
+        rebuild_in_background(folder_path, resize, job, type_)
+    return None
+
+
+def rebuild_in_background(folder_path, resize, job, type_):
+    cache_path = cache_path_for(folder_path, resize, job, type_)
+    with rebuild_lock:
+        proc = rebuilding.get(cache_path)
+        if proc is not None and proc.poll() is None:
+            return proc
+        print(f"[CACHE MISS] Rebuilding in background: {cache_path}")
+        proc = subprocess.Popen([
+            sys.executable, "-m", "thesystem.cachebuild",
+            folder_path, str(resize[0]), str(resize[1]), job, type_
+        ])
+        rebuilding[cache_path] = proc
+        return proc
+
+
+def rebuild_finished(cache_path):
+    proc = rebuilding.get(cache_path)
+    return proc is None or proc.poll() is not None
+
+
+def placeholder_stack(folder_path, resize, scale=4):
+    """
+    A single frame to show while the real stack is rebuilt: the first source
+    image decoded at 1/`scale` resolution and stretched to `resize`.
+    """
+    try:
+        names = list_frames(folder_path)
+        img = Image.open(os.path.join(folder_path, names[0]))
+        mode = img.mode
+        img = img.convert("RGBA")
+        img = img.reduce(scale) if min(img.size) >= scale else img
+        img = img.resize(resize, Image.Resampling.BILINEAR)
+    except (OSError, IndexError, ValueError):
+        mode = "RGBA"
+        img = Image.new("RGBA", resize, (0, 0, 0, 0))
+    return [(np.asarray(img), mode)]
+
+
+if __name__ == "__main__":
+    folder_path, width, height, job, type_ = sys.argv[1:6]
+    sys.exit(0 if build_image_config(folder_path, (int(width), int(height)), job, type_) else 1)
@@ -3,6 +3,8 @@ from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
 from datetime import datetime, date
 import subprocess
 import thesystem.system
+import thesystem.audio
+import thesystem.windows
 import threading
 import sys
 from thesystem.misc import resource_path
@@ -34,5 +36,5 @@ def add_cal(entry_1, window, initial_height, window_width):
 
 def ex_close(window, initial_height, window_width):
     threading.Thread(target=thesystem.system.fade_out, args=(window, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, initial_height, window_width, step=12, delay=1)
@@ -1,12 +1,11 @@
 import ujson
 import random
-import subprocess
 import tkinter
 import csv
 import thesystem.system
+import thesystem.audio
+import thesystem.windows
 import threading
-import sys
-from thesystem.misc import resource_path
 
 def get_priority_key_and_value(contents):
     """
@@ -154,7 +153,7 @@ def demon_fight(canvas_name,window):
     with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
         theme_data=ujson.load(themefile)
         theme=theme_data["Theme"]
-    subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Demon Castle/gui1.py')])
+    thesystem.windows.open_script(f'{theme} Version/Demon Castle/gui1.py')
     ex_close(window)
 
 def ex_close(win):
@@ -164,7 +163,7 @@ def ex_close(win):
     with open("Files/Player Data/Tabs.json",'w') as fin_tab_son:
         tab_son_data["Castle"]='Close'
         ujson.dump(tab_son_data,fin_tab_son,indent=4)
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(win, win.winfo_width(), win.winfo_height(), step=50, delay=1)
 
 def reward_castle():
@@ -189,7 +188,7 @@ def reward_castle():
     with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
         theme_data=ujson.load(themefile)
         theme=theme_data["Theme"]
-    subprocess.Popen([sys.executable, resource_path(f"{theme} Version/Leveled up/gui.py")])
+    thesystem.windows.open_script(f"{theme} Version/Leveled up/gui.py")
 
     with open("Files/Player Data/Inventory.json", 'r') as fson:
         data_fininv=ujson.load(fson)
@@ -212,7 +211,7 @@ def reward_castle():
     with open("Files/Player Data/Inventory.json", 'w') as finaladdon:
         ujson.dump(data_fininv, finaladdon, indent=6)
 
-    subprocess.Popen([sys.executable, resource_path("Anime Version/Demon Castle/gui.py")])
+    thesystem.windows.open_script("Anime Version/Demon Castle/gui.py")
 
 def choose_demon_by_rank(rank_of):
     with open("Files/Player Data/Demon_Data.json", "r") as demon_file:
@@ -0,0 +1,127 @@
+"""
+Files/Data/Inventory_List.json, parsed once per process and indexed.
+
+    from thesystem.catalog import catalog
+
+    catalog.item("Coin Bag 500")                     # a copy of the item's entry
+    catalog.names(rank="S", rarity="Legendary")      # every S-rank Legendary item
+    catalog.sample(rank="B")                         # one B-rank item, or None
+    catalog.sample_weighted({"Common": 60, "Rare": 25}, rank="C", quest=True)
+
+Items are bucketed by rank, rarity, category ("cat") and quest
+eligibility when the file is read; a bucket for several criteria at once is
+built the first time it is asked for and kept. Picking from a bucket is one
+random index. Every call first compares the file's mtime and size with the
+ones it was read at, so an edited or patched catalog is picked up by the
+next call.
+"""
+import threading
+import random
+import ujson
+
+from thesystem.storage import file_stamp
+
+CATALOG_FILE = "Files/Data/Inventory_List.json"
+# What the night market and quests have always assumed for an item without one
+DEFAULT_RARITY = "Common"
+CRITERIA = ("rank", "rarity", "cat", "quest")
+
+
+def item_key(entry, criterion):
+    if criterion == "rarity":
+        return entry.get("rarity", DEFAULT_RARITY)
+    if criterion == "quest":
+        return entry.get("quest") == True
+    return entry.get(criterion)
+
+
+class ItemCatalog:
+    def __init__(self, path=CATALOG_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.stamp = None
+        self.document = {}
+        self.entries = {}
+        self.buckets = {}
+        self.rarities = ()
+
+    def _fresh(self):
+        try:
+            stamp = file_stamp(self.path)
+        except OSError:
+            stamp = None
+        with self.lock:
+            if stamp != self.stamp:
+                self._load(stamp)
+        return self
+
+    def _load(self, stamp):
+        try:
+            with open(self.path, 'r') as f:
+                document = ujson.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error loading item catalog: {e}")
+            document = {}
+        entries = {name: data[0] for name, data in document.items() if data}
+        buckets = {(): tuple(entries)}
+        for name, entry in entries.items():
+            for criterion in CRITERIA:
+                key = ((criterion, item_key(entry, criterion)),)
+                buckets.setdefault(key, []).append(name)
+        self.document = document
+        self.entries = entries
+        self.buckets = {key: tuple(names) for key, names in buckets.items()}
+        self.rarities = tuple(sorted({item_key(entry, "rarity") for entry in entries.values()}))
+        self.stamp = stamp
+
+    def _bucket(self, criteria):
+        key = tuple(sorted((criterion, value) for criterion, value in criteria.items() if value is not None))
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            # Several criteria: narrow the smallest single-criterion bucket, once
+            smallest = min((self.buckets.get((pair,), ()) for pair in key), key=len)
+            bucket = tuple(name for name in smallest
+                           if all(item_key(self.entries[name], criterion) == value for criterion, value in key))
+            self.buckets[key] = bucket
+        return bucket
+
+    def listing(self):
+        """The whole file as {name: [entry]}. Shared between callers; do not modify it."""
+        return self._fresh().document
+
+    def item(self, name):
+        """A copy of the item's entry, or None if the catalog has no such item."""
+        entry = self._fresh().entries.get(name)
+        return None if entry is None else dict(entry)
+
+    def names(self, rank=None, rarity=None, cat=None, quest=None):
+        """Names of the items matching every criterion given, in file order."""
+        self._fresh()
+        return self._bucket({"rank": rank, "rarity": rarity, "cat": cat, "quest": quest})
+
+    def sample(self, rng=random, **criteria):
+        """One matching item's name, uniformly at random, or None if nothing matches."""
+        bucket = self.names(**criteria)
+        return bucket[rng.randrange(len(bucket))] if bucket else None
+
+    def sample_weighted(self, rarity_weights, rng=random, default_weight=1, **criteria):
+        """
+        One matching item's name, each item weighted by its rarity, or None.
+        The rarity is drawn first (by weight times bucket size), then an item
+        of that rarity, which is the same as weighting every item.
+        """
+        self._fresh()
+        rarity = criteria.pop("rarity", None)
+        if rarity is not None:
+            return self.sample(rng, rarity=rarity, **criteria)
+        # The rarities the file has, not the weight table's, so an unlisted one keeps default_weight
+        buckets = [(self._bucket(dict(criteria, rarity=value)), rarity_weights.get(value, default_weight))
+                   for value in self.rarities]
+        buckets = [(bucket, weight * len(bucket)) for bucket, weight in buckets if bucket and weight > 0]
+        if not buckets:
+            return None
+        bucket = rng.choices([bucket for bucket, _ in buckets], weights=[mass for _, mass in buckets])[0]
+        return bucket[rng.randrange(len(bucket))]
+
+
+catalog = ItemCatalog()
@@ -1,9 +1,7 @@
 import ujson
-import subprocess
 from datetime import datetime
 import csv
-import sys
-from thesystem.misc import resource_path
+import thesystem.windows
 
 def dailys_init():
     with open("Files/Player Data/Daily_Quest.json", 'r') as daily_quest_file:
@@ -114,7 +112,7 @@ def daily_preview(window):
     with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
         theme_data=ujson.load(themefile)
         theme=theme_data["Theme"]
-    subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Daily Quest Rewards/gui.py')])
+    thesystem.windows.open_script(f'{theme} Version/Daily Quest Rewards/gui.py')
 
 def check_daily_comp(today_date_str, window):
     with open("Files/Player Data/Daily_Quest.json", 'r') as daily_quest_file:
@@ -190,7 +188,7 @@ def check_daily_comp(today_date_str, window):
                 with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
                     theme_data = ujson.load(themefile)
                     theme = theme_data["Theme"]
-                subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Daily Quest Rewards/gui.py')])
+                thesystem.windows.open_script(f'{theme} Version/Daily Quest Rewards/gui.py')
 
                 # Close the daily quest tab
                 with open("Files/Player Data/Tabs.json", 'r') as tab_son:
@@ -250,7 +248,7 @@ def check_daily_comp(today_date_str, window):
                 with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
                     theme_data = ujson.load(themefile)
                     theme = theme_data["Theme"]
-                subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Daily Quest Rewards/gui.py')])
+                thesystem.windows.open_script(f'{theme} Version/Daily Quest Rewards/gui.py')
 
                 # Close the daily quest tab
                 with open("Files/Player Data/Tabs.json", 'r') as tab_son:
@@ -311,7 +309,7 @@ def check_daily_comp(today_date_str, window):
                 with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
                     theme_data = ujson.load(themefile)
                     theme = theme_data["Theme"]
-                subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Daily Quest Rewards/gui.py')])
+                thesystem.windows.open_script(f'{theme} Version/Daily Quest Rewards/gui.py')
 
                 # Close the daily quest tab
                 with open("Files/Player Data/Tabs.json", 'r') as tab_son:
@@ -2,13 +2,14 @@ import ujson
 import csv
 import thesystem.skills
 import thesystem.system as system
-import subprocess
+import thesystem.audio
 from datetime import datetime, timedelta
 import random
 import threading
 import thesystem.system
-import sys
-from thesystem.misc import resource_path
+import thesystem.windows
+import os
+from thesystem.state import player_state
 
 with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
     theme_data = ujson.load(themefile)
@@ -31,7 +32,7 @@ def ex_close(win):
         tab_son_data["Dungeons"]='Close'
         ujson.dump(tab_son_data,fin_tab_son,indent=4)
     threading.Thread(target=system.fade_out, args=(win, 0.8)).start()
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     system.animate_window_close(win, initial_height, window_width, step=20, delay=1)
 
 def check_fatigue(rank):
@@ -68,7 +69,7 @@ def open_e_dunfile(eve):
         with open("Files/Player Data/Todays_Dungeon.json", 'w') as final_dun_full:
             ujson.dump(dun_full_data, final_dun_full, indent=6)
 
-        subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Dungeon Runs/gui.py')])
+        thesystem.windows.open_script(f'{theme} Version/Dungeon Runs/gui.py')
         ex_close(eve)
 
 def open_d_dunfile(eve):
@@ -89,7 +90,7 @@ def open_d_dunfile(eve):
         with open("Files/Player Data/Todays_Dungeon.json", 'w') as final_dun_full:
             ujson.dump(dun_full_data, final_dun_full, indent=6)
 
-        subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Dungeon Runs/gui.py')])
+        thesystem.windows.open_script(f'{theme} Version/Dungeon Runs/gui.py')
         ex_close(eve)
 
 def open_c_dunfile(eve):
@@ -110,7 +111,7 @@ def open_c_dunfile(eve):
         with open("Files/Player Data/Todays_Dungeon.json", 'w') as final_dun_full:
             ujson.dump(dun_full_data, final_dun_full, indent=6)
 
-        subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Dungeon Runs/gui.py')])
+        thesystem.windows.open_script(f'{theme} Version/Dungeon Runs/gui.py')
         ex_close(eve)
 
 def open_b_dunfile(eve):
@@ -131,7 +132,7 @@ def open_b_dunfile(eve):
         with open("Files/Player Data/Todays_Dungeon.json", 'w') as final_dun_full:
             ujson.dump(dun_full_data, final_dun_full, indent=6)
 
-        subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Dungeon Runs/gui.py')])
+        thesystem.windows.open_script(f'{theme} Version/Dungeon Runs/gui.py')
         ex_close(eve)
 
 def open_a_dunfile(eve):
@@ -152,7 +153,7 @@ def open_a_dunfile(eve):
         with open("Files/Player Data/Todays_Dungeon.json", 'w') as final_dun_full:
             ujson.dump(dun_full_data, final_dun_full, indent=6)
 
-        subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Dungeon Runs/gui.py')])
+        thesystem.windows.open_script(f'{theme} Version/Dungeon Runs/gui.py')
         ex_close(eve)
 
 def open_s_dunfile(eve):
@@ -173,7 +174,7 @@ def open_s_dunfile(eve):
         with open("Files/Player Data/Todays_Dungeon.json", 'w') as final_dun_full:
             ujson.dump(dun_full_data, final_dun_full, indent=6)
 
-        subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Dungeon Runs/gui.py')])
+        thesystem.windows.open_script(f'{theme} Version/Dungeon Runs/gui.py')
         ex_close(eve)
 
 rank_order = {'E': 1, 'D': 2, 'C': 3, 'B': 4, 'A': 5, 'S': 6}
@@ -221,13 +222,13 @@ def instance_dungeon(eve):
             rank=item_data.get('rank', '')
         fat_check=check_fatigue(rank)
         if fat_check==False:
-            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Instance Dungeon Confirm/gui.py')])
+            thesystem.windows.open_script(f'{theme} Version/Instance Dungeon Confirm/gui.py')
             ex_close(eve)
     else:
         with open("Files/Checks/Message.csv", 'w', newline='') as check_file:
             check_fw = csv.writer(check_file)
             check_fw.writerow(["No Instance Keys"])
-        subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Message/gui.py')])
+        thesystem.windows.open_script(f'{theme} Version/Message/gui.py')
 
 def get_item_name_from_csv():
     # Read the item name from the CSV file
@@ -273,14 +274,25 @@ def update_inventory(window):
     with open("Files/Player Data/Todays_Dungeon.json", 'w') as final_dun_full:
         ujson.dump(dun_full_data, final_dun_full, indent=6)
 
-    subprocess.Popen([sys.executable, resource_path('Manwha Version/Dungeon Runs/gui.py')])
+    thesystem.windows.open_script('Manwha Version/Dungeon Runs/gui.py')
     window.quit()
 
+# Daily gates per rank: one gate for every 1 in `tries` rolls of a `sides`-sided die
+GATE_ODDS = {
+    "E": (5, 2),
+    "D": (7, 3),
+    "C": (10, 3),
+    "B": (10, 5),
+    "A": (10, 10),
+    "S": (1, 10),
+    "Red Gate": (10, 20),
+}
+
 def dun_check():
     global e_rank, d_rank, c_rank, b_rank, a_rank, s_rank, red_gate
 
     # Path to the ujson file
-    file_path = "Files\\Player Data\\Todays_Dungeon.json"
+    file_path = os.path.join("Files", "Player Data", "Todays_Dungeon.json")
     
     # Load the existing data from the file
     try:
@@ -295,38 +307,10 @@ def dun_check():
 
     # Check if data already exists for today's date
     if current_date_string not in dun_check_data:
-        dun_check_data = {}
-        # E Rank Distro
-        e_rank_vals = sum(1 for _ in range(5) if random.randint(1, 2) == 1)
-
-        # D Rank Distro
-        d_rank_vals = sum(1 for _ in range(7) if random.randint(1, 3) == 1)
-
-        # C Rank Distro
-        c_rank_vals = sum(1 for _ in range(10) if random.randint(1, 3) == 1)
-
-        # B Rank Distro
-        b_rank_vals = sum(1 for _ in range(10) if random.randint(1, 5) == 1)
-
-        # A Rank Distro
-        a_rank_vals = sum(1 for _ in range(10) if random.randint(1, 10) == 1)
-
-        # S Rank Distro
-        s_rank_vals = sum(1 for _ in range(1) if random.randint(1, 10) == 1)
-
-        # Red Gate Rank Distro
-        red_rank_vals = sum(1 for _ in range(10) if random.randint(1, 20) == 1)
-
-        # Store today's values in the dictionary
-        dun_check_data[current_date_string] = {
-            "E": e_rank_vals,
-            "D": d_rank_vals,
-            "C": c_rank_vals,
-            "B": b_rank_vals,
-            "A": a_rank_vals,
-            "S": s_rank_vals,
-            "Red Gate": red_rank_vals
-        }
+        dun_check_data = {current_date_string: {
+            rank: sum(1 for _ in range(tries) if random.randint(1, sides) == 1)
+            for rank, (tries, sides) in GATE_ODDS.items()
+        }}
 
         # Write the updated data back to the file
         with open(file_path, 'w') as wrt_dun_check:
@@ -344,29 +328,30 @@ def dun_check():
     return e_rank, d_rank, c_rank, b_rank, a_rank, s_rank
 
 def dungeon_rank_get(rank, amt1, amt1_check, act1):
-    with open("Files/Player Data/Status.json", 'r') as fson:
-        data = ujson.load(fson)
-        agi1 = data["status"][0]['agi']
-        stre1 = data["status"][0]['str']
-        str_eqip = data["equipment"][0]['STR']
-        agi_eqip = data["equipment"][0]['AGI']
-
-        with open("Files/Player Data/Skill.json", 'r') as f:
-            skill_data = ujson.load(f)
-
-        equipment_percent=0
-        if thesystem.system.skill_use("Mind Over Matter", (0)) == True and ("Mind Over Matter"in skill_data):
-            lvl=skill_data["Mind Over Matter"][0]["lvl"]
-            if type(lvl)==str: lvl=10
+    data = player_state.get("Status.json")
+    agi1 = data["status"][0]['agi']
+    stre1 = data["status"][0]['str']
+    str_eqip = data["equipment"][0]['STR']
+    agi_eqip = data["equipment"][0]['AGI']
 
-            equipment_percent=0.05*lvl
+    skill_data = player_state.skills()
 
-        agi_eqip1=agi_eqip+(agi_eqip*equipment_percent)
-        str_eqip1=str_eqip+(str_eqip*equipment_percent)
+    equipment_percent=0
+    if thesystem.system.skill_use("Mind Over Matter", (0)) == True and ("Mind Over Matter"in skill_data):
+        lvl=skill_data["Mind Over Matter"][0]["lvl"]
+        if type(lvl)==str: lvl=10
 
-        agi=agi1+agi_eqip1
-        stre=stre1+str_eqip1
-    
+        equipment_percent=0.05*lvl
+
+    agi_eqip1=agi_eqip+(agi_eqip*equipment_percent)
+    str_eqip1=str_eqip+(str_eqip*equipment_percent)
+
+    agi=agi1+agi_eqip1
+    stre=stre1+str_eqip1
+    return scaled_amount(rank, amt1, amt1_check, stre, agi)
+
+def scaled_amount(rank, amt1, amt1_check, stre, agi):
+    """Reps (or time) an exercise asks for in a `rank` dungeon, given the player's total STR and AGI."""
     rank_modifiers = {
         'D': {"amt": {50: 10, 15: 5, 2: 1, 30: 15, 1: 1}, "time": {45: 15, 60: 60, 1: 1}},
         'C': {"amt": {50: 20, 15: 15, 2: 2, 30: 30, 1: 2}, "time": {45: 30, 60: 120, 1: 2}},
@@ -403,8 +388,8 @@ def reduction(val, stre, agi, types):
     
     return 0
 
-def calculate_hp_deduction(player_rank: str, quest_rank: str, enemies_ignored: int = 1) -> float:
-    hp_add=0
+def hp_deduction_fraction(player_rank: str, quest_rank: str, enemies_ignored: int = 1) -> float:
+    """Share of max HP lost for skipping `enemies_ignored` activities of a wave."""
     # Rank weights — linear scale
     player_rank_scores = {'National': 7, 'S': 6, 'A': 5, 'B': 4, 'C': 3, 'D': 2, 'E': 1}
     quest_rank_scores = {'E': 1, 'D': 2, 'C': 3, 'B': 4, 'A': 5, 'S': 6}
@@ -421,38 +406,40 @@ def calculate_hp_deduction(player_rank: str, quest_rank: str, enemies_ignored: i
     # We'll use base = 0.1 (10%), and total is capped at 100%
 
     base_deduction_per_enemy = 0.1  # 10% base per enemy
-    deduction = (quest_score / player_score) * base_deduction_per_enemy * enemies_ignored
+    return (quest_score / player_score) * base_deduction_per_enemy * enemies_ignored
 
-    with open("Files/Player Data/Status.json", 'r') as data_fson:
-        data_status=ujson.load(data_fson)
-        current_hp=data_status["status"][0]["hp"]
-        level=data_status["status"][0]["level"]
-        max_hp=100+(100*level)
+def calculate_hp_deduction(player_rank: str, quest_rank: str, enemies_ignored: int = 1) -> float:
+    hp_add=0
+    enemies_ignored = max(0, min(enemies_ignored, 4))
+    deduction = hp_deduction_fraction(player_rank, quest_rank, enemies_ignored)
 
-        deductable=max_hp*deduction
+    data_status=player_state.get("Status.json")
+    current_hp=data_status["status"][0]["hp"]
+    level=data_status["status"][0]["level"]
+    max_hp=100+(100*level)
 
-        if current_hp-deductable<=50:
-            #Skill File
-            with open("Files/Player Data/Skill.json", 'r') as f:
-                skill_data = ujson.load(f)
+    deductable=max_hp*deduction
 
-            if thesystem.skills.skill_use("Iron Warrior", (24*60*60)) == True and ("Iron Warrior"in skill_data):
-                lvl=skill_data["Iron Warrior"][0]["lvl"]
-                if type(lvl)==str: lvl=10
-                hp_add=max_hp*(0.025*lvl)
+    if current_hp-deductable<=50:
+        #Skill File
+        skill_data = player_state.skills()
 
-        if (current_hp+hp_add)-deductable<0:
-            data_status["status"][0]["hp"]=0
-            thesystem.system.message_open("Dead")
-        
-        else:
-            data_status["status"][0]["hp"]-=deductable
-            data_status["status"][0]["hp"]+=hp_add
+        if thesystem.skills.skill_use("Iron Warrior", (24*60*60)) == True and ("Iron Warrior"in skill_data):
+            lvl=skill_data["Iron Warrior"][0]["lvl"]
+            if type(lvl)==str: lvl=10
+            hp_add=max_hp*(0.025*lvl)
+
+    if (current_hp+hp_add)-deductable<0:
+        data_status["status"][0]["hp"]=0
+        thesystem.system.message_open("Dead")
+    
+    else:
+        data_status["status"][0]["hp"]-=deductable
+        data_status["status"][0]["hp"]+=hp_add
 
-        with open("Files/Player Data/Status.json", 'w') as data_fson:
-            ujson.dump(data_status, data_fson)
+    player_state.update("Status.json")
 
-        if data_status["status"][0]["hp"]-(deductable/enemies_ignored)<0:
-            thesystem.system.message_open("Will die")
+    if data_status["status"][0]["hp"]-(deductable/enemies_ignored)<0:
+        thesystem.system.message_open("Will die")
 
         
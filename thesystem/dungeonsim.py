@@ -0,0 +1,312 @@
+"""
+Monte Carlo balance check for dungeons, headless and vectorised with NumPy.
+
+    python -m thesystem.dungeonsim                          the current player, every rank
+    python -m thesystem.dungeonsim --level 40 --str 150 --agi 120 --completion 0.8
+    python -m thesystem.dungeonsim --rank S --runs 5000000 --seed 7 --json
+
+Every roll the game makes for a dungeon is made here for millions of runs
+at once, from the same tables: the daily gate counts of dungeon.dun_check,
+the waves, monsters and XP of Dungeon Runs generate_waves, the events of
+roll_dungeon_modifiers, the exercise amounts of dungeon.scaled_amount and
+the HP lost for skipped activities from dungeon.hp_deduction_fraction.
+
+A run plays the dungeon the way Dungeon Runs does: every wave, and the
+boss's first appearance, can be skipped with activities left undone (each
+activity is done with probability `completion`), then the boss's phases
+must be finished. Skills (Mind Over Matter, Iron Warrior, the skill panel)
+are left out; the HP lost is what a full-HP player would lose.
+"""
+import itertools
+import argparse
+import ujson
+import sys
+
+import numpy as np
+
+import thesystem.system
+from thesystem.dungeon import GATE_ODDS, scaled_amount, hp_deduction_fraction
+
+MONSTER_FILE = "Files/Data/Dungeon_Boss_List.json"
+STR_EXERCISES = "Files/Workout/STR_based.json"
+AGI_EXERCISES = "Files/Workout/AGI_based.json"
+
+RANKS = ["E", "D", "C", "B", "A", "S"]
+
+# As in Dungeon Runs (gui.py) generate_waves and roll_dungeon_modifiers
+BASE_WAVES = {"E": 3, "D": 3, "C": 4, "B": 5, "A": 5, "S": 6}
+WAVE_VARIATION = [-1, 0, 0, 0, 1]
+MIN_WAVES = 3
+BOSS_RANK = {"E": "D", "D": "C", "C": "B", "B": "A", "A": "S", "S": "S"}
+BOSS_PHASES = {"E": 1, "D": 1, "C": 2, "B": 2, "A": 3, "S": 3}
+EVENT_CHANCE = {"E": 0.2, "D": 0.3, "C": 0.4, "B": 0.5, "A": 0.6, "S": 0.7}
+ELITE_XP = 1.5
+BOSS_XP = 2
+ACTIVITIES = 4
+# ...and complete_dungeon: (coins, stat points) before the completion scaling
+REWARDS = {"E": (100, 1), "D": (500, 2), "C": (1000, 3), "B": (5000, 4), "A": (10000, 5), "S": (20000, 6)}
+
+# Activity pools a monster's 'attribute' draws from; anything else mixes two of each
+STR, AGI, MIXED = 0, 1, 2
+ATTRIBUTES = {"STR": STR, "AGI": AGI}
+
+# Runs generated at once; bounds memory at a few hundred MB for any --runs
+CHUNK = 250_000
+METRICS = ["waves", "events", "xp", "coins", "reps", "seconds", "hp_loss_pct"]
+
+
+class Profile:
+    """The player stats a simulation is run for. `str` and `agi` include equipment."""
+
+    def __init__(self, level, stre, agi, completion=1.0, name="profile"):
+        self.level = level
+        self.str = stre
+        self.agi = agi
+        self.completion = completion
+        self.name = name
+
+    @classmethod
+    def from_status(cls, data, completion=1.0):
+        status, equipment = data["status"][0], data["equipment"][0]
+        return cls(status["level"], status["str"] + equipment["STR"], status["agi"] + equipment["AGI"],
+                   completion, status.get("name", "player"))
+
+    @property
+    def rank(self):
+        return thesystem.system.give_ranking(self.level)
+
+    @property
+    def max_hp(self):
+        return 100 + 100 * self.level
+
+
+def boss_amount(amount):
+    """The boss version of an amount, by the same text replacement generate_activities does."""
+    return int(str(amount).replace("10", "15").replace("15", "20").replace("20", "25").replace("30", "45"))
+
+
+def load_monsters(path=MONSTER_FILE):
+    with open(path, "r") as f:
+        return ujson.load(f)
+
+
+def monster_pool(monsters, rank, kind):
+    """(XP, attribute code) arrays of the monsters generate_waves would draw from."""
+    chosen = [m for m in monsters.values() if m["rank"] == rank and m["type"] == kind]
+    return (np.array([m["XP"] for m in chosen], dtype=np.int64),
+            np.array([ATTRIBUTES.get(m.get("attribute", "STR"), MIXED) for m in chosen], dtype=np.int8))
+
+
+def exercise_table(path, rank, profile, boss=False):
+    """(reps, seconds) asked for each exercise in the file; 0 where it is the other kind."""
+    with open(path, "r") as f:
+        exercises = ujson.load(f)
+    reps, seconds = [], []
+    for name, details in exercises.items():
+        for detail in details:
+            kind = "amt" if "amt" in detail else "time"
+            amount = scaled_amount(rank, detail[kind], kind, profile.str, profile.agi)
+            if boss:
+                amount = boss_amount(amount)
+            reps.append(amount if kind == "amt" else 0)
+            # Every timed exercise is in seconds
+            seconds.append(amount if kind == "time" else 0)
+    return np.array(reps, dtype=np.int64), np.array(seconds, dtype=np.int64)
+
+
+class ActivityRolls:
+    """
+    The reps and seconds of one wave's activities. A wave asks for a uniform
+    random set of exercises (random.sample), so every possible set is listed
+    once and a roll is a single random index into that list.
+    """
+
+    def __init__(self, rank, profile, boss=False):
+        tables = {
+            STR: exercise_table(STR_EXERCISES, rank, profile, boss),
+            AGI: exercise_table(AGI_EXERCISES, rank, profile, boss),
+        }
+        self.sets = {
+            STR: self._sets([(tables[STR], ACTIVITIES)]),
+            AGI: self._sets([(tables[AGI], ACTIVITIES)]),
+            MIXED: self._sets([(tables[STR], ACTIVITIES // 2), (tables[AGI], ACTIVITIES // 2)]),
+        }
+
+    @staticmethod
+    def _sets(parts):
+        """(reps, seconds) totals of every way of picking `count` exercises from each table."""
+        totals = [(0, 0)]
+        for (reps, seconds), count in parts:
+            picks = [(sum(reps[i] for i in chosen), sum(seconds[i] for i in chosen))
+                     for chosen in itertools.combinations(range(len(reps)), count)]
+            totals = [(r + pr, s + ps) for r, s in totals for pr, ps in picks]
+        return np.array([r for r, _ in totals], dtype=np.int64), np.array([s for _, s in totals], dtype=np.int64)
+
+    def roll(self, rng, attribute):
+        runs = len(attribute)
+        reps = np.zeros(runs, dtype=np.int64)
+        seconds = np.zeros(runs, dtype=np.int64)
+        for code, (set_reps, set_seconds) in self.sets.items():
+            rows = attribute == code
+            if not rows.any():
+                continue
+            pick = rng.integers(len(set_reps), size=runs)
+            reps = np.where(rows, set_reps[pick], reps)
+            seconds = np.where(rows, set_seconds[pick], seconds)
+        return reps, seconds
+
+
+def simulate_gates(runs, seed=2222):
+    """Daily gate counts per rank over `runs` simulated days."""
+    rng = np.random.default_rng([seed, len(RANKS)])
+    return {rank: rng.binomial(tries, 1 / sides, runs) for rank, (tries, sides) in GATE_ODDS.items()}
+
+
+def simulate_chunk(rng, rank, profile, runs, monsters, activities, boss_activities, dungeon_type):
+    normal_xp, normal_attr = monster_pool(monsters, rank, "Normal")
+    elite_xp, elite_attr = monster_pool(monsters, rank, "Elite")
+    if len(elite_xp) == 0:
+        elite_xp, elite_attr = normal_xp, normal_attr
+    boss_xp, boss_attr = monster_pool(monsters, BOSS_RANK[rank], "Boss")
+
+    total = np.maximum(MIN_WAVES, BASE_WAVES[rank] + rng.choice(WAVE_VARIATION, runs))
+    # Skipping an activity: share of max HP lost, by the number left undone
+    hp_table = np.array([hp_deduction_fraction(profile.rank, rank, undone) for undone in range(ACTIVITIES + 1)])
+
+    xp = np.zeros(runs, dtype=np.int64)
+    reps = np.zeros(runs, dtype=np.int64)
+    seconds = np.zeros(runs, dtype=np.int64)
+    hp_lost = np.zeros(runs)
+    done = np.zeros(runs)
+
+    def play(attribute, rolls, active, skippable):
+        wave_reps, wave_seconds = rolls.roll(rng, attribute)
+        reps[active] += wave_reps[active]
+        seconds[active] += wave_seconds[active]
+        if skippable:
+            undone = rng.binomial(ACTIVITIES, 1 - profile.completion, runs)
+            hp_lost[active] += hp_table[undone[active]]
+            done[active] += (ACTIVITIES - undone[active]) / ACTIVITIES
+
+    everyone = np.ones(runs, dtype=bool)
+    pick = rng.integers(len(normal_xp), size=runs)
+    xp += normal_xp[pick]
+    play(normal_attr[pick], activities, everyone, True)
+
+    for wave in range(2, BASE_WAVES[rank] + max(WAVE_VARIATION)):
+        active = wave < total
+        elite = rng.random(runs) < (wave - 1) / total
+        normal_pick = rng.integers(len(normal_xp), size=runs)
+        elite_pick = rng.integers(len(elite_xp), size=runs)
+        wave_xp = np.where(elite, (elite_xp[elite_pick] * ELITE_XP).astype(np.int64), normal_xp[normal_pick])
+        xp += np.where(active, wave_xp, 0)
+        play(np.where(elite, elite_attr[elite_pick], normal_attr[normal_pick]), activities, active, True)
+
+    pick = rng.integers(len(boss_xp), size=runs)
+    xp += boss_xp[pick] * BOSS_XP
+    # The boss's first appearance still counts as a wave; its phases after that must be finished
+    play(boss_attr[pick], boss_activities, everyone, True)
+    for _ in range(BOSS_PHASES[rank]):
+        play(boss_attr[pick], boss_activities, everyone, False)
+
+    completion = done / total
+    coins, _ = REWARDS[rank]
+    scale = 2 if dungeon_type == "Instance" else 1
+    return {
+        "waves": total,
+        "events": rng.binomial(total - 1, EVENT_CHANCE[rank]),
+        "xp": (xp * completion).astype(np.int64) * scale,
+        "coins": (coins * completion).astype(np.int64) * scale,
+        "reps": reps,
+        "seconds": seconds,
+        "hp_loss_pct": hp_lost * 100,
+    }
+
+
+def simulate(rank, profile, runs=1_000_000, seed=2222, dungeon_type="Normal", monsters=None):
+    """Per-run results of `runs` dungeons of `rank`, as arrays keyed by METRICS."""
+    monsters = monsters or load_monsters()
+    activities = ActivityRolls(rank, profile)
+    boss_activities = ActivityRolls(rank, profile, boss=True)
+    # One stream per rank, so a rank's numbers do not depend on which others were run
+    rng = np.random.default_rng([seed, RANKS.index(rank)])
+    parts = [simulate_chunk(rng, rank, profile, min(CHUNK, runs - start), monsters,
+                            activities, boss_activities, dungeon_type)
+             for start in range(0, runs, CHUNK)]
+    return {metric: np.concatenate([part[metric] for part in parts]) for metric in METRICS}
+
+
+def summarize(values):
+    p5, p50, p95 = np.percentile(values, [5, 50, 95])
+    return {"mean": float(values.mean()), "p5": float(p5), "p50": float(p50), "p95": float(p95),
+            "max": float(values.max())}
+
+
+def report(profile, ranks=RANKS, runs=1_000_000, seed=2222, dungeon_type="Normal"):
+    monsters = load_monsters()
+    result = {
+        "profile": {"level": profile.level, "rank": profile.rank, "str": profile.str, "agi": profile.agi,
+                    "completion": profile.completion},
+        "runs": runs,
+        "seed": seed,
+        "gates": {rank: summarize(counts) | {"none": float((counts == 0).mean())}
+                  for rank, counts in simulate_gates(runs, seed).items()},
+        "dungeons": {},
+    }
+    for rank in ranks:
+        runs_of_rank = simulate(rank, profile, runs, seed, dungeon_type, monsters)
+        summary = {metric: summarize(values) for metric, values in runs_of_rank.items()}
+        summary["deaths"] = float((runs_of_rank["hp_loss_pct"] >= 100).mean())
+        result["dungeons"][rank] = summary
+    return result
+
+
+def print_report(result):
+    profile = result["profile"]
+    print(f"Level {profile['level']} ({profile['rank']}), STR {profile['str']:g}, AGI {profile['agi']:g}, "
+          f"{profile['completion']:.0%} of activities done, {result['runs']:,} runs, seed {result['seed']}\n")
+
+    print(f"{'daily gates':<12}{'mean':>8}{'p95':>6}{'max':>6}{'none':>8}")
+    for rank, gates in result["gates"].items():
+        print(f"{rank:<12}{gates['mean']:>8.2f}{gates['p95']:>6.0f}{gates['max']:>6.0f}{gates['none']:>8.1%}")
+
+    for rank, summary in result["dungeons"].items():
+        print(f"\n{rank}-Rank dungeon{'':<10}{'mean':>10}{'p5':>10}{'p50':>10}{'p95':>10}{'max':>10}")
+        for metric in METRICS:
+            values = summary[metric]
+            print(f"  {metric:<24}" + "".join(f"{values[key]:>10.1f}" for key in ("mean", "p5", "p50", "p95", "max")))
+        print(f"  {'deaths':<24}{summary['deaths']:>10.2%}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m thesystem.dungeonsim")
+    parser.add_argument("--rank", choices=RANKS, action="append", help="dungeon rank(s) to run; all by default")
+    parser.add_argument("--level", type=int, help="player level (default: the current player's)")
+    parser.add_argument("--str", dest="stre", type=float, help="STR including equipment")
+    parser.add_argument("--agi", type=float, help="AGI including equipment")
+    parser.add_argument("--completion", type=float, default=1.0, help="chance each activity is done (0-1)")
+    parser.add_argument("--instance", action="store_true", help="Instance dungeons (double rewards)")
+    parser.add_argument("--runs", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=2222)
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args(argv)
+
+    from thesystem.state import player_state
+    profile = Profile.from_status(player_state.get("Status.json"), args.completion)
+    if args.level is not None:
+        profile.level = args.level
+    if args.stre is not None:
+        profile.str = args.stre
+    if args.agi is not None:
+        profile.agi = args.agi
+
+    result = report(profile, args.rank or RANKS, args.runs, args.seed, "Instance" if args.instance else "Normal")
+    if args.json:
+        print(ujson.dumps(result, indent=4))
+    else:
+        print_report(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
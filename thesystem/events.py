@@ -5,34 +5,54 @@ import random
 import subprocess
 import os
 import thesystem.system
+import thesystem.windows
 from PIL import Image, ImageTk
 from datetime import datetime, timedelta, date
 import time
 import sys
-from thesystem.misc import resource_path
+from thesystem.scheduler import scheduler, next_clock_time
+
+import thesystem.watcher
+
+EVENTS_FILE = "Files/Player Data/Player Events.json"
+# Edits to Player Events.json wake the tracker through the file watcher, this is only a safety net
+EVENT_RECHECK_SECONDS = 60*60
+
+def next_event_times(data, now):
+    times = {}
+    for key in data.keys():
+        event_time = next_clock_time(data[key]["time"], now=now, days=data[key]["days"])
+        if event_time is not None:
+            times[key] = event_time
+    return times
 
 def event_tracker():
-    while True:
-        today_day = datetime.today().strftime('%A')
-        current_time = datetime.now().strftime("%H:%M")
-        
-        with open("Files/Player Data/Player Events.json", "r") as f:
+    """Open the Urgent Quest screen whenever a player event starts."""
+    last_check = [datetime.now()]
+
+    def check_events():
+        now = datetime.now()
+        with open(EVENTS_FILE, "r") as f:
             data = ujson.load(f)
-        data_keys=data.keys()
-        for key in data_keys:
-            if today_day in data[key]["days"]:
-                if data[key]["time"]==current_time:
-                    with open("Files/Temp Files/Event.csv", "w", newline="") as f:
-                        writer = csv.writer(f)
-                        writer.writerow([key])
-                    data[key]["begun"]=True
-                    with open("Files/Player Data/Player Events.json", "w") as f:
-                        ujson.dump(data, f, indent=6)
-                    with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
-                        theme_data=ujson.load(themefile)
-                        theme=theme_data["Theme"]
-                    subprocess.Popen([sys.executable, resource_path(f"{theme} Version/Urgent Quest PVE/gui.py")])
-                elif current_time > data[key]["time"]:
-                    if data[key]["begun"]==False:
-                        print()
-        time.sleep(3)
\ No newline at end of file
+
+        # Every event whose start fell between the previous check and now
+        started = [key for key, event_time in next_event_times(data, last_check[0]).items() if event_time <= now]
+        last_check[0] = now
+
+        for key in started:
+            with open("Files/Temp Files/Event.csv", "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow([key])
+            data[key]["begun"]=True
+            with open(EVENTS_FILE, "w") as f:
+                ujson.dump(data, f, indent=6)
+            with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
+                theme_data=ujson.load(themefile)
+                theme=theme_data["Theme"]
+            thesystem.windows.open_screen("Urgent Quest PVE", theme=theme)
+
+        recheck = now + timedelta(seconds=EVENT_RECHECK_SECONDS)
+        return min(list(next_event_times(data, now).values()) + [recheck])
+
+    scheduler.schedule("events", check_events)
+    thesystem.watcher.watch(EVENTS_FILE, lambda path: scheduler.wake("events"))
@@ -0,0 +1,427 @@
+import numpy as np
+import threading
+import hashlib
+import ujson
+import time
+import cv2
+import os
+from PIL import Image
+
+# Frame stacks are one contiguous (N, H, W, 4) uint8 array next to a small JSON
+# header, so they can be memory-mapped instead of unpickled. The legacy
+# pickled `*_frame_stack W H.npy` name is still what every caller passes in.
+# The header doubles as the cache manifest: resize target plus size, mtime
+# and SHA-1 of every source frame.
+FORMAT_VERSION = 2
+IMAGE_TYPES = (".png", ".jpg", ".jpeg")
+
+
+def stack_paths(cache_path):
+    """Return the (frames, header) paths that belong to a legacy cache path."""
+    base = cache_path[:-4] if cache_path.endswith(".npy") else cache_path
+    return base + ".u8.npy", base + ".u8.json"
+
+
+def list_frames(folder_path, sort=True):
+    files = [f for f in os.listdir(folder_path) if f.lower().endswith(IMAGE_TYPES)]
+    if sort:
+        files.sort()
+    return files
+
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def source_entry(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns, file_hash(path)]
+
+
+def source_manifest(folder_path, sort=True):
+    return {name: source_entry(os.path.join(folder_path, name)) for name in list_frames(folder_path, sort)}
+
+
+def stack_is_fresh(folder_path, cache_path, resize):
+    """
+    True if the stack saved for `cache_path` was built from exactly the frames
+    now in `folder_path`, at `resize`. Files are only hashed when their size or
+    mtime moved; if the content turns out unchanged the new mtimes are recorded.
+    """
+    header = read_header(cache_path)
+    if header is None or header["resize"] != list(resize):
+        return False
+
+    recorded = header["sources"]
+    try:
+        names = list_frames(folder_path)
+    except OSError:
+        return False
+    if sorted(recorded) != names:
+        return False
+
+    touched = False
+    for name in names:
+        path = os.path.join(folder_path, name)
+        size, mtime_ns, digest = recorded[name]
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if (stat.st_size, stat.st_mtime_ns) == (size, mtime_ns):
+            continue
+        if stat.st_size != size or file_hash(path) != digest:
+            return False
+        recorded[name] = [size, stat.st_mtime_ns, digest]
+        touched = True
+
+    if touched:
+        # e.g. after a fresh checkout: same pixels, new mtimes
+        try:
+            write_header(cache_path, header)
+        except OSError:
+            pass
+    return True
+
+
+class FrameStack:
+    """
+    Read-only view over a saved frame stack. Indexing gives the same
+    `(array, mode)` pairs the pickled format held, but only the pages of the
+    requested frame are read from disk.
+    """
+
+    def __init__(self, frames, header):
+        self.frames = frames
+        self.header = header
+        self.modes = header["modes"]
+
+    def __getitem__(self, index):
+        return self.frames[index], self.modes[index]
+
+    def __len__(self):
+        return len(self.frames)
+
+    @property
+    def size(self):
+        return (self.frames.shape[2], self.frames.shape[1])
+
+
+def save_frame_stack(frames, modes, cache_path, sources=None, resize=None):
+    """
+    Write `frames` (a (N, H, W, 4) uint8 array or list of equally sized RGBA
+    arrays) and their original modes. Both files are written to temp names and
+    swapped in, header last, so readers never see half a stack.
+    """
+    frames_path, header_path = stack_paths(cache_path)
+    frames = np.ascontiguousarray(np.asarray(frames, dtype=np.uint8))
+
+    header = {
+        "version": FORMAT_VERSION,
+        "shape": list(frames.shape),
+        "modes": list(modes),
+        "resize": list(resize) if resize else None,
+        "sources": sources or {},
+    }
+
+    temp_path = frames_path + ".tmp"
+    with open(temp_path, "wb") as f:
+        np.save(f, frames)
+    replace(temp_path, frames_path)
+
+    write_header(cache_path, header)
+    return frames_path
+
+
+def write_header(cache_path, header):
+    header_path = stack_paths(cache_path)[1]
+    temp_path = header_path + ".tmp"
+    with open(temp_path, "w") as f:
+        ujson.dump(header, f, indent=4)
+    replace(temp_path, header_path)
+
+
+def replace(temp_path, path, attempts=20):
+    # On Windows a stack still mapped by an open screen cannot be replaced;
+    # give that screen a few seconds to close before giving up.
+    for attempt in range(attempts):
+        try:
+            os.replace(temp_path, path)
+            return
+        except PermissionError:
+            if attempt == attempts - 1:
+                os.remove(temp_path)
+                raise
+            time.sleep(0.25)
+
+
+def read_header(cache_path):
+    frames_path, header_path = stack_paths(cache_path)
+    if not (os.path.exists(frames_path) and os.path.exists(header_path)):
+        return None
+    try:
+        with open(header_path, "r") as f:
+            header = ujson.load(f)
+    except (OSError, ValueError):
+        return None
+    if header.get("version") != FORMAT_VERSION:
+        return None
+    return header
+
+
+def load_frame_stack(cache_path):
+    """Memory-map the stack saved for `cache_path`. Returns None if there is none."""
+    header = read_header(cache_path)
+    if header is None:
+        return None
+    frames_path = stack_paths(cache_path)[0]
+    try:
+        frames = np.load(frames_path, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    if list(frames.shape) != header["shape"]:
+        return None
+    return FrameStack(frames, header)
+
+
+# Background video stacks mapped by this process, by path
+videos = {}
+
+
+def open_video_frames(video_path):
+    """
+    Map a background video stack (a plain (N, H, W, 3) uint8 .npy) read-only.
+    Every window and process that opens the same file shares one copy
+    through the OS page cache instead of holding its own.
+    """
+    key = os.path.normcase(os.path.abspath(video_path))
+    frames = videos.get(key)
+    if frames is None:
+        try:
+            frames = np.load(video_path, mmap_mode="r")
+        except ValueError:
+            # Object arrays cannot be mapped
+            frames = np.load(video_path, allow_pickle=True)
+        videos[key] = frames
+    return frames
+
+
+def scaled_video_paths(video_path, size, rotate=False):
+    """Return the (frames, header) paths of `video_path` pre-scaled to `size`."""
+    base = video_path[:-4] if video_path.endswith(".npy") else video_path
+    base += f".{size[0]}x{size[1]}" + (".rot" if rotate else "")
+    return base + ".rgb.npy", base + ".rgb.json"
+
+
+def scale_video_frame(frame, size, rotate=False):
+    """Rotate, resize and convert one BGR video frame the way the player shows it."""
+    if rotate:
+        frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
+    height, width = frame.shape[:2]
+    interp = cv2.INTER_LINEAR if (size[0] > width or size[1] > height) else cv2.INTER_AREA
+    if (width, height) != tuple(size):
+        frame = cv2.resize(frame, tuple(size), interpolation=interp)
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+
+class ScaledVideo:
+    """
+    A background video scaled once to one canvas size, as an (N, H, W, 3) RGB
+    stack. A stack saved next to the source npy is mapped; otherwise frames are
+    scaled in order on a background thread into a new file, which playback can
+    read from while it fills and which later windows of that size just map.
+    """
+
+    def __init__(self, source, size, rotate=False, video_path=None):
+        self.source = source
+        self.size = tuple(size)
+        self.rotate = rotate
+        self.video_path = video_path
+        self.frames = None
+        # frames[:ready] are scaled
+        self.ready = 0
+        self.thread = None
+
+    def __len__(self):
+        return len(self.source)
+
+    def frame(self, index):
+        """RGB frame `index`, or None if it has not been scaled yet."""
+        frames = self.frames
+        if frames is None or index >= self.ready:
+            return None
+        return frames[index]
+
+    def _expected_header(self):
+        stat = os.stat(self.video_path)
+        return {
+            "version": FORMAT_VERSION,
+            "source": [stat.st_size, stat.st_mtime_ns],
+            "shape": [len(self.source), self.size[1], self.size[0], 3],
+            "rotate": self.rotate,
+        }
+
+    def open(self):
+        if self.video_path is not None:
+            frames_path, header_path = scaled_video_paths(self.video_path, self.size, self.rotate)
+            try:
+                with open(header_path, "r") as f:
+                    header = ujson.load(f)
+                if header == self._expected_header():
+                    frames = np.load(frames_path, mmap_mode="r")
+                    if list(frames.shape) == header["shape"]:
+                        self.frames = frames
+                        self.ready = len(frames)
+                        return self
+            except (OSError, ValueError):
+                pass
+
+        self.thread = threading.Thread(target=self._fill, daemon=True)
+        self.thread.start()
+        return self
+
+    def _fill(self):
+        shape = (len(self.source), self.size[1], self.size[0], 3)
+        frames = temp_path = None
+        if self.video_path is not None:
+            frames_path, header_path = scaled_video_paths(self.video_path, self.size, self.rotate)
+            # Per process, in case two processes scale the same size at once
+            temp_path = f"{frames_path}.{os.getpid()}.tmp"
+            try:
+                header = self._expected_header()
+                frames = np.lib.format.open_memmap(temp_path, mode="w+", dtype=np.uint8, shape=shape)
+            except OSError as e:
+                print(f"[Frame Cache] Could not cache scaled frames for {self.video_path}: {e}")
+                temp_path = None
+        if frames is None:
+            frames = np.empty(shape, dtype=np.uint8)
+        self.frames = frames
+
+        for i in range(len(frames)):
+            frame = self.source[i]
+            if isinstance(frame, str):
+                # Lists of frame files are read as they are needed
+                frame = cv2.imread(frame)
+            if frame is None:
+                frames[i] = frames[i - 1] if i else 0
+            else:
+                frames[i] = scale_video_frame(frame, self.size, self.rotate)
+            self.ready = i + 1
+
+        if temp_path is None:
+            return
+        try:
+            frames.flush()
+            replace(temp_path, frames_path)
+            with open(header_path + ".tmp", "w") as f:
+                ujson.dump(header, f, indent=4)
+            replace(header_path + ".tmp", header_path)
+            # Same pixels, now from the file every later window maps
+            self.frames = np.load(frames_path, mmap_mode="r")
+        except (OSError, ValueError) as e:
+            print(f"[Frame Cache] Could not save scaled frames for {self.video_path}: {e}")
+
+
+# Scaled stacks in use by this process, by (video path, size, rotate)
+scaled_videos = {}
+scaled_videos_lock = threading.Lock()
+
+
+def open_scaled_video(source, size, rotate=False):
+    """
+    Return a ScaledVideo of `source` (frames from open_video_frames, or any
+    sequence of BGR frames or frame paths) at `size`. Stacks of mapped videos
+    are cached on disk next to the video and shared by every window.
+    """
+    video_path = getattr(source, "filename", None)
+    if video_path is None:
+        return ScaledVideo(source, size, rotate).open()
+
+    key = (os.path.normcase(os.path.abspath(video_path)), tuple(size), rotate)
+    with scaled_videos_lock:
+        scaled = scaled_videos.get(key)
+        if scaled is None:
+            scaled = scaled_videos[key] = ScaledVideo(source, size, rotate, video_path).open()
+    return scaled
+
+
+def convert_legacy(cache_path, sources=None):
+    """
+    Load a pickled `(array, mode)` object stack and save it in the new format.
+    `sources` is the manifest to record for it, since the old format had none.
+    Returns the mapped stack, or the plain list if it could not be written.
+    """
+    data = np.load(cache_path, allow_pickle=True).tolist()
+    arrays = [np.asarray(Image.fromarray(arr).convert("RGBA")) for arr, mode in data]
+    modes = [mode for arr, mode in data]
+    try:
+        save_frame_stack(arrays, modes, cache_path, sources=sources, resize=arrays[0].shape[1::-1] if arrays else None)
+    except (OSError, ValueError) as e:
+        print(f"[Frame Cache] Could not convert {cache_path}: {e}")
+        return data
+    return load_frame_stack(cache_path) or data
+
+
+def build_frame_stack(folder_path, cache_path, resize=None, sort=True, progress=None):
+    """
+    Build the stack for every image in `folder_path`. Frames are converted to
+    RGBA and resized to `resize` (or to the first frame's size, so they stack).
+
+    Args:
+        progress (callable, optional): Called with (done, total) after each
+            frame; returning False cancels the build.
+
+    Returns:
+        int: Number of frames written (0 if nothing was written).
+    """
+    return build_frame_stacks(folder_path, [(cache_path, resize)], sort, progress)[0]
+
+
+def build_frame_stacks(folder_path, targets, sort=True, progress=None):
+    """
+    Build several sizes of the same folder in one pass, decoding every source
+    frame once. `targets` is a list of (cache_path, resize) pairs.
+
+    Returns:
+        list: Number of frames written for each target (0 if nothing was written).
+    """
+    files = list_frames(folder_path, sort)
+    stacks = [None] * len(targets)
+    resizes = [resize for cache_path, resize in targets]
+    modes = []
+    sources = {}
+
+    for i, filename in enumerate(files):
+        path = os.path.join(folder_path, filename)
+        try:
+            img = Image.open(path)
+            mode = img.mode
+            img = img.convert("RGBA")
+        except (OSError, ValueError) as e:
+            print(f"[Frame Cache] Skipping {path}: {e}")
+            # Still recorded, so an unreadable frame does not make the stack look stale forever
+            sources[filename] = source_entry(path)
+            continue
+
+        for t, resize in enumerate(resizes):
+            if resize is None:
+                resize = resizes[t] = img.size
+            frame = img if img.size == tuple(resize) else img.resize(resize, Image.Resampling.LANCZOS)
+
+            if stacks[t] is None:
+                stacks[t] = np.empty((len(files), resize[1], resize[0], 4), dtype=np.uint8)
+            stacks[t][len(modes)] = np.asarray(frame)
+
+        modes.append(mode)
+        sources[filename] = source_entry(path)
+
+        if progress is not None and progress(i + 1, len(files)) is False:
+            return [0] * len(targets)
+
+    if not modes:
+        return [0] * len(targets)
+
+    for (cache_path, resize), frames, resize in zip(targets, stacks, resizes):
+        save_frame_stack(frames[:len(modes)], modes, cache_path, sources=sources, resize=resize)
+    return [len(modes)] * len(targets)
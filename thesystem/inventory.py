@@ -2,13 +2,14 @@ from pathlib import Path
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
 from PIL import Image, ImageTk
 import ujson
-import subprocess
 import threading
 import thesystem.system
+import thesystem.audio
+import thesystem.windows
+import thesystem.journal
+from thesystem.state import player_state
 import csv
 import os
-import sys
-from thesystem.misc import resource_path
 
 def create_inventory_item(canvas, window, item_data, x, y, button_images, item_images, image5):
     tr_n = item_data.get('name', '')
@@ -50,7 +51,7 @@ def ex_close(win):
     with open("Files/Player Data/Tabs.json",'w') as fin_tab_son:
         tab_son_data["Inventory"]='Close'
         ujson.dump(tab_son_data,fin_tab_son,indent=4)
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(win, win.winfo_height(), win.winfo_width(), step=40, delay=1)
 
 def inventory_name_cut(name):
@@ -75,7 +76,7 @@ def inventory_item_data(name,rank,category,t,r,s,window):
             with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
                 theme_data=ujson.load(themefile)
                 theme=theme_data["Theme"]
-            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Item Data/gui.py')])
+            thesystem.windows.open_script(f'{theme} Version/Item Data/gui.py')
     
     except:
         print()
@@ -106,11 +107,10 @@ def get_inventory_button_image(name):
     return PhotoImage(file=files)
 
 def selling_item(name,window,val):
-    with open("Files/Player Data/Status.json", 'r') as read_status_file:
-        read_status_file_data=ujson.load(read_status_file)
-
-    with open("Files/Player Data/Inventory.json", 'r') as fin_inv_fson:
-        fin_inv_data=ujson.load(fin_inv_fson)
+    # The item leaving the inventory and the coins arriving are committed together
+    with player_state.transaction():
+        read_status_file_data=player_state.get("Status.json")
+        fin_inv_data=player_state.get("Inventory.json")
 
         fin_qt=fin_inv_data[name][0]["qty"]
         fin_inv_data[name][0]["qty"]=fin_qt-1
@@ -119,39 +119,35 @@ def selling_item(name,window,val):
             del fin_inv_data[name]
             closing=True
 
-    
-    
-    with open("Files/Player Data/Skill.json", 'r') as f:
-        skill_data = ujson.load(f)
+        skill_data = player_state.skills()
 
-    addition = 0
-    if thesystem.system.skill_use("Negotiation", (0), False) and ("Negotiation" in skill_data):
-        lvl = skill_data["Negotiation"][0]["lvl"]
-        if isinstance(lvl, str):
-            lvl = 10
+        addition = 0
+        if thesystem.system.skill_use("Negotiation", (0), False) and ("Negotiation" in skill_data):
+            lvl = skill_data["Negotiation"][0]["lvl"]
+            if isinstance(lvl, str):
+                lvl = 10
 
-        percentile = 0.015 * lvl
-        addition = abs(val) * percentile
+            percentile = 0.015 * lvl
+            addition = abs(val) * percentile
 
+        player_state.update("Inventory.json")
 
-    with open("Files/Player Data/Inventory.json", 'w') as finaladdon_inv:
-        ujson.dump(fin_inv_data, finaladdon_inv, indent=6)
-
-    with open("Files/Player Data/Status.json", 'w') as write_status_file:
         read_status_file_data["status"][0]['coins']+=int(val+addition)
-        ujson.dump(read_status_file_data, write_status_file, indent=4)
+        player_state.update("Status.json")
+
+    thesystem.journal.record("sale", coins=int(val+addition), item=name)
 
     with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
         theme_data=ujson.load(themefile)
         theme=theme_data["Theme"]
 
     if closing==True:
-        subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Inventory/gui.py')])
+        thesystem.windows.open_script(f'{theme} Version/Inventory/gui.py')
 
         window.quit()
 
     else:
-        subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Item Data/gui.py')])
+        thesystem.windows.open_script(f'{theme} Version/Item Data/gui.py')
 
         window.quit()
 
@@ -2,14 +2,13 @@ from pathlib import Path
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
 import ujson
 import csv
-import subprocess
 import threading
 import cv2
 from PIL import Image, ImageTk
 import sys
 import os
 import sys
-from thesystem.misc import resource_path
+from thesystem.state import player_state
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -18,6 +17,7 @@ project_root = os.path.abspath(os.path.join(current_dir, '../../'))
 sys.path.insert(0, project_root)
 
 import thesystem.system
+import thesystem.windows
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / "assets/frame0"
@@ -74,24 +74,26 @@ def process_item_buffs(item_data, status_data, sign=1):
 
 # Command to open and handle equipment selection
 def handle_selection(val, name, cat, window, dat1, dat2, dat3, dat4, dat5):
-    equipment_data = load_ujson(EQUIPMENT_FILE)
-    status_data = load_ujson(STATUS_FILE)
-
-    if equipment_data.get(cat):
-        current_item = list(equipment_data[cat].keys())[0]
-        process_item_buffs(equipment_data[cat][current_item][0], status_data, sign=-1)
-
-    if name != '-':
-        new_item_data = {1: dat1, 2: dat2, 3: dat3, 4: dat4, 5: dat5}.get(val)
-        if new_item_data is not None:
-            equipment_data[cat] = new_item_data
-            save_ujson(EQUIPMENT_FILE, equipment_data)
-
-            new_item_name = list(new_item_data.keys())[0]
-            process_item_buffs(new_item_data[new_item_name][0], status_data, sign=1)
-
-    save_ujson(STATUS_FILE, status_data)
-    subprocess.Popen([sys.executable, resource_path('Anime Version/Equipment/gui.py')])
+    # Equipment and the stats it grants are committed together
+    with player_state.transaction():
+        equipment_data = player_state.get("Equipment.json")
+        status_data = player_state.get("Status.json")
+
+        if equipment_data.get(cat):
+            current_item = list(equipment_data[cat].keys())[0]
+            process_item_buffs(equipment_data[cat][current_item][0], status_data, sign=-1)
+
+        if name != '-':
+            new_item_data = {1: dat1, 2: dat2, 3: dat3, 4: dat4, 5: dat5}.get(val)
+            if new_item_data is not None:
+                equipment_data[cat] = new_item_data
+                player_state.update("Equipment.json")
+
+                new_item_name = list(new_item_data.keys())[0]
+                process_item_buffs(new_item_data[new_item_name][0], status_data, sign=1)
+
+        player_state.update("Status.json")
+    thesystem.windows.open_script('Anime Version/Equipment/gui.py')
     window.quit()
 
 def equip_item(cat,item_full_data, window):
@@ -317,7 +319,7 @@ def equip_item(cat,item_full_data, window):
                 tab_son_data=ujson.load(tab_son)
 
             if tab_son_data["Inventory"]=='Close':
-                subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Equipment/gui.py')])
+                thesystem.windows.open_script(f'{theme} Version/Equipment/gui.py')
             window.quit()
 
     elif cat.upper()=="RUNE STONE":
@@ -386,7 +388,7 @@ def equip_item(cat,item_full_data, window):
         with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
             theme_data = ujson.load(themefile)
             theme = theme_data["Theme"]
-        subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Inventory/gui.py')])
+        thesystem.windows.open_script(f'{theme} Version/Inventory/gui.py')
         window.quit()
 
     if cat=="ORDER":
@@ -394,7 +396,7 @@ def equip_item(cat,item_full_data, window):
             data_fininv=ujson.load(fson)
         del data_fininv["The Orb of Order"]
 
-        subprocess.Popen([sys.executable, resource_path("First/The Order/gui.py")])
+        thesystem.windows.open_script("First/The Order/gui.py")
         window.quit()
 
 
@@ -1,9 +1,10 @@
-import ujson
+from thesystem.state import player_state
 
 
 def speedster():
-    with open('Files/Player Data/Skill.json', 'r') as skill_file:
-        skill_file_data=ujson.load(skill_file)
+    # The skills and the job change are committed together
+    with player_state.transaction():
+        skill_file_data=player_state.skills()
         skill_file_data["Force of Speed"]=[{
             "lvl":1,
             "type":"Job",
@@ -30,19 +31,15 @@ def speedster():
             }
         }]
 
-    with open('Files/Player Data/Skill.json', 'w') as fin_skill_file:
-        ujson.dump(skill_file_data, fin_skill_file, indent=6)
+        player_state.update("Skill.json")
 
-    with open("Files/Player Data/Status.json", 'r') as fson:
-        data=ujson.load(fson)
-    data["status"][1]['job']="Speedster"
-
-    with open("Files/Player Data/Status.json", 'w') as fson:
-        ujson.dump(data, fson, indent=6)
+        player_state.status_info()['job']="Speedster"
+        player_state.update("Status.json")
 
 def beserker():
-    with open('Files/Player Data/Skill.json', 'r') as skill_file:
-        skill_file_data=ujson.load(skill_file)
+    # The skills and the job change are committed together
+    with player_state.transaction():
+        skill_file_data=player_state.skills()
         skill_file_data["Strength Augmentation"]=[{
             "lvl":1,
             "type":"Job",
@@ -69,19 +66,15 @@ def beserker():
             }
         }]
 
-    with open('Files/Player Data/Skill.json', 'w') as fin_skill_file:
-        ujson.dump(skill_file_data, fin_skill_file, indent=6)
-
-    with open("Files/Player Data/Status.json", 'r') as fson:
-        data=ujson.load(fson)
-    data["status"][1]['job']="Beserker"
+        player_state.update("Skill.json")
 
-    with open("Files/Player Data/Status.json", 'w') as fson:
-        ujson.dump(data, fson, indent=6)
+        player_state.status_info()['job']="Beserker"
+        player_state.update("Status.json")
 
 def tank():
-    with open('Files/Player Data/Skill.json', 'r') as skill_file:
-        skill_file_data=ujson.load(skill_file)
+    # The skills and the job change are committed together
+    with player_state.transaction():
+        skill_file_data=player_state.skills()
         skill_file_data["Quick Heal"]=[{
             "lvl":1,
             "type":"Job",
@@ -108,19 +101,15 @@ def tank():
             }
         }]
 
-    with open('Files/Player Data/Skill.json', 'w') as fin_skill_file:
-        ujson.dump(skill_file_data, fin_skill_file, indent=6)
+        player_state.update("Skill.json")
 
-    with open("Files/Player Data/Status.json", 'r') as fson:
-        data=ujson.load(fson)
-    data["status"][1]['job']="Tank"
-
-    with open("Files/Player Data/Status.json", 'w') as fson:
-        ujson.dump(data, fson, indent=6)
+        player_state.status_info()['job']="Tank"
+        player_state.update("Status.json")
 
 def shadow_monarch():
-    with open('Files/Player Data/Skill.json', 'r') as skill_file:
-        skill_file_data=ujson.load(skill_file)
+    # The skills and the job change are committed together
+    with player_state.transaction():
+        skill_file_data=player_state.skills()
         skill_file_data["Shadow Extraction"]=[{
             "lvl":1,
             "type":"Job",
@@ -147,19 +136,15 @@ def shadow_monarch():
             }
         }]
 
-    with open('Files/Player Data/Skill.json', 'w') as fin_skill_file:
-        ujson.dump(skill_file_data, fin_skill_file, indent=6)
-
-    with open("Files/Player Data/Status.json", 'r') as fson:
-        data=ujson.load(fson)
-    data["status"][1]['job']="Shadow Monarch"
+        player_state.update("Skill.json")
 
-    with open("Files/Player Data/Status.json", 'w') as fson:
-        ujson.dump(data, fson, indent=6)
+        player_state.status_info()['job']="Shadow Monarch"
+        player_state.update("Status.json")
 
 def commander():
-    with open('Files/Player Data/Skill.json', 'r') as skill_file:
-        skill_file_data=ujson.load(skill_file)
+    # The skills and the job change are committed together
+    with player_state.transaction():
+        skill_file_data=player_state.skills()
         skill_file_data["Charismatic Presence"]=[{
             "lvl":1,
             "type":"Job",
@@ -186,19 +171,15 @@ def commander():
             }
         }]
 
-    with open('Files/Player Data/Skill.json', 'w') as fin_skill_file:
-        ujson.dump(skill_file_data, fin_skill_file, indent=6)
+        player_state.update("Skill.json")
 
-    with open("Files/Player Data/Status.json", 'r') as fson:
-        data=ujson.load(fson)
-    data["status"][1]['job']="Commander"
-
-    with open("Files/Player Data/Status.json", 'w') as fson:
-        ujson.dump(data, fson, indent=6)
+        player_state.status_info()['job']="Commander"
+        player_state.update("Status.json")
 
 def observer():
-    with open('Files/Player Data/Skill.json', 'r') as skill_file:
-        skill_file_data=ujson.load(skill_file)
+    # The skills and the job change are committed together
+    with player_state.transaction():
+        skill_file_data=player_state.skills()
         skill_file_data["Heightened Perception"]=[{
             "lvl":1,
             "type":"Job",
@@ -225,19 +206,15 @@ def observer():
             }
         }]
 
-    with open('Files/Player Data/Skill.json', 'w') as fin_skill_file:
-        ujson.dump(skill_file_data, fin_skill_file, indent=6)
-
-    with open("Files/Player Data/Status.json", 'r') as fson:
-        data=ujson.load(fson)
-    data["status"][1]['job']="Observer"
+        player_state.update("Skill.json")
 
-    with open("Files/Player Data/Status.json", 'w') as fson:
-        ujson.dump(data, fson, indent=6)
+        player_state.status_info()['job']="Observer"
+        player_state.update("Status.json")
 
 def artificer():
-    with open('Files/Player Data/Skill.json', 'r') as skill_file:
-        skill_file_data=ujson.load(skill_file)
+    # The skills and the job change are committed together
+    with player_state.transaction():
+        skill_file_data=player_state.skills()
         skill_file_data["Quick Thought"]=[{
             "lvl":1,
             "type":"Job",
@@ -264,13 +241,8 @@ def artificer():
             }
         }]
 
-    with open('Files/Player Data/Skill.json', 'w') as fin_skill_file:
-        ujson.dump(skill_file_data, fin_skill_file, indent=6)
-
-    with open("Files/Player Data/Status.json", 'r') as fson:
-        data=ujson.load(fson)
-    data["status"][1]['job']="Artificer"
+        player_state.update("Skill.json")
 
-    with open("Files/Player Data/Status.json", 'w') as fson:
-        ujson.dump(data, fson, indent=6)
+        player_state.status_info()['job']="Artificer"
+        player_state.update("Status.json")
 
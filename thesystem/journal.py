@@ -0,0 +1,309 @@
+from datetime import date, timedelta
+import threading
+import atexit
+import ujson
+import gzip
+import time
+import sys
+import os
+
+from thesystem.state import player_state
+
+JOURNAL_FOLDER = "Files/Player Data/Journal"
+# A segment is sealed (and later compressed) once it grows past this
+SEGMENT_BYTES = 1 << 20
+# Events appended between snapshots; startup only replays what came after the last one
+SNAPSHOT_EVENTS = 200
+SNAPSHOT_VERSION = 1
+
+# Numeric event fields that are summed per day and over the lifetime
+AMOUNTS = ("xp", "coins", "str", "int", "levels")
+
+
+def day_key(timestamp):
+    return time.strftime("%Y-%m-%d", time.localtime(timestamp))
+
+
+def segment_name(number):
+    return f"segment-{number:06d}.jsonl"
+
+
+def fold(state, event):
+    """Apply one event to the derived counters: lifetime totals and one bucket per day."""
+    kind = event["k"]
+    day = state["days"].setdefault(day_key(event["t"]), {})
+    for bucket in (state["totals"], day):
+        bucket[kind] = bucket.get(kind, 0) + 1
+        for field in AMOUNTS:
+            if field in event:
+                bucket[field] = bucket.get(field, 0) + event[field]
+    rank = event.get("rank")
+    if rank:
+        name = f"rank {rank}"
+        state["totals"][name] = state["totals"].get(name, 0) + 1
+    if "total" in event:
+        state["last_xp"] = event["total"]
+
+
+class ProgressionJournal:
+    """
+    Append-only record of what the player gained: XP, coins, stat points,
+    quests, dungeon clears and penalties.
+
+    Events are JSON lines appended to numbered segments in JOURNAL_FOLDER.
+    The counters (lifetime totals and per-day sums) are folded from them and
+    saved in snapshot.json together with the segment and byte offset they
+    cover, so starting up only replays the events written since. Queries
+    over a week or a month add up that many day buckets, however long the
+    history is. Sealed segments the snapshot covers are gzipped.
+
+    Other processes append to the same segments; refresh() picks up what
+    they wrote before anything is read.
+    """
+
+    def __init__(self, folder=JOURNAL_FOLDER):
+        self.folder = folder
+        self.lock = threading.RLock()
+        self.state = None
+        self.unsnapshotted = 0
+
+    # --- Files ---------------------------------------------------------------
+
+    def segment_path(self, number):
+        return os.path.join(self.folder, segment_name(number))
+
+    def segments(self):
+        """Numbers of all segments on disk, oldest first (compressed ones included)."""
+        numbers = set()
+        if os.path.isdir(self.folder):
+            for name in os.listdir(self.folder):
+                if name.startswith("segment-") and (name.endswith(".jsonl") or name.endswith(".jsonl.gz")):
+                    numbers.add(int(name[8:14]))
+        return sorted(numbers)
+
+    def _empty_state(self):
+        return {"version": SNAPSHOT_VERSION, "segment": 1, "offset": 0, "last_xp": None, "totals": {}, "days": {}}
+
+    def _load(self):
+        if self.state is not None:
+            return
+        os.makedirs(self.folder, exist_ok=True)
+        try:
+            with open(os.path.join(self.folder, "snapshot.json"), 'r') as f:
+                state = ujson.load(f)
+            if state.get("version") != SNAPSHOT_VERSION:
+                raise ValueError("old snapshot")
+        except (OSError, ValueError):
+            # No usable snapshot: fold the whole history once, then keep a snapshot
+            state = self._empty_state()
+            for event in self.events():
+                fold(state, event)
+            numbers = self.segments()
+            if numbers:
+                state["segment"] = numbers[-1]
+                path = self.segment_path(numbers[-1])
+                state["offset"] = os.path.getsize(path) if os.path.exists(path) else 0
+            self.state = state
+            self.snapshot()
+            return
+        self.state = state
+
+    def refresh(self):
+        """Fold in events appended (by this or another process) since the counters were last read."""
+        with self.lock:
+            self._load()
+            state = self.state
+            while True:
+                data = self._read_from(state["segment"], state["offset"])
+                # A line still being written by another process is picked up next time
+                end = data.rfind(b"\n") + 1
+                for line in data[:end].splitlines():
+                    if line.strip():
+                        fold(state, ujson.loads(line))
+                        self.unsnapshotted += 1
+                state["offset"] += end
+
+                if not any(number > state["segment"] for number in self.segments()):
+                    break
+                if end < len(data):
+                    break
+                state["segment"] += 1
+                state["offset"] = 0
+
+            if self.unsnapshotted >= SNAPSHOT_EVENTS:
+                self.snapshot()
+            return state
+
+    def _read_from(self, number, offset):
+        path = self.segment_path(number)
+        try:
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                return f.read()
+        except FileNotFoundError:
+            pass
+        # Compressed by another process since this one last read it
+        try:
+            with gzip.open(path + ".gz", 'rb') as f:
+                return f.read()[offset:]
+        except FileNotFoundError:
+            return b""
+
+    def append(self, kind, **fields):
+        """Record one event; `fields` may hold the AMOUNTS plus any details (rank, name, ...)."""
+        event = {"t": int(time.time()), "k": kind}
+        event.update(fields)
+        line = (ujson.dumps(event) + "\n").encode("utf-8")
+        with self.lock:
+            self._load()
+            numbers = self.segments()
+            number = numbers[-1] if numbers else 1
+            path = self.segment_path(number)
+            if os.path.exists(path) and os.path.getsize(path) >= SEGMENT_BYTES:
+                number += 1
+                path = self.segment_path(number)
+            # One write() on an O_APPEND file, so lines from several processes never interleave
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+            self.refresh()
+        self.update_statistics()
+        return event
+
+    def events(self, since=None):
+        """Every recorded event, oldest first; `since` (a timestamp) skips older ones."""
+        for number in self.segments():
+            path = self.segment_path(number)
+            if os.path.exists(path):
+                f = open(path, 'rb')
+            else:
+                f = gzip.open(path + ".gz", 'rb')
+            with f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    event = ujson.loads(line)
+                    if since is None or event["t"] >= since:
+                        yield event
+
+    def snapshot(self):
+        """Save the counters and the position they cover, then compress segments that are sealed."""
+        with self.lock:
+            path = os.path.join(self.folder, "snapshot.json")
+            temp_path = path + f".{os.getpid()}.tmp"
+            with open(temp_path, 'w') as f:
+                ujson.dump(self.state, f)
+            os.replace(temp_path, path)
+            self.unsnapshotted = 0
+            self.compact()
+
+    def compact(self):
+        """Gzip every segment before the one the snapshot points into; those are never appended to again."""
+        for number in self.segments():
+            if number >= self.state["segment"]:
+                break
+            path = self.segment_path(number)
+            if not os.path.exists(path):
+                continue
+            temp_path = path + f".gz.{os.getpid()}.tmp"
+            with open(path, 'rb') as source, gzip.open(temp_path, 'wb') as target:
+                target.write(source.read())
+            os.replace(temp_path, path + ".gz")
+            os.remove(path)
+
+    def close(self):
+        with self.lock:
+            if self.state is not None and self.unsnapshotted:
+                self.snapshot()
+
+    # --- Recording -----------------------------------------------------------
+
+    def observe_xp(self, xp, level=None):
+        """
+        Record the XP gained since the last observation. Callers add XP to
+        Status.json in many places and then check for level-ups, so the
+        gain is taken from the total rather than passed in.
+        """
+        with self.lock:
+            last = self.refresh()["last_xp"]
+            if last == xp:
+                return None
+            gain = xp - last if last is not None and xp > last else 0
+            fields = {"xp": gain, "total": xp}
+            if level is not None:
+                fields["level"] = level
+            return self.append("experience", **fields)
+
+    # --- Derived views -------------------------------------------------------
+
+    def totals(self):
+        with self.lock:
+            return dict(self.refresh()["totals"])
+
+    def gains(self, start, end=None):
+        """Sum of the day buckets from date `start` to `end` (inclusive, default today)."""
+        end = end or date.today()
+        with self.lock:
+            days = self.refresh()["days"]
+            result = {}
+            day = start
+            while day <= end:
+                for field, value in days.get(day.isoformat(), {}).items():
+                    result[field] = result.get(field, 0) + value
+                day += timedelta(days=1)
+            return result
+
+    def week(self):
+        """What was gained in the last seven days, today included."""
+        return self.gains(date.today() - timedelta(days=6))
+
+    def month(self):
+        """What was gained since the first of this month."""
+        return self.gains(date.today().replace(day=1))
+
+    def update_statistics(self):
+        """Rewrite the lifetime counters in Statistics.json from the journal."""
+        totals = self.totals()
+        try:
+            stats = player_state.get("Statistics.json")
+        except (OSError, ValueError):
+            return
+        stats["Quests"] = totals.get("quest", 0)
+        for rank in "EDCBAS":
+            stats[f"{rank} Rank"] = totals.get(f"rank {rank}", 0)
+        stats["Coins"] = totals.get("coins", 0)
+        stats["STR Points"] = totals.get("str", 0)
+        stats["INT Points"] = totals.get("int", 0)
+        stats["Penaltys"] = totals.get("penalty", 0)
+        player_state.update("Statistics.json")
+
+
+journal = ProgressionJournal()
+atexit.register(journal.close)
+
+
+def record(kind, **fields):
+    """Append an event to the shared journal, never letting a journal problem break the game action."""
+    try:
+        return journal.append(kind, **fields)
+    except (OSError, ValueError) as e:
+        print(f"[Journal] Could not record {kind}: {e}")
+        return None
+
+
+def observe_xp(xp, level=None):
+    try:
+        return journal.observe_xp(xp, level)
+    except (OSError, ValueError) as e:
+        print(f"[Journal] Could not record XP: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    # python -m thesystem.journal [week|month|total]
+    view = sys.argv[1] if len(sys.argv) > 1 else "week"
+    result = {"week": journal.week, "month": journal.month, "total": journal.totals}[view]()
+    for field, value in sorted(result.items()):
+        print(f"{field:<12} {value}")
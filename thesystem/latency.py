@@ -0,0 +1,90 @@
+import threading
+import tkinter
+import ujson
+import time
+import sys
+import os
+
+# Path of a JSON-lines file to append marks to; unset, every call here is a no-op
+LOG = os.environ.get("THESYSTEM_LATENCY")
+
+# Milestones of opening a screen, in the order they normally happen
+EVENTS = ["open", "interpreter up", "import done", "mainloop", "bar frame", "video frame"]
+
+_lock = threading.Lock()
+_screen = None
+_seen = set()
+
+
+def peak_rss():
+    """Peak resident memory of this process in bytes, or None if it cannot be read."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss)
+    except Exception:
+        return None
+
+
+def mark(event, t=None):
+    """Record the first time `event` happens for the current screen."""
+    if LOG is None:
+        return
+    with _lock:
+        if event in _seen:
+            return
+        _seen.add(event)
+        line = ujson.dumps({
+            "screen": _screen,
+            "event": event,
+            "t": time.time() if t is None else t,
+            "pid": os.getpid(),
+            "rss": peak_rss(),
+        })
+        with open(LOG, "a") as f:
+            f.write(line + "\n")
+
+
+def begin(screen):
+    """Start timing a screen opened inside this process (the window host)."""
+    global _screen
+    if LOG is None:
+        return
+    with _lock:
+        _screen = screen
+        _seen.clear()
+    mark("open")
+
+
+def _install():
+    """Mark window creation and the first event-loop pass of a standalone screen."""
+    global _screen
+    _screen = os.path.abspath(sys.argv[0]) if sys.argv and sys.argv[0] else None
+    # The interpreter is up and the screen's imports have reached thesystem
+    mark("interpreter up")
+
+    tk_init = tkinter.Tk.__init__
+    tk_mainloop = tkinter.Misc.mainloop
+
+    def __init__(self, *args, **kwargs):
+        # The screen scripts create their window once their imports are done
+        mark("import done")
+        tk_init(self, *args, **kwargs)
+
+    def mainloop(self, n=0):
+        self.after_idle(mark, "mainloop")
+        return tk_mainloop(self, n)
+
+    tkinter.Tk.__init__ = __init__
+    tkinter.Misc.mainloop = mainloop
+
+
+if LOG is not None:
+    _install()
@@ -5,6 +5,11 @@ import sys
 import os
 
 import thesystem.system
+from thesystem.state import player_state
+import thesystem.watcher
+import thesystem.tracing
+
+SETTINGS_FILE = "Files/Player Data/Settings.json"
 
 def resource_path(relative_path):
     try:
@@ -16,51 +21,73 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 def return_status():
-    with open("Files/Player Data/Status.json", 'r') as fson:
-        data=ujson.load(fson)
-        return data
+    return player_state.get("Status.json")
     
+def player_data_name(filename):
+    """'Files/Player Data/Status.json' -> 'Status.json'; None for files outside Player Data."""
+    folder, name = os.path.split(os.path.normpath(filename))
+    if folder == os.path.normpath(player_state.folder) and name.endswith(".json"):
+        return name
+    return None
+
 def load_ujson(filename):
-    with open(filename, 'r') as file:
-        return ujson.load(file)
+    with thesystem.tracing.span(f"load_ujson {os.path.basename(filename)}", path=filename):
+        # Player Data goes through the store (and its storage backend); a copy, as reading the file gave
+        name = player_data_name(filename)
+        if name is not None:
+            return ujson.loads(ujson.dumps(player_state.get(name)))
+        with open(filename, 'r') as file:
+            return ujson.load(file)
 
 def dump_ujson(filename, data, indents=6):
-    with open(filename, 'w') as file:
-        ujson.dump(data, file, indent=indents)
-        return True
+    with thesystem.tracing.span(f"dump_ujson {os.path.basename(filename)}", path=filename):
+        name = player_data_name(filename)
+        if name is not None:
+            player_state.update(name, data)
+            # Other screens read the files straight from disk
+            player_state.flush()
+            return True
+        with open(filename, 'w') as file:
+            ujson.dump(data, file, indent=indents)
+            return True
+
+def dump_ujson_field(filename, path, value):
+    """Write one field of a Player Data file, e.g. ("Player", "Push") of Daily_Quest.json."""
+    player_state.set_field(player_data_name(filename), path, value)
+    player_state.flush()
+    return True
     
 def check_theme():
-    theme_data=load_ujson("Files/Player Data/Theme_Check.json")
-    theme=theme_data["Theme"]
-
-    return theme
+    return player_state.theme()
 
 def update_screen(screen, state='Open'):
-    tab_son_data=load_ujson("Files/Player Data/Tabs.json")
+    # Served from memory until the file watcher (or a stat) sees Tabs.json change
+    tab_son_data=player_state.get("Tabs.json")
     new_state="Open"
     if state == 'Open':
         new_state="Close"
 
     if tab_son_data[screen]==new_state:
         tab_son_data[screen]=state
-        dump_ujson("Files/Player Data/Tabs.json", tab_son_data, 4)
+        player_state.update("Tabs.json")
+        # Other screens read Tabs.json straight from disk
+        player_state.flush()
         return True
     return False
 
 def return_settings():
-    with open("Files/Player Data/Settings.json", 'r') as fson:
-        data=ujson.load(fson)
-        return data
+    return player_state.get("Settings.json")
     
 def voice_activate():
-    first_run=False
-    while True:
-        with open("Files/Player Data/Settings.json", 'r') as fson:
-            data=ujson.load(fson)
-            
-        if data["Settings"]["Microphone"]=="True" and first_run==False:
+    """Start voice.py the first time the Microphone setting is switched on."""
+    launched = []
+
+    def check_microphone(path=None):
+        if player_state.settings()["Microphone"]=="True" and not launched:
+            launched.append(True)
+            thesystem.watcher.watcher.unsubscribe(SETTINGS_FILE, check_microphone)
             subprocess.Popen([sys.executable, resource_path('voice.py')])
             thesystem.system.info_open("Voice")
-            first_run=True
-        
-        time.sleep(2)
\ No newline at end of file
+
+    thesystem.watcher.watch(SETTINGS_FILE, check_microphone)
+    check_microphone()
\ No newline at end of file
@@ -4,6 +4,7 @@ import os
 import random
 import sys
 from thesystem.misc import resource_path
+from thesystem.catalog import catalog
 
 def get_weekly_night_market_data():
     """
@@ -84,14 +85,6 @@ def _create_new_weekly_data(week_key, monday_date):
     Returns:
         dict: New weekly data with rank items and metadata
     """
-    # Load inventory data to get rank items
-    try:
-        with open("Files/Data/Inventory_List.json", 'r') as f:
-            inventory_data = ujson.load(f)
-    except Exception as e:
-        print(f"Error loading inventory data: {e}")
-        inventory_data = {}
-    
     # Initialize rank items structure
     rank_items = {"S": {}, "B": {}, "C": {}, "D": {}}
     
@@ -103,26 +96,9 @@ def _create_new_weekly_data(week_key, monday_date):
         "D": {"Common": 1, "Rare": 0, "Epic": 0, "Legendary": 0}   # D-rank: 1 Common item
     }
     
-    # Process each rank separately
+    # Process each rank separately; the item catalog already has each rank's items by rarity
     for rank in ["S", "B", "C", "D"]:
-        # Collect all items for this rank
-        rank_candidates = {}
-        for item_name, item_data in inventory_data.items():
-            if item_data and len(item_data) > 0:
-                item = item_data[0]
-                item_rank = item.get("rank")
-                
-                if item_rank == rank:
-                    rarity = item.get("rarity", "Common")
-                    if item_name not in rank_candidates:
-                        rank_candidates[item_name] = {
-                            "rarity": rarity,
-                            "data": item
-                        }
-        
-        # Select items based on percentage-based rarity system
-        selected_items = _select_items_by_rarity(rank_candidates, rarity_config[rank])
-        rank_items[rank] = selected_items
+        rank_items[rank] = _select_items_by_rarity(rank, rarity_config[rank])
     
     # Create comprehensive weekly data structure
     weekly_data = {
@@ -142,13 +118,13 @@ def _create_new_weekly_data(week_key, monday_date):
     
     return weekly_data
 
-def _select_items_by_rarity(candidates, rarity_config):
+def _select_items_by_rarity(rank, rarity_config):
     """
     Select items based on percentage-based rarity system.
     Ensures each rank gets exactly 1 item by falling back to Common if needed.
     
     Args:
-        candidates (dict): All available items for a rank
+        rank (str): Rank to pick from the item catalog
         rarity_config (dict): How many items to select per rarity
     
     Returns:
@@ -156,14 +132,6 @@ def _select_items_by_rarity(candidates, rarity_config):
     """
     selected_items = {}
     
-    # Group candidates by rarity
-    rarity_groups = {"Common": [], "Rare": [], "Epic": [], "Legendary": []}
-    
-    for item_name, item_info in candidates.items():
-        rarity = item_info["rarity"]
-        if rarity in rarity_groups:
-            rarity_groups[rarity].append((item_name, item_info))
-    
     # Rarity percentages (total = 100%)
     rarity_percentages = {
         "Common": 50,    # 50% chance
@@ -185,33 +153,17 @@ def _select_items_by_rarity(candidates, rarity_config):
             selected_rarity = rarity
             break
     
-    # Try to select 1 item from the chosen rarity
-    available_items = rarity_groups.get(selected_rarity, [])
+    # Select 1 item from the chosen rarity, falling back to Common, then to any item of the rank
+    item_name = (catalog.sample(rank=rank, rarity=selected_rarity)
+                 or catalog.sample(rank=rank, rarity="Common")
+                 or catalog.sample(rank=rank))
     
-    if available_items:
-        # Select 1 item from the chosen rarity
-        selected = random.sample(available_items, 1)
-        
-        # Add selected item to result
-        for item_name, item_info in selected:
-            selected_items[item_name] = item_info
-    else:
-        # Fallback to Common if chosen rarity has no items
-        common_items = rarity_groups.get("Common", [])
-        if common_items:
-            selected = random.sample(common_items, 1)
-            for item_name, item_info in selected:
-                selected_items[item_name] = item_info
-        else:
-            # If even Common is empty, take any available item
-            all_items = []
-            for items in rarity_groups.values():
-                all_items.extend(items)
-            
-            if all_items:
-                selected = random.sample(all_items, 1)
-                for item_name, item_info in selected:
-                    selected_items[item_name] = item_info
+    if item_name:
+        item = catalog.item(item_name)
+        selected_items[item_name] = {
+            "rarity": item.get("rarity", "Common"),
+            "data": item
+        }
     
     return selected_items
 
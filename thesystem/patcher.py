@@ -0,0 +1,338 @@
+"""
+Applies the patches listed in patches.json, several versions at a time.
+
+    manifest = {"latest": "1.3.0", "patches": [
+        {"from": "1.0.0", "to": "1.1.0", "url": ".../patch_1.0.0_to_1.1.0.diff", "sha256": "..."},
+        ...
+    ]}
+
+plan() finds the shortest chain of patches from the installed version to the
+target. The hops download side by side into the Update Cache folder, resume
+where an interrupted download stopped, and are checked against their sha256.
+Only the files the chain touches are copied into a staging folder, patched
+there hop after hop, and backed up. The staged files are then moved over the
+install one rename at a time. If any of that fails, the files already
+replaced are moved back. A swap cut short by a crash is rolled back by
+recover() on the next run.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from collections import deque
+import threading
+import hashlib
+import zipfile
+import shutil
+import ujson
+import os
+
+from thesystem.updates import TIMEOUT, VERSION_FILE, is_newer
+
+CACHE_FOLDER = "Update Cache"
+BACKUP_FOLDER = "Update Backup"
+STAGING_FOLDER = ".update-staging"
+# Written before the first rename of a swap and removed after the last
+SWAP_JOURNAL = "swap.json"
+DOWNLOAD_WORKERS = 4
+CHUNK_BYTES = 1 << 16
+
+
+# What a failed update() left the install as, on the exception it raised (see install_state)
+UNCHANGED = "unchanged"        # nothing was swapped, or the swap was rolled back
+UPDATED = "updated"            # every file was swapped in; only the clean-up after it failed
+INTERRUPTED = "interrupted"    # a swap could not be rolled back; recover() retries on the next run
+
+
+class PatchError(Exception):
+    pass
+
+
+def install_state(error):
+    """UNCHANGED, UPDATED or INTERRUPTED for an exception raised by update(); None for any other."""
+    return getattr(error, "install_state", None)
+
+
+def plan(manifest, current, target=None):
+    """
+    Shortest list of patch entries leading from `current` to `target`
+    (the manifest's latest by default). [] when already there, None when no
+    chain of patches connects the two.
+    """
+    target = target or manifest.get("latest")
+    if target is None or current == target:
+        return []
+    edges = {}
+    for hop in manifest.get("patches", []):
+        edges.setdefault(hop.get("from"), []).append(hop)
+
+    # Breadth first, so the first time the target is reached it is by the fewest hops
+    came_from = {current: None}
+    queue = deque([current])
+    while queue:
+        node = queue.popleft()
+        for hop in edges.get(node, []):
+            following = hop.get("to")
+            if following in came_from:
+                continue
+            came_from[following] = hop
+            if following == target:
+                chain = []
+                while following != current:
+                    hop = came_from[following]
+                    chain.append(hop)
+                    following = hop["from"]
+                return chain[::-1]
+            queue.append(following)
+    return None
+
+
+def cache_path(hop, folder=CACHE_FOLDER):
+    name = os.path.basename(hop["url"].split("?")[0]) or f"patch_{hop['from']}_to_{hop['to']}.diff"
+    return os.path.join(folder, name)
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(CHUNK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def download(hop, folder=CACHE_FOLDER, on_bytes=None, session=None):
+    """
+    Download one patch into `folder`, continuing a partial download with a
+    Range request, and check its sha256. Returns the file's path; a file
+    already downloaded and intact is not fetched again.
+    """
+    import requests
+
+    expected = hop.get("sha256")
+    if not expected:
+        raise PatchError(f"Patch {hop['from']} -> {hop['to']} has no sha256 in the manifest")
+    path = cache_path(hop, folder)
+    if os.path.exists(path) and file_sha256(path) == expected:
+        return path
+
+    os.makedirs(folder, exist_ok=True)
+    partial = path + ".part"
+    have = os.path.getsize(partial) if os.path.exists(partial) else 0
+    headers = {"Range": f"bytes={have}-"} if have else {}
+    session = session or requests
+
+    with session.get(hop["url"], headers=headers, stream=True, timeout=TIMEOUT) as response:
+        if response.status_code == 416:
+            # The part file is already complete (or longer than the patch); start over
+            os.remove(partial)
+            return download(hop, folder, on_bytes, session)
+        response.raise_for_status()
+        # 206: the server continued where the part file stops; 200: it sent everything
+        mode = "ab" if response.status_code == 206 and have else "wb"
+        if on_bytes is not None and mode == "ab":
+            on_bytes(have)
+        with open(partial, mode) as f:
+            for chunk in response.iter_content(chunk_size=CHUNK_BYTES):
+                f.write(chunk)
+                if on_bytes is not None:
+                    on_bytes(len(chunk))
+
+    actual = file_sha256(partial)
+    if actual != expected:
+        os.remove(partial)
+        raise PatchError(f"Patch {hop['from']} -> {hop['to']} failed verification (sha256 {actual})")
+    os.replace(partial, path)
+    return path
+
+
+def download_all(chain, folder=CACHE_FOLDER, progress=None, workers=DOWNLOAD_WORKERS):
+    """Download every hop of `chain` concurrently. `progress(fraction)` follows the bytes received."""
+    import requests
+
+    total = sum(hop.get("size", 0) for hop in chain)
+    received = [0]
+    lock = threading.Lock()
+
+    def on_bytes(count):
+        with lock:
+            received[0] += count
+            if progress is not None and total:
+                progress(min(1.0, received[0] / total))
+
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda hop: download(hop, folder, on_bytes, session), chain))
+
+
+def touched_files(patch_path):
+    """Paths (relative to the install) a unified/git diff creates, changes or deletes."""
+    touched = []
+    with open(patch_path, "rb") as f:
+        lines = f.read().decode("utf-8", errors="replace").splitlines()
+    for line, following in zip(lines, lines[1:]):
+        if not (line.startswith("--- ") and following.startswith("+++ ")):
+            continue
+        for header in (line[4:], following[4:]):
+            name = header.split("\t")[0].strip()
+            if name == "/dev/null":
+                continue
+            if name.startswith(("a/", "b/")):
+                name = name[2:]
+            if name not in touched:
+                touched.append(name)
+    return touched
+
+
+def inside(root, relative):
+    """Absolute path of `relative` under `root`; a patch may not reach outside the install."""
+    root = os.path.abspath(root)
+    path = os.path.abspath(os.path.join(root, relative))
+    if os.path.commonpath([root, path]) != root:
+        raise PatchError(f"Patch touches a path outside the install: {relative}")
+    return path
+
+
+def stage(patch_paths, root, staging, files):
+    """Copy `files` from the install into `staging` and apply every patch there in order."""
+    import patch_ng
+
+    new_folder = os.path.join(staging, "new")
+    os.makedirs(new_folder, exist_ok=True)
+    for relative in files:
+        source = inside(root, relative)
+        if os.path.isfile(source):
+            os.makedirs(os.path.dirname(os.path.join(new_folder, relative)), exist_ok=True)
+            shutil.copy2(source, os.path.join(new_folder, relative))
+
+    for patch_path in patch_paths:
+        patch_set = patch_ng.fromfile(patch_path)
+        if not patch_set or not patch_set.apply(root=new_folder):
+            raise PatchError(f"{os.path.basename(patch_path)} does not apply to the installed files")
+    return new_folder
+
+
+def backup(root, files, folder=BACKUP_FOLDER):
+    """Zip the current copies of `files` (the ones that exist) before they are replaced."""
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, f"backup_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.zip")
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for relative in files:
+            source = inside(root, relative)
+            if os.path.isfile(source):
+                archive.write(source, relative)
+    return path
+
+
+def swap(root, staging, files):
+    """
+    Move the staged files over the install. Each file is one rename; the
+    originals are moved aside first, and moved back if any step fails.
+    """
+    new_folder = os.path.join(staging, "new")
+    old_folder = os.path.join(staging, "old")
+    journal = os.path.join(staging, SWAP_JOURNAL)
+    added = [relative for relative in files if not os.path.exists(inside(root, relative))]
+    with open(journal, "w") as f:
+        ujson.dump({"files": files, "added": added}, f)
+
+    try:
+        for relative in files:
+            target = inside(root, relative)
+            staged = os.path.join(new_folder, relative)
+            if os.path.exists(target):
+                os.makedirs(os.path.dirname(os.path.join(old_folder, relative)), exist_ok=True)
+                os.replace(target, os.path.join(old_folder, relative))
+            if os.path.exists(staged):
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                os.replace(staged, target)
+            # Not staged: the patches deleted it, and moving it aside was the delete
+    except Exception:
+        rollback(root, staging)
+        raise
+    os.remove(journal)
+
+
+def rollback(root, staging):
+    """Put back every original a swap moved aside, and drop the files it added."""
+    journal = os.path.join(staging, SWAP_JOURNAL)
+    with open(journal, "r") as f:
+        swapped = ujson.load(f)
+    old_folder = os.path.join(staging, "old")
+    for relative in reversed(swapped["files"]):
+        target = inside(root, relative)
+        original = os.path.join(old_folder, relative)
+        if os.path.exists(original):
+            os.replace(original, target)
+        elif relative in swapped["added"] and not os.path.exists(os.path.join(staging, "new", relative)):
+            # A new file that had already been moved in, and any folders made for it
+            if os.path.exists(target):
+                os.remove(target)
+                try:
+                    os.removedirs(os.path.dirname(target))
+                except OSError:
+                    pass
+    os.remove(journal)
+
+
+def recover(root="."):
+    """Roll back a swap interrupted by a crash and clear the staging folder. Returns True if one was found."""
+    staging = os.path.join(root, STAGING_FOLDER)
+    interrupted = os.path.exists(os.path.join(staging, SWAP_JOURNAL))
+    if interrupted:
+        rollback(root, staging)
+    shutil.rmtree(staging, ignore_errors=True)
+    return interrupted
+
+
+def update(manifest, current, root=".", target=None, log=print, progress=None):
+    """
+    Bring the install at `root` from `current` to `target` (the manifest's
+    latest). Returns the version now installed. Anything it raises (PatchError
+    when the update cannot be done) says what it left the install as:
+    install_state(error) is UNCHANGED, UPDATED or INTERRUPTED.
+    """
+    staging = os.path.join(root, STAGING_FOLDER)
+    journal = os.path.join(staging, SWAP_JOURNAL)
+    state = UNCHANGED
+    try:
+        if recover(root):
+            log("Rolled back an update that was interrupted.")
+        target = target or manifest.get("latest")
+        if not is_newer(target, current):
+            return current
+        chain = plan(manifest, current, target)
+        if chain is None:
+            raise PatchError(f"No chain of patches leads from {current} to {target}")
+        log(f"Updating {current} -> {target} in {len(chain)} step(s): "
+            + " -> ".join([current] + [hop["to"] for hop in chain]))
+
+        patch_paths = download_all(chain, os.path.join(root, CACHE_FOLDER), progress)
+        log("Patches downloaded and verified.")
+
+        files = []
+        for patch_path in patch_paths:
+            files += [name for name in touched_files(patch_path) if name not in files]
+        # The version file moves with the patched files, so they can never disagree
+        version_file = os.path.normpath(VERSION_FILE)
+        if version_file not in files:
+            files.append(version_file)
+
+        shutil.rmtree(staging, ignore_errors=True)
+        try:
+            log(f"Applying to {len(files)} file(s)...")
+            new_folder = stage(patch_paths, root, staging, files)
+            with open(os.path.join(new_folder, version_file), "w") as f:
+                f.write(target)
+            log(f"Backed up the changed files to {backup(root, files, os.path.join(root, BACKUP_FOLDER))}")
+            swap(root, staging, files)
+            state = UPDATED
+        finally:
+            # A journal left behind means the rollback failed; recover() needs it and the moved-aside files
+            if not os.path.exists(journal):
+                shutil.rmtree(staging, ignore_errors=True)
+
+        for patch_path in patch_paths:
+            os.remove(patch_path)
+        return target
+    except Exception as e:
+        if state != UPDATED and os.path.exists(journal):
+            state = INTERRUPTED
+        e.install_state = state
+        raise
@@ -2,6 +2,8 @@ import ujson
 import subprocess
 import csv
 import thesystem.system
+import thesystem.audio
+import thesystem.windows
 import ctypes
 import sys
 import sys
@@ -28,7 +30,7 @@ def complete(entry_1, entry_2, window):
     ex_close(window)
 
 def ex_close(window):
-    subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_close.py')])
+    thesystem.audio.play("Close SFX")
     thesystem.system.animate_window_close(window, window.winfo_height(), window.winfo_width(), step=30, delay=1)
 
 def is_admin():
@@ -0,0 +1,108 @@
+import threading
+import time
+
+import psutil
+
+from thesystem.scheduler import scheduler
+from thesystem.state import player_state
+
+# Quality tiers, best first. Each one also applies everything above it.
+FULL_VIDEO = 0
+HALF_VIDEO = 1
+STATIC_VIDEO = 2
+BARS_OFF = 3
+TIER_NAMES = ["full-rate video", "half-rate video", "static video", "bar animation off"]
+
+EVALUATE_SECONDS = 2
+# Worst event-loop lag (seconds) in an evaluation window that costs a tier,
+# and the lag every window has to stay under before one is given back
+LAG_HIGH = 0.060
+LAG_LOW = 0.020
+# System CPU percentages with the same meaning
+CPU_HIGH = 85
+CPU_LOW = 60
+# Headroom has to last this long before quality steps back up
+RECOVER_SECONDS = 10
+
+
+class QualityGovernor:
+    """
+    Picks how much animation each window can afford.
+
+    Video players and bar animators report, per window, how late each of
+    their frames ran (Tk event-loop lag plus the time the frame itself
+    took). Every EVALUATE_SECONDS each window's worst report and the system
+    CPU load decide whether that window steps one tier down, or, after
+    RECOVER_SECONDS of headroom, one tier back up. A window starts at full
+    quality and is forgotten once it stops reporting, so a new screen does
+    not inherit what an old one ran into.
+
+    The "Performernce (ANIME):" setting keeps its old meaning: no bar
+    animation at all, checked when a screen starts its bars. Video is left
+    to the tiers.
+    """
+
+    def __init__(self):
+        self.tiers = {}
+        self.lags = {}
+        self.calm_since = {}
+        self.running = False
+        self.lock = threading.Lock()
+
+    def tier(self, window):
+        """The quality tier `window` (a Tk toplevel) should draw at."""
+        return self.tiers.get(window, FULL_VIDEO)
+
+    def report(self, window, lag):
+        """Record that a frame drawn in `window` ran `lag` seconds late."""
+        with self.lock:
+            if lag > self.lags.get(window, 0):
+                self.lags[window] = lag
+            if self.running:
+                return
+            self.running = True
+        # The first reading only sets the reference point for the next one
+        psutil.cpu_percent(interval=None)
+        scheduler.schedule("quality governor", self.evaluate, EVALUATE_SECONDS)
+
+    def pinned(self):
+        """True while the setting has bar animation off."""
+        try:
+            return player_state.settings().get("Performernce (ANIME):") == "True"
+        except (OSError, ValueError, KeyError):
+            return False
+
+    def evaluate(self):
+        with self.lock:
+            lags, self.lags = self.lags, {}
+            # A window that sent nothing has closed or stopped animating
+            self.tiers = {window: tier for window, tier in self.tiers.items() if window in lags}
+            self.calm_since = {window: since for window, since in self.calm_since.items() if window in lags}
+            if not lags:
+                # No screen animating any more; the next report starts over
+                self.running = False
+                return None
+
+        cpu = psutil.cpu_percent(interval=None)
+        now = time.monotonic()
+        for window, lag in lags.items():
+            if lag > LAG_HIGH or cpu > CPU_HIGH:
+                self.calm_since.pop(window, None)
+                self.set_tier(window, self.tier(window) + 1)
+            elif lag < LAG_LOW and cpu < CPU_LOW:
+                since = self.calm_since.setdefault(window, now)
+                if now - since >= RECOVER_SECONDS:
+                    self.calm_since[window] = now
+                    self.set_tier(window, self.tier(window) - 1)
+            else:
+                self.calm_since.pop(window, None)
+        return EVALUATE_SECONDS
+
+    def set_tier(self, window, tier):
+        tier = max(FULL_VIDEO, min(BARS_OFF, tier))
+        if tier != self.tier(window):
+            print(f"[Quality] {window}: {TIER_NAMES[self.tier(window)]} -> {TIER_NAMES[tier]}")
+            self.tiers[window] = tier
+
+
+governor = QualityGovernor()
@@ -2,12 +2,49 @@ from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
 import ujson
 import csv
 import random
-import subprocess
 import os
 import thesystem.system
+import thesystem.windows
+import thesystem.journal
+from thesystem.catalog import catalog
 from PIL import Image, ImageTk
-import sys
-from thesystem.misc import resource_path
+
+def quest_rewards(rank, quest_type):
+    """Rewards for a player-made quest: a coin bag, a random item of the rank and, from B up, levels and points."""
+    if quest_type=='STR':
+        rew3="STRav"
+    elif quest_type=='INT':
+        rew3="INTav"
+
+    # ? Rewards
+    amt={
+        "S":250000, 
+        "A":130000,
+        "B":80000,
+        "C":5000,
+        "D":500,
+        "E":300
+        }
+
+    coinval=amt[rank]
+    rew1=f"Coin Bag {coinval}"
+    rew2=catalog.sample(rank=rank)
+
+    rew_dict={rew1:1}
+    # A rank the catalog has no items for gets the coins without an item
+    if rew2 is not None:
+        rew_dict[rew2]=1
+    if rank in ["S"]:
+        rew_dict["LVLADD"]=8
+        rew_dict[rew3]=10
+    elif rank in ["A"]:
+        rew_dict["LVLADD"]=5
+        rew_dict[rew3]=8
+    elif rank in ["B"]:
+        rew_dict["LVLADD"]=2
+        rew_dict[rew3]=6
+
+    return rew_dict
 
 def quest_adding_func(entry_1,entry_2,entry_3,entry_4,entry_5,entry_6,window):
     try:
@@ -38,11 +75,6 @@ def quest_adding_func(entry_1,entry_2,entry_3,entry_4,entry_5,entry_6,window):
         if quest_type not in ["STR", "INT"]:
             quest_type="STR"
 
-        if quest_type=='STR':
-            rew3="STRav"
-        elif quest_type=='INT':
-            rew3="INTav"
-
         id_val=random.randrange(1,999999)
 
         with open("Files/Data/Quest_Desc.json", 'r') as quest_desc_file:
@@ -57,40 +89,7 @@ def quest_adding_func(entry_1,entry_2,entry_3,entry_4,entry_5,entry_6,window):
                 desc_list=quest_desc["Hard"]
                 findesc=random.choice(desc_list)
 
-        # ? Rewards
-        amt={
-            "S":250000, 
-            "A":130000,
-            "B":80000,
-            "C":5000,
-            "D":500,
-            "E":300
-            }
-        
-        coinval=amt[rank]
-        rew1=f"Coin Bag {coinval}"
-        with open("Files/Data/Inventory_List.json", 'r') as rewards_name_file:
-            reward_names=ujson.load(rewards_name_file)
-            reward_names_list=list(reward_names.keys())
-
-            final_rewards_list=[]
-            for k in reward_names_list:
-                if rank==reward_names[k][0]["rank"]:
-                    final_rewards_list.append(k)
-            
-            rew2=random.choice(final_rewards_list)
-
-        rew_dict={rew1:1, rew2:1}
-        if rank in ["S"]:
-            rew_dict["LVLADD"]=8
-            rew_dict[rew3]=10
-        elif rank in ["A"]:
-            rew_dict["LVLADD"]=5
-            rew_dict[rew3]=8
-        elif rank in ["B"]:
-            rew_dict["LVLADD"]=2
-            rew_dict[rew3]=6
-
+        rew_dict=quest_rewards(rank, quest_type)
 
         detail=[{
             "desc":findesc,
@@ -114,7 +113,7 @@ def quest_adding_func(entry_1,entry_2,entry_3,entry_4,entry_5,entry_6,window):
 
     window.quit()
 
-    subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Quests/gui.py')])
+    thesystem.windows.open_script(f'{theme} Version/Quests/gui.py')
 
 def quest_reward(window,dicts,rank,name,special=False):
     rol=list(dicts.keys())
@@ -157,10 +156,11 @@ def quest_reward(window,dicts,rank,name,special=False):
 
             with open("Files/Player Data/Status.json", 'w') as fson:
                 ujson.dump(data_status, fson, indent=4)
+            thesystem.journal.observe_xp(data_status["status"][0]['XP'], new_level)
             with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
                 theme_data=ujson.load(themefile)
                 theme=theme_data["Theme"]
-            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Leveled up/gui.py')])
+            thesystem.windows.open_script(f'{theme} Version/Leveled up/gui.py')
 
         elif k=="STRav":
             for k in range(dicts[k]):
@@ -206,6 +206,9 @@ def quest_reward(window,dicts,rank,name,special=False):
             with open("Files/Player Data/Inventory.json", 'w') as finaladdon:
                 ujson.dump(data_fininv, finaladdon, indent=6)
 
+    thesystem.journal.record("vow" if special else "quest", rank=rank, name=name,
+                             str=dicts.get("STRav", 0), int=dicts.get("INTav", 0))
+
     with open("Files/Player Data/Active_Quests.json", 'r') as fols:
         quests=ujson.load(fols)
 
@@ -229,13 +232,13 @@ def quest_reward(window,dicts,rank,name,special=False):
             with open("Files\Temp Files\Quest Rewards.json", 'w') as fols:
                 ujson.dump(data_quest_rewards, fols, indent=6)
             
-            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/New Items/gui.py')])
+            thesystem.windows.open_script(f'{theme} Version/New Items/gui.py')
         else:
             thesystem.system.message_open("Quest Completed")
-            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Quests/gui.py')])
+            thesystem.windows.open_script(f'{theme} Version/Quests/gui.py')
     else:
         thesystem.system.message_open("Revertion")
-        subprocess.Popen([sys.executable, resource_path('First/Vows/gui.py')])
+        thesystem.windows.open_script('First/Vows/gui.py')
 
     window.quit()
 
@@ -251,7 +254,7 @@ def abandon_quest(name,window):
     with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
         theme_data=ujson.load(themefile)
         theme=theme_data["Theme"]
-    subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Quests/gui.py')])
+    thesystem.windows.open_script(f'{theme} Version/Quests/gui.py')
 
     window.quit()
 
@@ -304,7 +307,7 @@ def open_write_quest(name,id,type,window):
                 rec=[name,id,type]
                 fw.writerow(rec)
 
-        subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Quest Info/gui.py')])
+        thesystem.windows.open_script(f'{theme} Version/Quest Info/gui.py')
 
         with open("Files/Player Data/Tabs.json",'r') as tab_son:
             tab_son_data=ujson.load(tab_son)
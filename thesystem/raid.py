@@ -0,0 +1,241 @@
+"""
+Demon Castle raid rules, without Tk and without threads.
+
+A RaidEngine is one fight. Whoever drives it makes the player's moves and
+moves the fight clock forward with tick(); every call returns the events
+it caused, for a screen to draw or a simulation to count:
+
+    engine = RaidEngine(floor, status["status"][0])
+    moves = engine.new_turn()
+    engine.choose(0)
+    engine.tick(0.25)       # hazards, the burn phase and the move's time limit
+    engine.resolve(True)    # the move was done
+
+Events are tuples, kind first:
+
+    ("hit", damage, glanced)    ("timeout",)     ("staggered",)   ("enraged",)
+    ("recovered",)              ("enemy_hit", damage, blast)      ("hazard", damage)
+    ("victory",)                ("defeat", cause, message, delay)
+    ("next", "turn" | "enemy", delay)   what follows, after `delay` seconds
+
+Demon Castle/raid_interface.py draws the events and ticks four times a
+second; thesystem.raidsim plays thousands of fights with a scripted player.
+"""
+import random
+
+EXERCISES = {'easy': ['Jumping Jacks', 'Wall Sit', 'Crunches'], 'medium': ['Squats', 'Push-ups', 'Plank'], 'hard': ['Pull-ups', 'Burpees', 'V-Ups']}
+BOSSES = ['an Orc Warlord', 'a Lich King', 'a Fire Drake', 'a Demon Knight']
+
+# Seconds between one step of the fight and the next
+PAUSE = 1.5
+MOVE_SECONDS = 45
+BURN_MOVE_SECONDS = 30
+BURN_PHASE_SECONDS = 60
+HAZARD_FLOORS = range(50, 75)
+HAZARD_SECONDS = (15, 25)
+STAGGER_SHARE = 0.3
+
+DEFEAT_MESSAGES = {
+    "slain": "You have been slain.",
+    "hazard": "You succumbed to the hazardous environment.",
+    "burn": "You were overwhelmed by the Demon Lord's power.",
+}
+
+
+def floor_boss(floor_num, rng=random):
+    """(boss, mechanic) met on a floor; ordinary floors draw one of BOSSES."""
+    if floor_num == 100:
+        return "Final Demon Lord", "execute_phase"
+    elif floor_num % 25 == 0:
+        return "Archdemon of Ruin", "power_charge"
+    elif floor_num % 10 == 0:
+        return "Armored Gatekeeper", "defensive_stance"
+    return rng.choice(BOSSES), None
+
+
+def enemy_health(floor_num, level):
+    base_hp = 50 + (floor_num * 15) + round(pow(floor_num, 1.2))
+    return base_hp + (level * 10)
+
+
+class RaidEngine:
+    def __init__(self, floor_num, player, rng=random):
+        self.rng = rng
+        self.current_floor = floor_num
+        self.current_boss, self.boss_mechanic = floor_boss(floor_num, rng)
+
+        self.affliction = None
+        if self.current_boss == "Archdemon of Ruin":
+            self.affliction = "timer_burn"
+        elif self.current_boss == "Lich King":
+            self.affliction = "fatigue"
+        self.player_affliction = None
+        self.is_defending = False
+
+        self.enemy_max_health = enemy_health(floor_num, player["level"])
+        self.player_str, self.player_agi, self.player_vit = player["str"], player["agi"], player["vit"]
+        self.player_max_health = 75 + (self.player_vit * 5)
+        self.player_health = self.player_max_health
+        self.stagger_value = 0
+        self.stagger_threshold = self.enemy_max_health * STAGGER_SHARE
+        self.is_staggered = False
+
+        self.boss_phase = 1
+        if self.boss_mechanic == "execute_phase":
+            self.enemy_max_health *= 2
+        self.enemy_health = self.enemy_max_health
+
+        self.hazard = "unstable_ground" if floor_num in HAZARD_FLOORS else None
+
+        # Fight clock in seconds, and the moments its timers go off (None: not running)
+        self.clock = 0.0
+        self.hazard_at = self.clock + rng.randint(*HAZARD_SECONDS) if self.hazard else None
+        self.burn_until = None
+        self.move_deadline = None
+
+        self.moves = []
+        self.chosen_move = None
+        self.turns = 0
+        self.over = False
+        self.result = None
+        self.cause = None
+
+    # --- The player's side ---------------------------------------------------
+
+    def new_turn(self):
+        """Offer three moves; they share one rep count and time limit."""
+        if self.over:
+            return []
+        all_exercises = EXERCISES['easy'] + EXERCISES['medium'] + EXERCISES['hard']
+        base_reps = self.rng.randint(8, 20)
+        base_time = MOVE_SECONDS
+        if self.player_affliction == "fatigue":
+            base_reps = round(base_reps * 1.5)
+        elif self.player_affliction == "timer_burn":
+            base_time = BURN_MOVE_SECONDS
+        self.moves = [{'name': name, 'reps': base_reps, 'time': base_time}
+                      for name in self.rng.sample(all_exercises, 3)]
+        self.chosen_move = None
+        self.turns += 1
+        return self.moves
+
+    def choose(self, move_index):
+        """Start the chosen move's time limit."""
+        self.chosen_move = self.moves[move_index]
+        self.moves = []
+        self.move_deadline = self.clock + self.chosen_move['time']
+        return self.chosen_move
+
+    def time_left(self):
+        return None if self.move_deadline is None else max(0.0, self.move_deadline - self.clock)
+
+    def resolve(self, success):
+        """End the chosen move, done (`success`) or not."""
+        if self.over or self.chosen_move is None:
+            return []
+        move, self.chosen_move, self.move_deadline = self.chosen_move, None, None
+        events = []
+        if success:
+            damage = round(move['reps'] * 1.5) + (self.player_str * 1.5)
+            if self.is_staggered:
+                damage = round(damage * 1.5)
+            self.enemy_health -= damage
+            self.stagger_value += damage
+            events.append(("hit", damage, self.is_defending))
+            self.is_defending = False
+        else:
+            events.append(("timeout",))
+
+        if self.enemy_health <= 0:
+            self._end("victory")
+            return events + [("victory",)]
+
+        if self.boss_mechanic == "execute_phase" and self.boss_phase == 1 and self.enemy_health <= self.enemy_max_health / 2:
+            self.boss_phase = 2
+            self.burn_until = self.clock + BURN_PHASE_SECONDS
+            return events + [("enraged",), ("next", "turn", 0)]
+
+        if self.stagger_value >= self.stagger_threshold:
+            self.is_staggered = True
+            self.stagger_value = 0
+            return events + [("staggered",), ("next", "turn", PAUSE)]
+        return events + [("next", "enemy", PAUSE)]
+
+    # --- The enemy's side ----------------------------------------------------
+
+    def enemy_turn(self):
+        if self.over:
+            return []
+        events = []
+        self.player_affliction = None
+        if self.is_staggered:
+            self.is_staggered = False
+            events.append(("recovered",))
+
+        blast = self.boss_mechanic == "power_charge" and self.enemy_health < self.enemy_max_health / 2
+        if blast:
+            enemy_attack_power = (self.current_floor * 18)
+            self.boss_mechanic = None
+        else:
+            enemy_attack_power = (self.current_floor * 12)
+
+        player_defense = self.player_vit / 2
+        final_damage = max(1, round(enemy_attack_power - player_defense) + self.rng.randint(-3, 3))
+        self.player_health -= final_damage
+        events.append(("enemy_hit", final_damage, blast))
+
+        if self.player_health <= 0:
+            return events + self._defeat("slain", PAUSE)
+        return events + [("next", "turn", PAUSE)]
+
+    # --- The clock -----------------------------------------------------------
+
+    def tick(self, seconds):
+        """
+        Move the clock `seconds` forward, setting off every timer that comes
+        due on the way in the order they come due.
+        """
+        events = []
+        end = self.clock + seconds
+        while not self.over:
+            timers = [(at, name) for name, at in (("hazard", self.hazard_at), ("burn", self.burn_until),
+                                                  ("move", self.move_deadline)) if at is not None and at <= end]
+            if not timers:
+                break
+            self.clock, name = min(timers)
+            if name == "hazard":
+                events += self._hazard()
+            elif name == "burn":
+                self.burn_until = None
+                if self.enemy_health > 0:
+                    events += self._defeat("burn", 0)
+            else:
+                events += self.resolve(False)
+        if not self.over:
+            self.clock = end
+        return events
+
+    def _hazard(self):
+        hazard_damage = round(self.current_floor * 0.5)
+        self.player_health -= hazard_damage
+        self.hazard_at = self.clock + self.rng.randint(*HAZARD_SECONDS)
+        events = [("hazard", hazard_damage)]
+        if self.player_health <= 0:
+            events += self._defeat("hazard", 0)
+        return events
+
+    def _defeat(self, cause, delay):
+        self._end("defeat")
+        self.cause = cause
+        return [("defeat", cause, DEFEAT_MESSAGES[cause], delay)]
+
+    def _end(self, result):
+        self.over = True
+        self.result = result
+        self.hazard_at = self.burn_until = self.move_deadline = None
+
+    def rewards(self):
+        """(XP, coins) for beating this floor."""
+        base_xp = 10 + (self.enemy_max_health // 10)
+        coin_gain = 5 if "Boss" in self.current_boss else 0
+        return base_xp, coin_gain
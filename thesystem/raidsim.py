@@ -0,0 +1,173 @@
+"""
+Demon Castle balance check: thousands of fights per floor, across processes.
+
+    python -m thesystem.raidsim                             the current player, floors 1-100
+    python -m thesystem.raidsim --floors 40-60 --fights 5000 --pace 2.5
+    python -m thesystem.raidsim --level 60 --str 90 --vit 80 --json
+
+Every fight is a thesystem.raid.RaidEngine, the same rules the raid screen
+plays, driven by a scripted player instead of Tk: it takes `think` seconds
+to pick a move and `pace` seconds per rep (give or take `spread`), and a
+move that takes longer than its time limit fails exactly as it would on
+screen. The clock jumps from one event to the next, so a fight costs
+microseconds rather than minutes.
+
+Fights are split into fixed chunks seeded by (seed, floor, chunk), so the
+results do not depend on how many worker processes ran them.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import random
+import ujson
+import sys
+import os
+
+import numpy as np
+
+from thesystem.raid import RaidEngine, floor_boss, DEFEAT_MESSAGES
+
+FLOORS = range(1, 101)
+# Fights per task handed to a worker
+CHUNK = 250
+
+
+class Athlete:
+    """How the scripted player does its moves."""
+
+    def __init__(self, pace=2.0, think=3.0, spread=0.25):
+        self.pace = pace
+        self.think = think
+        self.spread = spread
+
+    def seconds(self, reps, rng):
+        return self.think + reps * self.pace * rng.uniform(1 - self.spread, 1 + self.spread)
+
+
+def fight(floor_num, player, athlete, rng):
+    """Play one fight to the end. Returns the finished engine."""
+    engine = RaidEngine(floor_num, player, rng)
+    step, delay = "turn", 0
+    while not engine.over:
+        events = engine.tick(delay)
+        if engine.over:
+            break
+        if step == "turn":
+            moves = engine.new_turn()
+            # The three moves only differ by name
+            engine.choose(0)
+            events = engine.tick(athlete.seconds(moves[0]['reps'], rng))
+            if engine.chosen_move is not None:
+                events += engine.resolve(True)
+        else:
+            events = engine.enemy_turn()
+        following = [event for event in events if event[0] == "next"]
+        if following:
+            _, step, delay = following[-1]
+    return engine
+
+
+def fight_chunk(floor_num, chunk, count, player, athlete, seed):
+    """(won, seconds, turns, cause) arrays for `count` fights on one floor."""
+    rng = random.Random(f"{seed}:{floor_num}:{chunk}")
+    won = np.zeros(count, dtype=bool)
+    seconds = np.zeros(count)
+    turns = np.zeros(count, dtype=np.int64)
+    causes = []
+    for i in range(count):
+        engine = fight(floor_num, player, athlete, rng)
+        won[i] = engine.result == "victory"
+        seconds[i] = engine.clock
+        turns[i] = engine.turns
+        causes.append(engine.cause)
+    return floor_num, won, seconds, turns, causes
+
+
+def summarize(floor_num, won, seconds, turns, causes):
+    p50, p95 = np.percentile(seconds, [50, 95])
+    boss, mechanic = floor_boss(floor_num, random.Random(0))
+    return {
+        "boss": boss if mechanic else "random",
+        "fights": len(won),
+        "win_rate": float(won.mean()),
+        "seconds": {"mean": float(seconds.mean()), "p50": float(p50), "p95": float(p95),
+                    "win_mean": float(seconds[won].mean()) if won.any() else None},
+        "turns": {"mean": float(turns.mean()), "max": int(turns.max())},
+        "losses": {cause: causes.count(cause) / len(won) for cause in DEFEAT_MESSAGES},
+    }
+
+
+def simulate(player, floors=FLOORS, fights=1000, athlete=None, seed=2222, workers=None):
+    """Per-floor summaries of `fights` fights each, run on `workers` processes."""
+    athlete = athlete or Athlete()
+    tasks = [(floor_num, chunk, min(CHUNK, fights - chunk * CHUNK), player, athlete, seed)
+             for floor_num in floors for chunk in range((fights + CHUNK - 1) // CHUNK)]
+    parts = {}
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        for floor_num, *arrays in executor.map(fight_chunk, *zip(*tasks)):
+            parts.setdefault(floor_num, []).append(arrays)
+
+    result = {}
+    for floor_num in floors:
+        won, seconds, turns, causes = zip(*parts[floor_num])
+        result[floor_num] = summarize(floor_num, np.concatenate(won), np.concatenate(seconds),
+                                      np.concatenate(turns), sum(causes, []))
+    return result
+
+
+def parse_floors(text):
+    """'1-100', '25', '40-60,100' -> floor numbers"""
+    floors = []
+    for part in text.split(","):
+        first, _, last = part.partition("-")
+        floors += range(int(first), int(last or first) + 1)
+    return floors
+
+
+def print_report(player, athlete, fights, result):
+    print(f"Level {player['level']}, STR {player['str']:g}, VIT {player['vit']:g}; "
+          f"{athlete.think:g}s to choose, {athlete.pace:g}s per rep (+/-{athlete.spread:.0%}); "
+          f"{fights:,} fights per floor\n")
+    print(f"{'floor':>5}  {'boss':<20}{'win':>8}{'mean s':>9}{'p50 s':>8}{'p95 s':>8}{'turns':>7}"
+          + "".join(f"{cause:>9}" for cause in DEFEAT_MESSAGES))
+    for floor_num, summary in result.items():
+        seconds = summary["seconds"]
+        print(f"{floor_num:>5}  {summary['boss']:<20}{summary['win_rate']:>8.1%}{seconds['mean']:>9.0f}"
+              f"{seconds['p50']:>8.0f}{seconds['p95']:>8.0f}{summary['turns']['mean']:>7.1f}"
+              + "".join(f"{summary['losses'][cause]:>9.1%}" for cause in DEFEAT_MESSAGES))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m thesystem.raidsim")
+    parser.add_argument("--floors", type=parse_floors, default=list(FLOORS), help="e.g. 1-100, 25 or 40-60,100")
+    parser.add_argument("--fights", type=int, default=1000, help="fights per floor")
+    parser.add_argument("--level", type=int, help="player level (default: the current player's)")
+    parser.add_argument("--str", dest="stre", type=float, help="STR (default: the current player's)")
+    parser.add_argument("--vit", type=float, help="VIT (default: the current player's)")
+    parser.add_argument("--pace", type=float, default=2.0, help="seconds per rep")
+    parser.add_argument("--think", type=float, default=3.0, help="seconds to choose a move")
+    parser.add_argument("--spread", type=float, default=0.25, help="how much the pace varies, as a share")
+    parser.add_argument("--workers", type=int, help="processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=2222)
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args(argv)
+
+    from thesystem.state import player_state
+    status = player_state.get("Status.json")["status"][0]
+    # The raid reads the bare stats, without equipment
+    player = {"level": status["level"], "str": status["str"], "agi": status["agi"], "vit": status["vit"]}
+    for key, value in (("level", args.level), ("str", args.stre), ("vit", args.vit)):
+        if value is not None:
+            player[key] = value
+    athlete = Athlete(args.pace, args.think, args.spread)
+
+    result = simulate(player, args.floors, args.fights, athlete, args.seed, args.workers)
+    if args.json:
+        print(ujson.dumps({"player": player, "pace": args.pace, "think": args.think, "spread": args.spread,
+                           "fights": args.fights, "seed": args.seed, "floors": result}, indent=4))
+    else:
+        print_report(player, athlete, args.fights, result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+import threading
+import itertools
+import heapq
+import time
+from datetime import datetime, timedelta
+
+
+class Job:
+    def __init__(self, name, callback):
+        self.name = name
+        self.callback = callback
+        self.deadline = None
+        self.cancelled = False
+
+
+class Scheduler:
+    """
+    One thread that sleeps until the earliest registered deadline.
+
+    A job's callback may return the number of seconds until it should run
+    again (or a datetime), anything else ends the job. Deadlines are kept in
+    a heap; moving a job just pushes a new entry and the stale one is skipped.
+    """
+
+    def __init__(self):
+        self.heap = []
+        self.jobs = {}
+        self.counter = itertools.count()
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def start(self):
+        with self.condition:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+        return self
+
+    def _push(self, job, deadline):
+        job.deadline = deadline
+        heapq.heappush(self.heap, (deadline, next(self.counter), job))
+        self.condition.notify()
+
+    def schedule(self, name, callback, delay=0):
+        """
+        Run `callback` after `delay` seconds (or at `delay` if it is a datetime).
+        A job registered under an existing name replaces it.
+        """
+        with self.condition:
+            if name in self.jobs:
+                self.jobs[name].cancelled = True
+            job = Job(name, callback)
+            self.jobs[name] = job
+            self._push(job, to_deadline(delay))
+        self.start()
+        return job
+
+    def wake(self, name, delay=0):
+        """Pull job `name` forward so it runs after `delay` seconds at the latest."""
+        with self.condition:
+            job = self.jobs.get(name)
+            if job is None:
+                return False
+            deadline = to_deadline(delay)
+            if job.deadline is None or deadline < job.deadline:
+                self._push(job, deadline)
+            return True
+
+    def cancel(self, name):
+        with self.condition:
+            job = self.jobs.pop(name, None)
+            if job is not None:
+                job.cancelled = True
+
+    def _next_due(self):
+        with self.condition:
+            while True:
+                # Drop entries for cancelled or rescheduled jobs
+                while self.heap:
+                    deadline, _, job = self.heap[0]
+                    if job.cancelled or job.deadline != deadline:
+                        heapq.heappop(self.heap)
+                    else:
+                        break
+
+                if not self.heap:
+                    self.condition.wait()
+                    continue
+
+                deadline, _, job = self.heap[0]
+                wait = deadline - time.time()
+                if wait > 0:
+                    self.condition.wait(wait)
+                    continue
+
+                heapq.heappop(self.heap)
+                job.deadline = None
+                return job
+
+    def _run(self):
+        while True:
+            job = self._next_due()
+            try:
+                result = job.callback()
+            except Exception as e:
+                print(f"[Scheduler] Job {job.name} failed: {e}")
+                result = None
+
+            with self.condition:
+                if job.cancelled or job.deadline is not None:
+                    # Cancelled, or woken again while it was running
+                    continue
+                if isinstance(result, (int, float, datetime)) and not isinstance(result, bool):
+                    self._push(job, to_deadline(result))
+                elif self.jobs.get(job.name) is job:
+                    del self.jobs[job.name]
+
+
+def to_deadline(delay):
+    if isinstance(delay, datetime):
+        return delay.timestamp()
+    return time.time() + max(0, delay)
+
+
+def next_midnight(now=None):
+    now = now or datetime.now()
+    return datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+
+
+def next_clock_time(clock, now=None, days=None):
+    """
+    Next datetime at which the wall clock reads `clock` ('HH:MM', '24:00' means midnight).
+
+    Args:
+        clock (str): Time of day.
+        now (datetime, optional): Reference time. Defaults to datetime.now().
+        days (list, optional): Weekday names ('Monday', ...) the time is valid on. Any day if None.
+    """
+    now = now or datetime.now()
+    if clock == "24:00":
+        clock = "00:00"
+    target = datetime.combine(now.date(), datetime.strptime(clock, "%H:%M").time())
+
+    for offset in range(8):
+        candidate = target + timedelta(days=offset)
+        if candidate <= now:
+            continue
+        if days is None or candidate.strftime('%A') in days:
+            return candidate
+    return None
+
+
+scheduler = Scheduler()
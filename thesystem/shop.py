@@ -1,9 +1,8 @@
 import random
 import ujson
-import subprocess
 import thesystem.system
-import sys
-from thesystem.misc import resource_path
+import thesystem.windows
+from thesystem.catalog import catalog
 
 def quests_add(rank, vals, read_status_file_data, window):
     ab_points = ["STR", "AGI", "VIT", "INT", "PER", "MAN"]
@@ -46,9 +45,6 @@ def quests_add(rank, vals, read_status_file_data, window):
         coinval = amt.get(rank, 0)
         rew1 = f"Coin Bag {coinval}"
 
-        with open("Files/Data/Inventory_List.json", 'r') as f:
-            reward_names = ujson.load(f)
-
         # Define rarity weights
         rarity_weights = {
             "Common": 60,
@@ -58,25 +54,7 @@ def quests_add(rank, vals, read_status_file_data, window):
         }
 
         # Weighted selection for quest-only rewards
-        weighted_rewards = []
-        for name, data in reward_names.items():
-            item = data[0]
-            if item.get("rank") == rank and item.get("quest") == True:
-                rarity = item.get("rarity", "Common")
-                weight = rarity_weights.get(rarity, 1)
-                weighted_rewards.append((name, weight))
-
-
-        if weighted_rewards:
-            names, weights = zip(*weighted_rewards)
-            rew2 = random.choices(names, weights=weights, k=1)[0]
-        else:
-            # fallback: pick any matching rank reward
-            final_rewards_list = [
-                k for k, v in reward_names.items()
-                if v[0].get("rank") == rank and v[0].get("quest") == True
-            ]
-            rew2 = random.choice(final_rewards_list) if final_rewards_list else ""
+        rew2 = catalog.sample_weighted(rarity_weights, rank=rank, quest=True) or ""
 
         # --- Quest Info ---
         file_name = f"Files/Workout/{random_ab}_based.json"
@@ -173,6 +151,6 @@ def quests_add(rank, vals, read_status_file_data, window):
             ujson.dump(tab_son_data, fin_tab_son, indent=4)
 
         inv_name = f"{theme} Version/Shop/gui.py"
-        subprocess.Popen([sys.executable, resource_path(inv_name)])
+        thesystem.windows.open_script(inv_name)
 
     window.quit()
\ No newline at end of file
@@ -4,12 +4,17 @@ import os
 import subprocess
 from datetime import datetime, timedelta, date
 import thesystem.system
+import thesystem.windows
 import sys
 from thesystem.misc import resource_path
+from thesystem.state import player_state
+from thesystem.scheduler import scheduler
+
+FATIGUE_CHECK_SECONDS = 30
+fatigue_open = False
 
 def skill_use(skill_name,cooldown):
-    with open("Files/Player Data/Skill tracker.json", "r") as f:
-        skill_track_data = ujson.load(f)
+    skill_track_data = player_state.get("Skill tracker.json")
     
     now = datetime.now()
     formatted = now.strftime("%Y-%m-%d %H:%M:%S")
@@ -22,10 +27,9 @@ def skill_use(skill_name,cooldown):
         diff_seconds = abs((dt2 - dt1).total_seconds())
         if diff_seconds >= cooldown:
             skill_track_data[skill_name]["last_used"] = formatted
-            with open("Files/Player Data/Skill tracker.json", "w") as f:
-                ujson.dump(skill_track_data, f, indent=6)
+            player_state.update("Skill tracker.json")
 
-                thesystem.system.skill_message(skill_name)
+            thesystem.system.skill_message(skill_name)
 
             return True
         else:
@@ -33,59 +37,55 @@ def skill_use(skill_name,cooldown):
     except:
         skill_track_data[skill_name]={"last_used":formatted, "cooldown":cooldown}
         skill_track_data[skill_name]["last_used"] = formatted
-        with open("Files/Player Data/Skill tracker.json", "w") as f:
-            ujson.dump(skill_track_data, f, indent=6)
+        player_state.update("Skill tracker.json")
 
         thesystem.system.skill_message(skill_name)
 
         return True
 
 def skill_tracking_and_fatigue():
-    fatigue_open=False
-    while True:
-        with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
-            theme_data=ujson.load(themefile)
-            theme=theme_data["Theme"]
-        
-        if not os.path.exists("Files/Player Data/Skill tracker.json"):
-            with open("Files/Player Data/Skill tracker.json", "w") as f:
-                ujson.dump({}, f, indent=6)
-
-        #Status File
-        with open("Files/Player Data/Status.json", 'r') as f:
-            status_data = ujson.load(f)
-        
-        #Skill File
-        with open("Files/Player Data/Skill.json", 'r') as f:
-            skill_data = ujson.load(f)
+    """Check fatigue every FATIGUE_CHECK_SECONDS and straight after Status.json changes."""
+    def status_changed(key, data):
+        if key == "Status.json":
+            scheduler.wake("fatigue")
 
-        fat_percent=(status_data["status"][0]["fatigue"]/status_data["status"][0]["fatigue_max"])*100
+    player_state.subscribe(status_changed)
+    scheduler.schedule("fatigue", fatigue_check)
 
+def fatigue_check():
+    global fatigue_open
+    theme=player_state.theme()
+    
+    if not os.path.exists("Files/Player Data/Skill tracker.json"):
+        with open("Files/Player Data/Skill tracker.json", "w") as f:
+            ujson.dump({}, f, indent=6)
 
-        if fat_percent>=50:
-            if skill_use("Rush", (24*60*60)) == True and ("Rush"in skill_data):
-                with open("Files/Player Data/Status.json", 'r') as f:
-                    status_data = ujson.load(f)
+    #Status File
+    status_data = player_state.get("Status.json")
+    
+    #Skill File
+    skill_data = player_state.skills()
 
-                status = status_data["status"][0]
+    fat_percent=(status_data["status"][0]["fatigue"]/status_data["status"][0]["fatigue_max"])*100
 
-                fat_percent = (status["fatigue"] / status["fatigue_max"]) * 100
-                lvl=skill_data["Rush"][0]["lvl"]
-                if type(lvl)==str: lvl=10
-                reduce_fatigue_value = (2*lvl / 100) * status["fatigue_max"]
-                status["fatigue"] -= reduce_fatigue_value
 
-                # Step 4: Update fatigue in Status.json
-                with open("Files/Player Data/Status.json", 'w') as f:
-                    ujson.dump(status_data, f, indent=6)
+    if fat_percent>=50:
+        if skill_use("Rush", (24*60*60)) == True and ("Rush"in skill_data):
+            status = status_data["status"][0]
 
-            if fatigue_open==False:
-                subprocess.Popen([sys.executable, resource_path(f"{theme} Version/Fatigue/gui.py")])
-                fatigue_open=True
+            fat_percent = (status["fatigue"] / status["fatigue_max"]) * 100
+            lvl=skill_data["Rush"][0]["lvl"]
+            if type(lvl)==str: lvl=10
+            reduce_fatigue_value = (2*lvl / 100) * status["fatigue_max"]
+            # Step 4: Update fatigue in Status.json (a single-field write)
+            player_state.set_field("Status.json", ("status", 0, "fatigue"), status["fatigue"] - reduce_fatigue_value)
 
-        if fat_percent<50:
-            fatigue_open=False
+        if fatigue_open==False:
+            thesystem.windows.open_screen("Fatigue", theme=theme)
+            fatigue_open=True
 
+    if fat_percent<50:
+        fatigue_open=False
 
-        time.sleep(3)
+    return FATIGUE_CHECK_SECONDS
 
@@ -0,0 +1,306 @@
+import threading
+import wave
+import time
+
+import numpy as np
+
+RATE = 16000
+# 30 ms frames, the unit the voice gate works in
+FRAME = 480
+
+HOTWORD = "system"
+
+
+class RingBuffer:
+    """Fixed-size store of the most recent int16 samples."""
+
+    def __init__(self, seconds, rate=RATE):
+        self.data = np.zeros(int(seconds * rate), dtype=np.int16)
+        # Total samples ever written; the newest sample sits at written - 1
+        self.written = 0
+
+    def write(self, samples):
+        samples = samples[-len(self.data):]
+        start = self.written % len(self.data)
+        end = start + len(samples)
+        if end <= len(self.data):
+            self.data[start:end] = samples
+        else:
+            split = len(self.data) - start
+            self.data[start:] = samples[:split]
+            self.data[:end - len(self.data)] = samples[split:]
+        self.written += len(samples)
+
+    def since(self, position):
+        """Samples written from absolute `position` on (as far back as the buffer reaches)."""
+        position = max(position, self.written - len(self.data))
+        count = self.written - position
+        if count <= 0:
+            return np.zeros(0, dtype=np.int16)
+        start = position % len(self.data)
+        if start + count <= len(self.data):
+            return self.data[start:start + count].copy()
+        return np.concatenate([self.data[start:], self.data[:start + count - len(self.data)]])
+
+
+# --- Capture -----------------------------------------------------------------
+
+class MicrophoneSource:
+    """Keeps one microphone stream open and yields FRAME-sized int16 chunks."""
+
+    def __init__(self, rate=RATE):
+        self.rate = rate
+
+    def frames(self, stop):
+        import speech_recognition as sr
+        with sr.Microphone(sample_rate=self.rate, chunk_size=FRAME) as source:
+            while not stop.is_set():
+                yield np.frombuffer(source.stream.read(FRAME), dtype=np.int16)
+
+
+class FileSource:
+    """Reads a 16-bit mono WAV as if it were the microphone, for running without one."""
+
+    def __init__(self, path, realtime=False):
+        self.path = path
+        self.realtime = realtime
+        with wave.open(path, "rb") as f:
+            self.rate = f.getframerate()
+
+    def frames(self, stop):
+        with wave.open(self.path, "rb") as f:
+            while not stop.is_set():
+                raw = f.readframes(FRAME)
+                if not raw:
+                    return
+                chunk = np.frombuffer(raw, dtype=np.int16)
+                if f.getnchannels() > 1:
+                    chunk = chunk.reshape(-1, f.getnchannels())[:, 0].copy()
+                yield chunk
+                if self.realtime:
+                    time.sleep(len(chunk) / self.rate)
+
+
+# --- Voice gate --------------------------------------------------------------
+
+class VoiceGate:
+    """
+    Cuts the stream into utterances by frame energy. The noise floor is
+    measured once from the first `calibrate_seconds` of audio and then only
+    drifts with frames that are not speech, so there is no calibration pause
+    before every command.
+    """
+
+    def __init__(self, rate=RATE, ratio=3.0, calibrate_seconds=1.0, silence_seconds=0.6,
+                 max_seconds=5.0, preroll_seconds=0.3, min_seconds=0.25):
+        self.rate = rate
+        self.ratio = ratio
+        self.calibrate_frames = int(calibrate_seconds * rate / FRAME)
+        self.silence_frames = int(silence_seconds * rate / FRAME)
+        self.max_samples = int(max_seconds * rate)
+        self.preroll = int(preroll_seconds * rate)
+        self.min_samples = int(min_seconds * rate)
+        self.floor = None
+        self.calibration = []
+        self.start = None
+        self.quiet = 0
+
+    def energy(self, chunk):
+        return float(np.sqrt(np.mean(chunk.astype(np.float32) ** 2))) if len(chunk) else 0.0
+
+    def feed(self, chunk, buffer):
+        """
+        Add one chunk (already written to `buffer`). Returns the samples of a
+        finished utterance, or None.
+        """
+        level = self.energy(chunk)
+        if self.floor is None:
+            self.calibration.append(level)
+            if len(self.calibration) >= self.calibrate_frames:
+                self.floor = max(float(np.median(self.calibration)), 1.0)
+            return None
+
+        speech = level > self.floor * self.ratio
+        if self.start is None:
+            if speech:
+                self.start = buffer.written - len(chunk) - self.preroll
+                self.quiet = 0
+            else:
+                self.floor = 0.95 * self.floor + 0.05 * max(level, 1.0)
+            return None
+
+        self.quiet = 0 if speech else self.quiet + 1
+        length = buffer.written - self.start
+        if self.quiet < self.silence_frames and length < self.max_samples:
+            return None
+
+        utterance = buffer.since(self.start)
+        self.start = None
+        if len(utterance) < self.min_samples:
+            return None
+        return utterance
+
+
+# --- Recognizers -------------------------------------------------------------
+
+class Recognizer:
+    """
+    Turns int16 mono samples into text. `spot` answers only whether the
+    hotword was said and should be cheap; the default just transcribes.
+    """
+
+    def transcribe(self, samples, rate):
+        raise NotImplementedError
+
+    def spot(self, samples, rate, hotword=HOTWORD):
+        return hotword in self.transcribe(samples, rate)
+
+
+class GoogleRecognizer(Recognizer):
+    def __init__(self):
+        import speech_recognition as sr
+        self.sr = sr
+        self.recognizer = sr.Recognizer()
+
+    def transcribe(self, samples, rate):
+        audio = self.sr.AudioData(samples.tobytes(), rate, 2)
+        try:
+            return self.recognizer.recognize_google(audio).lower()
+        except self.sr.UnknownValueError:
+            return ""
+
+
+class SphinxSpotter(Recognizer):
+    """Offline hotword spotting through pocketsphinx, when it is installed."""
+
+    def __init__(self):
+        import speech_recognition as sr
+        import pocketsphinx  # noqa: F401  (fail here rather than on the first utterance)
+        self.sr = sr
+        self.recognizer = sr.Recognizer()
+
+    def transcribe(self, samples, rate):
+        audio = self.sr.AudioData(samples.tobytes(), rate, 2)
+        try:
+            return self.recognizer.recognize_sphinx(audio).lower()
+        except self.sr.UnknownValueError:
+            return ""
+
+    def spot(self, samples, rate, hotword=HOTWORD):
+        audio = self.sr.AudioData(samples.tobytes(), rate, 2)
+        try:
+            heard = self.recognizer.recognize_sphinx(audio, keyword_entries=[(hotword, 1e-20)])
+        except self.sr.UnknownValueError:
+            return False
+        return hotword in heard.lower()
+
+
+class ScriptedRecognizer(Recognizer):
+    """Offline stand-in that 'hears' the given transcripts in order, one per utterance."""
+
+    def __init__(self, transcripts):
+        self.transcripts = list(transcripts)
+        self.heard = []
+
+    def transcribe(self, samples, rate):
+        text = self.transcripts.pop(0).lower() if self.transcripts else ""
+        self.heard.append(text)
+        return text
+
+    def spot(self, samples, rate, hotword=HOTWORD):
+        # Peek, so a match is still there for transcribe(); a miss uses the transcript up
+        if self.transcripts and hotword in self.transcripts[0].lower():
+            return True
+        if self.transcripts:
+            self.heard.append(self.transcripts.pop(0).lower())
+        return False
+
+
+class ShapeSpotter(Recognizer):
+    """
+    Built-in stand-in for SphinxSpotter. It cannot tell words apart; it only
+    turns away utterances that cannot hold the hotword: too short, no voiced
+    stretch (a vowel), or, for a hotword with an s or z in it, no hiss.
+    Knocks, clicks, hum and most background noise stop here instead of going
+    to the recognizer; anything that sounds like speech still does.
+    """
+
+    def __init__(self, min_seconds=0.3, voiced_seconds=0.09, voiced_crossings=0.12, hiss_crossings=0.3,
+                 loud_share=0.1):
+        self.min_seconds = min_seconds
+        self.voiced_seconds = voiced_seconds
+        self.voiced_crossings = voiced_crossings
+        self.hiss_crossings = hiss_crossings
+        self.loud_share = loud_share
+
+    def transcribe(self, samples, rate):
+        return ""
+
+    def spot(self, samples, rate, hotword=HOTWORD):
+        count = len(samples) // FRAME
+        if count * FRAME < self.min_seconds * rate:
+            return False
+        frames = samples[:count * FRAME].astype(np.float32).reshape(count, FRAME)
+        energy = np.sqrt(np.mean(frames ** 2, axis=1))
+        # Share of neighbouring samples that change sign: low for vowels, high for s and z
+        crossings = np.mean(np.signbit(frames[:, 1:]) != np.signbit(frames[:, :-1]), axis=1)
+        loud = energy >= energy.max() * self.loud_share
+        voiced = loud & (crossings < self.voiced_crossings)
+        if voiced.sum() * FRAME < self.voiced_seconds * rate:
+            return False
+        if any(letter in hotword for letter in "sz"):
+            return bool(np.any(loud & (crossings > self.hiss_crossings)))
+        return True
+
+
+def default_spotter():
+    try:
+        return SphinxSpotter()
+    except ImportError:
+        print("[Voice] pocketsphinx is not installed, so the hotword is not spotted offline: every "
+              "utterance that sounds like speech goes to the online recognizer. "
+              "'pip install pocketsphinx' to keep the rest on this computer.")
+        return ShapeSpotter()
+
+
+# --- Pipeline ----------------------------------------------------------------
+
+class VoicePipeline:
+    """
+    Microphone -> ring buffer -> voice gate -> hotword spotting -> full
+    recognition -> `on_command(text)`. Only utterances the spotter accepts
+    are sent to the (usually remote) recognizer.
+    """
+
+    def __init__(self, source, recognizer, on_command, spotter=None, hotword=HOTWORD, buffer_seconds=10):
+        self.source = source
+        self.recognizer = recognizer
+        self.spotter = spotter
+        self.on_command = on_command
+        self.hotword = hotword
+        self.buffer = RingBuffer(buffer_seconds, source.rate)
+        self.gate = VoiceGate(source.rate)
+        self.stop_event = threading.Event()
+
+    def run(self):
+        for chunk in self.source.frames(self.stop_event):
+            self.buffer.write(chunk)
+            utterance = self.gate.feed(chunk, self.buffer)
+            if utterance is not None:
+                self.handle(utterance)
+
+    def handle(self, utterance):
+        rate = self.source.rate
+        if self.spotter is not None and not self.spotter.spot(utterance, rate, self.hotword):
+            return None
+        try:
+            text = self.recognizer.transcribe(utterance, rate)
+        except Exception as e:
+            print(f"Error with speech recognition service: {e}")
+            return None
+        if self.hotword in text:
+            self.on_command(text)
+        return text
+
+    def stop(self):
+        self.stop_event.set()
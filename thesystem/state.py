@@ -0,0 +1,211 @@
+from contextlib import contextmanager
+import threading
+import atexit
+import os
+
+import thesystem.storage
+from thesystem.storage import PLAYER_DATA
+
+
+class PlayerStateStore:
+    """
+    Keeps the Files/Player Data documents in memory.
+
+    Each file is parsed once and then served from memory for as long as its
+    mtime and size on disk are unchanged (other processes still write these files).
+    Updates mark the document dirty and are written back together a short
+    moment later, each file through a temp file + rename so a crash never
+    leaves half a JSON document behind.
+
+    Where the documents actually live is up to the storage backend (see
+    thesystem.storage): the JSON files, or a SQLite database that commits
+    transaction() blocks atomically and set_field() as a single row update.
+    """
+
+    def __init__(self, folder=PLAYER_DATA, delay=0.2, backend=None):
+        self.folder = folder
+        self.delay = delay
+        self.backend = backend or thesystem.storage.default_backend(folder)
+        self.docs = {}
+        self.stamps = {}
+        self.dirty = set()
+        # Dirty documents whose contents the backend already holds (set_field), only the mirror is behind
+        self.stored = set()
+        self.depth = 0
+        # Documents handed out inside the current transaction; they may have been edited in place
+        self.touched = set()
+        self.listeners = []
+        self.lock = threading.RLock()
+        self.timer = None
+
+    def _key(self, name):
+        return name if name.endswith(".json") else name + ".json"
+
+    def path(self, name):
+        return os.path.join(self.folder, self._key(name))
+
+    def get(self, name):
+        """Return the live document for `name` ('Status' or 'Status.json')."""
+        key = self._key(name)
+        with self.lock:
+            if self.depth:
+                self.touched.add(key)
+            if key in self.dirty:
+                return self.docs[key]
+
+            # Always one stat: a screen in this process may have just written the file itself,
+            # before the file watcher's thread gets to report it
+            stamp = self.backend.stamp(key)
+            if stamp is None or self.stamps.get(key) != stamp:
+                self.docs[key], self.stamps[key] = self.backend.read(key)
+            return self.docs[key]
+
+    def update(self, name, data=None):
+        """
+        Mark `name` as changed. Pass `data` to replace the whole document,
+        otherwise the document returned by get() is assumed to be edited in place.
+        """
+        key = self._key(name)
+        with self.lock:
+            if data is not None:
+                self.docs[key] = data
+            self.stored.discard(key)
+            self._mark_dirty(key)
+            data = self.docs[key]
+        self._notify(key, data)
+
+    def set_field(self, name, path, value):
+        """
+        Set one field, e.g. set_field("Status.json", ("status", 0, "fatigue"), 12).
+        With the SQLite backend only that field is written to the database.
+        """
+        key = self._key(name)
+        with self.lock:
+            doc = self.get(key)
+            target = doc
+            for part in path[:-1]:
+                target = target[part]
+            target[path[-1]] = value
+            # Inside a transaction, or once the whole document is pending anyway, it is written with the rest
+            if self.depth == 0 and (key not in self.dirty or key in self.stored):
+                if self.backend.set_field(key, path, value):
+                    self.stored.add(key)
+                else:
+                    self.stored.discard(key)
+            self._mark_dirty(key)
+        self._notify(key, doc)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group updates to several documents so they are stored together:
+
+            with player_state.transaction():
+                inventory = player_state.get("Inventory.json")
+                status = player_state.get("Status.json")
+                ...
+                player_state.update("Inventory.json")
+                player_state.update("Status.json")
+
+        Everything is committed when the block ends. If it raises, every
+        document read or updated in the block is dropped from memory, edited
+        in place or not, so the next get() reads what is on disk, and nothing
+        is written.
+        """
+        with self.lock:
+            if self.depth == 0:
+                self.flush()
+            self.depth += 1
+            try:
+                yield self
+            except BaseException:
+                self.depth -= 1
+                if self.depth == 0:
+                    for key in self.dirty | self.touched:
+                        self.docs.pop(key, None)
+                        self.stamps.pop(key, None)
+                    self.dirty.clear()
+                    self.stored.clear()
+                    self.touched.clear()
+                raise
+            self.depth -= 1
+            if self.depth == 0:
+                self.touched.clear()
+                self.flush()
+
+    def _mark_dirty(self, key):
+        self.dirty.add(key)
+        if self.timer is None and self.depth == 0:
+            self.timer = threading.Timer(self.delay, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def _notify(self, key, data):
+        for callback in list(self.listeners):
+            try:
+                callback(key, data)
+            except Exception as e:
+                print(f"[Player State] Listener failed for {key}: {e}")
+
+    def reload(self, name):
+        """Drop the cached copy so the next get() reads the file again."""
+        key = self._key(name)
+        with self.lock:
+            if key in self.dirty or key not in self.stamps:
+                return
+            try:
+                # Our own flush leaves the stamp unchanged, nothing to re-read then
+                if self.backend.stamp(key) == self.stamps[key]:
+                    return
+            except OSError:
+                pass
+            del self.stamps[key]
+
+    def flush(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if self.depth:
+                # transaction() flushes when the outermost block ends
+                return
+            if not self.dirty:
+                return
+            pending = {key: self.docs[key] for key in self.dirty}
+            stored = self.stored
+            self.dirty = set()
+            self.stored = set()
+            self.stamps.update(self.backend.write(pending, stored))
+
+    def subscribe(self, callback):
+        """Call `callback(filename, data)` whenever a document is updated."""
+        self.listeners.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    # --- Typed reads ---------------------------------------------------------
+
+    def status(self):
+        return self.get("Status.json")["status"][0]
+
+    def status_info(self):
+        return self.get("Status.json")["status"][1]
+
+    def skills(self):
+        return self.get("Skill.json")
+
+    def settings(self):
+        return self.get("Settings.json")["Settings"]
+
+    def theme(self):
+        return self.get("Theme_Check.json")["Theme"]
+
+    def job(self):
+        return self.status_info()["job"]
+
+
+player_state = PlayerStateStore()
+atexit.register(player_state.flush)
@@ -0,0 +1,232 @@
+import threading
+import sqlite3
+import ujson
+import sys
+import os
+
+PLAYER_DATA = "Files/Player Data"
+DATABASE = os.path.join(PLAYER_DATA, "player.db")
+
+# Indent each file is written with; anything not listed gets 6. Before the store
+# these files were written from many places, not always alike: Status.json had
+# indent 4 in most of them, 6 in job.py, skills.py, castle.py and a few screens,
+# and 2 in the raid. 4 is the common one, so that is what it gets now; a file
+# last written by one of the others changes layout (not content) on its next write.
+INDENTS = {
+    "Settings.json": 4,
+    "Tabs.json": 4,
+    "Theme_Check.json": 4,
+    "Skill_old_check.json": 4,
+    "Status.json": 4,
+    "Daily_Quest.json": 4,
+    "Statistics.json": 4,
+}
+
+
+def file_stamp(path):
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def json_path(path):
+    """('status', 0, 'coins') -> '$."status"[0]."coins"', the path syntax of SQLite's json_set."""
+    parts = ["$"]
+    for part in path:
+        if isinstance(part, int):
+            parts.append(f"[{part}]")
+        else:
+            parts.append('."' + str(part).replace('"', '\\"') + '"')
+    return "".join(parts)
+
+
+class JSONFiles:
+    """Player Data as one JSON file per document, the way it has always been stored."""
+
+    def __init__(self, folder=PLAYER_DATA):
+        self.folder = folder
+
+    def path(self, key):
+        return os.path.join(self.folder, key)
+
+    def stamp(self, key):
+        return file_stamp(self.path(key))
+
+    def read(self, key):
+        """Return (document, stamp)."""
+        path = self.path(key)
+        stamp = file_stamp(path)
+        with open(path, 'r') as f:
+            return ujson.load(f), stamp
+
+    def write(self, docs, stored=()):
+        """
+        Store several documents. Returns {key: stamp}. `stored` names
+        documents whose contents the backend already has (see set_field).
+        """
+        return {key: self.write_file(key, doc) for key, doc in docs.items()}
+
+    def write_file(self, key, doc):
+        path = self.path(key)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w') as f:
+            ujson.dump(doc, f, indent=INDENTS.get(key, 6))
+        os.replace(temp_path, path)
+        return file_stamp(path)
+
+    def set_field(self, key, path, value):
+        """Store one field right away. Returns False when the whole document has to be written instead."""
+        return False
+
+    def close(self):
+        pass
+
+
+class SQLiteFiles(JSONFiles):
+    """
+    Player Data in one SQLite database in WAL mode.
+
+    Every document is a row holding its JSON text. Several documents are
+    committed in one transaction, and a single field is changed in place
+    with json_set, without re-serializing the document.
+
+    Most screens still open the JSON files directly, so each file is kept as
+    a mirror and rewritten after its row is committed. `mirrored` records
+    whether that has happened yet and `mtime_ns`/`size` the stamp of the
+    mirror that was written: a file with any other stamp was written by
+    someone else and is imported, while a file that still has the recorded
+    stamp but is behind the database (a crash between commit and mirror) is
+    rewritten from the row.
+    """
+
+    def __init__(self, folder=PLAYER_DATA, database=DATABASE):
+        super().__init__(folder)
+        self.database = database
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(database, isolation_level=None, check_same_thread=False, timeout=5)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS documents (
+                name TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                mtime_ns INTEGER,
+                size INTEGER,
+                mirrored INTEGER NOT NULL DEFAULT 1
+            )""")
+
+    def stamp(self, key):
+        # The mirror changes whenever the row does, so its stamp stays the cheap freshness check
+        try:
+            return file_stamp(self.path(key))
+        except FileNotFoundError:
+            return None
+
+    def read(self, key):
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT body, mtime_ns, size, mirrored FROM documents WHERE name = ?", (key,)).fetchone()
+        stamp = self.stamp(key)
+
+        if row is not None and (stamp is None or stamp == (row[1], row[2])):
+            doc = ujson.loads(row[0])
+            if not row[3] or stamp is None:
+                stamp = self._mirror(key, doc)
+            return doc, stamp
+
+        # Not imported yet, or the file was written by something that bypasses the database
+        doc, stamp = super().read(key)
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO documents (name, body, mtime_ns, size, mirrored) VALUES (?, ?, ?, ?, 1)",
+                (key, ujson.dumps(doc), stamp[0], stamp[1]))
+        return doc, stamp
+
+    def write(self, docs, stored=()):
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                for key, doc in docs.items():
+                    if key in stored:
+                        self.connection.execute("UPDATE documents SET mirrored = 0 WHERE name = ?", (key,))
+                    else:
+                        self.connection.execute(
+                            "INSERT INTO documents (name, body, mirrored) VALUES (?, ?, 0) "
+                            "ON CONFLICT(name) DO UPDATE SET body = excluded.body, mirrored = 0",
+                            (key, ujson.dumps(doc)))
+                self.connection.execute("COMMIT")
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+        return {key: self._mirror(key, doc) for key, doc in docs.items()}
+
+    def _mirror(self, key, doc):
+        stamp = self.write_file(key, doc)
+        with self.lock:
+            self.connection.execute("UPDATE documents SET mtime_ns = ?, size = ?, mirrored = 1 WHERE name = ?",
+                                    (stamp[0], stamp[1], key))
+        return stamp
+
+    def set_field(self, key, path, value):
+        with self.lock:
+            cursor = self.connection.execute(
+                "UPDATE documents SET body = json_set(body, ?, json(?)), mirrored = 0 WHERE name = ?",
+                (json_path(path), ujson.dumps(value), key))
+        return cursor.rowcount == 1
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+def default_backend(folder=PLAYER_DATA):
+    """SQLite once the database has been created (or THESYSTEM_STORAGE=sqlite), JSON files otherwise."""
+    database = os.path.join(folder, "player.db")
+    choice = os.environ.get("THESYSTEM_STORAGE", "")
+    if choice == "json":
+        return JSONFiles(folder)
+    if choice == "sqlite" or os.path.exists(database):
+        try:
+            return SQLiteFiles(folder, database)
+        except sqlite3.Error as e:
+            print(f"[Storage] Could not open {database}, using the JSON files: {e}")
+    return JSONFiles(folder)
+
+
+def import_json(folder=PLAYER_DATA, database=None):
+    """Create (or refresh) the database from every JSON file in `folder`. Returns the imported names."""
+    backend = SQLiteFiles(folder, database or os.path.join(folder, "player.db"))
+    names = sorted(name for name in os.listdir(folder) if name.endswith(".json"))
+    docs = {}
+    for name in names:
+        try:
+            docs[name] = JSONFiles.read(backend, name)[0]
+        except ValueError as e:
+            print(f"[Storage] Skipping {name}: {e}")
+    backend.write(docs)
+    backend.close()
+    return sorted(docs)
+
+
+def export_json(folder=PLAYER_DATA, database=None):
+    """Write every document in the database back out as its JSON file. Returns the exported names."""
+    backend = SQLiteFiles(folder, database or os.path.join(folder, "player.db"))
+    with backend.lock:
+        rows = backend.connection.execute("SELECT name, body FROM documents ORDER BY name").fetchall()
+    for name, body in rows:
+        backend._mirror(name, ujson.loads(body))
+    backend.close()
+    return [name for name, _ in rows]
+
+
+if __name__ == "__main__":
+    # python -m thesystem.storage import   -> move Player Data into player.db (the JSON files stay as a mirror)
+    # python -m thesystem.storage export   -> write player.db back out to the JSON files
+    # Delete player.db after exporting to go back to plain JSON storage.
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command == "import":
+        print(f"Imported {len(import_json())} documents into {DATABASE}")
+    elif command == "export":
+        print(f"Exported {len(export_json())} documents to {PLAYER_DATA}")
+    else:
+        print("usage: python -m thesystem.storage import|export")
+        sys.exit(2)
@@ -12,6 +12,19 @@ import cv2
 import os
 import queue
 import thesystem.misc
+import thesystem.windows
+import thesystem.events
+import thesystem.audio
+import thesystem.framecache
+import thesystem.cachebuild
+import thesystem.journal
+import thesystem.latency
+import thesystem.tracing
+from thesystem.state import player_state
+from thesystem.scheduler import scheduler, next_midnight, next_clock_time
+from thesystem.quality import governor, HALF_VIDEO, STATIC_VIDEO, BARS_OFF
+from thesystem.assets import assets
+from thesystem.catalog import catalog
 import numpy as np
 from multiprocessing import Pool, cpu_count
 import tkinter as tk
@@ -19,9 +32,14 @@ from tkinter import Label
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from functools import partial
 
+# The open() + ujson.load/dump pairs below show up as one span per file when tracing
+ujson = thesystem.tracing.traced_json(ujson)
+
 last_run = 0 
 tk_images = []
 POSITION_FILE = "Files/Player Data/window_positions.json"
+FATIGUE_CHECK_SECONDS = 30
+fatigue_open = False
 
 
 def fin_pen():
@@ -41,12 +59,14 @@ def fin_pen():
     with open("Files/Player Data/Settings.json", 'r') as settings_open:
         setting_data=ujson.load(settings_open)
     if yesterday==p_date and status=="UNDONE" and setting_data["Settings"]["Main_Penalty"]!="False":
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path(f'{theme} Version/Penalty Quest/gui.py')])
+        thesystem.windows.open_screen("Penalty Quest", theme=theme)
+        thesystem.journal.record("penalty", missed=dates)
         with open('Files/Checks/Daily_time_check.csv', 'w', newline='') as fout_final:
             fout_final_wr=csv.writer(fout_final)
             fout_final_wr.writerow([dates,"DONE","Complete"])
     elif yesterday!=p_date or status=="UNDONE" and setting_data["Settings"]["Main_Penalty"]!="False":
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path(f'{theme} Version/Penalty Quest/gui.py')])
+        thesystem.windows.open_screen("Penalty Quest", theme=theme)
+        thesystem.journal.record("penalty", missed=dates)
         with open('Files/Checks/Daily_time_check.csv', 'w', newline='') as fout_final:
             fout_final_wr=csv.writer(fout_final)
             fout_final_wr.writerow([dates,"DONE","Complete"])
@@ -107,18 +127,8 @@ def penalty_check(win):
         data0=ujson.load(pen_info_file)
         target_time_str=data0["Penalty Time"]
 
-    now=datetime.now()
-    if target_time_str == "24:00":
-        target_time_str = "00:00"
-    target_time=datetime.strptime(target_time_str, "%H:%M").time()
-    target_datetime=datetime.combine(now.date(), target_time)
-    
-    if target_datetime<now:
-        target_datetime+=timedelta(days=1)
-    
-    wait_time_ms = int((target_datetime - now).total_seconds() * 1000)
-    
-    win.after(wait_time_ms, fin_pen)
+    # fin_pen only opens screens, which the window host hands over to the Tk thread
+    scheduler.schedule("penalty", fin_pen, next_clock_time(target_time_str))
 
 def close(stp_eve, thrd):
     stp_eve.set()
@@ -167,7 +177,7 @@ def run_once_prog(stp_eve, thrd):
         # Wait for the thread to finish
         thrd.join()
     
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path('First/Check/gui.py')])
+        thesystem.windows.open_script('First/Check/gui.py', standalone=True)
 
         sys.exit()
     
@@ -177,7 +187,7 @@ def run_once_prog(stp_eve, thrd):
         # Wait for the thread to finish
         thrd.join()
 
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path('First/Check/gui.py')])
+        thesystem.windows.open_script('First/Check/gui.py', standalone=True)
 
         sys.exit()
 
@@ -219,8 +229,7 @@ def run_once_misc_inv():
 
 def random_skill_check():
     # Load the primary status file and extract player's data.
-    with open("Files/Player Data/Status.json", 'r') as f:
-        data = ujson.load(f)
+    data = player_state.get("Status.json")
     player = data["status"][0]
     meta = data["status"][1]
 
@@ -236,8 +245,7 @@ def random_skill_check():
     # Check if level-up is eligible (every 5 levels).
     if lvl % 5 == 0:
         # Load old stats.
-        with open("Files/Player Data/Skill_old_check.json", 'r') as f:
-            old_lvl_data = ujson.load(f)
+        old_lvl_data = player_state.get("Skill_old_check.json")
         old_stat = old_lvl_data["old_stat"][0]
 
         # Proceed only if the level has changed.
@@ -266,16 +274,14 @@ def random_skill_check():
             choosen_skill = random.choice(available_skills) if available_skills else "Dash"
 
             # Load current skills.
-            with open("Files/Player Data/Skill.json", 'r') as f:
-                main_skill_data = ujson.load(f)
+            main_skill_data = player_state.skills()
 
             # If the chosen skill exists, attempt an upgrade.
             if choosen_skill in main_skill_data:
                 if main_skill_data[choosen_skill][0]["lvl"] != "MAX":
                     main_skill_data[choosen_skill][0]["lvl"] += 1
                     # Write updated skills.
-                    with open("Files/Player Data/Skill.json", 'w') as f:
-                        ujson.dump(main_skill_data, f, indent=6)
+                    player_state.update("Skill.json")
                     # Log the skill upgrade to a temporary CSV.
                     with open("Files/Temp Files/Skill Up Temp.csv", 'w', newline='') as csvfile:
                         csv.writer(csvfile).writerow([choosen_skill])
@@ -289,8 +295,7 @@ def random_skill_check():
                 entry = new_skill_entry.pop(0) if new_skill_entry else {}
                 entry["pl_point"] = 0
                 main_skill_data[choosen_skill] = [entry]
-                with open("Files/Player Data/Skill.json", 'w') as f:
-                    ujson.dump(main_skill_data, f, indent=6)
+                player_state.update("Skill.json")
                 new_updates = {"Skills": "True", "Quests": "False", "Upgrade": "False", "Lines": "False"}
                 with open("Files/Data/New_Updates.json", 'w') as f:
                     ujson.dump(new_updates, f, indent=4)
@@ -305,15 +310,17 @@ def random_skill_check():
                 "per": per,
                 "man": man,
             })
-            with open("Files/Player Data/Skill_old_check.json", 'w') as f:
-                ujson.dump(old_lvl_data, f, indent=4)
+            player_state.update("Skill_old_check.json")
 
 def check_midnight(window,stop_event):
-    while not stop_event.is_set():
-        now = datetime.now()
-        if now.hour == 0 and now.minute == 0:
-            penalty_check(window)
-        time.sleep(1)
+    """Arm the penalty timer every midnight until `stop_event` is set."""
+    def midnight():
+        if stop_event.is_set():
+            return None
+        penalty_check(window)
+        return next_midnight()
+
+    scheduler.schedule("midnight", midnight, next_midnight())
 
 def random_quest():
     # ! The Random Quests thing
@@ -392,16 +399,7 @@ def random_quest():
                 
                 coinval=amt[rank]
                 rew1=f"Coin Bag {coinval}"
-                with open("Files/Data/Inventory_List.json", 'r') as rewards_name_file:
-                    reward_names=ujson.load(rewards_name_file)
-                    reward_names_list=list(reward_names.keys())
-
-                    final_rewards_list=[]
-                    for k in reward_names_list:
-                        if rank==reward_names[k][0]["rank"]:
-                            final_rewards_list.append(k)
-                    
-                    rew2=random.choice(final_rewards_list)
+                rew2=catalog.sample(rank=rank)
 
                 # ? Quest Info
                 file_name=f"Files/Workout/{random_ab}_based.json"
@@ -414,7 +412,10 @@ def random_quest():
 
                 # ? Final
 
-                rew_dict={rew1:1, rew2:1}
+                rew_dict={rew1:1}
+                # A rank the catalog has no items for gets the coins without an item
+                if rew2 is not None:
+                    rew_dict[rew2]=1
                 if rank in ["S"]:
                     rew_dict["LVLADD"]=8
                     rew_dict[rew3]=10
@@ -768,6 +769,7 @@ class VideoPlayer:
 
             if not self.first_frame_displayed:
                 self.first_frame_displayed = True
+                thesystem.latency.mark("video frame")
                 self.canvas.after(int(self.pause_duration * 1000), self.update_frame)
                 return
 
@@ -786,6 +788,7 @@ class VideoPlayer:
 class FastVideoPlayer:
     def __init__(self, canvas, preloaded_frames=None, del_x=0, del_y=0, resize_factor=0.7, buffer_size=4, pause_duration=0, fps=12, video_path=None):
         self.canvas = canvas
+        self.window = canvas.winfo_toplevel()
         self.del_x = del_x
         self.del_y = del_y
         self.pause_duration = float(pause_duration)
@@ -796,6 +799,7 @@ class FastVideoPlayer:
         self.rotate_video = False
         self.preloaded_mode = preloaded_frames is not None
         self.image_id = self.canvas.create_image(0, 0, anchor='nw')
+        self.photo = None
 
         # Wait for canvas dimensions to initialize
         self.canvas.update_idletasks()
@@ -827,43 +831,66 @@ class FastVideoPlayer:
         self.new_dimensions = self._calculate_new_dimensions()
 
         if self.preloaded_mode:
+            # Scaled once per canvas size, then playback is just an index
             self.current_frame_index = 0
-            self.read_thread = threading.Thread(target=self._loop_preloaded_frames, daemon=True)
+            self.shown_index = None
+            self.scaled = None
         else:
             self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
             self.read_thread = threading.Thread(target=self._read_frames, daemon=True)
-        self.read_thread.start()
+            self.read_thread.start()
 
         self.update_frame()
     
-    def _loop_preloaded_frames(self):
-        while not self.stop_event.is_set():
-            frame_data = self.frames[self.current_frame_index]
-            self.current_frame_index = (self.current_frame_index + 1) % len(self.frames)
+    def _next_preloaded_frame(self, tier):
+        if self.scaled is None or self.scaled.size != tuple(self.new_dimensions):
+            self.scaled = thesystem.framecache.open_scaled_video(self.frames, self.new_dimensions, self.rotate_video)
+            self.shown_index = None
+
+        if tier >= STATIC_VIDEO:
+            # Park on the first frame until the governor gives quality back
+            index = 0
+        else:
+            index = self.current_frame_index
+        if index == self.shown_index:
+            return None
 
-            # Lazy load: Load frame only when needed
-            if isinstance(frame_data, str):  # Assume it's a file path
-                frame = cv2.imread(frame_data)
-                if frame is None:
-                    continue
-            else:
-                frame = frame_data  # Already-loaded frame
+        # Hold the current frame until the next one has been scaled
+        with thesystem.tracing.span("video resize", "video", index=index):
+            frame = self.scaled.frame(index)
+        if frame is not None:
+            self.shown_index = index
+            # Half rate skips every other frame so the clip keeps its speed
+            step = 2 if tier == HALF_VIDEO else 1
+            self.current_frame_index = (index + step) % len(self.scaled)
+        return frame
+
+    def _frame_delay(self, tier):
+        if tier >= STATIC_VIDEO:
+            return 500
+        if tier == HALF_VIDEO:
+            return int(2000 / self.fps)
+        return int(1000 / self.fps)
 
-            if self.rotate_video:
-                frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
+    def _read_frames(self):
+        while not self.stop_event.is_set():
+            with thesystem.tracing.span("video decode", "video"):
+                ret, frame = self.cap.read()
+                if not ret:
+                    # Loop video by resetting the frame pointer.
+                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    ret, frame = self.cap.read()
+            if not ret:
+                continue
 
-            new_width, new_height = self.new_dimensions
-            interp = cv2.INTER_LINEAR if (new_width > self.original_width or new_height > self.original_height) else cv2.INTER_AREA
-            frame = cv2.resize(frame, (new_width, new_height), interpolation=interp)
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            with thesystem.tracing.span("video resize", "video"):
+                frame = thesystem.framecache.scale_video_frame(frame, self.new_dimensions, self.rotate_video)
 
             try:
                 self.frame_queue.put_nowait(frame)
             except queue.Full:
                 pass
 
-            time.sleep(1 / self.fps)
-
     def _calculate_new_dimensions(self):
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
@@ -882,30 +909,47 @@ class FastVideoPlayer:
 
         return new_width, new_height
 
-    def update_frame(self):
+    def update_frame(self, due=None):
+        started = time.monotonic()
+        tier = governor.tier(self.window)
         self.new_dimensions = self._calculate_new_dimensions()
-        try:
-            frame = self.frame_queue.get_nowait()
-        except queue.Empty:
+        if self.preloaded_mode:
+            frame = self._next_preloaded_frame(tier)
+        elif tier >= STATIC_VIDEO:
             frame = None
+        else:
+            try:
+                frame = self.frame_queue.get_nowait()
+            except queue.Empty:
+                frame = None
 
         if frame is not None:
-            img = Image.fromarray(frame)
-            imgtk = ImageTk.PhotoImage(image=img)
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
-            x_center = (canvas_width - frame.shape[1]) // 2
-            y_center = (canvas_height - frame.shape[0]) // 2
-            self.canvas.coords(self.image_id, x_center, y_center)
-            self.canvas.itemconfig(self.image_id, image=imgtk)
-            self.canvas.imgtk = imgtk  # Prevent garbage collection
+            height, width = frame.shape[:2]
+            with thesystem.tracing.span("video paint", "video"):
+                if self.photo is None or (self.photo.width(), self.photo.height()) != (width, height):
+                    # One image per size, repainted in place every frame
+                    self.photo = ImageTk.PhotoImage("RGB", (width, height))
+                    x_center = (self.canvas.winfo_width() - width) // 2
+                    y_center = (self.canvas.winfo_height() - height) // 2
+                    self.canvas.coords(self.image_id, x_center, y_center)
+                    self.canvas.itemconfig(self.image_id, image=self.photo)
+                    self.canvas.imgtk = self.photo  # Prevent garbage collection
+                self.photo.paste(Image.fromarray(frame))
 
             if not self.first_frame_displayed:
                 self.first_frame_displayed = True
+                thesystem.latency.mark("video frame")
                 self.canvas.after(int(self.pause_duration * 1000), self.update_frame)
                 return
 
-        self.canvas.after(int(1000 / self.fps), self.update_frame)
+        # Lateness of this frame plus the time it took to show
+        lag = time.monotonic() - started
+        if due is not None:
+            lag += max(0, started - due)
+        governor.report(self.window, lag)
+
+        delay = self._frame_delay(tier)
+        self.canvas.after(delay, self.update_frame, time.monotonic() + delay / 1000)
 
 class LazyImageLoader:
     def __init__(self, pil_data):
@@ -913,17 +957,116 @@ class LazyImageLoader:
         self.cache = {}
 
     def __getitem__(self, index):
-        if index not in self.cache:
-            arr, mode = self.pil_data[index]
+        # The frame count can change under a running animation when a placeholder is replaced
+        # Read in the opposite order to replace(), so a new cache never gets an old frame
+        cache = self.cache
+        pil_data = self.pil_data
+        index %= len(pil_data)
+        if index not in cache:
+            # With a mapped FrameStack this reads only the pages of this one frame
+            arr, mode = pil_data[index]
             img = Image.fromarray(arr)
             if img.mode != mode:
                 img = img.convert(mode)
-            self.cache[index] = ImageTk.PhotoImage(img)
-        return self.cache[index]
+            cache[index] = ImageTk.PhotoImage(img)
+        return cache[index]
+
+    def replace(self, pil_data):
+        """Swap in a new set of frames (e.g. a rebuilt cache in place of its placeholder)."""
+        self.pil_data = pil_data
+        self.cache = {}
 
     def __len__(self):
         return len(self.pil_data)
 
+# Frame rate of the animated top/bottom bars
+BAR_FPS = 24
+
+# Bar animators by the Tk root that ticks them
+bar_animators = {}
+
+
+class BarAnimator:
+    """
+    Cycles the animated bars of one window. Every animator under the same Tk
+    root is driven by a single `after` tick instead of one loop per screen.
+    The frame is picked from the time since the animator started, so a late
+    tick skips ahead instead of slowing the animation down, and nothing is
+    redrawn while the window is withdrawn, iconified or fully transparent, or
+    while the quality governor has turned its bar animation off. With the
+    "Performernce (ANIME):" setting on, the bars are never started.
+
+    Args:
+        canvas: Canvas holding the bar images.
+        *bars: (canvas item, frames) pairs, e.g. (top_image, top_preloaded_images).
+    """
+
+    def __init__(self, canvas, *bars, fps=BAR_FPS):
+        self.canvas = canvas
+        self.window = canvas.winfo_toplevel()
+        self.bars = list(bars)
+        self.fps = fps
+        self.shown = [None] * len(self.bars)
+        self.started = time.monotonic()
+        self.stopped = governor.pinned()
+        if self.stopped:
+            return
+
+        root = canvas._root()
+        if root not in bar_animators:
+            bar_animators[root] = []
+            schedule_bar_tick(root)
+        bar_animators[root].append(self)
+
+    def stop(self):
+        self.stopped = True
+
+    def visible(self):
+        if self.window.state() in ("withdrawn", "iconic"):
+            return False
+        return float(self.window.attributes("-alpha")) > 0
+
+    def tick(self, now):
+        if governor.tier(self.window) >= BARS_OFF or not self.visible():
+            return
+        step = int((now - self.started) * self.fps)
+        for i, (item, frames) in enumerate(self.bars):
+            index = step % len(frames)
+            if self.shown[i] != index:
+                self.canvas.itemconfig(item, image=frames[index])
+                self.shown[i] = index
+                thesystem.latency.mark("bar frame")
+
+
+def schedule_bar_tick(root):
+    delay = 1000 // BAR_FPS
+    root.after(delay, tick_bar_animators, root, time.monotonic() + delay / 1000)
+
+
+def tick_bar_animators(root, due):
+    now = time.monotonic()
+    animators = bar_animators.get(root, [])
+    for animator in list(animators):
+        try:
+            if animator.stopped or not animator.canvas.winfo_exists():
+                animators.remove(animator)
+                continue
+            animator.tick(now)
+        except tk.TclError:
+            # Destroyed between the check and the redraw
+            animators.remove(animator)
+
+    if not animators:
+        # Started again by the next animator
+        del bar_animators[root]
+        return
+    # How late this tick ran plus how long it took: the event-loop lag of every window on this root
+    lag = time.monotonic() - due
+    for animator in animators:
+        governor.report(animator.window, lag)
+    schedule_bar_tick(root)
+
+
 def set_preview_temp(o_name1,qt1):
     with open("Files/Temp Files/Inventory temp.csv", 'w', newline='') as new_csv_open:
         rec=[o_name1, qt1, "Preview"]
@@ -932,7 +1075,7 @@ def set_preview_temp(o_name1,qt1):
     with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
             theme_data=ujson.load(themefile)
             theme=theme_data["Theme"]
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path(f'{theme} Version/Item Data/gui.py')])
+    thesystem.windows.open_screen("Item Data", theme=theme)
 
 def center_window(root, width, height):
     # Get screen width and height
@@ -960,7 +1103,7 @@ def update_penalty_countdown(duration_seconds, countdown_label, canvas, window):
             with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
                 theme_data = ujson.load(themefile)
                 theme = theme_data["Theme"]
-            subprocess.Popen([sys.executable, thesystem.misc.resource_path(f'{theme} Version/Penalty Quest Rewards/gui.py')])
+            thesystem.windows.open_screen("Penalty Quest Rewards", theme=theme)
             window.quit()
             return
 
@@ -1024,12 +1167,11 @@ def xp_formula(n):
 
 def get_fin_xp():
     # Load the status file
-    with open("Files/Player Data/Status.json", 'r') as fson:
-        data = ujson.load(fson)
-        lvl = int(data["status"][0]['level'])  # Current level
-        old_lvl = lvl
-        xp = float(data["status"][0]['XP'])  # Current XP value
-        last_lvl = int(data["status"][0]['last_level'])  # Last processed level
+    data = player_state.get("Status.json")
+    lvl = int(data["status"][0]['level'])  # Current level
+    old_lvl = lvl
+    xp = float(data["status"][0]['XP'])  # Current XP value
+    last_lvl = int(data["status"][0]['last_level'])  # Last processed level
 
     leveled_up = False
     new_lvl = lvl
@@ -1056,11 +1198,13 @@ def get_fin_xp():
         data["status"][0]['fatigue_max'] += 10 * level_difference
 
         # Save updated status to file
-        with open("Files/Player Data/Status.json", 'w') as up_fson:
-            ujson.dump(data, up_fson, indent=4)
+        player_state.update("Status.json")
 
+        thesystem.journal.record("level up", levels=level_difference, level=new_lvl)
         rank_up(old_lvl, new_lvl)
 
+    thesystem.journal.observe_xp(xp, new_lvl)
+
     # XP needed for next level
     next_level_xp = xp_formula(new_lvl + 1)
     fin_xp = next_level_xp - xp
@@ -1075,12 +1219,12 @@ def rank_up(old_lvl, new_lvl):
     old_rank=give_ranking(old_lvl)
     new_rank=give_ranking(new_lvl)
     if old_rank==new_rank:
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path(f'{theme} Version/Leveled up/gui.py')])
+        thesystem.windows.open_screen("Leveled up", theme=theme)
     else:
         with open("Files/Temp Files/Rank file.csv", "w", newline="") as f:
             writer=csv.writer(f)
             writer.writerow([f"{old_lvl}"])
-        subprocess.Popen([sys.executable, thesystem.misc.resource_path(f'{theme} Version/Rank up/gui.py')])
+        thesystem.windows.open_screen("Rank up", theme=theme)
 
 def rank_up_skill(name_of_skill, old_level):
     with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
@@ -1090,14 +1234,13 @@ def rank_up_skill(name_of_skill, old_level):
     with open("Files/Temp Files/Skill file.csv", "w", newline="") as f:
         writer=csv.writer(f)
         writer.writerow([f"{name_of_skill}", f"{old_level}"])
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path(f'{theme} Version/Skill Level up/gui.py')])
+    thesystem.windows.open_screen("Skill Level up", theme=theme)
 
 def return_back_to_tab(loc,window):
     with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
         theme_data=ujson.load(themefile)
         theme=theme_data["Theme"]
-        fin_loc=f'{theme} Version/{loc}/gui.py'
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path(fin_loc)])
+    thesystem.windows.open_screen(loc, theme=theme)
     window.quit()   
 
 def fade_out(window, alpha):
@@ -1165,7 +1308,7 @@ def message_open(message):
     with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
         theme_data=ujson.load(themefile)
         theme=theme_data["Theme"]
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path(f"{theme} Version/Message/gui.py")])
+    thesystem.windows.open_screen("Message", theme=theme)
 
 def resize_image_cv(image_path, size):
     """
@@ -1215,91 +1358,60 @@ def preload_images(image_paths, size, max_workers=None):
     
     preloaded_images = []
     
-    # Use ThreadPoolExecutor to parallelize resizing.
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        func = partial(resize_image_cv, size=size)
-        resized_images = list(executor.map(func, image_paths))
-    
-    # Convert each resized NumPy image to a PIL Image then to PhotoImage.
-    for img in resized_images:
-        if img is None:
-            continue
-        pil_img = Image.fromarray(img)
-        preloaded_images.append(ImageTk.PhotoImage(pil_img))
+    with thesystem.tracing.span("preload_images", "frames", count=len(image_paths), size=list(size)):
+        # Use ThreadPoolExecutor to parallelize resizing.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            func = partial(resize_image_cv, size=size)
+            resized_images = list(executor.map(func, image_paths))
+        
+        # Convert each resized NumPy image to a PIL Image then to PhotoImage.
+        for img in resized_images:
+            if img is None:
+                continue
+            pil_img = Image.fromarray(img)
+            preloaded_images.append(ImageTk.PhotoImage(pil_img))
     
     return preloaded_images
 
 def images_to_npy_with_mode(folder_path, output_path, resize=None, sort=True):
-    files = [f for f in os.listdir(folder_path) if f.lower().endswith((".png", ".jpg", ".jpeg"))]
-    if sort:
-        files.sort()
-
-    data_to_save = []
-
-    for filename in files:
-        path = os.path.join(folder_path, filename)
-        if not os.path.exists(path):
-            continue
-
-        img = Image.open(path)
-        mode = img.mode
-        img = img.convert("RGBA")
-
-        if resize:
-            img = img.resize(resize)
-
-        data_to_save.append((np.array(img), mode))
-
-    np.save(output_path, np.array(data_to_save, dtype=object), allow_pickle=True)
-    print(f"[Cached] {len(data_to_save)} frames → {output_path}")
+    count = thesystem.framecache.build_frame_stack(folder_path, output_path, resize=resize, sort=sort)
+    print(f"[Cached] {count} frames → {thesystem.framecache.stack_paths(output_path)[0]}")
 
 def load_or_cache_images(folder_path, resize, job, type_, profile=False):
-    width, height = resize
-    job = job.upper()
-    type_ = type_.lower()
-
     if profile: start_total = time.perf_counter()
 
-    # Step 1: Build cache filename
-    if job == "NONE":
-        cache_name = f"{type_}_frame_stack {width} {height}.npy"
-    else:
-        cache_name = f"alt_{type_}_frame_stack {width} {height}.npy"
-
-    cache_path = os.path.join(folder_path, cache_name)
-
-    # Step 2: Check for cache
-    if profile: start_check = time.perf_counter()
-    if not os.path.exists(cache_path):
-        print(f"[CACHE MISS] Generating cache: {cache_path}")
-        images_to_npy_with_mode(folder_path, cache_path, resize=resize)
-    if profile: end_check = time.perf_counter()
-
-    # Step 3: Load raw data
-    if profile: start_load = time.perf_counter()
-    cached_data = np.load(cache_path, allow_pickle=True)
-    if isinstance(cached_data, np.ndarray):
-        cached_data = cached_data.tolist()
-    if profile: end_load = time.perf_counter()
-
-    # Step 4: Wrap in lazy loader
-    if profile: start_wrap = time.perf_counter()
-    loader = LazyImageLoader(cached_data)
-    if profile: end_wrap = time.perf_counter()
+    # Memory, then the mapped npy stack. Missing or stale: a background process
+    # rebuilds it and a low-res frame is shown until then.
+    asset = assets.declare(folder_path, resize, job, type_)
+    with thesystem.tracing.span(f"load_or_cache_images {asset.type_}", "frames", folder=folder_path,
+                                size=list(resize)) as load:
+        cached_data, complete = asset.load()
+        load.set(tier=asset.tier, complete=complete)
 
-    end_total = time.perf_counter()
+    loader = LazyImageLoader(cached_data)
+    if not complete:
+        swap_in_rebuilt_stack(loader, asset)
 
     if profile:
-        # Profile report
-        print(f"\n--- Load Profile for '{type_}' ({job}) ---")
-        print(f"Cache check/build  : {(end_check - start_check):.4f}s")
-        print(f"Cache load (NumPy) : {(end_load - start_load):.4f}s")
-        print(f"LazyLoader wrapping: {(end_wrap - start_wrap):.4f}s")
-        print(f"TOTAL LOAD TIME    : {(end_total - start_total):.4f}s")
+        print(f"\n--- Load Profile for '{asset.type_}' ({asset.job}) ---")
+        print(f"Frames from        : {asset.tier}")
+        print(f"First load         : {asset.load_seconds:.4f}s")
+        print(f"TOTAL LOAD TIME    : {(time.perf_counter() - start_total):.4f}s")
         print("----------------------------------------\n")
 
     return loader
 
+def swap_in_rebuilt_stack(loader, asset):
+    def check():
+        if not thesystem.cachebuild.rebuild_finished(asset.cache_path):
+            return 0.5
+        stack, complete = asset.reload()
+        if complete:
+            loader.replace(stack)
+        return None
+
+    scheduler.schedule(f"rebuild {asset.cache_path} {id(loader)}", check, 0.5)
+
 def side_bar(image, size, alt=False):
     # Construct the path to the image
     s = 'thesystem/side_bars/' + image
@@ -1318,7 +1430,7 @@ def side_bar(image, size, alt=False):
         return None
 
 def info_open(message):
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path('Files/Mod/default/sfx.py')])
+    thesystem.audio.play("Open SFX")
     fout=open('Files/Temp Files/help.csv', 'w', newline='')
     fw=csv.writer(fout)
     rec=[message]
@@ -1327,33 +1439,10 @@ def info_open(message):
     with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
         theme_data=ujson.load(themefile)
         theme=theme_data["Theme"]
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path(f"{theme} Version/Info/gui.py")])
+    thesystem.windows.open_screen("Info", theme=theme)
 
 def event_tracker():
-    while True:
-        today_day = datetime.today().strftime('%A')
-        current_time = datetime.now().strftime("%H:%M")
-        
-        with open("Files/Player Data/Player Events.json", "r") as f:
-            data = ujson.load(f)
-        data_keys=data.keys()
-        for key in data_keys:
-            if today_day in data[key]["days"]:
-                if data[key]["time"]==current_time:
-                    with open("Files/Temp Files/Event.csv", "w", newline="") as f:
-                        writer = csv.writer(f)
-                        writer.writerow([key])
-                    data[key]["begun"]=True
-                    with open("Files/Player Data/Player Events.json", "w") as f:
-                        ujson.dump(data, f, indent=6)
-                    with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
-                        theme_data=ujson.load(themefile)
-                        theme=theme_data["Theme"]
-                    subprocess.Popen([sys.executable, thesystem.misc.resource_path(f"{theme} Version/Urgent Quest PVE/gui.py")])
-                elif current_time > data[key]["time"]:
-                    if data[key]["begun"]==False:
-                        print()
-        time.sleep(3)
+    thesystem.events.event_tracker()
 
 def skill_message(skill_name):
     with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
@@ -1364,21 +1453,17 @@ def skill_message(skill_name):
         writer = csv.writer(f)
         writer.writerow([skill_name])
     
-    subprocess.Popen([sys.executable, thesystem.misc.resource_path(f'{theme} Version/Skill Use/gui.py')])
+    thesystem.windows.open_screen("Skill Use", theme=theme)
 
 def skill_use(skill_name,cooldown, mana=0, skill_open=True):
-    with open("Files/Player Data/Status.json", 'r') as f:
-        status_data = ujson.load(f)
-        mp = status_data["status"][0]["mp"]
-        if mp < mana:
-            return False
-    with open("Files/Player Data/Skill tracker.json", "r") as f:
-        skill_track_data = ujson.load(f)
+    mp = player_state.status()["mp"]
+    if mp < mana:
+        return False
+    skill_track_data = player_state.get("Skill tracker.json")
     
     now = datetime.now()
     formatted = now.strftime("%Y-%m-%d %H:%M:%S")
-    with open("Files/Player Data/Skill.json", 'r') as f:
-        skill_data = ujson.load(f)
+    skill_data = player_state.skills()
     
     if skill_name not in skill_data.keys():
         return False
@@ -1392,10 +1477,9 @@ def skill_use(skill_name,cooldown, mana=0, skill_open=True):
         diff_seconds = abs((dt2 - dt1).total_seconds())
         if diff_seconds >= cooldown:
             skill_track_data[skill_name]["last_used"] = formatted
-            with open("Files/Player Data/Skill tracker.json", "w") as f:
-                ujson.dump(skill_track_data, f, indent=6)
+            player_state.update("Skill tracker.json")
 
-                if skill_open: skill_message(skill_name)
+            if skill_open: skill_message(skill_name)
 
             return True
         else:
@@ -1403,75 +1487,68 @@ def skill_use(skill_name,cooldown, mana=0, skill_open=True):
     except:
         skill_track_data[skill_name]={"last_used":formatted, "cooldown":cooldown}
         skill_track_data[skill_name]["last_used"] = formatted
-        with open("Files/Player Data/Skill tracker.json", "w") as f:
-            ujson.dump(skill_track_data, f, indent=6)
+        player_state.update("Skill tracker.json")
 
         if skill_open: skill_message(skill_name)
 
         return True
 
 def skill_tracking_and_fatigue():
-    fatigue_open=False
-    while True:
-        with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
-            theme_data=ujson.load(themefile)
-            theme=theme_data["Theme"]
-        
-        if not os.path.exists("Files/Player Data/Skill tracker.json"):
-            with open("Files/Player Data/Skill tracker.json", "w") as f:
-                ujson.dump({}, f, indent=6)
-
-        #Status File
-        with open("Files/Player Data/Status.json", 'r') as f:
-            status_data = ujson.load(f)
-        
-        #Skill File
-        with open("Files/Player Data/Skill.json", 'r') as f:
-            skill_data = ujson.load(f)
+    """Check fatigue every FATIGUE_CHECK_SECONDS and straight after Status.json changes."""
+    def status_changed(key, data):
+        if key == "Status.json":
+            scheduler.wake("fatigue")
 
-        fat_percent=(status_data["status"][0]["fatigue"]/status_data["status"][0]["fatigue_max"])*100
+    player_state.subscribe(status_changed)
+    scheduler.schedule("fatigue", fatigue_check)
 
+def fatigue_check():
+    global fatigue_open
+    theme=player_state.theme()
+    
+    if not os.path.exists("Files/Player Data/Skill tracker.json"):
+        with open("Files/Player Data/Skill tracker.json", "w") as f:
+            ujson.dump({}, f, indent=6)
 
-        if fat_percent>=50:
-            if skill_use("Nimble Endurance", (24*60*60)) == True and ("Nimble Endurance"in skill_data) and fat_percent>=100:
-                with open("Files/Player Data/Status.json", 'r') as f:
-                    status_data = ujson.load(f)
-
-                status = status_data["status"][0]
+    #Status File
+    status_data = player_state.get("Status.json")
+    
+    #Skill File
+    skill_data = player_state.skills()
 
-                fat_percent = (status["fatigue"] / status["fatigue_max"]) * 100
-                lvl=skill_data["Nimble Endurance"][0]["lvl"]
-                if type(lvl)==str: lvl=10
-                reduce_fatigue_value = (2*lvl / 100) * status["fatigue_max"]
-                status["fatigue"] -= reduce_fatigue_value
+    fat_percent=(status_data["status"][0]["fatigue"]/status_data["status"][0]["fatigue_max"])*100
 
-                # Step 4: Update fatigue in Status.json
-                with open("Files/Player Data/Status.json", 'w') as f:
-                    ujson.dump(status_data, f, indent=6)
-            
-            elif skill_use("Rush", (24*60*60)) == True and ("Rush"in skill_data):
 
-                status = status_data["status"][0]
+    if fat_percent>=50:
+        if skill_use("Nimble Endurance", (24*60*60)) == True and ("Nimble Endurance"in skill_data) and fat_percent>=100:
+            status = status_data["status"][0]
 
-                fat_percent = (status["fatigue"] / status["fatigue_max"]) * 100
-                lvl=skill_data["Rush"][0]["lvl"]
-                if type(lvl)==str: lvl=10
-                reduce_fatigue_value = (2*lvl / 100) * status["fatigue_max"]
-                status["fatigue"] -= reduce_fatigue_value
+            fat_percent = (status["fatigue"] / status["fatigue_max"]) * 100
+            lvl=skill_data["Nimble Endurance"][0]["lvl"]
+            if type(lvl)==str: lvl=10
+            reduce_fatigue_value = (2*lvl / 100) * status["fatigue_max"]
+            # Step 4: Update fatigue in Status.json (a single-field write)
+            player_state.set_field("Status.json", ("status", 0, "fatigue"), status["fatigue"] - reduce_fatigue_value)
+        
+        elif skill_use("Rush", (24*60*60)) == True and ("Rush"in skill_data):
 
-                # Step 4: Update fatigue in Status.json
-                with open("Files/Player Data/Status.json", 'w') as f:
-                    ujson.dump(status_data, f, indent=6)
+            status = status_data["status"][0]
 
-            if fatigue_open==False:
-                subprocess.Popen([sys.executable, thesystem.misc.resource_path(f"{theme} Version/Fatigue/gui.py")])
-                fatigue_open=True
+            fat_percent = (status["fatigue"] / status["fatigue_max"]) * 100
+            lvl=skill_data["Rush"][0]["lvl"]
+            if type(lvl)==str: lvl=10
+            reduce_fatigue_value = (2*lvl / 100) * status["fatigue_max"]
+            # Step 4: Update fatigue in Status.json (a single-field write)
+            player_state.set_field("Status.json", ("status", 0, "fatigue"), status["fatigue"] - reduce_fatigue_value)
 
-        if fat_percent<50:
-            fatigue_open=False
+        if fatigue_open==False:
+            thesystem.windows.open_screen("Fatigue", theme=theme)
+            fatigue_open=True
 
+    if fat_percent<50:
+        fatigue_open=False
 
-        time.sleep(3)
+    return FATIGUE_CHECK_SECONDS
         
 def equipment_value_plus(val):
     with open("Files/Player Data/Skill.json", 'r') as f:
@@ -0,0 +1,269 @@
+"""
+Timing spans in Chrome's trace-event format (chrome://tracing, Perfetto).
+
+    THESYSTEM_TRACE="Files/Temp Files/Trace" python gui.py
+    python -m thesystem.tracing merge "Files/Temp Files/Trace" -o trace.json
+
+Each process appends its spans to trace-<pid>.json in the folder. Every
+launched screen inherits the folder and the id of the launch span, so
+after merging, one timeline shows a click in gui.py, the screen process it
+started and that screen's file reads and frame work.
+
+Unset, span() hands back one shared do-nothing object and traced() returns
+the function itself, so the hooks cost a call and nothing else.
+"""
+import subprocess
+import itertools
+import threading
+import atexit
+import ujson
+import glob
+import time
+import sys
+import os
+
+FOLDER = os.environ.get("THESYSTEM_TRACE")
+# Id of the launch that started this process, so the merged timeline can draw the arrow
+FLOW_ENV = "THESYSTEM_TRACE_FLOW"
+
+# Wall clock in microseconds, so spans from different processes line up
+_EPOCH = time.time() - time.perf_counter()
+_lock = threading.Lock()
+_file = None
+_file_pid = None
+_named_threads = set()
+_flow_ids = itertools.count(1)
+
+
+def now():
+    return (_EPOCH + time.perf_counter()) * 1e6
+
+
+def process_name():
+    script = sys.argv[0] if sys.argv and sys.argv[0] else "python"
+    folder, name = os.path.split(os.path.abspath(script))
+    if name == "gui.py":
+        # 'Anime Version/Status Tab/gui.py' -> 'Status Tab/gui.py'
+        return f"{os.path.basename(folder)}/{name}"
+    return name
+
+
+def _write(event):
+    global _file, _file_pid
+    pid = os.getpid()
+    tid = threading.get_native_id()
+    event["pid"] = pid
+    event["tid"] = tid
+    with _lock:
+        if _file_pid != pid:
+            # First event, or a forked child that must not share its parent's file
+            os.makedirs(FOLDER, exist_ok=True)
+            _file = open(os.path.join(FOLDER, f"trace-{pid}.json"), "w", buffering=1)
+            _file_pid = pid
+            _named_threads.clear()
+            _file.write("[\n")
+            _file.write(ujson.dumps({"ph": "M", "name": "process_name", "pid": pid, "tid": tid,
+                                     "args": {"name": process_name()}}) + ",\n")
+        if tid not in _named_threads:
+            _named_threads.add(tid)
+            _file.write(ujson.dumps({"ph": "M", "name": "thread_name", "pid": pid, "tid": tid,
+                                     "args": {"name": threading.current_thread().name}}) + ",\n")
+        # The array is left open; Chrome accepts that, and a killed process loses nothing
+        _file.write(ujson.dumps(event) + ",\n")
+
+
+class Span:
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name, cat, args):
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = now()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = now()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        _write({"ph": "X", "name": self.name, "cat": self.cat, "ts": self.start,
+                "dur": end - self.start, "args": self.args})
+        return False
+
+    def set(self, **args):
+        """Attach details only known once the work is done (frame count, child pid...)."""
+        self.args.update(args)
+
+    def flow_out(self):
+        """Start an arrow from this span; returns the id the receiving process passes to flow_in."""
+        flow = (os.getpid() << 20) + next(_flow_ids)
+        _write({"ph": "s", "name": "launch", "cat": "launch", "id": flow, "ts": now()})
+        return flow
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **args):
+        pass
+
+    def flow_out(self):
+        return None
+
+
+NULL_SPAN = _NullSpan()
+
+
+def span(name, cat="io", **args):
+    """with span("read Status.json", path=...): ... -- timed when tracing is on."""
+    if FOLDER is None:
+        return NULL_SPAN
+    return Span(name, cat, args)
+
+
+def traced(name=None, cat="call"):
+    """Decorator form of span(); leaves the function untouched when tracing is off."""
+    def wrap(func):
+        if FOLDER is None:
+            return func
+        label = name or func.__qualname__
+
+        def traced_func(*args, **kwargs):
+            with Span(label, cat, {}):
+                return func(*args, **kwargs)
+        traced_func.__name__ = func.__name__
+        traced_func.__qualname__ = func.__qualname__
+        traced_func.__doc__ = func.__doc__
+        return traced_func
+    return wrap
+
+
+def flow_in(flow, name="started"):
+    """End the arrow of the launch that started this work, on a short marker span."""
+    if FOLDER is None or not flow:
+        return
+    start = now()
+    _write({"ph": "X", "name": name, "cat": "launch", "ts": start, "dur": 1, "args": {}})
+    _write({"ph": "f", "bp": "e", "name": "launch", "cat": "launch", "id": int(flow), "ts": start})
+
+
+def launch_name(args):
+    """[python, '.../Status Tab/gui.py'] -> 'launch Status Tab/gui.py'"""
+    if isinstance(args, (str, bytes, os.PathLike)):
+        args = [args]
+    args = [os.fsdecode(arg) for arg in args]
+    if len(args) > 2 and args[1] == "-m":
+        return f"launch -m {args[2]}"
+    target = args[1] if len(args) > 1 and args[0] == sys.executable else args[0]
+    folder, name = os.path.split(target)
+    return f"launch {os.path.basename(folder)}/{name}" if folder else f"launch {name}"
+
+
+class TracedPopen(subprocess.Popen):
+    """subprocess.Popen that times the launch and hands the child the flow id."""
+
+    def __init__(self, args, *rest, **kwargs):
+        with Span(launch_name(args), "launch", {}) as launch:
+            env = kwargs.get("env")
+            kwargs["env"] = dict(os.environ if env is None else env, **{FLOW_ENV: str(launch.flow_out())})
+            super().__init__(args, *rest, **kwargs)
+            launch.set(child=self.pid)
+
+
+class TracedJSON:
+    """Stand-in for ujson in modules that open files themselves; load/dump become spans."""
+
+    def __init__(self, module):
+        self._module = module
+
+    def __getattr__(self, name):
+        return getattr(self._module, name)
+
+    def load(self, file, *args, **kwargs):
+        path = getattr(file, "name", "")
+        with Span(f"read {os.path.basename(str(path))}", "io", {"path": str(path)}):
+            return self._module.load(file, *args, **kwargs)
+
+    def dump(self, obj, file, *args, **kwargs):
+        path = getattr(file, "name", "")
+        with Span(f"write {os.path.basename(str(path))}", "io", {"path": str(path)}):
+            return self._module.dump(obj, file, *args, **kwargs)
+
+
+def traced_json(module):
+    """ujson itself when tracing is off; TracedJSON around it when it is on."""
+    return module if FOLDER is None else TracedJSON(module)
+
+
+def close():
+    global _file, _file_pid
+    with _lock:
+        if _file is not None and _file_pid == os.getpid():
+            _file.close()
+        _file = None
+        _file_pid = None
+
+
+def read_trace(path):
+    """Events of one per-process file, whether or not its process closed the array."""
+    with open(path, "r") as f:
+        text = f.read().strip()
+    if not text:
+        return []
+    text = text.rstrip(",")
+    if not text.endswith("]"):
+        text += "]"
+    try:
+        return ujson.loads(text)
+    except ValueError:
+        # Cut off mid-event: keep every complete line
+        events = []
+        for line in text.splitlines()[1:]:
+            try:
+                events.append(ujson.loads(line.rstrip(",]")))
+            except ValueError:
+                pass
+        return events
+
+
+def merge(folder, output):
+    """Combine every trace-<pid>.json in `folder` into one trace file. Returns the event count."""
+    events = []
+    for path in sorted(glob.glob(os.path.join(folder, "trace-*.json"))):
+        events.extend(read_trace(path))
+    # Metadata first, then time order
+    events.sort(key=lambda event: (event.get("ph") != "M", event.get("ts", 0)))
+    with open(output, "w") as f:
+        ujson.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    return len(events)
+
+
+def _install():
+    atexit.register(close)
+    subprocess.Popen = TracedPopen
+    flow_in(os.environ.pop(FLOW_ENV, None))
+
+
+if FOLDER is not None:
+    _install()
+
+
+if __name__ == "__main__":
+    # python -m thesystem.tracing merge [folder] [-o trace.json]
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m thesystem.tracing")
+    parser.add_argument("command", choices=["merge"])
+    parser.add_argument("folder", nargs="?", default=FOLDER or "Files/Temp Files/Trace")
+    parser.add_argument("-o", dest="output", default="trace.json")
+    options = parser.parse_args()
+    count = merge(options.folder, options.output)
+    print(f"{count} events -> {options.output}")
@@ -0,0 +1,187 @@
+"""
+Background check for a newer version.
+
+The patches.json manifest is fetched with a conditional GET (ETag and
+Last-Modified from the previous answer), so an unchanged manifest costs a
+304 and no body. The last manifest is cached on disk: a start within the
+check interval of the previous one makes no request at all, and an offline
+start still knows the latest version it saw. Failed checks retry on a
+backoff schedule rather than every interval.
+
+Results are handed to subscribers in-process:
+
+    updates.update_checker.subscribe(lambda local, latest, manifest: ...)
+    updates.update_checker.start()
+
+Callbacks run on the checker's own thread; anything touching Tk should go
+through thesystem.windows.call_in_host. THESYSTEM_UPDATE_URL points the
+checker at another manifest, e.g. a local test server.
+"""
+import threading
+import random
+import ujson
+import time
+import os
+
+from packaging import version
+
+from thesystem.scheduler import scheduler
+
+MANIFEST_URL = os.environ.get(
+    "THESYSTEM_UPDATE_URL",
+    "https://raw.githubusercontent.com/Epoch2222/Solo-Leveling-System/main/patches.json"
+)
+VERSION_FILE = "version.csv"
+CACHE_FILE = "Files/Temp Files/Update Manifest.json"
+
+CHECK_SECONDS = 1800
+# (connect, read) seconds; a stalled server ends the check instead of a thread
+TIMEOUT = (3.05, 10)
+# Seconds before retrying after 1, 2, 3... failures in a row
+BACKOFF_SECONDS = [60, 300, 900, 1800, 3600]
+
+
+def local_version(path=VERSION_FILE):
+    """First cell of version.csv, or '0.0.0' if there is none."""
+    try:
+        with open(path, "r") as f:
+            return f.readline().split(",")[0].strip() or "0.0.0"
+    except OSError:
+        return "0.0.0"
+
+
+def is_newer(latest, current):
+    try:
+        return version.parse(latest) > version.parse(current)
+    except (version.InvalidVersion, TypeError):
+        return False
+
+
+class UpdateChecker:
+    JOB = "update check"
+
+    def __init__(self, url=MANIFEST_URL, cache_path=CACHE_FILE, version_path=VERSION_FILE,
+                 interval=CHECK_SECONDS, timeout=TIMEOUT, backoff=BACKOFF_SECONDS):
+        self.url = url
+        self.cache_path = cache_path
+        self.version_path = version_path
+        self.interval = interval
+        self.timeout = timeout
+        self.backoff = backoff
+        self.failures = 0
+        self.subscribers = []
+        self.notified = None
+        self.session = None
+        self.lock = threading.Lock()
+        self.cache = self._load_cache()
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, "r") as f:
+                cache = ujson.load(f)
+        except (OSError, ValueError):
+            return {}
+        # A cache written for another manifest URL says nothing about this one
+        return cache if cache.get("url") == self.url else {}
+
+    def _save_cache(self):
+        os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+        temp = self.cache_path + ".tmp"
+        with open(temp, "w") as f:
+            ujson.dump(self.cache, f, indent=4)
+        os.replace(temp, self.cache_path)
+
+    def subscribe(self, callback):
+        """Call `callback(local_version, latest_version, manifest)` when a newer version is found."""
+        self.subscribers.append(callback)
+
+    def manifest(self):
+        """The last manifest seen, from this run or a previous one, or None."""
+        return self.cache.get("manifest")
+
+    def fetch(self):
+        """
+        One conditional GET of the manifest. Returns the manifest (the cached one
+        on a 304) and raises on network errors, bad statuses and bad JSON.
+        """
+        import requests
+
+        if self.session is None:
+            self.session = requests.Session()
+        headers = {}
+        if self.cache.get("manifest") is not None:
+            if self.cache.get("etag"):
+                headers["If-None-Match"] = self.cache["etag"]
+            if self.cache.get("last_modified"):
+                headers["If-Modified-Since"] = self.cache["last_modified"]
+
+        response = self.session.get(self.url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304:
+            self.cache["checked"] = time.time()
+        else:
+            response.raise_for_status()
+            self.cache = {
+                "url": self.url,
+                "manifest": response.json(),
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "checked": time.time(),
+            }
+        self._save_cache()
+        return self.cache["manifest"]
+
+    def check(self):
+        """Fetch now, tell subscribers about a newer version and return seconds until the next check."""
+        with self.lock:
+            try:
+                manifest = self.fetch()
+            except Exception as e:
+                self.failures += 1
+                delay = self.backoff[min(self.failures, len(self.backoff)) - 1]
+                print(f"[Update Check] {e}; retrying in {delay}s")
+                # Spread retries out so many clients do not come back in step
+                return delay * random.uniform(0.8, 1.2)
+            self.failures = 0
+        self._announce(manifest)
+        return self.interval
+
+    def _announce(self, manifest):
+        latest = (manifest or {}).get("latest")
+        current = local_version(self.version_path)
+        # Once per version, not on every check
+        if latest is None or latest == self.notified or not is_newer(latest, current):
+            return
+        self.notified = latest
+        for callback in list(self.subscribers):
+            try:
+                callback(current, latest, manifest)
+            except Exception as e:
+                print(f"[Update Check] Subscriber failed: {e}")
+
+    def _run_check(self):
+        delay = self.check()
+        scheduler.schedule(self.JOB, self._start_check, delay)
+
+    def _start_check(self):
+        # The request runs on its own thread so a slow server never holds up the scheduler
+        threading.Thread(target=self._run_check, daemon=True, name="update check").start()
+
+    def start(self):
+        """
+        Begin checking in the background. A manifest cached by a recent run is
+        announced straight away and the first request waits out the interval.
+        """
+        checked = self.cache.get("checked", 0)
+        remaining = self.interval - (time.time() - checked)
+        if self.manifest() is not None and 0 < remaining <= self.interval:
+            threading.Thread(target=self._announce, args=(self.manifest(),), daemon=True).start()
+            scheduler.schedule(self.JOB, self._start_check, remaining)
+        else:
+            scheduler.schedule(self.JOB, self._start_check)
+        return self
+
+    def stop(self):
+        scheduler.cancel(self.JOB)
+
+
+update_checker = UpdateChecker()
@@ -0,0 +1,157 @@
+import threading
+import ctypes
+import ctypes.util
+import struct
+import sys
+import os
+
+from thesystem.scheduler import scheduler
+from thesystem.state import player_state
+
+# Folders watched by default and the file types inside them that matter
+WATCHED = [
+    ("Files/Player Data", ".json"),
+    ("Files/Checks", ".csv"),
+]
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def normalize(path):
+    return os.path.normcase(os.path.normpath(path))
+
+
+class FileWatcher:
+    """
+    Publishes a change event whenever a watched file is written.
+
+    Uses inotify on Linux (a blocked read, no wakeups while nothing
+    changes). Everywhere else, Windows included, the folders are stat'ed on a scheduler
+    job every `interval` seconds and files whose mtime or size moved are
+    published.
+    """
+
+    def __init__(self, folders=WATCHED, interval=1):
+        self.folders = folders
+        self.interval = interval
+        self.listeners = {}
+        self.stamps = {}
+        self.lock = threading.Lock()
+        self.mode = None
+
+    def subscribe(self, path, callback):
+        """
+        Call `callback(path)` when `path` changes. `path` may also be one of
+        the watched folders, to hear about every file inside it.
+        """
+        with self.lock:
+            self.listeners.setdefault(normalize(path), []).append(callback)
+        return callback
+
+    def unsubscribe(self, path, callback):
+        with self.lock:
+            callbacks = self.listeners.get(normalize(path), [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def _publish(self, folder, name):
+        path = os.path.join(folder, name)
+        with self.lock:
+            # Folder listeners first, so the player state cache is invalidated before anyone reads it
+            callbacks = self.listeners.get(normalize(folder), []) + self.listeners.get(normalize(path), [])
+
+        for callback in callbacks:
+            try:
+                callback(path)
+            except Exception as e:
+                print(f"[File Watcher] Listener failed for {path}: {e}")
+
+    def start(self):
+        if self.mode is not None:
+            return self
+        try:
+            self._start_inotify()
+            self.mode = "inotify"
+        except (OSError, AttributeError, TypeError):
+            self._scan(publish=False)
+            scheduler.schedule("file watcher", self._scan, self.interval)
+            self.mode = "stat"
+        return self
+
+    # --- inotify -------------------------------------------------------------
+
+    def _start_inotify(self):
+        libc_path = ctypes.util.find_library("c") if sys.platform.startswith("linux") else None
+        if libc_path is None:
+            # Windows has no C library to find (CDLL(None) would raise TypeError there)
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(libc_path, use_errno=True)
+        fd = libc.inotify_init1(0)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        watches = {}
+        for folder, suffix in self.folders:
+            if not os.path.isdir(folder):
+                continue
+            wd = libc.inotify_add_watch(fd, folder.encode(), IN_CLOSE_WRITE | IN_MOVED_TO | IN_DELETE)
+            if wd < 0:
+                os.close(fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {folder}")
+            watches[wd] = (folder, suffix)
+
+        threading.Thread(target=self._read_inotify, args=(fd, watches), daemon=True).start()
+
+    def _read_inotify(self, fd, watches):
+        while True:
+            buffer = os.read(fd, 64 * 1024)
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, cookie, length = EVENT_HEADER.unpack_from(buffer, offset)
+                offset += EVENT_HEADER.size
+                name = buffer[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+                offset += length
+
+                folder, suffix = watches.get(wd, (None, None))
+                if folder is not None and name.endswith(suffix):
+                    self._publish(folder, name)
+
+    # --- stat fallback -------------------------------------------------------
+
+    def _scan(self, publish=True):
+        for folder, suffix in self.folders:
+            try:
+                entries = list(os.scandir(folder))
+            except OSError:
+                continue
+            for entry in entries:
+                if not entry.name.endswith(suffix):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                stamp = (stat.st_mtime_ns, stat.st_size)
+                if self.stamps.get(entry.path) != stamp:
+                    self.stamps[entry.path] = stamp
+                    if publish:
+                        self._publish(folder, entry.name)
+        return self.interval
+
+
+def player_data_changed(path):
+    player_state.reload(os.path.basename(path))
+
+
+watcher = FileWatcher()
+watcher.subscribe("Files/Player Data", player_data_changed)
+
+
+def watch(path, callback):
+    """Subscribe `callback(path)` to changes of `path` and make sure the watcher runs."""
+    watcher.subscribe(path, callback)
+    watcher.start()
+    return callback
@@ -0,0 +1,308 @@
+import subprocess
+import threading
+import tkinter
+import runpy
+import queue
+import sys
+import os
+
+import thesystem.misc
+from thesystem.workerpool import WorkerPool, PROJECT_ROOT
+from thesystem.state import player_state
+import thesystem.latency
+import thesystem.tracing
+
+# Host installed by the long-lived main window (gui.py). When it is None every
+# screen falls back to being launched as its own interpreter.
+_host = None
+# Warm interpreters used for anything that still needs its own process.
+_pool = None
+# How long a closed screen's threads get to notice they should stop
+THREAD_GRACE_SECONDS = 5
+
+_tk_after = tkinter.Misc.after
+
+
+def hosted_window(widget):
+    """The HostedWindow `widget` belongs to, or None for the main window's own widgets."""
+    while widget is not None:
+        if isinstance(widget, HostedWindow):
+            return widget
+        widget = widget.master
+    return None
+
+
+class HostedCallWrapper(tkinter.CallWrapper):
+    """
+    Runs a hosted screen's callbacks (commands, bindings, after() jobs) with
+    the default root pointed at the screen, as while it was built, and
+    notes the threads they start.
+    """
+
+    def __init__(self, func, subst, widget):
+        super().__init__(func, subst, widget)
+        self.window = hosted_window(widget)
+
+    def __call__(self, *args):
+        if self.window is None:
+            return super().__call__(*args)
+        saved_default_root = tkinter._default_root
+        tkinter._default_root = self.window
+        before = threading.enumerate()
+        try:
+            return super().__call__(*args)
+        finally:
+            tkinter._default_root = saved_default_root
+            self.window.adopt(before)
+
+
+def _after(widget, ms, func=None, *args):
+    # Remember a hosted screen's pending jobs so they can be cancelled when it closes
+    window = hosted_window(widget) if func is not None else None
+    if window is None:
+        return _tk_after(widget, ms, func, *args)
+
+    def job(*args):
+        window.jobs.discard(job_id)
+        func(*args)
+
+    job.__name__ = getattr(func, "__name__", type(func).__name__)
+    job_id = _tk_after(widget, ms, job, *args)
+    window.jobs.add(job_id)
+    return job_id
+
+
+class HostedWindow(tkinter.Toplevel):
+    """
+    Stand-in for the `Tk()` a screen script creates when it runs inside the
+    window host. The host already owns the event loop, so `mainloop` returns
+    straight away and `quit` only tears down this screen.
+    """
+
+    script_path = None
+    # The script's globals, and whether the script has returned
+    namespace = None
+    built = False
+
+    def __init__(self, master=None, cnf={}, **kw):
+        super().__init__(master, cnf, **kw)
+        self.jobs = set()
+        self.threads = set()
+        # A tag of its own, so a screen's bind("<Destroy>") cannot replace this one
+        self.bindtags(self.bindtags() + ("HostedWindow",))
+
+    def mainloop(self, n=0):
+        self.after_idle(thesystem.latency.mark, "mainloop")
+
+    def adopt(self, before):
+        """Count threads started since the `before` snapshot as this screen's."""
+        self.threads = {t for t in self.threads if t.is_alive()}
+        self.threads.update(t for t in threading.enumerate() if t not in before)
+
+    def closed(self):
+        """
+        Cancel the screen's pending after() jobs and set every threading.Event
+        among its globals, the stop signal the screens already give their
+        loops. Returns the threads it started that are still running.
+        """
+        for job_id in list(self.jobs):
+            try:
+                self.after_cancel(job_id)
+            except tkinter.TclError:
+                pass
+        self.jobs.clear()
+        for value in list((self.namespace or {}).values()):
+            if isinstance(value, threading.Event):
+                value.set()
+        return {t for t in self.threads if t.is_alive()}
+
+    def quit(self):
+        try:
+            self.destroy()
+        except tkinter.TclError:
+            pass
+
+
+def _on_destroy(event):
+    window = event.widget
+    if _host is not None and isinstance(window, HostedWindow):
+        _host.closed(window)
+
+
+class WindowHost:
+    def __init__(self, root):
+        self.root = root
+        self.thread = threading.current_thread()
+        self.pending = queue.Queue()
+        self.windows = []
+        # Screens that left threads running after they closed; launched on their own from then on
+        self.standalone = set()
+        self.building = None
+        root.bind_class("HostedWindow", "<Destroy>", _on_destroy)
+        self._poll()
+
+    def _poll(self):
+        # Screens requested from worker threads (skill tracker, events, voice)
+        # are handed over here, since Tk may only be touched by its own thread.
+        while True:
+            try:
+                script_path = self.pending.get_nowait()
+            except queue.Empty:
+                break
+            if callable(script_path):
+                script_path()
+            elif not self.run(script_path):
+                launch_script(script_path)
+        self.root.after(50, self._poll)
+
+    def _new_window(self, *args, **kwargs):
+        thesystem.latency.mark("import done")
+        window = HostedWindow(self.root)
+        window.script_path = self.building
+        self.windows.append(window)
+        # Tkinter-Designer screens create most widgets and images without a
+        # master, so point the default root at the new screen while it builds.
+        tkinter._default_root = window
+        return window
+
+    def open(self, script_path):
+        if threading.current_thread() is not self.thread:
+            self.pending.put(script_path)
+            return True
+        return self.run(script_path)
+
+    def run(self, script_path):
+        """
+        Run a screen script inside this process. Returns False if the screen
+        could not be built, or has left threads running before, so the caller
+        can fall back to a standalone launch.
+        """
+        if script_path in self.standalone:
+            return False
+        # Screens still read Player Data with open() + ujson.load, so write out pending updates first,
+        # as launch_script does for a new process (this also covers screens queued by open())
+        player_state.flush()
+        saved_tk = tkinter.Tk
+        saved_default_root = tkinter._default_root
+        saved_building = self.building
+        opened = len(self.windows)
+        before = threading.enumerate()
+        namespace = None
+
+        tkinter.Tk = self._new_window
+        self.building = script_path
+        thesystem.latency.begin(script_path)
+        try:
+            with thesystem.tracing.span(f"host {os.path.basename(os.path.dirname(script_path))}", "screen",
+                                        path=script_path):
+                namespace = runpy.run_path(script_path, run_name="__main__")
+        except SystemExit:
+            pass
+        except Exception as e:
+            print(f"[Window Host] Could not host {script_path}: {e}")
+            for window in self.windows[opened:]:
+                window.quit()
+                window.closed()
+            del self.windows[opened:]
+            return False
+        finally:
+            tkinter.Tk = saved_tk
+            tkinter._default_root = saved_default_root
+            self.building = saved_building
+
+        for window in self.windows[opened:]:
+            window.namespace = namespace
+            window.built = True
+            window.adopt(before)
+            if not window.winfo_exists():
+                self.closed(window)
+        self.windows = [w for w in self.windows if w.winfo_exists()]
+        return True
+
+    def closed(self, window):
+        if not window.built:
+            # Closed while its script was still running; run() sees to it once the script returns
+            return
+        running = window.closed()
+        if running:
+            self.root.after(THREAD_GRACE_SECONDS * 1000, self._check_threads, window.script_path, running)
+
+    def _check_threads(self, script_path, threads):
+        running = [t for t in threads if t.is_alive()]
+        if running and script_path not in self.standalone:
+            print(f"[Window Host] {script_path} left {len(running)} thread(s) running after it closed; "
+                  f"it will open in its own process from now on")
+            self.standalone.add(script_path)
+
+
+def install_host(root):
+    """Make `root` the resident host for every screen opened from this process."""
+    global _host
+    tkinter.CallWrapper = HostedCallWrapper
+    tkinter.Misc.after = _after
+    _host = WindowHost(root)
+    return _host
+
+
+def hosting():
+    return _host is not None
+
+
+def call_in_host(func):
+    """Run `func()` on the host's Tk thread. Returns False if no host is installed."""
+    if _host is None:
+        return False
+    _host.pending.put(func)
+    return True
+
+
+def start_pool(size=2):
+    """Keep `size` pre-warmed interpreters ready for standalone launches."""
+    global _pool
+    _pool = WorkerPool(size).start()
+    return _pool
+
+
+def launch_script(script_path):
+    # A separate interpreter reads Player Data from disk, so hand it the latest state
+    player_state.flush()
+
+    if _pool is not None:
+        with thesystem.tracing.span(thesystem.tracing.launch_name(script_path), "launch", worker=True) as launch:
+            proc = _pool.launch(script_path, launch.flow_out())
+        if proc is not None:
+            return proc
+    # Timed (and linked to the new process) by tracing's Popen when it is on
+    return subprocess.Popen([sys.executable, script_path], cwd=PROJECT_ROOT)
+
+
+def open_script(relative_path, standalone=False):
+    """
+    Open any screen script given relative to the project root, e.g.
+    'First/Check/gui.py'. Runs inside the window host when one is installed,
+    otherwise (or with standalone=True) in a new interpreter.
+    """
+    script_path = thesystem.misc.resource_path(relative_path)
+
+    if _host is not None and not standalone:
+        if _host.open(script_path):
+            return True
+
+    launch_script(script_path)
+    return False
+
+
+def open_screen(name, script="gui.py", theme=None, standalone=False):
+    """
+    Open `{theme} Version/<name>/<script>`.
+
+    Args:
+        name (str): Screen folder, e.g. 'Inventory' or 'Status Tab'.
+        script (str, optional): Script inside the folder. Defaults to 'gui.py'.
+        theme (str, optional): 'Anime' or 'Manwha'. Read from Theme_Check.json if None.
+        standalone (bool, optional): Always start a separate interpreter. Defaults to False.
+    """
+    if theme is None:
+        theme = thesystem.misc.check_theme()
+
+    return open_script(os.path.join(f"{theme} Version", name, script), standalone)
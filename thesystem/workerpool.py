@@ -0,0 +1,140 @@
+import subprocess
+import threading
+import runpy
+import queue
+import sys
+import os
+
+READY = "ready"
+# The folder holding the thesystem package; workers run from it, like gui.py
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Bar sizes shared by most tab screens; decoded ahead of time in every worker.
+WARM_FRAME_STACKS = [
+    ("thesystem/top_bar", (695, 39), "NONE", "top"),
+    ("thesystem/bottom_bar", (702, 36), "NONE", "bottom"),
+    ("thesystem/top_bar", (715, 41), "NONE", "top"),
+    ("thesystem/bottom_bar", (715, 41), "NONE", "bottom"),
+    ("thesystem/top_bar", (970, 40), "NONE", "top"),
+    ("thesystem/bottom_bar", (970, 40), "NONE", "bottom"),
+]
+
+
+class WorkerPool:
+    """
+    Keeps `size` Python interpreters running with the heavy imports and the
+    common bar frame stacks already loaded. A launch hands the script path to
+    an idle worker, which then runs it as if it had been started directly.
+    """
+
+    def __init__(self, size=2):
+        self.size = size
+        self.idle = queue.Queue()
+        self.broken = False
+
+    def start(self):
+        for _ in range(self.size):
+            self._refill()
+        return self
+
+    def _refill(self):
+        if not self.broken:
+            threading.Thread(target=self._spawn, daemon=True).start()
+
+    def _spawn(self):
+        # `-m thesystem.workerpool` and the screens' "Files/..." paths both need the project root
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")]))
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "thesystem.workerpool"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            cwd=PROJECT_ROOT,
+            env=env
+        )
+        # Blocks this refill thread until the worker has finished warming up
+        if proc.stdout.readline().strip() != READY:
+            print("[Worker Pool] Worker failed to start, falling back to cold launches.")
+            self.broken = True
+            proc.kill()
+            return
+        proc.stdout.close()
+        self.idle.put(proc)
+
+    def launch(self, script_path, flow=None):
+        """
+        Returns the worker running `script_path`, or None if no warm worker was
+        free. `flow` is the tracing id of the launch, passed on to the worker.
+        """
+        while True:
+            try:
+                proc = self.idle.get_nowait()
+            except queue.Empty:
+                return None
+            if proc.poll() is None:
+                break
+
+        try:
+            line = os.path.abspath(script_path)
+            if flow is not None:
+                line += f"\t{flow}"
+            proc.stdin.write(line + "\n")
+            proc.stdin.close()
+        except OSError:
+            return None
+        finally:
+            self._refill()
+
+        return proc
+
+    def shutdown(self):
+        self.broken = True
+        while True:
+            try:
+                proc = self.idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+
+
+def warm_up():
+    import cv2
+    import numpy
+    import PIL.Image
+    import PIL.ImageTk
+    import thesystem.system
+    from thesystem.assets import assets
+
+    for folder_path, resize, job, type_ in WARM_FRAME_STACKS:
+        try:
+            assets.declare(folder_path, resize, job, type_).load(count=False)
+        except Exception as e:
+            print(f"[Worker Pool] Could not preload {folder_path} {resize}: {e}", file=sys.stderr)
+
+
+def serve():
+    warm_up()
+    print(READY, flush=True)
+
+    script_path, _, flow = sys.stdin.readline().strip().partition("\t")
+    if not script_path:
+        # The pool (or the whole program) shut down before this worker was used
+        return
+
+    import thesystem.tracing
+    thesystem.tracing.flow_in(flow, f"run {os.path.basename(os.path.dirname(script_path))}")
+
+    # Nothing reads the handshake pipe any more
+    sys.stdout = sys.stderr
+    sys.stdin = open(os.devnull)
+    sys.argv = [script_path]
+    sys.path.insert(0, os.path.dirname(script_path))
+    runpy.run_path(script_path, run_name="__main__")
+
+
+if __name__ == "__main__":
+    serve()
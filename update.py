@@ -1,15 +1,13 @@
-import requests
-import pandas as pd
 from packaging import version
-import zipfile
-import os
 import time
 import threading
-from datetime import datetime
 import tkinter as tk
 from tkinter import ttk
 import json
 
+from thesystem.updates import UpdateChecker, local_version
+import thesystem.patcher as patcher
+
 # --- UI CONFIGURATION ---
 root = tk.Tk()
 root.title("System Updater")
@@ -42,74 +40,37 @@ local_csv_path = "version.csv"
 target_directory = "."
 
 # --- CORE FUNCTIONS ---
-def create_backup(source_dir, backup_dir="Update Backup"):
-    if not os.path.exists(backup_dir):
-        os.makedirs(backup_dir, exist_ok=True)
-    
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    backup_path = os.path.join(backup_dir, f"backup_{timestamp}.zip")
-    log(f"Creating backup at: {backup_path}")
-
-    with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root_dir, dirs, files in os.walk(source_dir):
-            dirs[:] = [d for d in dirs if d not in ['__pycache__', '.git', 'venv', backup_dir]]
-            for file in files:
-                zipf.write(os.path.join(root_dir, file), os.path.relpath(os.path.join(root_dir, file), source_dir))
-    log("Backup complete.")
-
 def get_remote_manifest(url):
+    # Same conditional GET and on-disk cache as the background check in gui.py
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
+        return UpdateChecker(url).fetch()
     except Exception as e:
         log(f"Error fetching remote manifest: {e}")
         return None
 
 def get_local_version(local_path):
-    try:
-        df = pd.read_csv(local_path, header=None)
-        return str(df.iloc[0, 0]).strip()
-    except Exception:
-        return "0.0.0" # Default to a base version if file doesn't exist
+    return local_version(local_path)
+
+# What to tell the player about the install after a failed update
+INSTALL_STATES = {
+    patcher.UNCHANGED: "No files were changed.",
+    patcher.UPDATED: "The new version is installed; only cleaning up the downloaded patches failed.",
+    patcher.INTERRUPTED: "The update was cut short and could not be undone yet. Run the updater again to restore the previous version.",
+}
 
-def download_file_with_progress(url, output_path):
-    log("Downloading patch...")
-    response = requests.get(url, stream=True)
-    response.raise_for_status()
-    total = int(response.headers.get('content-length', 0))
-    downloaded = 0
-    with open(output_path, 'wb') as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            if chunk:
-                f.write(chunk)
-                downloaded += len(chunk)
-                percent = (downloaded / total) * 100 if total else 0
-                progress["value"] = percent
-                log(f"Downloading... {int(percent)}%")
-    log("Download complete.")
+def set_progress(fraction):
+    progress["value"] = fraction * 100
 
-def download_and_apply_patch(patch_url, destination):
-    temp_patch_file = "__temp_patch__.diff"
+def run_update_thread():
+    # Undo a swap a crash cut short before reading version.csv, which it may have replaced already
     try:
-        download_file_with_progress(patch_url, temp_patch_file)
-        log("Applying patch...")
-        patch_set = patch.fromfile(temp_patch_file)
-        if patch_set and patch_set.apply(root=destination):
-            log("Patch applied successfully.")
-            progress["value"] = 100
-            return True
-        else:
-            log("Failed to apply patch.")
-            return False
+        if patcher.recover(target_directory):
+            log("Rolled back an update that was interrupted.")
     except Exception as e:
-        log(f"An error occurred during patching: {e}")
-        return False
-    finally:
-        if os.path.exists(temp_patch_file):
-            os.remove(temp_patch_file)
+        log(f"Could not roll back an interrupted update: {e}. Files may be mixed between versions.")
+        finish_update()
+        return
 
-def run_update_thread():
     try:
         manifest = get_remote_manifest(patches_manifest_url)
         local_ver = get_local_version(local_csv_path)
@@ -123,32 +84,25 @@ def run_update_thread():
 
         if version.parse(remote_ver) > version.parse(local_ver):
             log("Newer version found.")
-            patch_to_apply = next((p for p in manifest.get("patches", []) if p.get("from") == local_ver and p.get("to") == remote_ver), None)
-            
-            if not patch_to_apply:
-                log(f"No direct patch from {local_ver} to {remote_ver}.")
-                finish_update()
-                return
-
-            create_backup(target_directory)
-            if download_and_apply_patch(patch_to_apply["url"], target_directory):
-                with open(local_csv_path, "w") as f:
-                    f.write(remote_ver)
+            # Every hop from the installed version to the latest, backed up and swapped in together
+            try:
+                patcher.update(manifest, local_ver, target_directory, log=log, progress=set_progress)
                 log("Update complete!")
-            else:
-                log("Update failed. Please check backup folder.")
+            except Exception as e:
+                log(f"Update failed: {e}. {INSTALL_STATES.get(patcher.install_state(e), '')}".strip())
         else:
             log("You already have the latest version.")
         
         finish_update()
     except Exception as e:
-        log(f"[Update Thread] Error: {e}")
+        # Raised before the patcher was started, so nothing was touched
+        log(f"[Update Thread] Error: {e}. No files were changed.")
         finish_update()
 
 if __name__ == "__main__":
     # Ensure you have the required library installed
     try:
-        import patch_ng as patch
+        import patch_ng  # noqa: F401  (used by thesystem.patcher)
     except ImportError:
         log("Error: 'patch-ng' library not found.")
         log("Please run: pip install patch-ng")
@@ -1,121 +1,89 @@
-import speech_recognition as sr
 import threading
-import subprocess
-import ujson
+import sys
 
-# Define the hotkey and commands
-HOTKEY = "system"
-COMMANDS = {
-    "status": 1,
-    "inventory": 2,
-    "storage": 2,
-    "quests": 3,
-    "quest": 3,
-    "daily          ": 4,
-    "strength training": 4,
-    "skills": 5,
-    "skill": 5,
-    "equipment": 6,
-    "armor": 6,
-    "exit": 7,
-    "dungeon": 8,
-    "dungeons": 8,
-    "credits": 9,
-    "setting": 10,
-    "settings": 10,
-    "demon castle": 11,
-    "demons castle": 11,
-    "castle": 11,
-    "store":12,
-    "shop":12,
-    "intro":13,
-    "introduction":13,
-    "Fatigue":14
-}
+import thesystem.audio
+import thesystem.windows
+from thesystem.speech import (HOTWORD, FileSource, GoogleRecognizer, MicrophoneSource, ScriptedRecognizer,
+                              VoicePipeline, default_spotter)
+from thesystem.watcher import watch
+from thesystem.state import player_state
 
-# A flag to control the listening state
-listening = True
+# Spoken keyword -> screen it opens, checked in this order
+COMMANDS = [
+    ("status", "Status Tab"),
+    ("inventory", "Inventory"),
+    ("storage", "Inventory"),
+    ("quests", "Quests"),
+    ("quest", "Quests"),
+    ("daily", "Daily Quest"),
+    ("strength training", "Daily Quest"),
+    ("skills", "Skills Tab"),
+    ("skill", "Skills Tab"),
+    ("equipment", "Equipment"),
+    ("armor", "Equipment"),
+    ("dungeon", "Dungeon"),
+    ("dungeons", "Dungeon"),
+    ("credits", "Credits"),
+    ("setting", "Settings"),
+    ("settings", "Settings"),
+    ("demon castle", "Demon Castle"),
+    ("demons castle", "Demon Castle"),
+    ("castle", "Demon Castle"),
+    ("store", "Shop"),
+    ("shop", "Shop"),
+    ("intro", "Intro"),
+    ("introduction", "Intro"),
+    ("fatigue", "Fatigue"),
+]
 
-def recognize_speech():
-    global listening
-    recognizer = sr.Recognizer()
-    microphone = sr.Microphone()
 
-    print("Thread started, listening for '{hotkey} [command]'...")
-    while listening:
-        try:
-            with open('Files/Player Data/Theme_Check.json', 'r') as themefile:
-                theme_data=ujson.load(themefile)
-                theme=theme_data["Theme"]
-            with microphone as source:
-                recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                print("Listening...")
-                audio = recognizer.listen(source, timeout=5)
+def dispatch(command):
+    """Open the screen for the first keyword in `command`. Returns the screen name, or None."""
+    for keyword, screen in COMMANDS:
+        if keyword in command:
+            print(f"Hotkey and command '{keyword}' detected. Output: {screen}")
+            thesystem.audio.play("Button SFX")
+            thesystem.windows.open_screen(screen, theme=player_state.theme())
+            return screen
+    return None
 
-            # Recognize the speech
-            command = recognizer.recognize_google(audio).lower()
 
-            # Check for hotkey and commands
-            if HOTKEY in command:
-                for keyword, value in COMMANDS.items():
-                    if keyword in command:
-                        print(f"Hotkey and command '{keyword}' detected. Output: {value}")
-                        subprocess.Popen([sys.executable, resource_path('Files/Mod/default/sfx_button.py')])
-                        if value==1:
-                            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Status Tab/gui.py')])
-                        elif value==2:
-                            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Inventory/gui.py')])
-                        elif value==3:
-                            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Quests/gui.py')])
-                        elif value==4:
-                            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Daily Quest/gui.py')])
-                        elif value==5:
-                            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Skills Tab/gui.py')])
-                        elif value==6:
-                            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Equipment/gui.py')])
-                        elif value==8:
-                            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Dungeon/gui.py')])
-                        elif value==9:
-                            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Credits/gui.py')])
-                        elif value==10:
-                            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Settings/gui.py')])
-                        elif value==11:
-                            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Demon Castle/gui.py')])
-                        elif value==12:
-                            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Shop/gui.py')])
-                        elif value==13:
-                            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Intro/gui.py')])
-                        elif value==14:
-                            subprocess.Popen([sys.executable, resource_path(f'{theme} Version/Fatigue/gui.py')])
-                        break  # Continue listening after processing the command
-        except sr.UnknownValueError:
-            pass  # Ignore unrecognized speech
-        except sr.RequestError as e:
-            print(f"Error with speech recognition service: {e}")
-        except sr.WaitTimeoutError:
-            pass  # Timeout if no speech is detected
+def main(args=sys.argv[1:]):
+    # python voice.py [clip.wav "system status" ...] runs a recording through
+    # the pipeline with the given transcripts instead of the microphone
+    if args:
+        source = FileSource(args[0])
+        recognizer = spotter = ScriptedRecognizer(args[1:])
+    else:
+        source = MicrophoneSource()
+        recognizer = GoogleRecognizer()
+        spotter = default_spotter()
 
-def main():
-    global listening
-
-    # Create and start a thread for speech recognition
-    speech_thread = threading.Thread(target=recognize_speech, daemon=True)
+    pipeline = VoicePipeline(source, recognizer, dispatch, spotter=spotter)
+    speech_thread = threading.Thread(target=pipeline.run, daemon=True)
     speech_thread.start()
+    print(f"Thread started, listening for '{HOTWORD} [command]'...")
+
+    microphone_off = threading.Event()
+
+    def check_microphone(path=None):
+        if player_state.settings()["Microphone"] == "False":
+            microphone_off.set()
+
+    if not args:
+        watch("Files/Player Data/Settings.json", check_microphone)
+        check_microphone()
 
     try:
-        while True:
-            with open("Files/Player Data/Settings.json", 'r') as fson:
-                data=ujson.load(fson)
-            listening = data["Settings"]["Microphone"]
-            if listening == "False":
-                listening = False
-                speech_thread.join()  # Wait for the thread to finish
-                print("Speech recognition stopped.")
-                break
+        while speech_thread.is_alive() and not microphone_off.wait(0.5):
+            pass
+        pipeline.stop()
+        speech_thread.join()  # Wait for the thread to finish
+        print("Speech recognition stopped.")
     except KeyboardInterrupt:
-        listening = False
+        pipeline.stop()
         speech_thread.join()
         print("\nProgram terminated.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()